@@ -1,36 +1,117 @@
 """メインアプリケーションクラス - 全体の統合と管理"""
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from models.note_model import NoteData
 from services.storage_service import StorageService
+from models.note_repository import JsonNoteRepository
 from controllers.note_controller import NoteController
 from views.main_window import MainWindow
 from services.ui_service import UIService
 from services.language_service import get_language_service
-from utils.constants import STATUS_NEW_FILE, STATUS_LOAD_FAILED
+from services.main_thread_dispatcher import MainThreadDispatcher
+from services.instance_service import SingleInstanceServer
+from services.settings_service import get_settings_service
+from services.rpc_server import RpcServer
+from core.rpc import NoteRpcHandler
+from core.history import RevisionStore
+from core.trash import TrashStore
+from core.cold_archive import ColdArchive
+from core.recent_notes import RecentNotes
+from core.pruner import BackgroundPruner
+from utils.phase_timer import PhaseTimer
+from utils.metrics import get_metrics
+from utils.constants import (
+    STATUS_NEW_FILE, STATUS_LOAD_FAILED, RPC_DEFAULT_PORT, SETTING_RPC_ENABLED, SETTING_RPC_PORT,
+    FSYNC_POLICIES, DEFAULT_FSYNC_POLICY, SETTING_FSYNC_POLICY, HISTORY_FILE_SUFFIX, HISTORY_MAX_REVISIONS,
+    HISTORY_MAX_AGE_DAYS, HISTORY_MAX_BYTES, SETTING_HISTORY_MAX_REVISIONS, SETTING_HISTORY_MAX_AGE_DAYS,
+    SETTING_HISTORY_MAX_BYTES, HISTORY_PRUNE_INTERVAL, TRASH_FILE_SUFFIX, TRASH_MAX_AGE_DAYS, TRASH_MAX_BYTES,
+    TRASH_PURGE_INTERVAL, TRASH_PURGE_INITIAL_DELAY, SETTING_TRASH_MAX_AGE_DAYS, SETTING_TRASH_MAX_BYTES, COLD_ARCHIVE_FILE_SUFFIX,
+    COLD_ARCHIVE_INDEX_SUFFIX, COLD_ARCHIVE_AFTER_DAYS, COLD_ARCHIVE_INTERVAL, SETTING_COLD_ARCHIVE_AFTER_DAYS,
+    BODY_COMPRESS_THRESHOLD, SETTING_BODY_COMPRESS_THRESHOLD, RECENT_NOTES_FILE_SUFFIX, METRICS_ENABLED_DEFAULT,
+    SETTING_DIAGNOSTICS_ENABLED
+)
 
 
 class StickyNoteApplication:
     """付箋アプリケーションのメインクラス"""
     
-    def __init__(self):
+    def __init__(self, instance_server: Optional[SingleInstanceServer] = None,
+                 startup_request: Optional[Dict[str, Any]] = None):
+        # 処理時間の計測（起動フェーズも記録するので最初に設定を反映する）
+        get_metrics().enabled = bool(get_settings_service().get(SETTING_DIAGNOSTICS_ENABLED, METRICS_ENABLED_DEFAULT))
+        
+        # 起動フェーズの計測
+        self.startup_timer = PhaseTimer(metrics_prefix="startup")
+        
         # 言語サービス
-        self.language_service = get_language_service()
+        with self.startup_timer.phase("language_service"):
+            self.language_service = get_language_service()
         
         # サービス層の初期化
-        self.storage_service = StorageService()
-        self._setup_storage_callbacks()
+        with self.startup_timer.phase("storage_service"):
+            self.settings_service = get_settings_service()
+            fsync_policy = self.settings_service.get(SETTING_FSYNC_POLICY, DEFAULT_FSYNC_POLICY)
+            if fsync_policy not in FSYNC_POLICIES:
+                fsync_policy = DEFAULT_FSYNC_POLICY
+            compress_threshold = self.settings_service.get(SETTING_BODY_COMPRESS_THRESHOLD, BODY_COMPRESS_THRESHOLD)
+            repository = JsonNoteRepository(fsync_policy=fsync_policy, compress_threshold=compress_threshold)
+            self.storage_service = StorageService(repository)
+            self._setup_storage_callbacks()
+            
+            # 本文の履歴（古い版は付箋の読み込み後にバックグラウンドで削除）
+            self.revision_store = RevisionStore(
+                repository.file_path + HISTORY_FILE_SUFFIX,
+                max_revisions=self.settings_service.get(SETTING_HISTORY_MAX_REVISIONS, HISTORY_MAX_REVISIONS),
+                max_age_days=self.settings_service.get(SETTING_HISTORY_MAX_AGE_DAYS, HISTORY_MAX_AGE_DAYS),
+                max_bytes=self.settings_service.get(SETTING_HISTORY_MAX_BYTES, HISTORY_MAX_BYTES))
+            self.history_pruner = BackgroundPruner(self.revision_store.prune, HISTORY_PRUNE_INTERVAL, "history-pruner")
+            
+            # ごみ箱（保管期間を過ぎた付箋はバックグラウンドで完全に削除）
+            self.trash_store = TrashStore(
+                repository.file_path + TRASH_FILE_SUFFIX,
+                max_age_days=self.settings_service.get(SETTING_TRASH_MAX_AGE_DAYS, TRASH_MAX_AGE_DAYS),
+                max_bytes=self.settings_service.get(SETTING_TRASH_MAX_BYTES, TRASH_MAX_BYTES))
+            self.trash_purger = BackgroundPruner(self._purge_expired_trash, TRASH_PURGE_INTERVAL, "trash-purger",
+                                                 initial_delay=TRASH_PURGE_INITIAL_DELAY)
+            
+            # アーカイブファイル（長く使われていない付箋の移動はメインスレッドで行う）
+            self.cold_archive = ColdArchive(repository.file_path + COLD_ARCHIVE_FILE_SUFFIX,
+                                            repository.file_path + COLD_ARCHIVE_INDEX_SUFFIX,
+                                            lock=self.storage_service.write_lock())
+            self.cold_archiver = BackgroundPruner(lambda: self.dispatcher.post(self._archive_cold_notes),
+                                                  COLD_ARCHIVE_INTERVAL, "cold-archiver")
+            
+            # 最近開いた付箋（クイックオープンの順位付けに使用）
+            self.recent_notes = RecentNotes(repository.file_path + RECENT_NOTES_FILE_SUFFIX)
         
         # ビューの初期化
-        self.main_window = MainWindow()
+        with self.startup_timer.phase("main_window"):
+            self.main_window = MainWindow()
+            self.dispatcher = MainThreadDispatcher(self.main_window)
         
         # コントローラーの初期化（メインウィンドウを渡す）
-        self.note_controller = NoteController(self.storage_service, self.main_window)
-        self._setup_controller_callbacks()
+        with self.startup_timer.phase("controller"):
+            self.note_controller = NoteController(self.storage_service, self.main_window,
+                                                  self.revision_store, self.trash_store, self.cold_archive,
+                                                  self.recent_notes)
+            self._setup_controller_callbacks()
         
         # ビューのコールバック設定
         self._setup_view_callbacks()
         
-        # 初期化完了
+        # 自動化API（設定で有効にした場合だけ、付箋の読み込み後に開始）
+        self.settings_service.add_setting_changed_listener(self._on_setting_changed)
+        self.rpc_server: Optional[RpcServer] = None
+        
+        # 後から起動されたインスタンスからの要求（付箋の読み込み完了までは保留）
+        self.instance_server = instance_server
+        self._pending_requests: List[Dict[str, Any]] = []
+        if startup_request and startup_request.get("command") != "show":
+            self._pending_requests.append(startup_request)
+        if instance_server is not None:
+            instance_server.set_request_handler(
+                lambda request: self.dispatcher.post(self.handle_instance_request, request))
+        
+        # 初期化完了（付箋の読み込みはウィンドウ表示後にバックグラウンドで行う）
         self._initialize_application()
     
     def _setup_storage_callbacks(self) -> None:
@@ -42,14 +123,28 @@ class StickyNoteApplication:
         """コントローラーのコールバックを設定"""
         self.note_controller.on_notes_changed = self._on_notes_changed
         self.note_controller.on_status_update = self._on_status_update
+        self.note_controller.on_trash_changed = self._refresh_trash
+        self.note_controller.on_cold_notes_changed = self.main_window.set_cold_notes
     
     def _setup_view_callbacks(self) -> None:
         """ビューのコールバックを設定"""
         self.main_window.on_create_note = self._on_create_note_requested
         self.main_window.on_open_note = self._on_open_note_requested
-        self.main_window.on_delete_note = self._on_delete_note_requested
+        self.main_window.on_open_notes = self._on_open_notes_requested
+        self.main_window.on_close_notes = self._on_close_notes_requested
+        self.main_window.on_delete_notes = self._on_delete_notes_requested
         self.main_window.on_change_color = self._on_change_color_requested
+        self.main_window.on_archive_notes = self._on_archive_notes_requested
         self.main_window.on_refresh = self._on_refresh_requested
+        self.main_window.on_arrange_notes = self._on_arrange_notes_requested
+        self.main_window.on_undo = self._on_undo_requested
+        self.main_window.on_redo = self._on_redo_requested
+        self.main_window.on_trash_shown = self._refresh_trash
+        self.main_window.on_include_cold_changed = self.note_controller.set_include_cold_archive
+        self.main_window.on_quick_open = self.note_controller.show_quick_open
+        self.main_window.on_restore_trash = self._on_restore_trash_requested
+        self.main_window.on_purge_trash = self._on_purge_trash_requested
+        self.main_window.on_empty_trash = self._on_empty_trash_requested
         
         # ウィンドウクローズイベント
         self.main_window.protocol("WM_DELETE_WINDOW", self._on_application_exit)
@@ -59,11 +154,86 @@ class StickyNoteApplication:
     
     def _initialize_application(self) -> None:
         """アプリケーションを初期化"""
+        self.main_window.set_loading(True)
+        self.dispatcher.start()
+        
+        # 最初のフレームが描画された時点を記録してから読み込みを開始
+        self.main_window.after_idle(self._on_first_frame)
+    
+    def _on_first_frame(self) -> None:
+        """メインウィンドウが表示され操作可能になったとき"""
+        self.startup_timer.mark("first_frame")
+        
+        # 保存されたデータをワーカースレッドで読み込み
+        self.storage_service.load_all_notes_in_background(self.dispatcher.post, self._on_notes_loaded)
+    
+    def _on_notes_loaded(self, notes: List[NoteData]) -> None:
+        """付箋の読み込みが完了したとき（メインスレッドで呼ばれる）"""
+        self.startup_timer.mark("notes_loaded")
+        self.main_window.set_loading(False)
+        
         if not self.storage_service.is_file_exists():
             self._on_status_update(self.language_service.translate("status_new_file"))
         
-        # コントローラーを初期化（保存されたデータを読み込み）
-        self.note_controller.initialize()
+        with self.startup_timer.phase("apply_notes"):
+            self.note_controller.load_notes(notes, on_complete=self._on_startup_complete)
+        
+        self._update_rpc_server()
+        self.history_pruner.start()
+        self.trash_purger.start()
+        self.cold_archiver.start()
+        
+        pending, self._pending_requests = self._pending_requests, []
+        for request in pending:
+            self.handle_instance_request(request)
+    
+    def _on_startup_complete(self) -> None:
+        """前回開いていた付箋の復元まで完了したとき"""
+        self.startup_timer.mark("windows_restored")
+    
+    def handle_instance_request(self, request: Dict[str, Any]) -> None:
+        """後から起動されたインスタンスの要求を処理（メインスレッドで呼ばれる）"""
+        if not self.note_controller.is_loaded:
+            self._pending_requests.append(request)
+            return
+        
+        command = request.get("command")
+        if command == "show":
+            self.main_window.show_window()
+        elif command == "new_note":
+            self.note_controller.create_new_note(str(request.get("text", "")))
+    
+    def _on_setting_changed(self, key: str, value: Any) -> None:
+        """設定が変更されたときの処理"""
+        if key in (SETTING_RPC_ENABLED, SETTING_RPC_PORT) and self.note_controller.is_loaded:
+            self._update_rpc_server(show_status=True)
+        elif key == SETTING_DIAGNOSTICS_ENABLED:
+            get_metrics().enabled = bool(value)
+    
+    def _update_rpc_server(self, show_status: bool = False) -> None:
+        """設定に合わせて自動化APIを開始・停止"""
+        enabled = bool(self.settings_service.get(SETTING_RPC_ENABLED, False))
+        port = self.settings_service.get(SETTING_RPC_PORT, RPC_DEFAULT_PORT)
+        
+        if self.rpc_server is not None and (not enabled or self.rpc_server.port != port):
+            self.rpc_server.stop()
+            self.rpc_server = None
+            if not enabled and show_status:
+                self._on_status_update(self.language_service.translate("status_rpc_stopped"))
+        
+        if enabled and self.rpc_server is None:
+            handler = NoteRpcHandler(self.note_controller)
+            rpc_server = RpcServer(handler.handle, self.dispatcher.post, port)
+            if rpc_server.start():
+                self.rpc_server = rpc_server
+                if show_status:
+                    self._on_status_update(self.language_service.translate("status_rpc_started", port))
+            else:
+                self._on_status_update(self.language_service.translate("status_rpc_failed", port))
+    
+    def get_startup_timings(self) -> List[tuple]:
+        """起動フェーズごとの計測結果を取得"""
+        return self.startup_timer.get_timings()
     
     def run(self) -> None:
         """アプリケーションを実行"""
@@ -102,18 +272,74 @@ class StickyNoteApplication:
         """付箋を開くリクエストの処理"""
         self.note_controller.open_note_by_id(note_id)
     
-    def _on_delete_note_requested(self, note_id: str) -> None:
+    def _on_open_notes_requested(self, note_ids: List[str]) -> None:
+        """選択した付箋をまとめて開くリクエストの処理"""
+        self.note_controller.open_notes(note_ids)
+    
+    def _on_close_notes_requested(self, note_ids: List[str]) -> None:
+        """選択した付箋をまとめて閉じるリクエストの処理"""
+        self.note_controller.close_notes(note_ids)
+    
+    def _on_delete_notes_requested(self, note_ids: List[str]) -> None:
         """付箋削除リクエストの処理"""
-        self.note_controller.delete_note_by_id(note_id)
+        if len(note_ids) == 1:
+            self.note_controller.delete_note_by_id(note_ids[0])
+        else:
+            self.note_controller.delete_many(note_ids)
     
-    def _on_change_color_requested(self, note_id: str) -> None:
+    def _on_change_color_requested(self, note_ids: List[str]) -> None:
         """付箋の色変更リクエストの処理"""
-        self.note_controller.change_note_color(note_id)
+        self.note_controller.change_notes_color(note_ids)
+    
+    def _on_archive_notes_requested(self, note_ids: List[str], archived: bool) -> None:
+        """付箋のアーカイブ（アーカイブから戻す）リクエストの処理"""
+        self.note_controller.set_notes_archived(note_ids, archived)
     
     def _on_refresh_requested(self) -> None:
         """更新リクエストの処理"""
         self.note_controller.refresh_notes()
     
+    def _on_arrange_notes_requested(self) -> None:
+        """付箋整列リクエストの処理"""
+        self.note_controller.arrange_all_notes()
+    
+    def _on_undo_requested(self) -> None:
+        """元に戻すリクエストの処理"""
+        if self.note_controller.is_loaded:
+            self.note_controller.undo()
+    
+    def _on_redo_requested(self) -> None:
+        """やり直しリクエストの処理"""
+        if self.note_controller.is_loaded:
+            self.note_controller.redo()
+    
+    def _refresh_trash(self) -> None:
+        """ごみ箱タブを表示中なら一覧を更新（ごみ箱の読み込みは表示するまで行わない）"""
+        if self.main_window.is_trash_visible():
+            self.main_window.set_trash_items(self.trash_store.list_items())
+    
+    def _purge_expired_trash(self) -> None:
+        """保管期間を過ぎた付箋を削除（バックグラウンドのスレッドで呼ばれる）"""
+        if self.trash_store.purge_expired():
+            self.dispatcher.post(self._refresh_trash)
+    
+    def _archive_cold_notes(self) -> None:
+        """閉じたまま長く変更されていない付箋をアーカイブファイルに移す"""
+        max_age_days = self.settings_service.get(SETTING_COLD_ARCHIVE_AFTER_DAYS, COLD_ARCHIVE_AFTER_DAYS)
+        self.note_controller.archive_cold_notes(max_age_days)
+    
+    def _on_restore_trash_requested(self, note_ids: List[str]) -> None:
+        """ごみ箱の付箋を元に戻すリクエストの処理"""
+        self.note_controller.restore_from_trash(note_ids)
+    
+    def _on_purge_trash_requested(self, note_ids: List[str]) -> None:
+        """ごみ箱の付箋を完全に削除するリクエストの処理"""
+        self.note_controller.purge_from_trash(note_ids)
+    
+    def _on_empty_trash_requested(self) -> None:
+        """ごみ箱を空にするリクエストの処理"""
+        self.note_controller.empty_trash()
+    
     def _on_note_selection_changed(self, note_id: Optional[str]) -> None:
         """付箋選択変更時の処理"""
         if note_id:
@@ -124,5 +350,14 @@ class StickyNoteApplication:
     
     def _on_application_exit(self) -> None:
         """アプリケーション終了時の処理"""
+        self.dispatcher.stop()
+        if self.instance_server is not None:
+            self.instance_server.stop()
+        if self.rpc_server is not None:
+            self.rpc_server.stop()
+        self.history_pruner.stop()
+        self.trash_purger.stop()
+        self.cold_archiver.stop()
         self.note_controller.shutdown()
+        self.note_controller.undo_log.close()
         self.main_window.destroy()
@@ -0,0 +1,110 @@
+"""大きな本文の圧縮保存の効果の計測
+
+使用方法:
+    python -m benchmarks.bench_body_compression [付箋数] [大きな付箋の数] [大きな本文の文字数]
+
+ログを貼り付けたような大きな本文を含む付箋データを、圧縮なしと圧縮ありでそれぞれ保存し、
+ファイルサイズ・読み込み時間・本文の参照時間（初回は展開、2回目以降はキャッシュ）と、
+検索ボックスに1文字ずつ入力したときの1回あたりの検索時間（初回・2回目以降）を表示する。
+"""
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+from core.search import search_notes
+from models.note_model import NoteData, get_body_cache
+from models.note_repository import JsonNoteRepository
+from utils.constants import BODY_COMPRESS_THRESHOLD
+
+LOAD_REPEAT = 5  # 読み込み時間の計測回数
+SEARCH_QUERY = "worker-3 処理 42"  # 1文字ずつ入力して検索するクエリ
+
+
+def make_notes(count: int, large_count: int, large_chars: int) -> List[NoteData]:
+    """計測用の付箋データを作成（先頭の large_count 件はログのような大きな本文）"""
+    notes = []
+    for i in range(count):
+        if i < large_count:
+            lines = []
+            length = 0
+            while length < large_chars:
+                line = f"2024-01-01 12:{i % 60:02d}:{len(lines) % 60:02d} INFO worker-{len(lines) % 8} 処理 {len(lines)} 件目を完了"
+                lines.append(line)
+                length += len(line) + 1
+            text = "\n".join(lines)
+        else:
+            text = f"付箋 {i}\n" + "テキスト" * 20
+        notes.append(NoteData(id=f"{20240101000000000 + i}", text=text, x=i % 1000, y=i % 700))
+    return notes
+
+
+def measure_access(notes: List[NoteData]) -> Tuple[float, float]:
+    """大きな本文の参照時間（初回・キャッシュ済み、1件あたりのマイクロ秒）"""
+    get_body_cache().clear()
+    cold = []
+    warm = []
+    for note in notes:
+        start = time.perf_counter()
+        note.text
+        cold.append((time.perf_counter() - start) * 1e6)
+        start = time.perf_counter()
+        note.text
+        warm.append((time.perf_counter() - start) * 1e6)
+    return statistics.mean(cold), statistics.mean(warm)
+
+
+def measure_search(notes: List[NoteData]) -> Tuple[float, float]:
+    """1文字ずつ入力したときの検索時間（初回・2回目以降の中央値、1回あたりのミリ秒）"""
+    times = []
+    for length in range(1, len(SEARCH_QUERY) + 1):
+        start = time.perf_counter()
+        search_notes(notes, SEARCH_QUERY[:length])
+        times.append((time.perf_counter() - start) * 1000)
+    return times[0], statistics.median(times[1:])
+
+
+def run(threshold: int, notes: List[NoteData], large_count: int,
+        directory: str) -> Tuple[int, float, float, float, float, float]:
+    """1つの設定で保存・読み込み・参照・検索を計測"""
+    path = os.path.join(directory, f"bench_{threshold}.json")
+    if not JsonNoteRepository(path, compress_threshold=threshold).save_all(notes):
+        raise RuntimeError(f"保存に失敗しました: {path}")
+    size = os.path.getsize(path)
+    
+    load_times = []
+    loaded: List[NoteData] = []
+    for _ in range(LOAD_REPEAT):
+        start = time.perf_counter()
+        loaded = JsonNoteRepository(path, compress_threshold=threshold).load_all()
+        load_times.append((time.perf_counter() - start) * 1000)
+    cold, warm = measure_access(loaded[:large_count])
+    first_search, search = measure_search(loaded)
+    return size, statistics.median(load_times), cold, warm, first_search, search
+
+
+def main(argv: List[str]) -> int:
+    """計測を実行して結果を表示"""
+    note_count = int(argv[0]) if argv else 1000
+    large_count = int(argv[1]) if len(argv) > 1 else 20
+    large_chars = int(argv[2]) if len(argv) > 2 else 200_000
+    notes = make_notes(note_count, large_count, large_chars)
+    directory = tempfile.mkdtemp(prefix="free_sticky_bench_")
+    try:
+        print(f"付箋 {note_count} 件（うち {large_chars} 文字の本文 {large_count} 件）、"
+              f"圧縮するのは {BODY_COMPRESS_THRESHOLD} 文字以上の本文")
+        print(f"{'compress':<10}{'file KB':>10}{'load ms':>10}{'first us':>12}{'cached us':>12}"
+              f"{'search1 ms':>12}{'search ms':>12}")
+        for label, threshold in (("off", 0), ("on", BODY_COMPRESS_THRESHOLD)):
+            size, load_ms, cold, warm, first_search, search = run(threshold, notes, large_count, directory)
+            print(f"{label:<10}{size / 1024:>10.0f}{load_ms:>10.1f}{cold:>12.1f}{warm:>12.2f}"
+                  f"{first_search:>12.1f}{search:>12.2f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,66 @@
+"""fsyncポリシーごとの保存コストの計測
+
+使用方法:
+    python -m benchmarks.bench_fsync_policy [付箋数] [保存回数]
+
+各ポリシーで同じ付箋データを繰り返し保存し、1回あたりの保存時間を表示する。
+ロックファイルの取得・一時ファイルへの書き込み・os.replace を含む実際の保存経路を計測する。
+"""
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import List
+from models.note_model import NoteData
+from models.note_repository import JsonNoteRepository
+from utils.constants import FSYNC_POLICIES
+
+
+def make_notes(count: int) -> List[NoteData]:
+    """計測用の付箋データを作成"""
+    return [NoteData(id=f"{20240101000000000 + i}", text=f"付箋 {i}\n" + "テキスト" * 20,
+                     x=i % 1000, y=i % 700)
+            for i in range(count)]
+
+
+def run(policy: str, notes: List[NoteData], saves: int, directory: str) -> List[float]:
+    """1つのポリシーで保存を繰り返し、各保存の所要時間（ミリ秒）を返す"""
+    path = os.path.join(directory, f"bench_{policy}.json")
+    repository = JsonNoteRepository(path, fsync_policy=policy, fsync_interval=0.5)
+    timings = []
+    for i in range(saves):
+        notes[i % len(notes)].text += "."
+        start = time.perf_counter()
+        if not repository.save_all(notes):
+            raise RuntimeError(f"保存に失敗しました: {path}")
+        timings.append((time.perf_counter() - start) * 1000)
+    
+    start = time.perf_counter()
+    repository.sync_to_disk()
+    timings.append((time.perf_counter() - start) * 1000)  # 終了時のfsync
+    return timings
+
+
+def main(argv: List[str]) -> int:
+    """計測を実行して結果を表示"""
+    note_count = int(argv[0]) if argv else 500
+    saves = int(argv[1]) if len(argv) > 1 else 50
+    notes = make_notes(note_count)
+    directory = tempfile.mkdtemp(prefix="free_sticky_bench_")
+    try:
+        print(f"付箋 {note_count} 件 × 保存 {saves} 回（periodic の間隔は 0.5 秒）")
+        print(f"{'policy':<10}{'mean ms':>10}{'p50 ms':>10}{'max ms':>10}{'shutdown ms':>14}{'total ms':>11}")
+        for policy in FSYNC_POLICIES:
+            timings = run(policy, notes, saves, directory)
+            per_save, shutdown = timings[:-1], timings[-1]
+            print(f"{policy:<10}{statistics.mean(per_save):>10.2f}{statistics.median(per_save):>10.2f}"
+                  f"{max(per_save):>10.2f}{shutdown:>14.2f}{sum(timings):>11.1f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""計測（utils.metrics）のオーバーヘッドの計測
+
+使用方法:
+    python -m benchmarks.bench_metrics [呼び出し回数]
+
+何もしない関数を、そのまま呼んだ場合と @timed を付けて計測を無効・有効にした場合とで
+1回あたりの時間（マイクロ秒）を比べる。
+"""
+import sys
+import time
+from typing import Callable, List
+from utils.metrics import get_metrics, timed
+
+
+def noop() -> None:
+    """計測対象の何もしない関数"""
+
+
+timed_noop = timed("bench.noop")(noop)
+
+
+def per_call_us(func: Callable[[], None], calls: int) -> float:
+    """1回あたりの時間（マイクロ秒）"""
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+def main(argv: List[str]) -> int:
+    """計測を実行して結果を表示"""
+    calls = int(argv[0]) if argv else 1_000_000
+    metrics = get_metrics()
+    metrics.reset()
+    
+    plain_us = per_call_us(noop, calls)
+    metrics.enabled = False
+    disabled_us = per_call_us(timed_noop, calls)
+    metrics.enabled = True
+    enabled_us = per_call_us(timed_noop, calls)
+    
+    recorded = dict(metrics.histograms())["bench.noop"]["count"]
+    if recorded != calls:
+        raise AssertionError(f"記録された回数が一致しません: {recorded}")
+    print(f"呼び出し {calls} 回")
+    print(f"{'plain us':>10}{'disabled us':>13}{'enabled us':>12}")
+    print(f"{plain_us:>10.3f}{disabled_us:>13.3f}{enabled_us:>12.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
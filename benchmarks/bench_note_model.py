@@ -0,0 +1,112 @@
+"""付箋データモデルのメモリ使用量と変換速度の計測
+
+使用方法:
+    python -m benchmarks.bench_note_model [付箋数]
+
+__slots__ を使った NoteData と、以前の通常の dataclass（asdict で辞書に変換）を比べ、
+1件あたりのメモリ使用量と、辞書・タプルとの相互変換の速度（1秒あたりの件数）を表示する。
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional
+from models.note_model import NoteData
+from utils.constants import DEFAULT_NOTE_COLOR
+
+COLORS = ("#FFFF99", "#FFCCCC", "#CCFFCC", "#CCE5FF", "#E5CCFF")
+
+
+@dataclass
+class LegacyNoteData:
+    """比較用の以前の付箋データ（通常の dataclass）"""
+    id: str
+    text: str = ""
+    x: Optional[int] = None
+    y: Optional[int] = None
+    width: int = 200
+    height: int = 200
+    color: str = DEFAULT_NOTE_COLOR
+    is_open: bool = False
+    was_open: bool = False
+    archived: bool = False
+    revision: int = 0
+    updated_at: float = 0.0
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LegacyNoteData':
+        return cls(
+            id=data.get("id", ""),
+            text=data.get("text", ""),
+            x=data.get("x"),
+            y=data.get("y"),
+            width=data.get("width", 200),
+            height=data.get("height", 200),
+            color=data.get("color", DEFAULT_NOTE_COLOR),
+            is_open=data.get("is_open", False),
+            was_open=data.get("was_open", False),
+            archived=data.get("archived", False),
+            revision=data.get("revision", 0),
+            updated_at=data.get("updated_at", 0.0)
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def make_records(count: int) -> List[Dict[str, Any]]:
+    """計測用の付箋レコード（JSONを読み込んだ直後と同じく、色は件数分の別々の文字列）"""
+    return [{"id": f"{20240101000000000 + i}", "text": f"付箋 {i}", "x": i % 1000, "y": i % 700,
+             "width": 200 + i % 300, "height": 200, "color": "".join(COLORS[i % len(COLORS)]),
+             "is_open": i % 50 == 0, "was_open": i % 50 == 0, "archived": i % 7 == 0,
+             "revision": i % 9, "updated_at": 1700000000.0 + i}
+            for i in range(count)]
+
+
+def measure_memory(from_dict: Callable[[Dict[str, Any]], Any], records: List[Dict[str, Any]]) -> float:
+    """付箋データ1件あたりのメモリ使用量（バイト。本文などレコードと共有する文字列を除く）"""
+    gc.collect()
+    tracemalloc.start()
+    notes = [from_dict(record) for record in records]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del notes
+    return current / len(records)
+
+
+def throughput(func: Callable[[Any], Any], items: List[Any]) -> float:
+    """1秒あたりの変換件数"""
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return len(items) / (time.perf_counter() - start)
+
+
+def main(argv: List[str]) -> int:
+    """計測を実行して結果を表示"""
+    count = int(argv[0]) if argv else 100_000
+    records = make_records(count)
+    print(f"付箋 {count} 件")
+    print(f"{'model':<10}{'bytes/note':>12}{'from_dict/s':>14}{'to_dict/s':>12}{'to_tuple/s':>12}{'from_tuple/s':>14}")
+    
+    legacy_notes = [LegacyNoteData.from_dict(record) for record in records]
+    legacy = (measure_memory(LegacyNoteData.from_dict, records),
+              throughput(LegacyNoteData.from_dict, records),
+              throughput(LegacyNoteData.to_dict, legacy_notes))
+    print(f"{'dataclass':<10}{legacy[0]:>12.0f}{legacy[1]:>14,.0f}{legacy[2]:>12,.0f}{'-':>12}{'-':>14}")
+    
+    notes = [NoteData.from_dict(record) for record in records]
+    tuples = [note.to_tuple() for note in notes]
+    current = (measure_memory(NoteData.from_dict, records),
+               throughput(NoteData.from_dict, records),
+               throughput(NoteData.to_dict, notes),
+               throughput(NoteData.to_tuple, notes),
+               throughput(NoteData.from_tuple, tuples))
+    print(f"{'slots':<10}{current[0]:>12.0f}{current[1]:>14,.0f}{current[2]:>12,.0f}"
+          f"{current[3]:>12,.0f}{current[4]:>14,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
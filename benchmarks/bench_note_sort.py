@@ -0,0 +1,78 @@
+"""付箋一覧の並べ替えの計測
+
+使用方法:
+    python -m benchmarks.bench_note_sort [付箋数] [編集する付箋数]
+
+一覧の行（表示値と並べ替えキー）を毎回作り直して並べ替える以前の方法と、
+行をキャッシュして変更された付箋だけを差し込む NoteRowCache・SortedOrder を比べ、
+数件の付箋を編集したあとに一覧を更新する時間（ミリ秒）を列ごとに表示する。
+"""
+import random
+import statistics
+import sys
+import time
+from typing import List, Tuple
+from models.note_model import NoteData
+from core.note_sort import NoteRowCache, SortedOrder, SORT_COLUMNS, parse_note_timestamp
+from utils.constants import TEXT_PREVIEW_MAX_LENGTH
+
+REPEAT = 5  # 計測回数
+
+
+def format_row(note: NoteData, is_cold: bool) -> Tuple[str, str, str, str]:
+    """一覧の1行の表示値（NoteListComponent と同じ内容）"""
+    return (note.id, note.get_formatted_date(), note.get_preview_text(TEXT_PREVIEW_MAX_LENGTH),
+            note.get_status_text())
+
+
+def make_notes(count: int) -> List[NoteData]:
+    """計測用の付箋データを作成"""
+    rng = random.Random(0)
+    return [NoteData(id=f"2024{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}{i % 86400:06d}{i:05d}",
+                     text=f"{rng.choice('abcdefXYZ')} 付箋 {i}\n" + "本文" * 40, is_open=i % 50 == 0)
+            for i in range(count)]
+
+
+def full_sort(notes: List[NoteData], column: int) -> List[str]:
+    """以前の方法（すべての行を作り直して並べ替える）"""
+    keyed = []
+    for note in notes:
+        values = format_row(note, False)
+        keys = (note.id, parse_note_timestamp(note.id), values[2].casefold(), values[3].casefold())
+        keyed.append((keys[column], note.id))
+    keyed.sort()
+    return [note_id for _, note_id in keyed]
+
+
+def main(argv: List[str]) -> int:
+    """計測を実行して結果を表示"""
+    count = int(argv[0]) if argv else 20_000
+    edits = int(argv[1]) if len(argv) > 1 else 3
+    notes = make_notes(count)
+    rng = random.Random(1)
+    print(f"付箋 {count} 件、1回の更新で {edits} 件を編集")
+    print(f"{'column':<10}{'full ms':>10}{'cached ms':>11}")
+    for column, name in enumerate(SORT_COLUMNS):
+        cache = NoteRowCache(format_row)
+        order = SortedOrder()
+        order.set_sort(name)
+        order.update({note.id: cache.get(note) for note in notes})
+        full_times = []
+        cached_times = []
+        for _ in range(REPEAT):
+            for note in rng.sample(notes, edits):
+                note.text = rng.choice("abcdefXYZ") + note.text[1:]
+            start = time.perf_counter()
+            expected = full_sort(notes, column)
+            full_times.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            result = order.update({note.id: cache.get(note) for note in notes})
+            cached_times.append((time.perf_counter() - start) * 1000)
+            if result != expected:
+                raise AssertionError(f"並び順が一致しません: {name}")
+        print(f"{name:<10}{statistics.median(full_times):>10.1f}{statistics.median(cached_times):>11.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
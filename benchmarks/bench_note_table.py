@@ -0,0 +1,93 @@
+"""列指向の付箋テーブルによる集計・絞り込み・並べ替えの計測
+
+使用方法:
+    python -m benchmarks.bench_note_table [付箋数]
+
+付箋を1件変更するたびに同じ問い合わせを行う場合の時間（ミリ秒）を、NoteData を1件ずつたどる方法と
+NoteService.table（変更された行の書き換えを含む）を使う方法とで比べる。
+テーブル全体の作り直しにかかる時間も表示する。
+"""
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import Any, Callable, List, Tuple
+from models.note_model import NoteData
+from core.note_service import NoteService
+from core.note_table import NoteTable, FLAG_OPEN
+from services.storage_service import StorageService
+
+COLORS = ("#FFFF99", "#FFCCCC", "#CCFFCC", "#CCE5FF", "#E5CCFF")
+SECOND_MONITOR = (1920, 0, 3840, 1080)  # 2台目のモニターの範囲（左・上・右・下）
+REPEAT = 5  # 計測回数
+
+
+def make_notes(count: int) -> List[NoteData]:
+    """計測用の付箋データを作成"""
+    return [NoteData(id=f"{20240101000000000 + i}", text=f"付箋 {i}", x=(i * 37) % 3840, y=(i * 13) % 1080,
+                     width=200 + i % 300, color=COLORS[i % len(COLORS)], is_open=i % 50 == 0,
+                     was_open=i % 50 == 0, archived=i % 7 == 0, revision=i % 9, updated_at=1700000000.0 - i)
+            for i in range(count)]
+
+
+def measure(func: Callable[[], Any]) -> float:
+    """中央値の実行時間（ミリ秒）"""
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main(argv: List[str]) -> int:
+    """計測を実行して結果を表示"""
+    count = int(argv[0]) if argv else 100_000
+    notes = make_notes(count)
+    rebuild_ms = measure(lambda: NoteTable().rebuild(notes))
+    service = NoteService(StorageService())
+    service.set_notes(notes)
+    service.is_loaded = False  # 変更しても保存しない
+    left, top, right, bottom = SECOND_MONITOR
+    edits = iter(range(10 ** 9))
+    
+    def edit() -> None:
+        """付箋を1件変更（テーブルには変更された行として記録される）"""
+        i = next(edits)
+        note = notes[(i * 7919) % count]
+        note.x = (note.x + 1) % 3840
+        note.color = COLORS[i % len(COLORS)]
+        service.update(note, save=False)
+    
+    queries: List[Tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+        ("per color",
+         lambda: Counter(note.color for note in notes),
+         lambda: service.table.count_by_color()),
+        ("open count",
+         lambda: sum(1 for note in notes if note.is_open),
+         lambda: service.table.count_with_flags(FLAG_OPEN)),
+        ("color filter",
+         lambda: [note.id for note in notes if note.color == COLORS[1] and not note.archived],
+         lambda: service.table.select(color=COLORS[1], archived=False)),
+        ("monitor 2",
+         lambda: [note.id for note in notes if note.is_open and note.x is not None
+                  and left <= note.x < right and top <= note.y < bottom],
+         lambda: service.table.select(is_open=True, rect=SECOND_MONITOR)),
+        ("sort updated",
+         lambda: sorted(notes, key=lambda note: note.updated_at),
+         lambda: service.table.sorted_rows("updated_at")),
+    ]
+    service.table.count_by_color()  # 最初の参照でテーブルと色ごとの索引を作成しておく
+    
+    print(f"付箋 {count} 件（テーブルの作り直し {rebuild_ms:.1f} ms）")
+    print("各問い合わせの前に付箋を1件変更（table ms は変更された行の書き換えを含む）")
+    print(f"{'query':<14}{'objects ms':>12}{'table ms':>10}{'speedup':>9}")
+    for label, by_objects, by_table in queries:
+        objects_ms = measure(lambda: (edit(), by_objects()))
+        table_ms = measure(lambda: (edit(), by_table()))
+        print(f"{label:<14}{objects_ms:>12.2f}{table_ms:>10.2f}{objects_ms / table_ms:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
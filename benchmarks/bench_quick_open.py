@@ -0,0 +1,60 @@
+"""クイックオープンの絞り込みの計測
+
+使用方法:
+    python -m benchmarks.bench_quick_open [付箋数] [入力する文字列]
+
+入力する文字列を1文字ずつ打ち込んだときの1回あたりの時間（ミリ秒）を、
+毎回すべての候補を調べ直す場合と、前回の候補だけを絞り込む QuickOpenMatcher とで比べる。
+"""
+import random
+import sys
+import time
+from typing import List
+from models.note_model import NoteData
+from core.quick_open import QuickOpenIndex, QuickOpenMatcher
+
+SYLLABLES = ("ka", "re", "de", "po", "mi", "lo", "su", "ta", "ne", "ri", "ho", "ga", "zu", "be", "ya", "to")
+
+
+def make_notes(count: int) -> List[NoteData]:
+    """計測用の付箋データを作成（2〜4音節の単語を並べた本文）"""
+    rng = random.Random(0)
+    words = ["".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(5000)]
+    return [NoteData(id=f"{20240101000000000 + i}", text=" ".join(rng.choices(words, k=12)))
+            for i in range(count)]
+
+
+def main(argv: List[str]) -> int:
+    """計測を実行して結果を表示"""
+    count = int(argv[0]) if argv else 100_000
+    query = argv[1] if len(argv) > 1 else "kapomi"
+    notes = make_notes(count)
+    index = QuickOpenIndex()
+    
+    start = time.perf_counter()
+    items = index.items(notes)
+    build_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    index.items(notes)
+    reuse_ms = (time.perf_counter() - start) * 1000
+    ranks = {note.id: rank for rank, note in enumerate(notes[:100])}
+    print(f"付箋 {count} 件（候補の作成 {build_ms:.0f} ms、2回目以降 {reuse_ms:.0f} ms）")
+    print(f"{'query':<10}{'matches':>9}{'rescan ms':>11}{'narrow ms':>11}")
+    
+    matcher = QuickOpenMatcher(items, ranks)
+    for length in range(1, len(query) + 1):
+        typed = query[:length]
+        start = time.perf_counter()
+        expected = QuickOpenMatcher(items, ranks).match(typed)
+        rescan_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        result = matcher.match(typed)
+        narrow_ms = (time.perf_counter() - start) * 1000
+        if [item.note_id for item in result] != [item.note_id for item in expected]:
+            raise AssertionError(f"結果が一致しません: {typed}")
+        print(f"{typed:<10}{matcher.candidate_count(typed):>9}{rescan_ms:>11.1f}{narrow_ms:>11.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,231 @@
+"""コマンドラインインターフェース - GUIを起動せずに付箋を一括操作する
+
+使用方法:
+    python main.py note add "テキスト" [--color #FFFF99]
+    python main.py note list [--open] [--no-include-archive]
+    python main.py note search <キーワード> [--include-archive]
+    python main.py note export [出力ファイル] [--format json|jsonl] [--no-include-archive]
+    python main.py note import <入力ファイル|->
+    python main.py note sync <共有フォルダー>
+
+tkinterを一切importしないので、GUIが起動していても安全に実行できる。
+書き込むコマンドは読み込みから保存までデータファイルのロックを保持し、書き込みは一時ファイル経由の
+置き換えで行う。GUIは次回保存時にCLIで追加された付箋を取り込む。
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+from typing import Iterable, Iterator, List, Optional, TextIO
+from models.note_model import NoteData
+from models.note_repository import JsonNoteRepository
+from services.storage_service import StorageService
+from services.language_service import get_language_service
+from core.note_service import NoteService, validate_note_fields
+from core.sync import FolderSyncEngine
+from core.cold_archive import ColdArchive
+from utils.constants import (
+    NOTES_FILE, DEFAULT_NOTE_COLOR, TEXT_PREVIEW_MAX_LENGTH, COLD_ARCHIVE_FILE_SUFFIX, COLD_ARCHIVE_INDEX_SUFFIX
+)
+
+# データファイルに書き込むサブコマンド
+WRITE_COMMANDS = ("add", "import", "sync")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """引数パーサーを作成"""
+    parser = argparse.ArgumentParser(prog="main.py note", description="付箋をコマンドラインから操作します")
+    parser.add_argument("--file", default=NOTES_FILE, help="付箋データファイル（既定: %(default)s）")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    add_parser = subparsers.add_parser("add", help="付箋を追加")
+    add_parser.add_argument("text", help="付箋の内容（- で標準入力から読み込み）")
+    add_parser.add_argument("--color", default=DEFAULT_NOTE_COLOR, help="付箋の色")
+    
+    list_parser = subparsers.add_parser("list", help="付箋を一覧表示")
+    list_parser.add_argument("--open", action="store_true", help="開いている付箋のみ表示")
+    list_parser.add_argument("--include-archive", action=argparse.BooleanOptionalAction, default=True,
+                             help="アーカイブファイルの付箋も表示（既定: 表示する）")
+    
+    search_parser = subparsers.add_parser("search", help="IDまたは内容で付箋を検索")
+    search_parser.add_argument("query", help="検索キーワード")
+    search_parser.add_argument("--include-archive", action="store_true", help="アーカイブファイルの付箋も検索")
+    
+    export_parser = subparsers.add_parser("export", help="付箋をJSONで書き出し")
+    export_parser.add_argument("output", nargs="?", default="-", help="出力ファイル（既定: 標準出力）")
+    export_parser.add_argument("--format", choices=("json", "jsonl"), default="json", help="出力形式")
+    export_parser.add_argument("--include-archive", action=argparse.BooleanOptionalAction, default=True,
+                               help="アーカイブファイルの付箋も書き出す（既定: 書き出す）")
+    
+    import_parser = subparsers.add_parser("import", help="JSONまたはJSON Linesから付箋を一括追加")
+    import_parser.add_argument("input", help="入力ファイル（- で標準入力）")
+    
+    sync_parser = subparsers.add_parser("sync", help="共有フォルダーを介して他のマシンと付箋を同期")
+    sync_parser.add_argument("folder", help="同期に使う共有フォルダー")
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLIのエントリーポイント"""
+    args = build_parser().parse_args(argv)
+    # 入力はロックを取得する前に読み込み、GUIの保存を待たせる時間を短くする
+    if args.command == "add" and args.text == "-":
+        args.text = sys.stdin.read()
+    if args.command == "import":
+        args.notes = _read_notes(args.input)
+        if args.notes is None:
+            return 1
+    
+    storage_service = StorageService(JsonNoteRepository(args.file))
+    storage_service.set_error_callback(lambda message: print(message, file=sys.stderr))
+    note_service = NoteService(storage_service)
+    note_service.conflict_prefix = get_language_service().translate("sync_conflict_prefix")
+    note_service.cold_archive = ColdArchive(args.file + COLD_ARCHIVE_FILE_SUFFIX, args.file + COLD_ARCHIVE_INDEX_SUFFIX,
+                                            lock=storage_service.write_lock())
+    
+    with contextlib.ExitStack() as stack:
+        if args.command in WRITE_COMMANDS:
+            # 読み込みから保存までの間に他のプロセスが書き込んだ変更を上書きしないようにする
+            try:
+                stack.enter_context(storage_service.write_lock())
+            except OSError as e:
+                print(f"データファイルをロックできませんでした: {e}", file=sys.stderr)
+                return 1
+        note_service.load()
+        
+        try:
+            return _run(note_service, args)
+        except BrokenPipeError:
+            # 出力先（headなど）が先に閉じられた場合は残りの出力を捨てて終了
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            return 1
+
+
+def _run(note_service: NoteService, args: argparse.Namespace) -> int:
+    """サブコマンドを実行"""
+    if args.command == "add":
+        return _add(note_service, args.text, args.color)
+    if args.command == "list":
+        notes = note_service.get_open_notes() if args.open else note_service.iter_notes(args.include_archive)
+        _write_lines(_format_notes(notes), sys.stdout)
+        return 0
+    if args.command == "search":
+        _write_lines(_format_notes(note_service.search(args.query, args.include_archive)), sys.stdout)
+        return 0
+    if args.command == "export":
+        return _export(note_service.iter_notes(args.include_archive), args.output, args.format)
+    if args.command == "import":
+        return _import(note_service, args.notes)
+    if args.command == "sync":
+        return _sync(note_service, args.file, args.folder)
+    return 2
+
+
+def _add(note_service: NoteService, text: str, color: str) -> int:
+    """付箋を1件追加"""
+    try:
+        validate_note_fields({"color": color})
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    note = NoteData.create_new(text.strip())
+    note.color = color
+    note.is_open = False
+    note.was_open = False
+    note_service.add_all([note])
+    print(note.id)
+    return 0
+
+
+def _format_notes(notes: Iterable[NoteData]) -> Iterator[str]:
+    """一覧表示用の行を1件ずつ生成"""
+    language_service = get_language_service()
+    for note in notes:
+        preview = note.get_preview_text(TEXT_PREVIEW_MAX_LENGTH, language_service)
+        yield f"{note.id}\t{note.get_formatted_date()}\t{note.get_status_text(language_service)}\t{preview}"
+
+
+def _write_lines(lines: Iterable[str], out: TextIO) -> None:
+    """行を順に書き出す（全件をメモリにためない）"""
+    for line in lines:
+        out.write(line)
+        out.write("\n")
+
+
+def _export(notes: Iterable[NoteData], output: str, output_format: str) -> int:
+    """付箋を書き出し"""
+    out = sys.stdout if output == "-" else open(output, "w", encoding="utf-8")
+    try:
+        if output_format == "jsonl":
+            _write_lines((json.dumps(note.to_dict(), ensure_ascii=False) for note in notes), out)
+        else:
+            # 配列全体を組み立てずに1件ずつ書き出す
+            out.write("[")
+            count = 0
+            for note in notes:
+                out.write(",\n  " if count else "\n  ")
+                out.write(json.dumps(note.to_dict(), ensure_ascii=False))
+                count += 1
+            out.write("\n]\n" if count else "]\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def _read_records(source: TextIO) -> Iterator[dict]:
+    """JSON配列またはJSON Linesから付箋のレコードを読み込み（JSON Linesは1行ずつ読む）"""
+    lines = (line for line in source if line.strip())
+    first = next(lines, None)
+    if first is None:
+        return
+    if first.lstrip().startswith("["):
+        # 配列は全体を読み込まないと解析できない
+        yield from json.loads(first + source.read())
+        return
+    yield json.loads(first)
+    for line in lines:
+        yield json.loads(line)
+
+
+def _read_notes(input_path: str) -> Optional[List[NoteData]]:
+    """取り込む付箋を読み込み（読み込めなければNone）"""
+    try:
+        source = sys.stdin if input_path == "-" else open(input_path, "r", encoding="utf-8")
+    except OSError as e:
+        print(f"入力ファイルを読み込めませんでした: {e}", file=sys.stderr)
+        return None
+    try:
+        return [NoteData.from_dict(record) for record in _read_records(source)]
+    except (json.JSONDecodeError, AttributeError, TypeError) as e:
+        print(f"入力ファイルを読み込めませんでした: {e}", file=sys.stderr)
+        return None
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def _import(note_service: NoteService, notes: List[NoteData]) -> int:
+    """付箋を一括追加（書き込みは1回だけ）"""
+    added = note_service.add_all(notes)
+    print(f"{len(added)}個の付箋を追加しました")
+    return 0
+
+
+def _sync(note_service: NoteService, notes_file: str, folder: str) -> int:
+    """共有フォルダーの変更ログと同期（GUIが起動中でも、GUIはデータファイルの変更として取り込む）"""
+    conflict_prefix = get_language_service().translate("sync_conflict_prefix")
+    engine = FolderSyncEngine(note_service, notes_file, folder, conflict_prefix)
+    try:
+        result = engine.sync()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"同期に失敗しました: {e}", file=sys.stderr)
+        return 1
+    for replica_id, reason in result.skipped.items():
+        print(f"{replica_id} の変更ログに不正なレコードがあるため取り込みませんでした: {reason}", file=sys.stderr)
+    print(f"書き出し: {result.exported}件 / 取り込み: {result.imported}件 / "
+          f"削除: {result.deleted}件 / 競合: {result.conflicts}件")
+    return 0
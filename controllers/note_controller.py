@@ -1,29 +1,86 @@
-"""付箋コントローラー - ビジネスロジックを管理"""
-from typing import Dict, List, Optional, Callable
+"""付箋コントローラー - 付箋のドメインロジック（core）とTkのビューをつなぐアダプター"""
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Callable
 from models.note_model import NoteData
+from core.note_service import NoteService, ExternalChanges, CONTENT_FIELDS, EDITABLE_FIELDS
+from core.note_table import NoteTable
+from core.file_watcher import FileWatcher
+from core.history import RevisionStore
+from core.trash import TrashStore
+from core.cold_archive import ColdArchive
+from core.undo import UndoLog, NoteStates
+from core.recent_notes import RecentNotes
+from core.quick_open import QuickOpenIndex, QuickOpenMatcher
 from services.storage_service import StorageService
 from services.ui_service import UIService
+from services.placement_service import PlacementService
 from services.language_service import get_language_service
 from views.note_window import StickyNoteWindow
+from views.history_window import HistoryWindow
+from views.quick_open_window import QuickOpenWindow
+from utils.metrics import timed
 from utils.constants import (
-    STATUS_CREATED, STATUS_EDITING, STATUS_DELETED, STATUS_COLOR_CHANGED,
+    STARTUP_RESTORE_BATCH_SIZE, STATUS_CREATED, STATUS_EDITING, STATUS_DELETED, STATUS_COLOR_CHANGED,
     MSG_ERROR_NOTE_DATA
 )
 
 
 class NoteController:
-    """付箋のビジネスロジックを管理するコントローラー"""
+    """付箋ウィンドウとNoteServiceを仲介するコントローラー"""
     
-    def __init__(self, storage_service: StorageService, main_window=None):
+    def __init__(self, storage_service: StorageService, main_window=None,
+                 revision_store: Optional[RevisionStore] = None, trash_store: Optional[TrashStore] = None,
+                 cold_archive: Optional[ColdArchive] = None, recent_notes: Optional[RecentNotes] = None):
         self.storage_service = storage_service
         self.main_window = main_window  # メインウィンドウの参照を保持
         self.open_windows: Dict[str, StickyNoteWindow] = {}
-        self.all_notes: List[NoteData] = []
         self.language_service = get_language_service()
+        self.placement_service = PlacementService()
+        
+        # 付箋のドメインロジック（保存はTkのafter()でまとめて行う）
+        if main_window is not None:
+            self.note_service = NoteService(storage_service, main_window.after, main_window.after_cancel)
+            # 他プロセスによるデータファイルの変更を監視
+            self.file_watcher: Optional[FileWatcher] = FileWatcher(
+                self._check_external_changes, main_window.after, main_window.after_cancel)
+        else:
+            self.note_service = NoteService(storage_service)
+            self.file_watcher = None
+        self.note_service.on_external_change = self._on_external_change
+        self.note_service.conflict_prefix = self.language_service.translate("sync_conflict_prefix")
+        self.note_service.history = revision_store
+        self.note_service.trash = trash_store
+        if trash_store is not None:
+            # ごみ箱から完全に削除した付箋は履歴も削除する
+            trash_store.on_purged = self.note_service.forget_history
+        self.note_service.cold_archive = cold_archive
+        # 一覧の検索対象に含めているアーカイブファイルの付箋（含めていない間はNone）
+        self._cold_notes: Optional[Dict[str, NoteData]] = None
+        # 元に戻す・やり直しの履歴
+        self.undo_log = UndoLog()
+        # 最近開いた付箋（クイックオープンの順位付けに使用）と、クイックオープンの候補
+        self.recent_notes = recent_notes
+        self._quick_open_index = QuickOpenIndex()
         
         # コールバック
         self.on_notes_changed: Optional[Callable[[List[NoteData]], None]] = None
         self.on_status_update: Optional[Callable[[str], None]] = None
+        self.on_trash_changed: Optional[Callable[[], None]] = None
+        self.on_cold_notes_changed: Optional[Callable[[List[NoteData]], None]] = None
+    
+    @property
+    def all_notes(self) -> List[NoteData]:
+        """すべての付箋データ（NoteServiceが保持）"""
+        return self.note_service.notes
+    
+    @property
+    def note_table(self) -> NoteTable:
+        """付箋の列指向のテーブル（集計・絞り込み・並べ替え用。all_notes の変更に追従する）"""
+        return self.note_service.table
+    
+    @property
+    def is_loaded(self) -> bool:
+        """付箋の読み込みが完了しているか"""
+        return self.note_service.is_loaded
     
     def set_main_window(self, main_window) -> None:
         """メインウィンドウを設定"""
@@ -31,21 +88,43 @@ class NoteController:
     
     def initialize(self) -> None:
         """コントローラーを初期化"""
-        self.all_notes = self.storage_service.load_all_notes()
+        self.note_service.load()
         
         # 前回開いていた付箋を再表示
-        for note in self.all_notes:
-            if note.is_open or note.was_open:
-                self._create_note_window(note)
+        for note in self.note_service.get_open_notes():
+            self._create_note_window(note)
         
         if self.on_notes_changed:
             self.on_notes_changed(self.all_notes)
     
+    def load_notes(self, notes: List[NoteData], on_complete: Optional[Callable[[], None]] = None) -> None:
+        """読み込み済みの付箋を反映し、前回開いていた付箋を少しずつ再表示"""
+        self.note_service.set_notes(notes)
+        
+        if self.on_notes_changed:
+            self.on_notes_changed(self.all_notes)
+        
+        if self.file_watcher is not None:
+            self.file_watcher.start()
+        self._restore_windows_in_batches(self.note_service.get_open_notes(), 0, on_complete)
+    
+    def _restore_windows_in_batches(self, notes: List[NoteData], start: int,
+                                    on_complete: Optional[Callable[[], None]]) -> None:
+        """付箋ウィンドウを STARTUP_RESTORE_BATCH_SIZE 個ずつ after() で復元"""
+        end = start + STARTUP_RESTORE_BATCH_SIZE
+        for note in notes[start:end]:
+            if note.id not in self.open_windows:
+                self._create_note_window(note)
+        
+        if end < len(notes):
+            self.main_window.after(1, self._restore_windows_in_batches, notes, end, on_complete)
+        elif on_complete:
+            on_complete()
+    
     def create_new_note(self, text: str = "") -> None:
         """新しい付箋を作成"""
-        note = NoteData.create_new(text)
-        self.all_notes.append(note)
-        self.storage_service.save_all_notes(self.all_notes)
+        note = self.note_service.create(text)
+        self._record_undo("new_note", {note.id: None}, self._snapshot([note.id]))
         
         window = self._create_note_window(note)
         window.focus_text_area()
@@ -67,43 +146,440 @@ class NoteController:
                     self.on_status_update(self.language_service.translate("status_editing", note_id))
                 return
         
-        # 付箋データを検索
-        note = self._find_note_by_id(note_id)
+        # 付箋データを検索（アーカイブファイルに移した付箋は戻す）
+        self._thaw([note_id])
+        note = self.note_service.find(note_id)
         if note:
+            self._record_recent([note_id])
             note.is_open = True
             window = self._create_note_window(note)
             window.focus_text_area()
-            self.storage_service.save_all_notes(self.all_notes)
+            self.note_service.save([note_id])
         else:
             UIService.show_error(self.language_service.translate("msg_error_note_data"))
     
     def delete_note_by_id(self, note_id: str) -> bool:
-        """指定したIDの付箋を削除"""
-        if not UIService.confirm_delete():
-            return False
+        """指定したIDの付箋をごみ箱に移す（ごみ箱や元に戻すで復元できるので確認しない）"""
+        # 削除を元に戻せるよう、編集中の本文を取り込んでから記録
+        self._thaw([note_id])
+        self._capture_window_state([note_id])
+        before = self._snapshot([note_id])
         
         # 開いているウィンドウを閉じる
-        if note_id in self.open_windows:
-            window = self.open_windows[note_id]
-            if window.winfo_exists():
-                window.destroy()
-            del self.open_windows[note_id]
+        self._discard_window(note_id)
         
         # データから削除
-        self.all_notes = [note for note in self.all_notes if note.id != note_id]
-        self.storage_service.save_all_notes(self.all_notes)
+        if not self.note_service.delete(note_id):
+            return False
+        self._record_undo("delete", before, {note_id: None})
         
         if self.on_status_update:
-            self.on_status_update(self.language_service.translate("status_deleted", note_id))
+            self.on_status_update(self.language_service.translate("status_trashed", note_id))
+        
+        if self.on_trash_changed:
+            self.on_trash_changed()
         
         if self.on_notes_changed:
             self.on_notes_changed(self.all_notes)
         
         return True
     
+    def create_many(self, items: Iterable[Mapping[str, Any]]) -> List[NoteData]:
+        """複数の付箋を作成（検証・保存・変更通知は1回だけ、不正な要素があればValueError）"""
+        notes = self.note_service.create_many(items)
+        note_ids = [note.id for note in notes]
+        self._record_undo("new_note", dict.fromkeys(note_ids), self._snapshot(note_ids))
+        for note in notes:
+            if note.is_open:
+                self._create_note_window(note)
+        
+        self._notify_batch_change("status_created_many", len(notes))
+        return notes
+    
+    def update_many(self, changes: Mapping[str, Mapping[str, Any]]) -> List[NoteData]:
+        """複数の付箋を変更し、開いているウィンドウにも反映（保存・変更通知は1回だけ）"""
+        return self._apply_changes(changes, "status_updated_many", "edit")
+    
+    def open_notes(self, note_ids: Iterable[str]) -> None:
+        """複数の付箋を開く（アーカイブ済みの付箋はアーカイブから戻す）"""
+        note_ids = list(note_ids)
+        if len(note_ids) == 1:
+            self.open_note_by_id(note_ids[0])
+            return
+        self._thaw(note_ids)
+        
+        changes = {note_id: {"is_open": True, "was_open": True, "archived": False}
+                   for note_id in note_ids
+                   if self.note_service.find(note_id) and note_id not in self.open_windows}
+        self._record_recent(changes)
+        self._apply_changes(changes, "status_opened_many", "open")
+    
+    def close_notes(self, note_ids: Iterable[str]) -> None:
+        """開いている付箋をまとめて閉じる"""
+        note_ids = [note_id for note_id in note_ids if note_id in self.open_windows]
+        self._capture_window_state(note_ids)
+        changes = {note_id: {"is_open": False, "was_open": False} for note_id in note_ids}
+        self._apply_changes(changes, "status_closed_many", "close")
+    
+    def change_notes_color(self, note_ids: Iterable[str], new_color: str = None) -> None:
+        """複数の付箋の色をまとめて変更（色の選択は1回だけ）"""
+        note_ids = list(note_ids)
+        self._thaw(note_ids)
+        notes = [note for note in map(self.note_service.find, note_ids) if note]
+        if not notes:
+            return
+        if len(notes) == 1:
+            self.change_note_color(notes[0].id, new_color)
+            return
+        
+        if new_color is None:
+            new_color = UIService.choose_color(notes[0].color)
+            if not new_color:
+                return
+        
+        self._apply_changes({note.id: {"color": new_color} for note in notes}, "status_color_changed_many",
+                            "color_change")
+    
+    def set_notes_archived(self, note_ids: Iterable[str], archived: bool = True) -> None:
+        """複数の付箋をアーカイブ（またはアーカイブから戻す）。アーカイブした付箋は閉じる"""
+        note_ids = list(note_ids)
+        self._thaw(note_ids)
+        note_ids = [note.id for note in map(self.note_service.find, note_ids)
+                    if note and note.archived != archived]
+        if archived:
+            self._capture_window_state(note_ids)
+            changes = {note_id: {"archived": True, "is_open": False, "was_open": False} for note_id in note_ids}
+        else:
+            changes = {note_id: {"archived": False} for note_id in note_ids}
+        if archived:
+            self._apply_changes(changes, "status_archived_many", "archive")
+        else:
+            self._apply_changes(changes, "status_unarchived_many", "unarchive")
+    
+    def _capture_window_state(self, note_ids: Iterable[str]) -> None:
+        """ウィンドウを閉じる前に、編集中の本文や位置を付箋データに取り込む"""
+        for note_id in note_ids:
+            window = self.open_windows.get(note_id)
+            if window is not None and window.winfo_exists():
+                window._update_note_data()
+    
+    def _apply_changes(self, changes: Mapping[str, Mapping[str, Any]], status_key: str,
+                       label_key: str) -> List[NoteData]:
+        """付箋データを一括変更し、ウィンドウの開閉や表示に反映（label_key は元に戻すときの操作名）"""
+        if not changes:
+            return []
+        
+        before = {note_id: self._snapshot([note_id], fields)[note_id] for note_id, fields in changes.items()}
+        notes = self.note_service.update_many(changes)
+        self._record_undo(label_key, before, self._capture_states(before))
+        self._sync_windows(notes, changes)
+        self._notify_batch_change(status_key, len(notes))
+        return notes
+    
+    def _sync_windows(self, notes: Iterable[NoteData], changes: Mapping[str, Iterable[str]]) -> None:
+        """変更された付箋に合わせてウィンドウを開閉し、表示を更新（changes は ID -> 変更された項目）"""
+        for note in notes:
+            window = self.open_windows.get(note.id)
+            if window is not None and not window.winfo_exists():
+                self._discard_window(note.id)
+                window = None
+            
+            if note.is_open and window is None:
+                self._create_note_window(note)
+            elif not note.is_open and window is not None:
+                self._discard_window(note.id)
+            elif window is not None:
+                fields = set(changes[note.id])
+                if fields <= {"color"}:
+                    window.apply_color_change(note.color)
+                else:
+                    window.reload_note_data(reload_text="text" in fields)
+                    if note.x is not None and note.y is not None:
+                        self.placement_service.register(note.id, note.x, note.y, note.width, note.height)
+    
+    def _check_external_changes(self) -> bool:
+        """他プロセスによる変更を確認して取り込む（FileWatcherから定期的に呼ばれる）"""
+        if not self.storage_service.has_external_changes():
+            return False
+        # 編集中で未保存の本文や位置を先に取り込み、手元の変更として扱われるようにする
+        self._capture_window_state(list(self.open_windows))
+        return bool(self.note_service.sync_external_changes())
+    
+    def _on_external_change(self, changes: ExternalChanges) -> None:
+        """他プロセスによる変更が取り込まれたとき、変更された付箋のウィンドウとリストだけを更新"""
+        for old_id, new_id in changes.renamed.items():
+            window = self.open_windows.pop(old_id, None)
+            if window is not None:
+                self.open_windows[new_id] = window
+            self.placement_service.unregister(old_id)
+        
+        for note in changes.removed:
+            self._discard_window(note.id)
+        
+        fields: Dict[str, Iterable[str]] = dict(changes.updated)
+        fields.update((note.id, CONTENT_FIELDS) for note in changes.added)
+        notes = [note for note in map(self.note_service.find, fields) if note]
+        self._sync_windows(notes, fields)
+        
+        self._notify_batch_change("status_external_changes", changes.count)
+    
+    # 元に戻す・やり直し
+    
+    def undo(self) -> None:
+        """直前の操作を元に戻す"""
+        self._replay(self.undo_log.undo(self._current_states), "status_undone", "status_nothing_to_undo")
+    
+    def redo(self) -> None:
+        """元に戻した操作をやり直す"""
+        self._replay(self.undo_log.redo(self._current_states), "status_redone", "status_nothing_to_redo")
+    
+    def _replay(self, result: Optional[tuple], status_key: str, empty_status_key: str) -> None:
+        """元に戻す・やり直しで得た状態を適用して通知"""
+        if result is None:
+            if self.on_status_update:
+                self.on_status_update(self.language_service.translate(empty_status_key))
+            return
+        
+        label_key, states = result
+        self._apply_states(states)
+        if self.on_trash_changed:
+            self.on_trash_changed()
+        
+        if self.on_status_update:
+            label = self.language_service.translate(label_key)
+            self.on_status_update(self.language_service.translate(status_key, label))
+        
+        if self.on_notes_changed:
+            self.on_notes_changed(self.all_notes)
+    
+    def _apply_states(self, states: NoteStates) -> None:
+        """記録した状態を付箋に適用（保存は通常の操作と同じ経路でまとめて1回）"""
+        removed = [note_id for note_id, state in states.items()
+                   if state is None and self.note_service.find(note_id)]
+        for note_id in removed:
+            self._discard_window(note_id)
+        self.note_service.delete_many(removed)
+        
+        changes = {note_id: {name: value for name, value in state.items() if name in EDITABLE_FIELDS}
+                   for note_id, state in states.items()
+                   if state is not None and self.note_service.find(note_id)}
+        restored = [NoteData.from_dict(state) for note_id, state in states.items()
+                    if state is not None and "id" in state and not self.note_service.find(note_id)]
+        self._capture_window_state(changes)
+        notes = self.note_service.update_many(changes)
+        notes += self.note_service.add_all(restored)
+        changes.update((note.id, CONTENT_FIELDS) for note in restored)
+        self._sync_windows(notes, changes)
+    
+    def _snapshot(self, note_ids: Iterable[str], fields: Optional[Iterable[str]] = None) -> NoteStates:
+        """付箋の現在の状態（fields を省略すると付箋全体、存在しない付箋はNone）"""
+        states: NoteStates = {}
+        for note_id in note_ids:
+            note = self.note_service.find(note_id)
+            if note is None:
+                states[note_id] = None
+            elif fields is None:
+                states[note_id] = note.to_dict()
+            else:
+                states[note_id] = {name: getattr(note, name) for name in fields}
+        return states
+    
+    def _capture_states(self, template: NoteStates) -> NoteStates:
+        """template と同じ付箋・項目について現在の状態を取得"""
+        states: NoteStates = {}
+        for note_id, state in template.items():
+            fields = None if state is None or "id" in state else state.keys()
+            states.update(self._snapshot([note_id], fields))
+        return states
+    
+    def _current_states(self, template: NoteStates) -> NoteStates:
+        """編集中の本文や位置を取り込んでから、template と同じ付箋・項目の現在の状態を取得"""
+        self._capture_window_state(template)
+        return self._capture_states(template)
+    
+    def _record_undo(self, label_key: str, before: NoteStates, after: NoteStates) -> None:
+        """操作を元に戻せるよう記録"""
+        if before or after:
+            self.undo_log.record(label_key, before, after)
+    
+    def show_quick_open(self) -> None:
+        """クイックオープンを表示（選んだ付箋を開く）"""
+        if self.main_window is None or not self.note_service.is_loaded:
+            return
+        items = self._quick_open_index.items(self.note_service.notes, self.language_service)
+        ranks = self.recent_notes.ranks() if self.recent_notes is not None else {}
+        window = QuickOpenWindow(self.main_window, QuickOpenMatcher(items, ranks))
+        window.on_open = self.open_note_by_id
+    
+    def _record_recent(self, note_ids: Iterable[str]) -> None:
+        """最近開いた付箋として記録"""
+        if self.recent_notes is None:
+            return
+        try:
+            self.recent_notes.record(note_ids)
+        except OSError as e:
+            self.storage_service.notify_error(f"最近開いた付箋の保存中にエラーが発生しました: {e}")
+    
+    def show_history(self, note_id: str) -> None:
+        """付箋の履歴ビューアを表示"""
+        store = self.note_service.history
+        if store is None or not self.note_service.find(note_id):
+            return
+        
+        # 未保存の本文を最新の版として記録してから一覧を取得
+        self.note_service.flush()
+        revisions = store.list_revisions(note_id)
+        if not revisions:
+            UIService.show_info(self.language_service.translate("msg_no_history"))
+            return
+        
+        window = HistoryWindow(self.main_window, note_id, revisions,
+                               lambda number: store.get_text(note_id, number))
+        window.on_restore = self.restore_revision
+    
+    def restore_revision(self, note_id: str, text: str) -> None:
+        """付箋の本文を過去の版に戻す（戻した本文も新しい版として記録される）"""
+        if not self.note_service.find(note_id):
+            return
+        
+        changes = {note_id: {"text": text}}
+        before = self._snapshot([note_id], ["text"])
+        notes = self.note_service.update_many(changes)
+        self._record_undo("history", before, self._capture_states(before))
+        self._sync_windows(notes, changes)
+        
+        if self.on_status_update:
+            self.on_status_update(self.language_service.translate("status_history_restored", note_id))
+        
+        if self.on_notes_changed:
+            self.on_notes_changed(self.all_notes)
+    
+    def delete_many(self, note_ids: Iterable[str]) -> List[NoteData]:
+        """複数の付箋をごみ箱に移す（保存・変更通知は1回だけ）"""
+        note_ids = list(note_ids)
+        self._thaw(note_ids)
+        note_ids = [note_id for note_id in note_ids if self.note_service.find(note_id)]
+        if not note_ids:
+            return []
+        
+        self._capture_window_state(note_ids)
+        before = self._snapshot(note_ids)
+        for note_id in note_ids:
+            self._discard_window(note_id)
+        deleted = self.note_service.delete_many(note_ids)
+        self._record_undo("delete", before, dict.fromkeys(note_ids))
+        
+        self._notify_batch_change("status_trashed_many", len(deleted))
+        if self.on_trash_changed:
+            self.on_trash_changed()
+        return deleted
+    
+    # アーカイブファイル
+    
+    def archive_cold_notes(self, max_age_days: float) -> List[NoteData]:
+        """閉じたまま長く変更されていない付箋をアーカイブファイルに移す（元に戻すの対象にはしない）"""
+        notes = self.note_service.archive_cold(max_age_days, exclude=self.open_windows)
+        if not notes:
+            return notes
+        if self._cold_notes is not None:
+            self._cold_notes.update((note.id, note) for note in notes)
+            self._notify_cold_notes_changed()
+        self._notify_batch_change("status_cold_archived_many", len(notes))
+        return notes
+    
+    def set_include_cold_archive(self, include: bool) -> None:
+        """アーカイブファイルの付箋を一覧の検索対象に含める（含める間だけ展開してメモリに置く）"""
+        archive = self.note_service.cold_archive
+        if not include or archive is None:
+            self._cold_notes = None
+        else:
+            try:
+                self._cold_notes = {note.id: note for note in archive.iter_notes()}
+            except (OSError, ValueError) as e:
+                self.storage_service.notify_error(f"アーカイブファイルの読み込み中にエラーが発生しました: {e}")
+                self._cold_notes = None
+        self._notify_cold_notes_changed()
+    
+    def _thaw(self, note_ids: Iterable[str]) -> None:
+        """アーカイブファイルに移した付箋をデータファイル側に戻す（開く・変更する前に呼ぶ）"""
+        cold_ids = [note_id for note_id in note_ids if self.note_service.is_in_cold_archive(note_id)]
+        if not cold_ids:
+            return
+        thawed = self.note_service.thaw(cold_ids)
+        if not thawed:
+            return
+        if self._cold_notes is not None:
+            for note in thawed:
+                self._cold_notes.pop(note.id, None)
+            self._notify_cold_notes_changed()
+        if self.on_notes_changed:
+            self.on_notes_changed(self.all_notes)
+    
+    def _notify_cold_notes_changed(self) -> None:
+        """一覧に表示するアーカイブファイルの付箋が変わったことを通知"""
+        if self.on_cold_notes_changed:
+            self.on_cold_notes_changed(list(self._cold_notes.values()) if self._cold_notes is not None else [])
+    
+    # ごみ箱
+    
+    def restore_from_trash(self, note_ids: Iterable[str]) -> List[NoteData]:
+        """ごみ箱の付箋を元に戻す"""
+        notes = self.note_service.restore_from_trash(note_ids)
+        note_ids = [note.id for note in notes]
+        self._record_undo("restore_from_trash", dict.fromkeys(note_ids), self._snapshot(note_ids))
+        
+        self._notify_batch_change("status_restored_many", len(notes))
+        if self.on_trash_changed:
+            self.on_trash_changed()
+        return notes
+    
+    def purge_from_trash(self, note_ids: Iterable[str]) -> int:
+        """ごみ箱の付箋を確認してから完全に削除"""
+        trash = self.note_service.trash
+        note_ids = list(note_ids)
+        if trash is None or not note_ids or not UIService.confirm_delete(len(note_ids)):
+            return 0
+        
+        count = trash.purge(note_ids)
+        self._notify_trash_purged(count)
+        return count
+    
+    def empty_trash(self) -> int:
+        """ごみ箱を確認してから空にする"""
+        trash = self.note_service.trash
+        if trash is None:
+            return 0
+        items = trash.list_items()
+        if not items or not UIService.confirm_delete(len(items)):
+            return 0
+        
+        count = trash.purge_all()
+        self._notify_trash_purged(count)
+        return count
+    
+    def _notify_trash_purged(self, count: int) -> None:
+        """ごみ箱から完全に削除したことを通知"""
+        if not count:
+            return
+        if self.on_status_update:
+            self.on_status_update(self.language_service.translate("status_purged_many", count))
+        if self.on_trash_changed:
+            self.on_trash_changed()
+    
+    def _notify_batch_change(self, status_key: str, count: int) -> None:
+        """一括操作の結果をステータスと付箋リストに1回だけ通知"""
+        if not count:
+            return
+        
+        if self.on_status_update:
+            self.on_status_update(self.language_service.translate(status_key, count))
+        
+        if self.on_notes_changed:
+            self.on_notes_changed(self.all_notes)
+    
     def change_note_color(self, note_id: str, new_color: str = None) -> None:
         """付箋の色を変更"""
-        note = self._find_note_by_id(note_id)
+        note = self.note_service.find(note_id)
         if not note:
             return
         
@@ -113,7 +589,9 @@ class NoteController:
                 return
         
         # データを更新
-        note.color = new_color
+        before = self._snapshot([note_id], ["color"])
+        self.note_service.set_color(note_id, new_color)
+        self._record_undo("color_change", before, self._capture_states(before))
         
         # 開いているウィンドウに適用
         if note_id in self.open_windows:
@@ -121,45 +599,70 @@ class NoteController:
             if window.winfo_exists():
                 window.apply_color_change(new_color)
         
-        self.storage_service.save_all_notes(self.all_notes)
-        
         if self.on_status_update:
             self.on_status_update(self.language_service.translate("status_color_changed", note_id))
         
         if self.on_notes_changed:
             self.on_notes_changed(self.all_notes)
     
+    def arrange_all_notes(self) -> None:
+        """開いている付箋を画面上にタイル状に整列"""
+        windows = [(note_id, window) for note_id, window in sorted(self.open_windows.items())
+                   if window.winfo_exists()]
+        if not windows or not self.main_window:
+            return
+        
+        sizes = [(note_id, window.winfo_width(), window.winfo_height()) for note_id, window in windows]
+        positions = self.placement_service.arrange(
+            sizes, self.main_window.winfo_screenwidth(), self.main_window.winfo_screenheight())
+        
+        before = self._snapshot([note_id for note_id, _ in windows], ["x", "y"])
+        self.placement_service.clear()
+        for note_id, width, height in sizes:
+            x, y = positions[note_id]
+            self.open_windows[note_id].move_to(x, y)
+            self.placement_service.register(note_id, x, y, width, height)
+        self._record_undo("arrange_all", before, self._capture_states(before))
+        
+        self.note_service.save(before)
+        
+        if self.on_status_update:
+            self.on_status_update(self.language_service.translate("status_arranged", len(windows)))
+        
+        if self.on_notes_changed:
+            self.on_notes_changed(self.all_notes)
+    
     def get_all_notes(self) -> List[NoteData]:
         """すべての付箋データを取得"""
-        return self.all_notes.copy()
+        return self.note_service.get_all()
     
     def get_note_by_id(self, note_id: str) -> Optional[NoteData]:
-        """指定したIDの付箋データを取得"""
-        return self._find_note_by_id(note_id)
+        """指定したIDの付箋データを取得（一覧に表示中のアーカイブファイルの付箋も含む）"""
+        note = self.note_service.find(note_id)
+        if note is None and self._cold_notes is not None:
+            note = self._cold_notes.get(note_id)
+        return note
     
     def refresh_notes(self) -> None:
         """付箋リストを更新"""
+        if not self.is_loaded:
+            return
+        
         # 開いているウィンドウの状態を更新
         for note_id, window in list(self.open_windows.items()):
             if window.winfo_exists():
-                note = self._find_note_by_id(note_id)
-                if note:
+                if self.note_service.find(note_id):
                     window._update_note_data()
                     # データを更新
-                    for i, existing_note in enumerate(self.all_notes):
-                        if existing_note.id == note_id:
-                            self.all_notes[i] = window.note_data
-                            break
+                    self.note_service.update(window.note_data, save=False)
             else:
                 # ウィンドウが閉じられている場合
                 del self.open_windows[note_id]
+                self.placement_service.unregister(note_id)
         
         # 閉じている付箋の状態を更新
-        open_note_ids = set(self.open_windows.keys())
-        for note in self.all_notes:
-            note.is_open = note.id in open_note_ids
-        
-        self.storage_service.save_all_notes(self.all_notes)
+        self.note_service.sync_open_state(self.open_windows.keys())
+        self.note_service.save(self.open_windows.keys())
         
         if self.on_notes_changed:
             self.on_notes_changed(self.all_notes)
@@ -170,41 +673,72 @@ class NoteController:
     
     def shutdown(self) -> None:
         """シャットダウン処理"""
+        if not self.is_loaded:
+            return
+        
+        if self.file_watcher is not None:
+            self.file_watcher.stop()
+        
         # 開いている付箋を「前回開いていた付箋」としてマーク
-        for note in self.all_notes:
-            if note.is_open:
-                note.was_open = True
+        self.note_service.mark_open_notes_for_restore()
         
         self.save_all_notes()
+        self.note_service.flush()
+        self.storage_service.sync_to_disk()
     
+    @timed("controller.create_note_window")
     def _create_note_window(self, note: NoteData) -> StickyNoteWindow:
         """付箋ウィンドウを作成"""
+        self._place_note(note)
         window = StickyNoteWindow(self.main_window, note)  # メインウィンドウをmasterとして渡す
         
         # コールバックを設定
         window.on_save = self._on_note_saved
         window.on_close = self._on_note_closed
         window.on_color_change = self._on_note_color_changed
+        window.on_show_history = self.show_history
         
         self.open_windows[note.id] = window
+        if note.x is not None and note.y is not None:
+            self.placement_service.register(note.id, note.x, note.y, note.width, note.height)
         return window
     
-    def _find_note_by_id(self, note_id: str) -> Optional[NoteData]:
-        """指定したIDの付箋を検索"""
-        for note in self.all_notes:
-            if note.id == note_id:
-                return note
-        return None
+    def _discard_window(self, note_id: str) -> None:
+        """付箋ウィンドウを保存せずに閉じ、配置情報からも取り除く"""
+        window = self.open_windows.pop(note_id, None)
+        if window is not None and window.winfo_exists():
+            window.destroy()
+        self.placement_service.unregister(note_id)
+    
+    def _place_note(self, note: NoteData) -> None:
+        """位置未設定または画面外の付箋に、他の付箋と重ならない位置を割り当てる"""
+        if not self.main_window:
+            return
+        
+        # セカンダリモニタ上の付箋を動かさないよう、仮想デスクトップ全体で判定する
+        window = self.main_window
+        if (note.x is not None and note.y is not None and
+                self.placement_service.is_on_screen(note.x, note.y, note.width, note.height,
+                                                    window.winfo_vrootwidth(),
+                                                    window.winfo_vrootheight(),
+                                                    window.winfo_vrootx(),
+                                                    window.winfo_vrooty())):
+            return
+        
+        screen_width = window.winfo_screenwidth()
+        screen_height = window.winfo_screenheight()
+        
+        note.x, note.y = self.placement_service.find_free_position(
+            note.width, note.height, screen_width, screen_height)
     
     def _on_note_saved(self, note_data: NoteData) -> None:
         """付箋が保存されたときのコールバック"""
-        # データを更新
-        for i, note in enumerate(self.all_notes):
-            if note.id == note_data.id:
-                self.all_notes[i] = note_data
-                break
+        if note_data.id in self.open_windows and note_data.x is not None and note_data.y is not None:
+            self.placement_service.register(note_data.id, note_data.x, note_data.y,
+                                            note_data.width, note_data.height)
         
-        self.storage_service.save_all_notes(self.all_notes)
+        # データを更新
+        self.note_service.update(note_data)
         
         if self.on_notes_changed:
             self.on_notes_changed(self.all_notes)
@@ -213,19 +747,14 @@ class NoteController:
         """付箋が閉じられたときのコールバック"""
         if note_id in self.open_windows:
             del self.open_windows[note_id]
+        self.placement_service.unregister(note_id)
         
         # データの状態を更新
-        note = self._find_note_by_id(note_id)
-        if note:
-            note.is_open = False
-            note.was_open = True
-        
-        self.storage_service.save_all_notes(self.all_notes)
+        self.note_service.set_open(note_id, False)
         
         if self.on_notes_changed:
             self.on_notes_changed(self.all_notes)
     
     def _on_note_color_changed(self, note_id: str, new_color: str) -> None:
-        """付箋の色が変更されたときのコールバック"""
-        if self.on_notes_changed:
-            self.on_notes_changed(self.all_notes)
+        """付箋ウィンドウで色が選ばれたときのコールバック（メインウィンドウからの変更と同じく元に戻せる）"""
+        self.change_note_color(note_id, new_color)
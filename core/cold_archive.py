@@ -0,0 +1,255 @@
+"""アーカイブファイル - 長く使われていない付箋を圧縮して別ファイルに保管する（GUIに依存しない）
+
+閉じたまま長期間変更されていない付箋は、データファイルの隣の圧縮ファイル（<データファイル>.archive）に移す。
+移した付箋は起動時の読み込み・保存・通常の検索の対象にならない。
+付箋は COLD_ARCHIVE_BLOCK_NOTES 件ずつ1つのブロックにまとめて圧縮して追記し、
+付箋ID -> ブロックの位置 の軽い索引（<データファイル>.archive.idx.json）だけを読み込んでおく。
+付箋を取り出すときは、その付箋を含むブロックだけを展開する。
+取り出した付箋の領域は索引から外すだけにしておき、その割合が COLD_ARCHIVE_COMPACT_RATIO を超えたら詰め直す。
+GUIとCLIが同時に書き換えないよう、追記・詰め直し・索引の書き込みはデータファイルと同じロックの中で行う。
+"""
+import contextlib
+import json
+import lzma
+import os
+import tempfile
+import zlib
+from datetime import datetime
+from typing import ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple
+from models.note_model import NoteData
+from core.search import note_matches
+from utils.constants import COLD_ARCHIVE_CODEC, COLD_ARCHIVE_BLOCK_NOTES, COLD_ARCHIVE_COMPACT_RATIO, ID_DATE_FORMAT
+
+# 圧縮方式 -> (圧縮, 展開)
+CODECS = {
+    "zlib": (lambda data: zlib.compress(data, 9), zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+# ブロックの位置・長さ・圧縮方式
+Block = Tuple[int, int, str]
+
+
+def last_touched(note: NoteData) -> Optional[float]:
+    """付箋が最後に変更された時刻（記録がなければIDの作成日時、どちらもなければNone）"""
+    if note.updated_at:
+        return note.updated_at
+    try:
+        return datetime.strptime(note.id[:14], ID_DATE_FORMAT).timestamp()
+    except ValueError:
+        return None
+
+
+def is_cold(note: NoteData, cutoff: float) -> bool:
+    """閉じていて、cutoff より前から変更されていない付箋か"""
+    if note.is_open:
+        return False
+    touched = last_touched(note)
+    return touched is not None and touched < cutoff
+
+
+class ColdArchive:
+    """長く使われていない付箋の圧縮保管ファイル（メインスレッドから使う）"""
+    
+    def __init__(self, path: str, index_path: str, codec: str = COLD_ARCHIVE_CODEC,
+                 block_notes: int = COLD_ARCHIVE_BLOCK_NOTES, compact_ratio: float = COLD_ARCHIVE_COMPACT_RATIO,
+                 lock: Optional[ContextManager] = None):
+        if codec not in CODECS:
+            raise ValueError(f"未対応の圧縮方式です: {codec}")
+        self.path = path
+        self.index_path = index_path
+        self.codec = codec
+        self.block_notes = max(1, block_notes)
+        self.compact_ratio = compact_ratio
+        # 他プロセスの書き込みと排他するロック（データファイルのロックを渡す。省略すると排他しない）
+        self.lock = lock if lock is not None else contextlib.nullcontext()
+        self._notes: Optional[Dict[str, Block]] = None  # 付箋ID -> ブロック（読み込むまではNone）
+        self._refs: Dict[Block, int] = {}  # ブロック -> 保管中の付箋の数
+        self._garbage = 0  # 取り出し済みの付箋だけになったブロックの合計バイト数
+        self._index_signature: Optional[Tuple[int, int]] = None
+    
+    # 参照
+    
+    def __contains__(self, note_id: str) -> bool:
+        self._ensure_loaded()
+        return note_id in self._notes
+    
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._notes)
+    
+    def iter_notes(self) -> Iterator[NoteData]:
+        """保管しているすべての付箋（ブロックごとに展開しながら返す）"""
+        self._ensure_loaded()
+        if not self._notes:
+            return
+        notes = self._notes
+        with open(self.path, "rb") as f:
+            for block in sorted(self._refs):
+                for note in self._read_block(f, block):
+                    if notes.get(note.id) == block:
+                        yield note
+    
+    def load_all(self) -> List[NoteData]:
+        """保管しているすべての付箋を展開して取得"""
+        return list(self.iter_notes())
+    
+    def search(self, query: str) -> List[NoteData]:
+        """IDまたは本文にクエリを含む付箋を大文字小文字を区別せずに検索"""
+        query = query.lower()
+        return [note for note in self.iter_notes() if note_matches(note, query)]
+    
+    # 更新
+    
+    def add(self, notes: Iterable[NoteData]) -> int:
+        """付箋を圧縮して追記（付箋の保存より先に書くので、途中で終了しても付箋は失われない）"""
+        notes = list(notes)
+        if not notes:
+            return 0
+        with self.lock:
+            self._ensure_loaded()
+            for note_id, block in self._write_blocks(self.path, notes):
+                if note_id in self._notes:
+                    self._forget(note_id)
+                self._remember(note_id, block)
+            self._save_index()
+        return len(notes)
+    
+    def take(self, note_ids: Iterable[str]) -> List[NoteData]:
+        """付箋を取り出す（取り出した付箋は保管対象から外れる）"""
+        with self.lock:
+            self._ensure_loaded()
+            targets: Dict[Block, set] = {}
+            for note_id in note_ids:
+                block = self._notes.get(note_id)
+                if block is not None:
+                    targets.setdefault(block, set()).add(note_id)
+            if not targets:
+                return []
+            
+            taken = []
+            with open(self.path, "rb") as f:
+                for block, ids in sorted(targets.items()):
+                    taken.extend(note for note in self._read_block(f, block) if note.id in ids)
+            self.discard(note.id for note in taken)
+            return taken
+    
+    def discard(self, note_ids: Iterable[str]) -> None:
+        """保管対象から外す（付箋がデータファイル側に戻った場合）"""
+        with self.lock:
+            self._ensure_loaded()
+            removed = [note_id for note_id in note_ids if note_id in self._notes]
+            if not removed:
+                return
+            for note_id in removed:
+                self._forget(note_id)
+            if self._should_compact():
+                self.compact()
+            else:
+                self._save_index()
+    
+    def compact(self) -> None:
+        """保管中の付箋だけでファイルを書き直す（一時ファイル経由）"""
+        with self.lock:
+            notes = self.load_all()
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, temp_path = tempfile.mkstemp(prefix=".free_sticky_archive_", suffix=".tmp", dir=directory)
+            os.close(fd)
+            try:
+                entries = self._write_blocks(temp_path, notes)
+                os.replace(temp_path, self.path)
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            self._notes = {}
+            self._refs = {}
+            self._garbage = 0
+            for note_id, block in entries:
+                self._remember(note_id, block)
+            self._save_index()
+    
+    # 内部処理
+    
+    def _write_blocks(self, path: str, notes: List[NoteData]) -> List[Tuple[str, Block]]:
+        """付箋を block_notes 件ずつ圧縮してファイルに追記し、付箋IDと書き込んだブロックの組を返す"""
+        compress = CODECS[self.codec][0]
+        entries = []
+        with open(path, "ab") as f:
+            offset = f.tell()
+            for start in range(0, len(notes), self.block_notes):
+                chunk = notes[start:start + self.block_notes]
+                payload = json.dumps([note.to_dict() for note in chunk], ensure_ascii=False).encode("utf-8")
+                data = compress(payload)
+                f.write(data)
+                entries.extend((note.id, (offset, len(data), self.codec)) for note in chunk)
+                offset += len(data)
+            f.flush()
+            os.fsync(f.fileno())
+        return entries
+    
+    def _remember(self, note_id: str, block: Block) -> None:
+        """索引に追加"""
+        self._notes[note_id] = block
+        self._refs[block] = self._refs.get(block, 0) + 1
+    
+    def _forget(self, note_id: str) -> None:
+        """索引から外し、ブロックが空になったらその領域を取り出し済みとして数える"""
+        block = self._notes.pop(note_id)
+        self._refs[block] -= 1
+        if not self._refs[block]:
+            del self._refs[block]
+            self._garbage += block[1]
+    
+    def _should_compact(self) -> bool:
+        """取り出し済みの領域が多くなったか"""
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        return size > 0 and self._garbage / size > self.compact_ratio
+    
+    @staticmethod
+    def _read_block(f, block: Block) -> List[NoteData]:
+        """ブロックを展開して付箋を取得"""
+        offset, length, codec = block
+        f.seek(offset)
+        payload = CODECS[codec][1](f.read(length))
+        return [NoteData.from_dict(data) for data in json.loads(payload.decode("utf-8"))]
+    
+    def _ensure_loaded(self) -> None:
+        """索引を読み込む（他のプロセスが書き換えていれば読み直す）"""
+        signature = self._get_index_signature()
+        if self._notes is not None and signature == self._index_signature:
+            return
+        self._notes = {}
+        self._refs = {}
+        self._garbage = 0
+        self._index_signature = signature
+        if signature is None:
+            return
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for note_id, block in data.get("notes", {}).items():
+            self._remember(note_id, tuple(block))
+        self._garbage = data.get("garbage", 0)
+    
+    def _save_index(self) -> None:
+        """索引を一時ファイル経由で保存"""
+        data = {"notes": self._notes, "garbage": self._garbage}
+        directory = os.path.dirname(os.path.abspath(self.index_path))
+        fd, temp_path = tempfile.mkstemp(prefix=".free_sticky_archive_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.index_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._index_signature = self._get_index_signature()
+    
+    def _get_index_signature(self) -> Optional[Tuple[int, int]]:
+        """索引ファイルの更新時刻とサイズ（存在しなければNone）"""
+        try:
+            stat = os.stat(self.index_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
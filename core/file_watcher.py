@@ -0,0 +1,58 @@
+"""ファイル監視 - データファイルの変更を定期的に確認する"""
+from typing import Any, Callable, Optional
+from utils.constants import FILE_WATCH_MIN_INTERVAL, FILE_WATCH_MAX_INTERVAL
+
+
+class FileWatcher:
+    """check を定期的に呼び出し、変更がない間は確認間隔を倍々に延ばす監視役
+    
+    check は変更を検出して処理した場合にTrueを返す関数（ファイルの更新時刻とサイズの比較など）。
+    schedule / cancel にはTkの after / after_cancel のような関数を渡す。
+    """
+    
+    def __init__(self, check: Callable[[], bool],
+                 schedule: Callable[[int, Callable[[], None]], Any],
+                 cancel: Callable[[Any], None],
+                 min_interval: int = FILE_WATCH_MIN_INTERVAL,
+                 max_interval: int = FILE_WATCH_MAX_INTERVAL):
+        self._check = check
+        self._schedule = schedule
+        self._cancel = cancel
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._job: Optional[Any] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """監視中か"""
+        return self._job is not None
+    
+    def start(self) -> None:
+        """監視を開始"""
+        if self._job is None:
+            self.interval = self.min_interval
+            self._job = self._schedule(self.interval, self._poll)
+    
+    def stop(self) -> None:
+        """監視を停止"""
+        if self._job is not None:
+            try:
+                self._cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+    
+    def _poll(self) -> None:
+        """変更を確認し、次の確認を予約"""
+        self._job = None
+        changed = False
+        try:
+            changed = self._check()
+        finally:
+            # 例外が起きても監視は続ける
+            if changed:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.interval * 2, self.max_interval)
+            self._job = self._schedule(self.interval, self._poll)
@@ -0,0 +1,292 @@
+"""付箋の履歴 - 本文の過去の版を差分で保存し、任意の版を復元する（GUIに依存しない）
+
+履歴はデータファイルの隣の JSON Lines ファイル（<データファイル>.history.jsonl）に追記する。
+各版は直前の版からの差分（コピーする範囲と挿入する文字列の列）として保存し、
+HISTORY_KEYFRAME_INTERVAL 版ごと（または差分が本文より大きくなる場合）に本文全体（キーフレーム）を保存する。
+そのため、どの版も最大 HISTORY_KEYFRAME_INTERVAL - 1 回の差分の適用で復元できる。
+
+保存期間は版数（付箋ごと）・経過日数・ファイル全体のサイズで制限し、
+BackgroundPruner（core/pruner.py）からバックグラウンドスレッドで定期的に prune を呼び出して古い版を削除する。
+"""
+import difflib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from utils.constants import (
+    HISTORY_KEYFRAME_INTERVAL, HISTORY_MAX_REVISIONS, HISTORY_MAX_AGE_DAYS, HISTORY_MAX_BYTES
+)
+
+
+def make_delta(old: str, new: str) -> List[Any]:
+    """old から new を作る差分（[開始, 終了] は old からのコピー、文字列は挿入）"""
+    ops: List[Any] = []
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif tag in ("replace", "insert"):
+            ops.append(new[j1:j2])
+    return ops
+
+
+def apply_delta(old: str, ops: Iterable[Any]) -> str:
+    """差分を適用して次の版の本文を作る"""
+    parts = []
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            parts.append(old[op[0]:op[1]])
+    return "".join(parts)
+
+
+@dataclass
+class Revision:
+    """履歴の1版（一覧表示用）"""
+    note_id: str
+    number: int
+    timestamp: float
+    length: int  # 本文の文字数
+    is_keyframe: bool
+
+
+def _encode(entry: Dict[str, Any]) -> str:
+    """ファイルに書き込む1行"""
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+
+class RevisionStore:
+    """付箋ごとの本文の履歴を差分で保存するストア
+    
+    記録はメインスレッドの保存処理から、削除はバックグラウンドのスレッドから呼ばれるので、
+    すべての操作をロックで排他する。
+    """
+    
+    def __init__(self, path: str, keyframe_interval: int = HISTORY_KEYFRAME_INTERVAL,
+                 max_revisions: int = HISTORY_MAX_REVISIONS, max_age_days: float = HISTORY_MAX_AGE_DAYS,
+                 max_bytes: int = HISTORY_MAX_BYTES):
+        self.path = path
+        self.keyframe_interval = max(1, keyframe_interval)
+        # 0 以下は無制限
+        self.max_revisions = max_revisions
+        self.max_age_days = max_age_days
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # 付箋ID -> 古い順の版（ファイルの1行の辞書に "size"（バイト数）を加えたもの）
+        self._entries: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._latest_text: Dict[str, str] = {}  # 付箋ID -> 最新の版の本文（差分を作るためのキャッシュ）
+        self._total_bytes = 0
+    
+    @property
+    def total_bytes(self) -> int:
+        """履歴ファイルのおおよそのサイズ"""
+        with self._lock:
+            self._ensure_loaded()
+            return self._total_bytes
+    
+    def record(self, note_id: str, text: str, timestamp: Optional[float] = None) -> bool:
+        """付箋の本文を新しい版として記録（最新の版と同じ本文なら何もしない）"""
+        return self.record_many([(note_id, text, timestamp)]) > 0
+    
+    def record_many(self, items: Iterable[Tuple[str, str, Optional[float]]]) -> int:
+        """複数の付箋の本文をまとめて記録し、記録した版の数を返す（ファイルへの追記は1回）"""
+        with self._lock:
+            self._ensure_loaded()
+            lines = []
+            for note_id, text, timestamp in items:
+                entry = self._make_entry(note_id, text, timestamp or time.time())
+                if entry is None:
+                    continue
+                line = _encode(entry)
+                entry["size"] = len(line.encode("utf-8")) + 1
+                self._entries.setdefault(note_id, []).append(entry)
+                self._latest_text[note_id] = text
+                self._total_bytes += entry["size"]
+                lines.append(line)
+            
+            if lines:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines))
+                    f.write("\n")
+            return len(lines)
+    
+    def _make_entry(self, note_id: str, text: str, timestamp: float) -> Optional[Dict[str, Any]]:
+        """前の版と比べて新しい版の行を作成（変化がなければNone）"""
+        entries = self._entries.get(note_id)
+        if not entries:
+            return {"id": note_id, "n": 1, "t": timestamp, "k": text}
+        
+        previous = self._latest_text.get(note_id)
+        if previous is None:
+            previous = self._rebuild(entries, len(entries) - 1)
+        if previous == text:
+            return None
+        
+        last = entries[-1]
+        number = last["n"] + 1
+        since_keyframe = next(i for i, entry in enumerate(reversed(entries)) if "k" in entry) + 1
+        if since_keyframe < self.keyframe_interval:
+            ops = make_delta(previous, text)
+            # 差分が本文より大きくなる（ほぼ全体の書き換え）場合は本文をそのまま保存する
+            if len(_encode(ops)) < len(text):
+                return {"id": note_id, "n": number, "t": timestamp, "d": ops}
+        return {"id": note_id, "n": number, "t": timestamp, "k": text}
+    
+    def list_revisions(self, note_id: str) -> List[Revision]:
+        """付箋の版の一覧を新しい順に取得"""
+        with self._lock:
+            self._ensure_loaded()
+            entries = self._entries.get(note_id, [])
+            revisions = []
+            text = ""
+            for entry in entries:
+                text = entry["k"] if "k" in entry else apply_delta(text, entry["d"])
+                revisions.append(Revision(note_id, entry["n"], entry["t"], len(text), "k" in entry))
+            revisions.reverse()
+            return revisions
+    
+    def get_text(self, note_id: str, number: int) -> Optional[str]:
+        """指定した版の本文を復元（直前のキーフレームから差分を順に適用する）"""
+        with self._lock:
+            self._ensure_loaded()
+            entries = self._entries.get(note_id, [])
+            for index, entry in enumerate(entries):
+                if entry["n"] == number:
+                    return self._rebuild(entries, index)
+            return None
+    
+    def _rebuild(self, entries: List[Dict[str, Any]], index: int) -> str:
+        """entries[index] の本文を復元"""
+        start = index
+        while "k" not in entries[start]:
+            start -= 1
+        text = entries[start]["k"]
+        for entry in entries[start + 1:index + 1]:
+            text = apply_delta(text, entry["d"])
+        return text
+    
+    def prune(self, now: Optional[float] = None) -> int:
+        """保存期間を過ぎた古い版を削除してファイルを書き直し、削除した版の数を返す"""
+        with self._lock:
+            self._ensure_loaded()
+            now = now if now is not None else time.time()
+            removed = 0
+            while True:
+                count = self._prune_once(now)
+                removed += count
+                # 残る最初の差分をキーフレームに置き換えて大きくなり、まだ上限を超えていれば続けて削除する
+                if not count or self.max_bytes <= 0 or self._total_bytes <= self.max_bytes:
+                    return removed
+    
+    def _prune_once(self, now: float) -> int:
+        """削除する版を決めて1回書き直し、削除した版の数を返す（ロックを取得した状態で呼ぶ）"""
+        drop: Dict[str, int] = {}  # 付箋ID -> 先頭から削除する版の数
+        
+        for note_id, entries in self._entries.items():
+            count = 0
+            if self.max_revisions > 0:
+                count = max(0, len(entries) - self.max_revisions)
+            if self.max_age_days > 0:
+                cutoff = now - self.max_age_days * 86400
+                while count < len(entries) and entries[count]["t"] < cutoff:
+                    count += 1
+            if count:
+                drop[note_id] = count
+        
+        # 全体のサイズの上限を超えている場合は、すべての付箋を通して古い版から削除する
+        remaining = self._total_bytes - sum(
+            entry["size"] for note_id, count in drop.items() for entry in self._entries[note_id][:count])
+        if self.max_bytes > 0 and remaining > self.max_bytes:
+            candidates = sorted(
+                (entry["t"], note_id, index)
+                for note_id, entries in self._entries.items()
+                for index, entry in enumerate(entries) if index >= drop.get(note_id, 0))
+            for _, note_id, index in candidates:
+                if remaining <= self.max_bytes:
+                    break
+                # 同じ付箋の中では時刻が古い順なので、先頭から順に削除される
+                drop[note_id] = max(drop.get(note_id, 0), index + 1)
+                remaining -= self._entries[note_id][index]["size"]
+        
+        if not drop:
+            return 0
+        
+        removed = 0
+        for note_id, count in drop.items():
+            entries = self._entries[note_id]
+            if count >= len(entries):
+                del self._entries[note_id]
+                self._latest_text.pop(note_id, None)
+                removed += len(entries)
+                continue
+            # 残る最初の版が差分なら本文全体に置き換える
+            head = entries[count]
+            if "k" not in head:
+                text = self._rebuild(entries, count)
+                del head["d"]
+                head["k"] = text
+                head["size"] = len(_encode({key: value for key, value in head.items()
+                                            if key != "size"}).encode("utf-8")) + 1
+            self._entries[note_id] = entries[count:]
+            removed += count
+        
+        self._rewrite()
+        return removed
+    
+    def forget(self, note_ids: Iterable[str]) -> None:
+        """付箋の履歴をすべて削除"""
+        with self._lock:
+            self._ensure_loaded()
+            targets = [note_id for note_id in note_ids if note_id in self._entries]
+            for note_id in targets:
+                del self._entries[note_id]
+                self._latest_text.pop(note_id, None)
+            if targets:
+                self._rewrite()
+    
+    def _rewrite(self) -> None:
+        """残っている版でファイルを書き直す（一時ファイル経由）"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(prefix=".free_sticky_history_", suffix=".tmp", dir=directory)
+        total = 0
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for entries in self._entries.values():
+                    for entry in entries:
+                        f.write(_encode({key: value for key, value in entry.items() if key != "size"}))
+                        f.write("\n")
+                        total += entry["size"]
+            os.replace(temp_path, self.path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._total_bytes = total
+    
+    def _ensure_loaded(self) -> None:
+        """最初に使うときに履歴ファイルを読み込む"""
+        if self._entries is not None:
+            return
+        self._entries = {}
+        self._total_bytes = 0
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 書き込み途中で終了した行
+                entries = self._entries.setdefault(entry["id"], [])
+                # 途中の行が失われて差分をたどれない版は読み込まない
+                if "k" not in entry and not entries:
+                    continue
+                entry["size"] = len(line.encode("utf-8"))
+                entries.append(entry)
+                self._total_bytes += entry["size"]
+        self._entries = {note_id: entries for note_id, entries in self._entries.items() if entries}
+
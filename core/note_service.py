@@ -0,0 +1,618 @@
+"""付箋サービス - GUIに依存しない付箋のドメインロジック"""
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+from models.note_model import NoteData
+from services.storage_service import StorageService
+from core.save_scheduler import SaveScheduler
+from core.search import search_notes
+from core.history import RevisionStore
+from core.trash import TrashStore
+from core.cold_archive import ColdArchive, is_cold
+from core.note_table import NoteTable
+from utils.id_generator import get_id_generator
+from utils.constants import MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT
+from utils.metrics import timed
+
+# 一括更新で変更できる項目と、その値として許可する型
+EDITABLE_FIELDS: Dict[str, tuple] = {
+    "text": (str,),
+    "x": (int, type(None)),
+    "y": (int, type(None)),
+    "width": (int,),
+    "height": (int,),
+    "color": (str,),
+    "is_open": (bool,),
+    "was_open": (bool,),
+    "archived": (bool,),
+}
+
+# Tkが受け付ける16進数の色指定（#RGB・#RRGGBB・#RRRRGGGGBBBB）
+COLOR_PATTERN = re.compile(r"#(?:[0-9A-Fa-f]{3}){1,2}|#[0-9A-Fa-f]{12}")
+
+
+def validate_note_fields(fields: Mapping[str, Any]) -> None:
+    """付箋の項目の組み合わせを検証（不正な場合はValueError）"""
+    for name, value in fields.items():
+        allowed = EDITABLE_FIELDS.get(name)
+        if allowed is None:
+            raise ValueError(f"変更できない項目です: {name}")
+        # boolはintのサブクラスなので座標やサイズには受け付けない
+        if not isinstance(value, allowed) or (isinstance(value, bool) and bool not in allowed):
+            raise ValueError(f"{name} の値が不正です: {value!r}")
+    if fields.get("width", MIN_WINDOW_WIDTH) < MIN_WINDOW_WIDTH:
+        raise ValueError(f"width は {MIN_WINDOW_WIDTH} 以上にしてください")
+    if fields.get("height", MIN_WINDOW_HEIGHT) < MIN_WINDOW_HEIGHT:
+        raise ValueError(f"height は {MIN_WINDOW_HEIGHT} 以上にしてください")
+    color = fields.get("color")
+    if color is not None and not COLOR_PATTERN.fullmatch(color):
+        raise ValueError(f"color の値が不正です: {color!r}")
+
+
+# 保存済みの内容と比べて変更を検出する項目
+CONTENT_FIELDS: Tuple[str, ...] = tuple(EDITABLE_FIELDS)
+
+
+def _note_content(note: NoteData) -> tuple:
+    """変更検出用に付箋の内容をタプルにまとめる（圧縮した本文は展開せずに比べる）"""
+    return tuple(note.stored_text if name == "text" else getattr(note, name) for name in CONTENT_FIELDS)
+
+
+@dataclass
+class ExternalChanges:
+    """他プロセスによる変更を取り込んだ結果"""
+    added: List[NoteData] = field(default_factory=list)
+    updated: Dict[str, Set[str]] = field(default_factory=dict)  # 付箋ID -> 変更された項目
+    removed: List[NoteData] = field(default_factory=list)
+    renamed: Dict[str, str] = field(default_factory=dict)  # IDが重複したため振り直した付箋の旧ID -> 新ID
+    
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed or self.renamed)
+    
+    @property
+    def count(self) -> int:
+        """変更された付箋の数"""
+        return len(self.added) + len(self.updated) + len(self.removed)
+
+
+class NoteService:
+    """付箋データの保持・検索・更新と保存のスケジューリングを担当するサービス
+    
+    tkinterを一切importしないため、CLIやテスト、ベンチマークからも利用できる。
+    """
+    
+    def __init__(self, storage_service: StorageService,
+                 schedule: Optional[Callable[[int, Callable[[], None]], object]] = None,
+                 cancel: Optional[Callable[[object], None]] = None):
+        self.storage_service = storage_service
+        self.save_scheduler = SaveScheduler(self._persist, schedule, cancel)
+        self._notes: List[NoteData] = []
+        self._index: Dict[str, NoteData] = {}
+        self._deleted_ids: Set[str] = set()  # 読み込み後にこのプロセスで削除したID
+        # 付箋ID -> ファイルに保存されていることを最後に確認した版番号と内容
+        self._synced: Dict[str, Tuple[int, tuple]] = {}
+        self.is_loaded = False  # 読み込み完了前に空のリストで上書き保存しないためのフラグ
+        # 列指向のテーブル（参照したときに、変更された付箋の行だけを書き換える）
+        self._table = NoteTable()
+        self._stale_rows: Optional[Set[str]] = None  # 書き換えが必要な行の付箋ID（Noneはすべて作り直す）
+        self._batch_depth = 0  # batch() の入れ子の深さ
+        self._batch_save_requested = False  # batch() の中で保存が要求されたか
+        
+        # 他プロセスによる変更を取り込んだときのコールバック
+        self.on_external_change: Optional[Callable[[ExternalChanges], None]] = None
+        # 保存した本文を記録する履歴（GUIで設定。CLIでは記録しない）
+        self.history: Optional[RevisionStore] = None
+        # 削除した付箋の移動先（GUIで設定。設定しない場合は完全に削除する）
+        self.trash: Optional[TrashStore] = None
+        # 長く使われていない付箋の移動先（設定しない場合は移さない）
+        self.cold_archive: Optional[ColdArchive] = None
+        # 他プロセスと本文の変更が競合したときに残すコピーの本文の接頭辞
+        self.conflict_prefix = ""
+    
+    # 読み込み・参照
+    
+    def load(self) -> List[NoteData]:
+        """ストレージから付箋を読み込み"""
+        self.set_notes(self.storage_service.load_all_notes())
+        return self._notes
+    
+    def set_notes(self, notes: List[NoteData]) -> None:
+        """読み込み済みの付箋を設定"""
+        self._notes = notes
+        self._index = {}
+        self._deleted_ids.clear()
+        self.is_loaded = True
+        self._invalidate_table()
+        
+        # 以降に生成するIDが既存のIDより大きくなるようにする
+        id_generator = get_id_generator()
+        id_generator.observe(note.id for note in notes)
+        
+        # 旧形式のIDは同じ秒に作成すると重複するので、重複分には新しいIDを振り直す
+        has_duplicates = False
+        for note in notes:
+            if not note.id or note.id in self._index:
+                note.id = id_generator.next_id()
+                has_duplicates = True
+            self._index[note.id] = note
+        self._synced = {note.id: (note.revision, _note_content(note)) for note in notes}
+        if has_duplicates:
+            self.save()
+    
+    @property
+    def notes(self) -> List[NoteData]:
+        """付箋のリスト（コピーせずに返すので変更しないこと）"""
+        return self._notes
+    
+    @property
+    def table(self) -> NoteTable:
+        """付箋の列指向のテーブル（変更された付箋の行を書き換え、付箋が増減していれば作り直す）"""
+        stale = self._stale_rows
+        if stale is None or (stale and not self._table.update_rows(map(self._index.get, stale))):
+            self._table.rebuild(self._notes)
+        self._stale_rows = set()
+        return self._table
+    
+    def get_all(self) -> List[NoteData]:
+        """すべての付箋のコピーを取得"""
+        return self._notes.copy()
+    
+    def find(self, note_id: str) -> Optional[NoteData]:
+        """IDで付箋を検索"""
+        return self._index.get(note_id)
+    
+    def search(self, query: str, include_archive: bool = False) -> List[NoteData]:
+        """IDまたは本文で付箋を検索（include_archive ならアーカイブファイルの付箋も検索）"""
+        found = search_notes(self._notes, query)
+        if include_archive and self.cold_archive is not None:
+            found.extend(self.cold_archive.search(query))
+        return found
+    
+    def iter_notes(self, include_archive: bool = False) -> Iterator[NoteData]:
+        """すべての付箋を順に取得（include_archive ならアーカイブファイルの付箋も展開しながら続けて返す）"""
+        yield from self._notes
+        if include_archive and self.cold_archive is not None:
+            yield from (note for note in self.cold_archive.iter_notes() if note.id not in self._index)
+    
+    def is_in_cold_archive(self, note_id: str) -> bool:
+        """付箋がアーカイブファイルに移されているか"""
+        return self.cold_archive is not None and note_id not in self._index and note_id in self.cold_archive
+    
+    def get_open_notes(self) -> List[NoteData]:
+        """前回開いていた付箋（起動時に復元する付箋）を取得"""
+        return [note for note in self._notes if note.is_open or note.was_open]
+    
+    # 更新
+    
+    def create(self, text: str = "", x: Optional[int] = None, y: Optional[int] = None) -> NoteData:
+        """新しい付箋を作成して保存"""
+        note = NoteData.create_new(text, x, y)
+        self._notes.append(note)
+        self._index[note.id] = note
+        self._append_table_rows([note])
+        self._request_save()
+        return note
+    
+    def add_all(self, notes: Iterable[NoteData]) -> List[NoteData]:
+        """複数の付箋を追加して1回だけ保存（IDが重複する付箋には新しいIDを割り当てる）"""
+        added = []
+        id_generator = get_id_generator()
+        for note in notes:
+            if not note.id or note.id in self._index:
+                note.id = id_generator.next_id()
+            else:
+                id_generator.observe([note.id])
+            self._deleted_ids.discard(note.id)  # 削除を元に戻した付箋
+            self._notes.append(note)
+            self._index[note.id] = note
+            added.append(note)
+        if added:
+            self._append_table_rows(added)
+            if self.trash is not None:
+                self.trash.discard(note.id for note in added)
+            if self.cold_archive is not None:
+                self.cold_archive.discard(note.id for note in added)
+            self._request_save()
+        return added
+    
+    def restore_from_trash(self, note_ids: Iterable[str]) -> List[NoteData]:
+        """ごみ箱の付箋を閉じた状態で元に戻して保存"""
+        if self.trash is None:
+            return []
+        notes = self.trash.take(note_ids)
+        for note in notes:
+            note.is_open = False
+            note.was_open = False
+        return self.add_all(notes)
+    
+    def create_many(self, items: Iterable[Mapping[str, Any]]) -> List[NoteData]:
+        """複数の付箋を作成して1回だけ保存
+        
+        items の各要素は EDITABLE_FIELDS の項目を持つ辞書。すべてを検証してから作成するので、
+        1件でも不正な要素があれば何も作成せずにValueErrorを送出する。
+        """
+        items = list(items)
+        for fields in items:
+            validate_note_fields(fields)
+        
+        notes = []
+        for fields in items:
+            note = NoteData.create_new()
+            note.is_open = False
+            note.was_open = False
+            for name, value in fields.items():
+                setattr(note, name, value)
+            notes.append(note)
+        return self.add_all(notes)
+    
+    def update_many(self, changes: Mapping[str, Mapping[str, Any]]) -> List[NoteData]:
+        """複数の付箋の項目を変更して1回だけ保存（changes は ID -> 変更する項目の辞書）
+        
+        すべてを検証してから変更するので、存在しないIDや不正な値があれば何も変更せずにValueErrorを送出する。
+        """
+        for note_id, fields in changes.items():
+            if note_id not in self._index:
+                raise ValueError(f"付箋が見つかりません: {note_id}")
+            validate_note_fields(fields)
+        
+        updated = []
+        for note_id, fields in changes.items():
+            note = self._index[note_id]
+            for name, value in fields.items():
+                setattr(note, name, value)
+            updated.append(note)
+        if updated:
+            self.save(changes)
+        return updated
+    
+    def delete_many(self, note_ids: Iterable[str]) -> List[NoteData]:
+        """複数の付箋を削除して1回だけ保存（存在しないIDは無視）"""
+        targets = {note_id for note_id in note_ids if note_id in self._index}
+        if not targets:
+            return []
+        
+        deleted = [self._index.pop(note_id) for note_id in targets]
+        self._deleted_ids.update(targets)
+        self._notes = [note for note in self._notes if note.id not in targets]
+        self._move_to_trash(deleted)
+        self.save()  # 行が減るのでテーブルは作り直す
+        return deleted
+    
+    def delete(self, note_id: str) -> Optional[NoteData]:
+        """付箋を削除して保存"""
+        note = self._index.pop(note_id, None)
+        if note is None:
+            return None
+        self._deleted_ids.add(note_id)
+        self._notes = [existing for existing in self._notes if existing.id != note_id]
+        self._move_to_trash([note])
+        self.save()  # 行が減るのでテーブルは作り直す
+        return note
+    
+    def archive_cold(self, max_age_days: float, exclude: Iterable[str] = (),
+                     now: Optional[float] = None) -> List[NoteData]:
+        """閉じたまま max_age_days 日以上変更されていない付箋をアーカイブファイルに移して保存
+        
+        未保存の変更がある付箋と exclude の付箋（ウィンドウが残っている付箋など）は移さない。
+        """
+        if self.cold_archive is None or max_age_days <= 0 or not self.is_loaded:
+            return []
+        cutoff = (now if now is not None else time.time()) - max_age_days * 86400
+        exclude = set(exclude)
+        targets = [note for note in self._notes
+                   if note.id not in exclude and is_cold(note, cutoff)
+                   and self._synced.get(note.id, (0, None))[1] == _note_content(note)]
+        if not targets:
+            return []
+        try:
+            self.cold_archive.add(targets)
+        except OSError as e:
+            self.storage_service.notify_error(f"アーカイブファイルへの移動中にエラーが発生しました: {e}")
+            return []
+        
+        target_ids = {note.id for note in targets}
+        for note_id in target_ids:
+            del self._index[note_id]
+        self._notes = [note for note in self._notes if note.id not in target_ids]
+        self.save()  # 行が減るのでテーブルは作り直す
+        return targets
+    
+    def thaw(self, note_ids: Iterable[str]) -> List[NoteData]:
+        """アーカイブファイルの付箋をデータファイル側に戻して保存"""
+        if self.cold_archive is None:
+            return []
+        note_ids = [note_id for note_id in note_ids if note_id not in self._index]
+        if not note_ids:
+            return []
+        try:
+            notes = self.cold_archive.take(note_ids)
+        except OSError as e:
+            self.storage_service.notify_error(f"アーカイブファイルの読み込み中にエラーが発生しました: {e}")
+            return []
+        return self.add_all(notes)
+    
+    def _move_to_trash(self, notes: List[NoteData]) -> None:
+        """削除した付箋をごみ箱に移す（付箋の保存より先に書くので、途中で終了しても付箋は失われない）"""
+        if self.trash is None:
+            # ごみ箱がなければ完全に削除されるので履歴も削除する
+            try:
+                self.forget_history(note.id for note in notes)
+            except OSError as e:
+                self.storage_service.notify_error(f"履歴の削除中にエラーが発生しました: {e}")
+            return
+        try:
+            self.trash.add(notes)
+        except OSError as e:
+            self.storage_service.notify_error(f"ごみ箱への移動中にエラーが発生しました: {e}")
+    
+    def forget_history(self, note_ids: Iterable[str]) -> None:
+        """完全に削除した付箋の履歴を削除（ごみ箱の削除処理のスレッドからも呼ばれる）"""
+        if self.history is not None:
+            self.history.forget(note_ids)
+    
+    def update(self, note: NoteData, save: bool = True) -> None:
+        """付箋を更新（同じIDの付箋を置き換え）"""
+        existing = self._index.get(note.id)
+        if existing is not None and existing is not note:
+            self._notes[self._notes.index(existing)] = note
+        elif existing is None:
+            self._notes.append(note)
+        self._index[note.id] = note
+        self._invalidate_table([note.id])  # 末尾に追加した付箋はテーブルにないので作り直しになる
+        if save:
+            self._request_save()
+    
+    def set_color(self, note_id: str, color: str) -> Optional[NoteData]:
+        """付箋の色を変更して保存"""
+        note = self._index.get(note_id)
+        if note is None:
+            return None
+        note.color = color
+        self.save([note_id])
+        return note
+    
+    def set_open(self, note_id: str, is_open: bool, save: bool = True) -> Optional[NoteData]:
+        """付箋の開閉状態を変更"""
+        note = self._index.get(note_id)
+        if note is None:
+            return None
+        note.is_open = is_open
+        if not is_open:
+            # 閉じた付箋は次回起動時に復元しない（まとめて閉じる場合と同じ）
+            note.was_open = False
+        self._invalidate_table([note_id])
+        if save:
+            self._request_save()
+        return note
+    
+    def sync_open_state(self, open_note_ids: Iterable[str]) -> None:
+        """実際に開いている付箋に合わせて開閉状態を更新"""
+        open_note_ids = set(open_note_ids)
+        for note in self._notes:
+            is_open = note.id in open_note_ids
+            if note.is_open != is_open:
+                note.is_open = is_open
+                self._invalidate_table([note.id])
+    
+    def mark_open_notes_for_restore(self) -> None:
+        """開いている付箋を「前回開いていた付箋」としてマーク"""
+        for note in self._notes:
+            if note.is_open and not note.was_open:
+                note.was_open = True
+                self._invalidate_table([note.id])
+    
+    # 保存
+    
+    def save(self, note_ids: Optional[Iterable[str]] = None) -> None:
+        """保存を要求（GUIではまとめて遅延実行される）
+        
+        付箋を直接変更した場合は、変更した付箋のIDを note_ids に渡すとテーブルはその行だけを書き換える
+        （省略するとテーブルをすべて作り直す）。
+        """
+        self._invalidate_table(note_ids)
+        self._request_save()
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """with文の中の変更の保存要求を、抜けるときの1回にまとめる（例外で抜けた場合は保存を要求しない）"""
+        self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._batch_save_requested = False
+            raise
+        self._batch_depth -= 1
+        if not self._batch_depth and self._batch_save_requested:
+            self._batch_save_requested = False
+            self._request_save()
+    
+    def _request_save(self) -> None:
+        """テーブルに変更を記録済みの状態で保存を要求"""
+        if self._batch_depth:
+            self._batch_save_requested = True
+        elif self.is_loaded:
+            self.save_scheduler.request()
+    
+    def _invalidate_table(self, note_ids: Optional[Iterable[str]] = None) -> None:
+        """テーブルの行を書き換えが必要として記録（note_ids を省略すると、付箋の増減などで全体を作り直す）"""
+        if note_ids is None:
+            self._stale_rows = None
+        elif self._stale_rows is not None:
+            self._stale_rows.update(note_ids)
+    
+    def _append_table_rows(self, notes: List[NoteData]) -> None:
+        """付箋リストの末尾に追加した付箋の行をテーブルに追加"""
+        if self._stale_rows is not None:
+            self._table.append(notes)
+    
+    def flush(self) -> None:
+        """未保存の変更を直ちに保存"""
+        if self.is_loaded:
+            self.save_scheduler.flush()
+    
+    def _persist(self) -> bool:
+        """すべての付箋をストレージに書き込み（他プロセスの変更を先に取り込んで上書きで消さない）"""
+        try:
+            # 取り込みから書き込みまでの間に他のプロセスが書き込まないようにする
+            with self.storage_service.write_lock():
+                return self._persist_locked()
+        except OSError as e:
+            # ロックの取得待ちのタイムアウトやロックファイルを作成できない場合
+            self.storage_service.notify_error(f"ノートの保存中にエラーが発生しました: {e}")
+            return False
+    
+    def _persist_locked(self) -> bool:
+        """ロックを取得した状態で、他プロセスの変更を取り込んでから書き込み"""
+        self.sync_external_changes()
+        
+        # 前回の保存から内容が変わった付箋だけ版番号を進める
+        now = time.time()
+        changed = []
+        for note in self._notes:
+            content = _note_content(note)
+            synced = self._synced.get(note.id)
+            if synced is None or synced[1] != content:
+                note.revision = max(note.revision, synced[0] if synced else 0) + 1
+                note.updated_at = now
+                changed.append(note)
+        self._invalidate_table(note.id for note in changed)
+        
+        success = self.storage_service.save_all_notes(self._notes)
+        if success:
+            # 保存時に圧縮された本文があるので、保存後の内容で記録する
+            self._synced = {note.id: (note.revision, _note_content(note)) for note in self._notes}
+            self._record_history(changed)
+        return success
+    
+    def _record_history(self, notes: List[NoteData]) -> None:
+        """内容が変わった付箋の本文を履歴に記録（本文が同じなら履歴側で無視される）"""
+        if self.history is None or not notes:
+            return
+        try:
+            self.history.record_many((note.id, note.text, note.updated_at) for note in notes)
+        except OSError as e:
+            self.storage_service.notify_error(f"履歴の保存中にエラーが発生しました: {e}")
+    
+    @timed("service.sync_external_changes")
+    def sync_external_changes(self) -> ExternalChanges:
+        """他プロセス（CLI・同期ツールなど）がファイルを変更していれば、変更された付箋だけを取り込む
+        
+        付箋ごとに、最後に確認した保存済みの版と比べて項目単位で統合する。
+        - ファイル側だけで変わった項目はファイルの内容を採用する
+        - このプロセスでだけ変わった項目は手元の内容を残す（次の保存でより新しい版になる）
+        - 両方で別の本文に変わった場合は手元の本文を残し、ファイル側の本文は競合コピーとして追加する
+        - ファイルから消えた付箋は、手元で変更されていなければ削除する
+        """
+        changes = ExternalChanges()
+        if not (self.is_loaded and self.storage_service.has_external_changes()
+                and self.storage_service.is_file_exists()):
+            return changes
+        try:
+            records = self.storage_service.read_external_records()
+        except Exception:
+            # 書きかけのファイルなどは次の確認で読み直す
+            return changes
+        
+        stored_ids = set()
+        for record in records:
+            note_id = record.get("id")
+            if not isinstance(note_id, str) or not note_id:
+                continue
+            stored_ids.add(note_id)
+            synced = self._synced.get(note_id)
+            # 版番号が変わっていないレコードは付箋データに変換しない
+            if synced is not None and synced[0] == record.get("revision", 0) and synced[0] > 0:
+                continue
+            self._merge_stored_record(NoteData.from_dict(record), synced, changes)
+        
+        # ファイルから削除された付箋
+        for note_id, (_, synced_content) in list(self._synced.items()):
+            if note_id in stored_ids:
+                continue
+            del self._synced[note_id]
+            note = self._index.get(note_id)
+            if note is not None and _note_content(note) == synced_content:
+                del self._index[note_id]
+                changes.removed.append(note)
+        if changes.removed:
+            removed_ids = {note.id for note in changes.removed}
+            self._notes = [note for note in self._notes if note.id not in removed_ids]
+        if changes.added and self.cold_archive is not None:
+            # 他のプロセスがアーカイブファイルから戻した付箋
+            try:
+                self.cold_archive.discard(note.id for note in changes.added)
+            except OSError as e:
+                self.storage_service.notify_error(f"アーカイブファイルの更新中にエラーが発生しました: {e}")
+        
+        if changes.added or changes.removed or changes.renamed:
+            self._invalidate_table()
+        else:
+            self._invalidate_table(changes.updated)
+        if changes and self.on_external_change:
+            self.on_external_change(changes)
+        return changes
+    
+    def _merge_stored_record(self, stored: NoteData, synced: Optional[Tuple[int, tuple]],
+                             changes: ExternalChanges) -> None:
+        """ファイル側で追加・変更された付箋を1件取り込む"""
+        stored_content = _note_content(stored)
+        local = self._index.get(stored.id)
+        self._synced[stored.id] = (stored.revision, stored_content)
+        get_id_generator().observe([stored.id])
+        
+        if local is not None and synced is None and _note_content(local) != stored_content:
+            # 別のプロセスが同じIDで別の付箋を作成していた場合は、未保存の手元の付箋のIDを振り直す
+            del self._index[local.id]
+            local.id = get_id_generator().next_id()
+            self._index[local.id] = local
+            changes.renamed[stored.id] = local.id
+            local = None
+        
+        if local is None:
+            if stored.id not in self._deleted_ids:
+                self._notes.append(stored)
+                self._index[stored.id] = stored
+                changes.added.append(stored)
+            return
+        
+        local_content = _note_content(local)
+        # 最後に確認した保存済みの版を基準に項目ごとに統合する
+        # （保存済みの版を知らない付箋はこのプロセスで作成して未保存なので、手元の内容をすべて残す）
+        base = synced[1] if synced is not None else stored_content
+        changed_fields = set()
+        text_conflict = False
+        for name, old, mine, theirs in zip(CONTENT_FIELDS, base, local_content, stored_content):
+            if theirs == mine or theirs == old:
+                continue
+            if mine == old:
+                changed_fields.add(name)
+            elif name == "text":
+                text_conflict = True
+        
+        # 圧縮された本文は展開せずにそのまま引き継ぐ
+        for name, value in zip(CONTENT_FIELDS, stored_content):
+            if name in changed_fields:
+                setattr(local, name, value)
+        if _note_content(local) == stored_content:
+            local.revision = stored.revision
+            local.updated_at = stored.updated_at
+        else:
+            # 手元にだけある変更は次の保存で保存済みの版より新しい版になる
+            local.revision = max(local.revision, stored.revision)
+        self._invalidate_table([local.id])
+        if changed_fields:
+            changes.updated[local.id] = changed_fields
+        
+        if text_conflict:
+            # 手元の本文を残し、上書きされるファイル側の本文はコピーとして残す
+            copy = NoteData.create_new(self.conflict_prefix + stored.text)
+            copy.color = stored.color
+            copy.is_open = False
+            copy.was_open = False
+            self._notes.append(copy)
+            self._index[copy.id] = copy
+            changes.added.append(copy)
@@ -0,0 +1,120 @@
+"""付箋一覧の並べ替え - 並べ替えキーのキャッシュと、変更分だけを差し込む並び順（GUIに依存しない）
+
+一覧の表示値と並べ替えキーは付箋の版・本文・状態が変わるまで使い回し、
+並び順は変更された付箋だけを bisect で抜き差しして保つ。
+"""
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from models.note_model import NoteData
+from utils.constants import ID_DATE_FORMAT, SORT_FULL_RESORT_RATIO
+
+# 並べ替えできる列（一覧の列の順序。NoteRow.keys の順序と同じ）
+SORT_COLUMNS: Tuple[str, ...] = ("id", "date", "preview", "status")
+
+_MISSING = object()  # キーがないことを表す値（どのキーとも等しくない）
+
+
+def parse_note_timestamp(note_id: str) -> float:
+    """付箋IDの日時部分をUNIX時間に変換（日時を含まないIDは0）"""
+    if len(note_id) >= 14 and note_id[:14].isdigit():
+        try:
+            return datetime.strptime(note_id[:14], ID_DATE_FORMAT).timestamp()
+        except ValueError:
+            return 0.0
+    return 0.0
+
+
+class NoteRow:
+    """一覧の1行の表示値と列ごとの並べ替えキー"""
+    __slots__ = ("signature", "values", "keys")
+    
+    def __init__(self, signature: tuple, values: Tuple[str, str, str, str], keys: tuple):
+        self.signature = signature
+        self.values = values
+        self.keys = keys
+
+
+class NoteRowCache:
+    """付箋ID -> 一覧の行（版・本文・状態が変わっていなければ作り直さない）"""
+    
+    def __init__(self, format_row: Callable[[NoteData, bool], Tuple[str, str, str, str]]):
+        self._format_row = format_row  # (付箋, アーカイブファイルの付箋か) -> 表示値
+        self._rows: Dict[str, NoteRow] = {}
+    
+    def get(self, note: NoteData, is_cold: bool = False) -> NoteRow:
+        """付箋の行を取得（変更されていれば作り直す）"""
+        # 本文は同じオブジェクトなら比較がすぐ終わるので、大きな本文でも展開・比較しない
+        signature = (note.revision, note.stored_text, note.is_open, note.archived, is_cold)
+        row = self._rows.get(note.id)
+        if row is None or row.signature != signature:
+            values = self._format_row(note, is_cold)
+            keys = (note.id, parse_note_timestamp(note.id), values[2].casefold(), values[3].casefold())
+            row = NoteRow(signature, values, keys)
+            self._rows[note.id] = row
+        return row
+    
+    def retain(self, note_ids: Any) -> None:
+        """指定した付箋以外の行を捨てる"""
+        self._rows = {note_id: row for note_id, row in self._rows.items() if note_id in note_ids}
+    
+    def clear(self) -> None:
+        """すべての行を捨てる（表示言語の変更時など）"""
+        self._rows.clear()
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+class SortedOrder:
+    """表示する付箋の並び順（並べ替えキーの昇順の (キー, 付箋ID) のリストを保持）
+    
+    列を指定しない間は渡された順序（保存順）のまま表示する。
+    変更された付箋が少なければ、古いキーの位置から抜いて新しいキーの位置に差し込み、
+    多ければ並べ替え直す。同じキーの付箋は付箋ID順。
+    """
+    
+    def __init__(self):
+        self.column: Optional[str] = None
+        self.descending = False
+        self._entries: List[Tuple[Any, str]] = []
+        self._keys: Dict[str, Any] = {}  # 付箋ID -> _entries に入れたキー
+    
+    def set_sort(self, column: Optional[str], descending: bool = False) -> None:
+        """並べ替える列と向きを設定（列が変わったら次の update で並べ替え直す）"""
+        if column is not None and column not in SORT_COLUMNS:
+            raise ValueError(f"並べ替えできない列です: {column}")
+        if column != self.column:
+            self._entries = []
+            self._keys = {}
+        self.column = column
+        self.descending = descending
+    
+    def toggle(self, column: str) -> None:
+        """見出しのクリック（同じ列なら向きを反転し、別の列なら昇順で並べ替える）"""
+        self.set_sort(column, not self.descending if column == self.column else False)
+    
+    def update(self, rows: Dict[str, NoteRow]) -> List[str]:
+        """表示する付箋（表示順の候補）から、並べ替えた付箋IDのリストを取得"""
+        if self.column is None:
+            return list(rows)
+        index = SORT_COLUMNS.index(self.column)
+        keys = {note_id: row.keys[index] for note_id, row in rows.items()}
+        
+        previous = self._keys
+        stale = [note_id for note_id, key in previous.items() if keys.get(note_id, _MISSING) != key]
+        fresh = [note_id for note_id, key in keys.items() if previous.get(note_id, _MISSING) != key]
+        if not previous or len(stale) + len(fresh) > len(keys) * SORT_FULL_RESORT_RATIO:
+            self._entries = sorted((key, note_id) for note_id, key in keys.items())
+        else:
+            entries = self._entries
+            for note_id in stale:
+                del entries[bisect_left(entries, (previous[note_id], note_id))]
+            for note_id in fresh:
+                insort(entries, (keys[note_id], note_id))
+        self._keys = keys
+        
+        order = [note_id for _, note_id in self._entries]
+        if self.descending:
+            order.reverse()
+        return order
@@ -0,0 +1,204 @@
+"""列指向の付箋テーブル - 付箋の項目ごとの配列で集計・絞り込み・並べ替えを行う（GUIに依存しない）
+
+NoteData を1件ずつたどる代わりに、位置・サイズ・状態・更新時刻を項目ごとの array に、
+色を色コード（色の文字列の番号）の array に持つ。
+- 状態での絞り込みは、状態のビットフラグの列を bytes.translate で 0/1 の列に変換して itertools.compress で選ぶ
+- 色での絞り込み・色ごとの件数は、色コード -> 行番号の索引を引く
+- 並べ替えは列の値をキーにした行番号の並べ替えで行う
+本文は持たないので、本文の検索には使わない。
+付箋の増減（末尾への追加を除く）では rebuild で作り直し、付箋の変更は update_rows でその行だけを書き換える。
+"""
+from array import array
+from bisect import insort
+from itertools import compress
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from models.note_model import NoteData, FLAG_OPEN, FLAG_ARCHIVED
+
+NO_POSITION = -(2 ** 62)  # 位置が未設定（None）の付箋の x・y
+
+# 列名 -> (NoteDataの属性, arrayの型コード)
+_NUMERIC_COLUMNS: Dict[str, Tuple[str, str]] = {
+    "x": ("x", "q"),
+    "y": ("y", "q"),
+    "width": ("width", "q"),
+    "height": ("height", "q"),
+    "flags": ("_flags", "B"),
+    "revision": ("revision", "q"),
+    "updated_at": ("updated_at", "d"),
+}
+
+Rect = Tuple[int, int, int, int]  # 左・上・右・下（右と下は含まない）
+
+
+def _column(typecode: str, values: Iterable) -> array:
+    """列を作成（None は NO_POSITION として格納）"""
+    values = list(values)
+    try:
+        return array(typecode, values)
+    except TypeError:
+        return array(typecode, [NO_POSITION if value is None else value for value in values])
+
+
+class NoteTable:
+    """付箋の項目を列ごとに保持するテーブル（行の順序は付箋リストの順序）"""
+    
+    def __init__(self):
+        self.ids: List[str] = []
+        self._rows: Dict[str, int] = {}  # 付箋ID -> 行番号
+        self.columns: Dict[str, array] = {name: array(typecode) for name, (_, typecode) in _NUMERIC_COLUMNS.items()}
+        self.color_codes = array("H")
+        self.colors: List[str] = []  # 色コード -> 色
+        self._color_index: Dict[str, int] = {}  # 色 -> 色コード
+        self._rows_by_color: Optional[Dict[int, List[int]]] = None  # 色コード -> 行番号（必要になったときに作成）
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def rebuild(self, notes: Sequence[NoteData]) -> None:
+        """付箋リストからテーブルを作り直す（列ごとに1回ずつ C の速さで走査する）"""
+        self.ids = list(map(attrgetter("id"), notes))
+        self._rows = dict(zip(self.ids, range(len(self.ids))))
+        for name, (attribute, typecode) in _NUMERIC_COLUMNS.items():
+            self.columns[name] = _column(typecode, map(attrgetter(attribute), notes))
+        colors = list(map(attrgetter("color"), notes))
+        for color in set(colors).difference(self._color_index):
+            self._color_index[color] = len(self.colors)
+            self.colors.append(color)
+        self.color_codes = array("H", map(self._color_index.__getitem__, colors))
+        self._rows_by_color = None
+    
+    def append(self, notes: Iterable[NoteData]) -> None:
+        """付箋リストの末尾に追加された付箋の行を追加"""
+        for note in notes:
+            row = len(self.ids)
+            self.ids.append(note.id)
+            self._rows[note.id] = row
+            for name, (attribute, _) in _NUMERIC_COLUMNS.items():
+                value = getattr(note, attribute)
+                self.columns[name].append(NO_POSITION if value is None else value)
+            code = self._color_code(note.color)
+            self.color_codes.append(code)
+            if self._rows_by_color is not None:
+                self._rows_by_color.setdefault(code, []).append(row)
+    
+    def update_rows(self, notes: Iterable[Optional[NoteData]]) -> bool:
+        """変更された付箋の行を書き換える（テーブルにない付箋があれば False を返すので rebuild すること）"""
+        for note in notes:
+            row = self._rows.get(note.id) if note is not None else None
+            if row is None:
+                return False
+            for name, (attribute, _) in _NUMERIC_COLUMNS.items():
+                value = getattr(note, attribute)
+                self.columns[name][row] = NO_POSITION if value is None else value
+            code = self._color_code(note.color)
+            old_code = self.color_codes[row]
+            if code != old_code:
+                self.color_codes[row] = code
+                if self._rows_by_color is not None:
+                    self._rows_by_color[old_code].remove(row)
+                    insort(self._rows_by_color.setdefault(code, []), row)
+        return True
+    
+    # 集計
+    
+    def count_by_color(self) -> Dict[str, int]:
+        """色ごとの付箋の数"""
+        return {self.colors[code]: len(rows) for code, rows in self._color_rows().items() if rows}
+    
+    def count_with_flags(self, flags: int, expected: Optional[int] = None) -> int:
+        """状態のビットフラグが一致する付箋の数（expected を省略すると flags がすべて立っている付箋）"""
+        return sum(self._flag_mask(flags, expected))
+    
+    # 絞り込み
+    
+    def rows_with_flags(self, flags: int, expected: Optional[int] = None) -> List[int]:
+        """状態のビットフラグが一致する行（expected を省略すると flags がすべて立っている行）"""
+        return list(compress(range(len(self.ids)), self._flag_mask(flags, expected)))
+    
+    def rows_with_color(self, color: str) -> List[int]:
+        """指定した色の行"""
+        code = self._color_index.get(color)
+        if code is None:
+            return []
+        return self._color_rows().get(code, [])
+    
+    def rows_in_rect(self, rect: Rect, rows: Optional[Iterable[int]] = None) -> List[int]:
+        """左上の位置が rect の中にある行（rows を渡すとその中から選ぶ）"""
+        left, top, right, bottom = rect
+        xs = self.columns["x"]
+        ys = self.columns["y"]
+        if rows is None:
+            return [row for row, (x, y) in enumerate(zip(xs, ys)) if left <= x < right and top <= y < bottom]
+        return [row for row in rows if left <= xs[row] < right and top <= ys[row] < bottom]
+    
+    def select(self, color: Optional[str] = None, is_open: Optional[bool] = None,
+               archived: Optional[bool] = None, rect: Optional[Rect] = None) -> List[str]:
+        """条件に一致する付箋のIDを付箋リストの順に取得（None の条件は問わない）"""
+        flags = 0
+        expected = 0
+        if is_open is not None:
+            flags |= FLAG_OPEN
+            expected |= FLAG_OPEN if is_open else 0
+        if archived is not None:
+            flags |= FLAG_ARCHIVED
+            expected |= FLAG_ARCHIVED if archived else 0
+        
+        rows: Optional[List[int]] = None
+        if color is not None:
+            rows = self.rows_with_color(color)
+        if flags:
+            if rows is None:
+                rows = self.rows_with_flags(flags, expected)
+            else:
+                flag_column = self.columns["flags"]
+                rows = [row for row in rows if flag_column[row] & flags == expected]
+        if rect is not None:
+            rows = self.rows_in_rect(rect, rows)
+        if rows is None:
+            return list(self.ids)
+        ids = self.ids
+        return [ids[row] for row in rows]
+    
+    # 並べ替え
+    
+    def sorted_rows(self, column: str, reverse: bool = False) -> List[int]:
+        """列の値で並べ替えた行番号（同じ値の行は付箋リストの順）"""
+        if column == "id":
+            key = self.ids.__getitem__
+        elif column == "color":
+            colors = self.colors
+            codes = self.color_codes
+            key = lambda row: colors[codes[row]]
+        else:
+            key = self.columns[column].tolist().__getitem__  # list の方が array より要素の取り出しが速い
+        return sorted(range(len(self.ids)), key=key, reverse=reverse)
+    
+    # 内部処理
+    
+    def _color_code(self, color: str) -> int:
+        """色コード（初めての色には新しいコードを割り当てる）"""
+        code = self._color_index.get(color)
+        if code is None:
+            code = self._color_index[color] = len(self.colors)
+            self.colors.append(color)
+        return code
+    
+    def _color_rows(self) -> Dict[int, List[int]]:
+        """色コード -> 行番号の索引（作り直した後の最初の参照で作成）"""
+        if self._rows_by_color is None:
+            rows_by_color: Dict[int, List[int]] = {}
+            for row, color_code in enumerate(self.color_codes):
+                rows = rows_by_color.get(color_code)
+                if rows is None:
+                    rows_by_color[color_code] = [row]
+                else:
+                    rows.append(row)
+            self._rows_by_color = rows_by_color
+        return self._rows_by_color
+    
+    def _flag_mask(self, flags: int, expected: Optional[int]) -> bytes:
+        """各行が条件に一致するかを 0/1 で表したバイト列"""
+        expected = flags if expected is None else expected
+        table = bytes(1 if value & flags == expected else 0 for value in range(256))
+        return self.columns["flags"].tobytes().translate(table)
@@ -0,0 +1,45 @@
+"""バックグラウンドでの定期削除 - 履歴やごみ箱の古いデータを別スレッドで定期的に削除する（GUIに依存しない）"""
+import threading
+from typing import Callable, Optional
+
+
+class BackgroundPruner:
+    """デーモンスレッドで定期的に prune を呼び出す
+    
+    prune はメインスレッド以外から呼ばれるので、対象のストアは自分でロックして排他すること。
+    """
+    
+    def __init__(self, prune: Callable[[], object], interval: float, name: str = "pruner",
+                 initial_delay: float = 0.0):
+        self.prune = prune
+        self.interval = interval
+        self.initial_delay = initial_delay  # 最初の削除までの待ち時間（起動直後の読み込みを避ける場合に指定）
+        self.name = name
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """定期的な削除を開始"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """定期的な削除を停止"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+    
+    def _run(self) -> None:
+        """initial_delay 秒後に1回、その後は interval 秒ごとに削除"""
+        if self.initial_delay > 0 and self._stop_event.wait(self.initial_delay):
+            return
+        while not self._stop_event.is_set():
+            try:
+                self.prune()
+            except OSError:
+                pass  # 次の周期で再試行
+            self._stop_event.wait(self.interval)
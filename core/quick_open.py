@@ -0,0 +1,186 @@
+"""クイックオープン - 付箋のプレビューとIDのあいまい検索（GUIに依存しない）
+
+入力した文字が順に含まれていれば一致とみなす（間に他の文字があってもよい）。
+文字を書き足したときは前回の候補だけを絞り込み、消したときは保持している途中の候補に戻るので、
+1文字ごとにすべての付箋を調べ直さない。
+並び順は一致の良さ（連続・単語の先頭・前方での一致）に、最近開いた付箋ほど大きい加点を加えて決める。
+"""
+import heapq
+import re
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+from models.note_model import NoteData
+from utils.constants import (
+    QUICK_OPEN_PREVIEW_LENGTH, QUICK_OPEN_MAX_RESULTS, QUICK_OPEN_RECENT_BONUS, RECENT_NOTES_MAX
+)
+
+if TYPE_CHECKING:
+    from services.language_service import LanguageService
+
+_WORD_SEPARATORS = " \t\n-_/.,:;()[]「」『』、。"
+_CONSECUTIVE_BONUS = 2.0  # 直前の文字の次で一致
+_WORD_START_BONUS = 1.5  # 単語の先頭で一致
+_SUBSTRING_BONUS = 1.0  # 入力が途切れずに含まれる場合の1文字あたりの加点
+_POSITION_PENALTY = 0.01  # 最初に一致した位置が1文字後ろになるごとの減点
+
+
+class QuickOpenItem:
+    """クイックオープンの候補（付箋1件）"""
+    __slots__ = ("note", "note_id", "preview", "haystack", "signature", "_label")
+    
+    def __init__(self, note: NoteData, preview: str, signature: tuple):
+        self.note = note
+        self.note_id = note.id
+        self.preview = preview
+        self.haystack = f"{preview}\n{note.id}".casefold()  # 検索対象
+        self.signature = signature  # 候補を作った時点の付箋の版と本文
+        self._label: Optional[str] = None
+    
+    @property
+    def label(self) -> str:
+        """表示する文字列（日付の整形は表示する候補だけで行う）"""
+        if self._label is None:
+            self._label = f"{self.preview}  ({self.note.get_formatted_date()})"
+        return self._label
+
+
+def compile_query(query: str) -> 're.Pattern[str]':
+    """入力の文字が順に含まれる文字列に一致する正規表現（各文字の手前を否定の文字クラスにして後戻りさせない）"""
+    return re.compile("".join(f"[^{re.escape(char)}]*{re.escape(char)}" for char in query), re.DOTALL)
+
+
+def fuzzy_score(query: str, text: str) -> Optional[float]:
+    """あいまい一致の点数（大きいほどよく一致。一致しなければNone。どちらも casefold 済みであること）"""
+    if not query:
+        return 0.0
+    index = text.find(query)
+    if index >= 0:
+        # 途切れずに含まれる場合
+        score = len(query) * (1.0 + _CONSECUTIVE_BONUS + _SUBSTRING_BONUS)
+        if index == 0 or text[index - 1] in _WORD_SEPARATORS:
+            score += _WORD_START_BONUS
+        return score - index * _POSITION_PENALTY
+    
+    score = 0.0
+    position = -1
+    first = -1
+    for char in query:
+        found = text.find(char, position + 1)
+        if found < 0:
+            return None
+        if found == position + 1:
+            score += _CONSECUTIVE_BONUS
+        elif found == 0 or text[found - 1] in _WORD_SEPARATORS:
+            score += _WORD_START_BONUS
+        if first < 0:
+            first = found
+        score += 1.0
+        position = found
+    return score - first * _POSITION_PENALTY
+
+
+def recent_bonus(rank: Optional[int]) -> float:
+    """最近開いた順位（0が最も新しい）に応じた加点"""
+    if rank is None or rank >= RECENT_NOTES_MAX:
+        return 0.0
+    return QUICK_OPEN_RECENT_BONUS * (1.0 - rank / RECENT_NOTES_MAX)
+
+
+class QuickOpenIndex:
+    """付箋ID -> 候補（付箋の版と本文が変わるまで作り直さない）"""
+    
+    def __init__(self):
+        self._items: Dict[str, QuickOpenItem] = {}
+    
+    def items(self, notes: Sequence[NoteData],
+              language_service: Optional['LanguageService'] = None) -> List[QuickOpenItem]:
+        """付箋リストの候補を取得（アーカイブ済みの付箋は除く）"""
+        cached = self._items
+        items = {}
+        for note in notes:
+            if note.archived:
+                continue
+            signature = (note.revision, note.stored_text)
+            item = cached.get(note.id)
+            if item is None or item.signature != signature or item.note is not note or item.note_id != note.id:
+                item = QuickOpenItem(note, note.get_preview_text(QUICK_OPEN_PREVIEW_LENGTH, language_service),
+                                     signature)
+            items[note.id] = item
+        self._items = items
+        return list(items.values())
+
+
+class QuickOpenMatcher:
+    """入力ごとに候補を絞り込んで順位を付ける"""
+    
+    def __init__(self, items: List[QuickOpenItem], recent_ranks: Dict[str, int],
+                 max_results: int = QUICK_OPEN_MAX_RESULTS):
+        self.recent_ranks = recent_ranks
+        self.max_results = max_results
+        # (入力, その入力に一致する候補) を入力の短い順に保持（先頭は空の入力とすべての候補）
+        self._levels: List[Tuple[str, List[QuickOpenItem]]] = [("", items)]
+    
+    def match(self, query: str) -> List[QuickOpenItem]:
+        """入力に一致する候補を順位の高い順に max_results 件まで取得"""
+        query = "".join(query.split()).casefold()
+        candidates = self._narrow(query)
+        ranks = self.recent_ranks
+        if not query:
+            # 入力がなければ最近開いた順
+            recent = [item for item in candidates if item.note_id in ranks]
+            recent.sort(key=lambda item: ranks[item.note_id])
+            if len(recent) >= self.max_results:
+                return recent[:self.max_results]
+            return recent + [item for item in candidates if item.note_id not in ranks][:self.max_results - len(recent)]
+        
+        # 先頭が入力と一致する候補は最高点なので、max_results 件以上あればそれより上になりうるのは
+        # 最近開いた付箋だけ。先頭が一致する最初の max_results 件と最近開いた付箋だけを採点する
+        pool: Iterable[int] = range(len(candidates))
+        leading = [index for index, item in enumerate(candidates) if item.haystack.startswith(query)]
+        if len(leading) >= self.max_results:
+            recent = [index for index, item in enumerate(candidates) if item.note_id in ranks]
+            pool = sorted(set(leading[:self.max_results]).union(recent))
+        
+        # 入力が途切れずに含まれる候補は、含まれない候補より必ず点数が高い（検索対象は短いので位置の減点は
+        # 1.5点未満）。含まれる候補が max_results 件以上あれば、含まれない候補は最近開いた付箋だけを採点する
+        substring_score = len(query) * (1.0 + _CONSECUTIVE_BONUS + _SUBSTRING_BONUS)
+        scored = []
+        deferred = []
+        for index in pool:
+            item = candidates[index]
+            haystack = item.haystack
+            position = haystack.find(query)
+            if position < 0:
+                deferred.append((index, item))
+                continue
+            score = substring_score - position * _POSITION_PENALTY
+            if position == 0 or haystack[position - 1] in _WORD_SEPARATORS:
+                score += _WORD_START_BONUS
+            rank = ranks.get(item.note_id)
+            if rank is not None:
+                score += recent_bonus(rank)
+            scored.append((score, -index, item))
+        score_all = len(scored) < self.max_results
+        for index, item in deferred:
+            rank = ranks.get(item.note_id)
+            if score_all or rank is not None:
+                scored.append((fuzzy_score(query, item.haystack) + recent_bonus(rank), -index, item))
+        # 点数が同じなら付箋リストの順
+        return [item for _, _, item in heapq.nlargest(self.max_results, scored, key=itemgetter(0, 1))]
+    
+    def candidate_count(self, query: str) -> int:
+        """入力に一致する候補の数"""
+        return len(self._narrow("".join(query.split()).casefold()))
+    
+    def _narrow(self, query: str) -> List[QuickOpenItem]:
+        """入力に一致する候補（前回までの入力の続きなら、その候補だけを調べる）"""
+        levels = self._levels
+        while not query.startswith(levels[-1][0]):
+            levels.pop()
+        base_query, base = levels[-1]
+        if query == base_query:
+            return base
+        pattern = compile_query(query)
+        candidates = [item for item in base if pattern.match(item.haystack)]
+        levels.append((query, candidates))
+        return candidates
@@ -0,0 +1,79 @@
+"""最近開いた付箋 - 付箋を開いた順序をファイルに保存する（GUIに依存しない）
+
+データファイルの隣の JSON ファイル（<データファイル>.recent.json）に、最近開いた付箋のIDと
+開いた時刻を新しい順に最大 max_entries 件だけ保存し、クイックオープンの順位付けに使う。
+ファイルは最初に使うときに読み込む。
+"""
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+from utils.constants import RECENT_NOTES_MAX
+
+
+class RecentNotes:
+    """最近開いた付箋の索引（メインスレッドから使う）"""
+    
+    def __init__(self, path: str, max_entries: int = RECENT_NOTES_MAX):
+        self.path = path
+        self.max_entries = max_entries
+        # 付箋ID -> 開いた時刻（UNIX時間。古い順。読み込むまではNone）
+        self._entries: Optional['OrderedDict[str, float]'] = None
+    
+    def record(self, note_ids: Iterable[str], opened_at: Optional[float] = None) -> None:
+        """付箋を開いたことを記録してファイルに書き込む"""
+        opened_at = opened_at or time.time()
+        self._ensure_loaded()
+        changed = False
+        for note_id in note_ids:
+            self._entries[note_id] = opened_at
+            self._entries.move_to_end(note_id)
+            changed = True
+        if not changed:
+            return
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._write()
+    
+    def ids(self) -> List[str]:
+        """最近開いた付箋のIDを新しい順に取得"""
+        self._ensure_loaded()
+        return list(reversed(self._entries))
+    
+    def ranks(self) -> Dict[str, int]:
+        """付箋ID -> 開いた順位（0が最も新しい）"""
+        return {note_id: rank for rank, note_id in enumerate(self.ids())}
+    
+    def _write(self) -> None:
+        """新しい順にファイルへ書き込む（一時ファイル経由）"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(prefix=".free_sticky_recent_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"notes": [[note_id, self._entries[note_id]] for note_id in reversed(self._entries)]},
+                          f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    
+    def _ensure_loaded(self) -> None:
+        """最初に使うときにファイルを読み込む（壊れたファイルは空として扱う）"""
+        if self._entries is not None:
+            return
+        self._entries = OrderedDict()
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        entries = data.get("notes", []) if isinstance(data, dict) else []
+        for entry in reversed(entries[:self.max_entries]):
+            if (isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], str)
+                    and isinstance(entry[1], (int, float))):
+                self._entries[entry[0]] = float(entry[1])
@@ -0,0 +1,256 @@
+"""JSON-RPC 2.0 の要求を付箋の操作に変換する（GUIに依存しない）
+
+対応するメソッド（パラメーターはすべて名前付き）:
+    notes.list    {"include_archived": false,     -> 付箋の配列
+                   "color": "#FFFF99", "is_open": true,
+                   "rect": [left, top, right, bottom]}
+    notes.stats   {}                              -> {"total", "open", "archived", "by_color"}
+    notes.get     {"id": "..."}                   -> 付箋
+    notes.search  {"query": "..."}                -> 付箋の配列
+    notes.create  {"text": "...", "color": ...}   -> {"id": "..."}
+    notes.update  {"id": "...", "text": ...}      -> 付箋
+    notes.delete  {"id": "..."}                   -> true
+
+バッチ要求では、連続する同じ書き込みメソッドを1回の一括操作（create_many など）にまとめる。
+"""
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from core.note_service import validate_note_fields
+from models.note_model import FLAG_OPEN, FLAG_ARCHIVED
+from core.search import search_notes
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+NOT_READY = -32000  # 付箋の読み込みが終わっていない
+
+_WRITE_METHODS = ("notes.create", "notes.update", "notes.delete")
+_READ_METHODS = ("notes.list", "notes.get", "notes.search", "notes.stats")
+
+
+class RpcError(Exception):
+    """JSON-RPCのエラー応答になる例外"""
+    
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def error_response(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    """エラー応答を作成"""
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+class _Call:
+    """バッチ内の1件の呼び出し"""
+    
+    def __init__(self, request_id: Any, method: str, params: Dict[str, Any], is_notification: bool):
+        self.request_id = request_id
+        self.method = method
+        self.params = params
+        self.is_notification = is_notification
+        self.response: Optional[Dict[str, Any]] = None
+    
+    def succeed(self, result: Any) -> None:
+        self.response = {"jsonrpc": "2.0", "id": self.request_id, "result": result}
+    
+    def fail(self, code: int, message: str) -> None:
+        self.response = error_response(self.request_id, code, message)
+
+
+class NoteRpcHandler:
+    """JSON-RPCの要求を処理する（付箋を変更するのでメインスレッドで呼び出すこと）
+    
+    backend は get_all_notes / get_note_by_id / create_many / update_many / delete_many と
+    note_table を持つオブジェクト（NoteController など）。
+    """
+    
+    def __init__(self, backend: Any):
+        self.backend = backend
+    
+    def handle(self, payload: Any) -> Optional[Any]:
+        """解析済みの要求（単一またはバッチ）を処理し、応答を返す（通知のみの場合はNone）"""
+        if isinstance(payload, list):
+            if not payload:
+                return error_response(None, INVALID_REQUEST, "空のバッチ要求です")
+            responses = self._handle_batch(payload)
+            return responses or None
+        
+        responses = self._handle_batch([payload])
+        return responses[0] if responses else None
+    
+    def _handle_batch(self, requests: List[Any]) -> List[Dict[str, Any]]:
+        """バッチ要求を先頭から順に処理（連続する同じ書き込みメソッドはまとめて実行）"""
+        calls: List[_Call] = []
+        responses: List[_Call] = []
+        for request in requests:
+            call, error = self._parse(request)
+            if error is not None:
+                responses.append(error)
+            else:
+                calls.append(call)
+                responses.append(call)
+        
+        ready = getattr(self.backend, "is_loaded", True)
+        start = 0
+        while start < len(calls):
+            method = calls[start].method
+            end = start + 1
+            if method in _WRITE_METHODS:
+                while end < len(calls) and calls[end].method == method:
+                    end += 1
+            group = calls[start:end]
+            start = end
+            
+            if not ready:
+                for call in group:
+                    call.fail(NOT_READY, "付箋の読み込みが完了していません")
+                continue
+            try:
+                self._run_group(method, group)
+            except RpcError as e:
+                for call in group:
+                    if call.response is None:
+                        call.fail(e.code, e.message)
+            except Exception as e:
+                for call in group:
+                    if call.response is None:
+                        call.fail(INTERNAL_ERROR, str(e))
+        
+        return [call.response for call in responses
+                if call.response is not None and not call.is_notification]
+    
+    def _parse(self, request: Any) -> Tuple[Optional[_Call], Optional[_Call]]:
+        """要求を検証して呼び出しに変換（不正な場合はエラー応答を持つ呼び出しを返す）"""
+        if not isinstance(request, dict):
+            error = _Call(None, "", {}, False)
+            error.fail(INVALID_REQUEST, "要求はオブジェクトである必要があります")
+            return None, error
+        
+        request_id = request.get("id")
+        is_notification = "id" not in request
+        method = request.get("method")
+        params = request.get("params", {})
+        if request.get("jsonrpc") != "2.0" or not isinstance(method, str):
+            error = _Call(request_id, "", {}, False)
+            error.fail(INVALID_REQUEST, "jsonrpc と method が必要です")
+            return None, error
+        
+        call = _Call(request_id, method, params, is_notification)
+        if method not in _WRITE_METHODS and method not in _READ_METHODS:
+            call.fail(METHOD_NOT_FOUND, f"メソッドがありません: {method}")
+            return None, call
+        if isinstance(params, list) and not params:
+            call.params = {}
+        elif not isinstance(params, dict):
+            call.fail(INVALID_PARAMS, "params は名前付き（オブジェクト）で指定してください")
+            return None, call
+        return call, None
+    
+    def _run_group(self, method: str, calls: List[_Call]) -> None:
+        """同じメソッドの呼び出しをまとめて実行"""
+        if method == "notes.create":
+            self._create(calls)
+        elif method == "notes.update":
+            self._update(calls)
+        elif method == "notes.delete":
+            self._delete(calls)
+        else:
+            for call in calls:
+                call.succeed(self._read(method, call.params))
+    
+    def _read(self, method: str, params: Mapping[str, Any]) -> Any:
+        """読み取り系のメソッドを実行"""
+        if method == "notes.list":
+            return self._list(params)
+        if method == "notes.stats":
+            table = self.backend.note_table
+            return {"total": len(table), "open": table.count_with_flags(FLAG_OPEN),
+                    "archived": table.count_with_flags(FLAG_ARCHIVED), "by_color": table.count_by_color()}
+        if method == "notes.get":
+            return self._find(params.get("id")).to_dict()
+        
+        query = params.get("query")
+        if not isinstance(query, str):
+            raise RpcError(INVALID_PARAMS, "query を文字列で指定してください")
+        return [note.to_dict() for note in search_notes(self.backend.get_all_notes(), query)]
+    
+    def _list(self, params: Mapping[str, Any]) -> List[Dict[str, Any]]:
+        """付箋の一覧（色・開閉・位置の条件は列指向のテーブルで絞り込む）"""
+        include_archived = params.get("include_archived", False)
+        color = params.get("color")
+        is_open = params.get("is_open")
+        rect = params.get("rect")
+        if color is not None and not isinstance(color, str):
+            raise RpcError(INVALID_PARAMS, "color を文字列で指定してください")
+        if is_open is not None and not isinstance(is_open, bool):
+            raise RpcError(INVALID_PARAMS, "is_open を真偽値で指定してください")
+        if rect is not None and not (isinstance(rect, list) and len(rect) == 4
+                                     and all(type(value) is int for value in rect)):
+            raise RpcError(INVALID_PARAMS, "rect を [左, 上, 右, 下] の整数で指定してください")
+        
+        if color is None and is_open is None and rect is None:
+            return [note.to_dict() for note in self.backend.get_all_notes()
+                    if include_archived or not note.archived]
+        note_ids = self.backend.note_table.select(color=color, is_open=is_open,
+                                                  archived=None if include_archived else False,
+                                                  rect=tuple(rect) if rect is not None else None)
+        return [self.backend.get_note_by_id(note_id).to_dict() for note_id in note_ids]
+    
+    def _find(self, note_id: Any) -> Any:
+        """IDから付箋を取得（見つからなければRpcError）"""
+        note = self.backend.get_note_by_id(note_id) if isinstance(note_id, str) else None
+        if note is None:
+            raise RpcError(INVALID_PARAMS, f"付箋が見つかりません: {note_id}")
+        return note
+    
+    def _create(self, calls: List[_Call]) -> None:
+        """付箋をまとめて作成（不正な呼び出しだけをエラーにする）"""
+        valid = [call for call in calls if self._validate(call, call.params)]
+        notes = self.backend.create_many([call.params for call in valid])
+        for call, note in zip(valid, notes):
+            call.succeed({"id": note.id})
+    
+    def _update(self, calls: List[_Call]) -> None:
+        """付箋をまとめて変更（同じ付箋への変更は順に重ねる）"""
+        changes: Dict[str, Dict[str, Any]] = {}
+        valid = []
+        for call in calls:
+            fields = {name: value for name, value in call.params.items() if name != "id"}
+            try:
+                note = self._find(call.params.get("id"))
+            except RpcError as e:
+                call.fail(e.code, e.message)
+                continue
+            if self._validate(call, fields):
+                changes.setdefault(note.id, {}).update(fields)
+                valid.append(call)
+        
+        self.backend.update_many(changes)
+        for call in valid:
+            call.succeed(self.backend.get_note_by_id(call.params["id"]).to_dict())
+    
+    def _delete(self, calls: List[_Call]) -> None:
+        """付箋をまとめて削除（確認ダイアログは表示しない）"""
+        valid = []
+        for call in calls:
+            try:
+                valid.append((call, self._find(call.params.get("id")).id))
+            except RpcError as e:
+                call.fail(e.code, e.message)
+        
+        self.backend.delete_many([note_id for _, note_id in valid])
+        for call, _ in valid:
+            call.succeed(True)
+    
+    @staticmethod
+    def _validate(call: _Call, fields: Mapping[str, Any]) -> bool:
+        """項目を検証し、不正な場合は呼び出しをエラーにする"""
+        try:
+            validate_note_fields(fields)
+        except ValueError as e:
+            call.fail(INVALID_PARAMS, str(e))
+            return False
+        return True
@@ -0,0 +1,54 @@
+"""保存スケジューラー - 連続する保存要求を1回の書き込みにまとめる"""
+from typing import Any, Callable, Optional
+from utils.constants import SAVE_DEBOUNCE_DELAY
+
+
+class SaveScheduler:
+    """保存要求を遅延実行してまとめるスケジューラー
+    
+    schedule にはTkの after のような (遅延ミリ秒, 関数) -> ジョブID の関数を渡す。
+    schedule を省略した場合（CLIやテストなどGUIのない環境）は要求のたびに即座に保存する。
+    """
+    
+    def __init__(self, save: Callable[[], Any],
+                 schedule: Optional[Callable[[int, Callable[[], None]], Any]] = None,
+                 cancel: Optional[Callable[[Any], None]] = None,
+                 delay: int = SAVE_DEBOUNCE_DELAY):
+        self._save = save
+        self._schedule = schedule
+        self._cancel = cancel
+        self.delay = delay
+        self._job: Any = None
+        self._pending = False
+    
+    @property
+    def pending(self) -> bool:
+        """未実行の保存要求があるか"""
+        return self._pending
+    
+    def request(self) -> None:
+        """保存を要求"""
+        if self._schedule is None:
+            self._save()
+            return
+        
+        self._pending = True
+        if self._job is None:
+            self._job = self._schedule(self.delay, self._run)
+    
+    def flush(self) -> None:
+        """未実行の保存要求があれば直ちに保存"""
+        if self._job is not None and self._cancel is not None:
+            try:
+                self._cancel(self._job)
+            except Exception:
+                pass
+        self._job = None
+        if self._pending:
+            self._run()
+    
+    def _run(self) -> None:
+        """保存を実行"""
+        self._job = None
+        self._pending = False
+        self._save()
@@ -0,0 +1,33 @@
+"""付箋検索 - GUIに依存しない検索ロジック"""
+from typing import Iterable, List
+from weakref import WeakKeyDictionary
+from models.note_model import CompressedBody, NoteData
+
+# 圧縮した本文 -> 小文字にした本文（付箋の本文が置き換えられ、古い圧縮した本文が破棄されると消える）
+_search_keys: 'WeakKeyDictionary[CompressedBody, str]' = WeakKeyDictionary()
+
+
+def _search_key(note: NoteData) -> str:
+    """本文の検索用の文字列（圧縮した本文は初回だけ展開し、入力のたびに展開しない）"""
+    body = note.stored_text
+    if not isinstance(body, CompressedBody):
+        return body.lower()
+    key = _search_keys.get(body)
+    if key is None:
+        # 展開した本文のキャッシュから編集中の付箋を押し出さないよう、キャッシュを通さずに展開する
+        key = body.decompress().lower()
+        _search_keys[body] = key
+    return key
+
+
+def note_matches(note: NoteData, query: str) -> bool:
+    """付箋がクエリにマッチするか（queryは小文字化済みであること）"""
+    return query in note.id.lower() or query in _search_key(note)
+
+
+def search_notes(notes: Iterable[NoteData], query: str) -> List[NoteData]:
+    """IDまたは本文にクエリを含む付箋を大文字小文字を区別せずに検索"""
+    query = query.lower()
+    if not query:
+        return list(notes)
+    return [note for note in notes if note_matches(note, query)]
@@ -0,0 +1,359 @@
+"""フォルダー同期 - 共有フォルダーを介して複数のマシンの付箋を同期する（GUIに依存しない）
+
+共有フォルダーには、マシン（レプリカ）ごとに1つの変更ログ <レプリカID>.jsonl を置く。
+各レプリカは自分のログにだけ追記し、他のレプリカのログは前回読んだ位置（チェックポイント）から
+先だけを読む。そのため、1万件の付箋のうち3件を編集した場合に送受信されるのは3レコードだけになる。
+
+付箋ごとにバージョンベクター（レプリカID -> そのレプリカでの編集回数）を持ち、
+- 一方が他方を含む場合は新しい方を採用する
+- 並行に編集された場合は updated_at（同じならレプリカID）が大きい方を残し、
+  負けた側のマシンが自分の版を新しい付箋（競合コピー）として残す
+- 削除と編集が並行した場合は編集を残す
+同期の状態（レプリカID・各付箋のバージョンベクター・チェックポイント）は
+データファイルの隣のサイドカーファイル（<データファイル>.sync.json）に保存する。
+他のレプリカのログは、すべてのレコードを検証してから取り込む。不正なレコードを含むログは取り込まずに
+SyncResult.skipped に記録するので、一部だけを反映した状態にはならない。取り込んだ変更の保存は1回にまとめる。
+"""
+import hashlib
+import json
+import os
+import tempfile
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from models.note_model import NoteData
+from core.note_service import NoteService, validate_note_fields
+from utils.constants import SYNC_FIELDS, SYNC_LOG_SUFFIX, SYNC_STATE_SUFFIX
+
+VersionVector = Dict[str, int]
+
+EQUAL = "equal"
+NEWER = "newer"
+OLDER = "older"
+CONCURRENT = "concurrent"
+
+
+def compare_versions(a: VersionVector, b: VersionVector) -> str:
+    """バージョンベクター a を b と比較（EQUAL / NEWER / OLDER / CONCURRENT）"""
+    a_ahead = any(count > b.get(replica, 0) for replica, count in a.items())
+    b_ahead = any(count > a.get(replica, 0) for replica, count in b.items())
+    if a_ahead and b_ahead:
+        return CONCURRENT
+    if a_ahead:
+        return NEWER
+    if b_ahead:
+        return OLDER
+    return EQUAL
+
+
+def merge_versions(a: VersionVector, b: VersionVector) -> VersionVector:
+    """2つのバージョンベクターの要素ごとの最大値"""
+    merged = dict(a)
+    for replica, count in b.items():
+        if count > merged.get(replica, 0):
+            merged[replica] = count
+    return merged
+
+
+def _sync_content(fields: Dict[str, Any]) -> str:
+    """同期対象の項目のハッシュ（前回の同期から変わったかの判定に使う）"""
+    payload = json.dumps([fields.get(name) for name in SYNC_FIELDS], ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def validate_record(record: Any) -> None:
+    """他のレプリカのログの1レコードを検証（不正な場合はValueError）"""
+    if not isinstance(record, dict):
+        raise ValueError(f"レコードの形式が不正です: {record!r}")
+    note_id = record.get("id")
+    if not isinstance(note_id, str) or not note_id:
+        raise ValueError(f"id が不正です: {note_id!r}")
+    vv = record.get("vv")
+    if not isinstance(vv, dict) or not all(isinstance(replica, str) and type(count) is int and count >= 0
+                                           for replica, count in vv.items()):
+        raise ValueError(f"vv が不正です: {note_id}")
+    if not isinstance(record.get("deleted"), bool):
+        raise ValueError(f"deleted が不正です: {note_id}")
+    updated_at = record.get("updated_at", 0.0)
+    if isinstance(updated_at, bool) or not isinstance(updated_at, (int, float)):
+        raise ValueError(f"updated_at が不正です: {note_id}")
+    if record["deleted"]:
+        return
+    fields = record.get("fields")
+    if not isinstance(fields, dict):
+        raise ValueError(f"fields が不正です: {note_id}")
+    validate_note_fields({name: fields[name] for name in SYNC_FIELDS if name in fields})
+
+
+def _note_fields(note: NoteData) -> Dict[str, Any]:
+    """付箋の同期対象の項目（位置や開閉状態はマシンごとの状態なので同期しない）"""
+    return {name: getattr(note, name) for name in SYNC_FIELDS}
+
+
+@dataclass
+class SyncResult:
+    """1回の同期の結果"""
+    exported: int = 0  # 共有フォルダーに書き出したレコード数
+    imported: int = 0  # 他のレプリカから取り込んだ変更の数
+    conflicts: int = 0  # 並行編集で作成した競合コピーの数
+    deleted: int = 0  # 他のレプリカでの削除を反映した数
+    skipped: Dict[str, str] = field(default_factory=dict)  # 不正なレコードがあり取り込まなかったレプリカID -> 理由
+
+
+class SyncState:
+    """同期の状態（サイドカーファイル）"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.replica_id = uuid.uuid4().hex[:12]
+        # 付箋ID -> {"vv": バージョンベクター, "hash": 最後に同期した内容のハッシュ, "deleted": 削除済みか}
+        self.notes: Dict[str, Dict[str, Any]] = {}
+        # 他のレプリカID -> そのログを読み終えたバイト位置
+        self.checkpoints: Dict[str, int] = {}
+        self._load()
+    
+    def _load(self) -> None:
+        """状態を読み込み"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.replica_id = data.get("replica_id", self.replica_id)
+        self.notes = data.get("notes", {})
+        self.checkpoints = data.get("checkpoints", {})
+    
+    def save(self) -> None:
+        """状態を一時ファイル経由で保存"""
+        data = {"replica_id": self.replica_id, "notes": self.notes, "checkpoints": self.checkpoints}
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(prefix=".free_sticky_sync_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+class FolderSyncEngine:
+    """共有フォルダーの変更ログを介して NoteService の付箋を同期するエンジン"""
+    
+    def __init__(self, note_service: NoteService, notes_file: str, folder: str, conflict_prefix: str = ""):
+        self.note_service = note_service
+        self.folder = folder
+        self.conflict_prefix = conflict_prefix
+        self.state = SyncState(notes_file + SYNC_STATE_SUFFIX)
+    
+    @property
+    def replica_id(self) -> str:
+        """このマシンのレプリカID"""
+        return self.state.replica_id
+    
+    def sync(self) -> SyncResult:
+        """手元の変更を書き出し、他のレプリカの変更を取り込む"""
+        os.makedirs(self.folder, exist_ok=True)
+        result = SyncResult()
+        
+        # 先に手元の変更を書き出してバージョンを進めておかないと、未同期の編集が上書きされる
+        result.exported += self._export()
+        logs = []
+        for replica_id, path in self._peer_logs():
+            try:
+                logs.append((replica_id, *self._read_log(replica_id, path)))
+            except ValueError as e:
+                result.skipped[replica_id] = str(e)
+        self._thaw_targets(logs)
+        # 取り込んだ変更は最後に1回だけ保存する
+        with self.note_service.batch():
+            for replica_id, records, checkpoint in logs:
+                self._import_records(replica_id, records, result)
+                self.state.checkpoints[replica_id] = checkpoint
+        # 競合の解決で作成・復元した付箋を書き出す
+        result.exported += self._export()
+        
+        self.state.save()
+        return result
+    
+    def _export(self) -> int:
+        """前回の同期から変わった付箋と削除された付箋だけを自分のログに追記"""
+        records = []
+        local_ids = set()
+        for note in self.note_service.notes:
+            local_ids.add(note.id)
+            fields = _note_fields(note)
+            content = _sync_content(fields)
+            entry = self.state.notes.get(note.id)
+            if entry is not None and entry["hash"] == content and not entry.get("deleted"):
+                continue
+            vv = self._bump(entry)
+            self.state.notes[note.id] = {"vv": vv, "hash": content}
+            records.append({"id": note.id, "vv": vv, "updated_at": note.updated_at,
+                            "deleted": False, "fields": fields})
+        
+        for note_id, entry in self.state.notes.items():
+            # アーカイブファイルに移した付箋は削除ではない
+            if note_id in local_ids or entry.get("deleted") or self.note_service.is_in_cold_archive(note_id):
+                continue
+            vv = self._bump(entry)
+            entry.update(vv=vv, hash=None, deleted=True)
+            records.append({"id": note_id, "vv": vv, "updated_at": 0.0, "deleted": True})
+        
+        if records:
+            self._append_log(records)
+        return len(records)
+    
+    def _bump(self, entry: Optional[Dict[str, Any]]) -> VersionVector:
+        """このレプリカでの編集回数を1つ進めたバージョンベクター"""
+        vv = dict(entry["vv"]) if entry else {}
+        vv[self.replica_id] = vv.get(self.replica_id, 0) + 1
+        return vv
+    
+    def _append_log(self, records: List[Dict[str, Any]]) -> None:
+        """自分のログにレコードを追記"""
+        path = os.path.join(self.folder, self.replica_id + SYNC_LOG_SUFFIX)
+        with open(path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def _peer_logs(self) -> List[tuple]:
+        """他のレプリカのログファイルの一覧"""
+        logs = []
+        for name in sorted(os.listdir(self.folder)):
+            if not name.endswith(SYNC_LOG_SUFFIX):
+                continue
+            replica_id = name[:-len(SYNC_LOG_SUFFIX)]
+            if replica_id != self.replica_id:
+                logs.append((replica_id, os.path.join(self.folder, name)))
+        return logs
+    
+    def _read_log(self, replica_id: str, path: str) -> Tuple[List[Dict[str, Any]], int]:
+        """他のレプリカのログのうち、チェックポイントより後のレコードを読み込んで検証
+        
+        レコードと、読み終えた位置（次回のチェックポイント）を返す。不正なレコードがあればValueError。
+        """
+        offset = self.state.checkpoints.get(replica_id, 0)
+        if offset > os.path.getsize(path):
+            offset = 0  # ログが作り直された
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+        
+        # 書き込み途中の最後の行は次回に読む
+        end = data.rfind(b"\n") + 1
+        records = [json.loads(line) for line in data[:end].splitlines() if line.strip()]
+        for record in records:
+            validate_record(record)
+        return records, offset + end
+    
+    def _thaw_targets(self, logs: List[Tuple[str, List[Dict[str, Any]], int]]) -> None:
+        """相手が変更・削除した付箋がアーカイブファイルにあれば、取り込む前にデータファイル側に戻す"""
+        note_ids = []
+        for _, records, _ in logs:
+            for record in records:
+                entry = self.state.notes.get(record["id"])
+                if (compare_versions(record["vv"], entry["vv"] if entry else {}) in (NEWER, CONCURRENT)
+                        and self.note_service.is_in_cold_archive(record["id"])):
+                    note_ids.append(record["id"])
+        if note_ids:
+            self.note_service.thaw(note_ids)
+    
+    def _import_records(self, replica_id: str, records: List[Dict[str, Any]], result: SyncResult) -> None:
+        """他のレプリカの1つのログのレコードを取り込む"""
+        to_add: Dict[str, NoteData] = {}
+        to_update: Dict[str, Dict[str, Any]] = {}
+        to_delete: List[str] = []
+        for record in records:
+            self._merge_record(record, replica_id, to_add, to_update, to_delete, result)
+        
+        self.note_service.delete_many(to_delete)
+        self.note_service.update_many(to_update)
+        self.note_service.add_all(to_add.values())
+    
+    def _merge_record(self, record: Dict[str, Any], origin: str, to_add: Dict[str, NoteData],
+                      to_update: Dict[str, Dict[str, Any]], to_delete: List[str], result: SyncResult) -> None:
+        """1件のレコードを手元の状態と比較して統合"""
+        note_id = record["id"]
+        remote_vv: VersionVector = record["vv"]
+        entry = self.state.notes.get(note_id)
+        local_vv = entry["vv"] if entry else {}
+        order = compare_versions(remote_vv, local_vv)
+        if order in (EQUAL, OLDER):
+            return
+        
+        local = self.note_service.find(note_id)  # アーカイブファイルの付箋は _thaw_targets で戻してある
+        pending = to_add.get(note_id)  # このログの前のレコードで追加予定の付箋
+        local_deleted = bool(entry and entry.get("deleted"))
+        
+        if order == NEWER:
+            self._apply_remote(record, local, pending, to_add, to_update, to_delete, result)
+            return
+        
+        # 並行した編集
+        merged = merge_versions(local_vv, remote_vv)
+        if record["deleted"]:
+            if local_deleted:
+                self.state.notes[note_id] = {"vv": merged, "hash": None, "deleted": True}
+            else:
+                # 編集を残す（ハッシュを消して次の書き出しで相手に送り直す）
+                self.state.notes[note_id] = {"vv": merged, "hash": None}
+            return
+        
+        remote_content = _sync_content(record["fields"])
+        if local_deleted:
+            # 手元の削除より相手の編集を残す
+            self._apply_remote(record, local, pending, to_add, to_update, to_delete, result)
+            self.state.notes[note_id]["vv"] = merged
+            return
+        if entry.get("hash") == remote_content:
+            self.state.notes[note_id] = {"vv": merged, "hash": remote_content}
+            return
+        
+        # 両方が別の内容に編集した場合は勝敗を決め、負けた側のマシンだけが自分の版をコピーとして残す
+        current = pending or local
+        remote_wins = (record.get("updated_at", 0.0), origin) > (current.updated_at, self.replica_id)
+        if remote_wins:
+            copy = NoteData.create_new(self.conflict_prefix + current.text)
+            copy.color = current.color
+            copy.is_open = False
+            copy.was_open = False
+            to_add[copy.id] = copy
+            result.conflicts += 1
+            self._apply_remote(record, local, pending, to_add, to_update, to_delete, result)
+            self.state.notes[note_id]["vv"] = merged
+        else:
+            self.state.notes[note_id] = {"vv": merged, "hash": entry.get("hash")}
+    
+    def _apply_remote(self, record: Dict[str, Any], local: Optional[NoteData], pending: Optional[NoteData],
+                      to_add: Dict[str, NoteData], to_update: Dict[str, Dict[str, Any]], to_delete: List[str],
+                      result: SyncResult) -> None:
+        """相手の版（追加・変更・削除）を手元に反映"""
+        note_id = record["id"]
+        if record["deleted"]:
+            if pending is not None:
+                del to_add[note_id]
+            if local is not None:
+                to_delete.append(note_id)
+                to_update.pop(note_id, None)
+                result.deleted += 1
+            self.state.notes[note_id] = {"vv": record["vv"], "hash": None, "deleted": True}
+            return
+        
+        fields = {name: record["fields"][name] for name in SYNC_FIELDS if name in record["fields"]}
+        if pending is not None:
+            for name, value in fields.items():
+                setattr(pending, name, value)
+        elif local is not None:
+            to_update.setdefault(note_id, {}).update(fields)
+            if note_id in to_delete:
+                to_delete.remove(note_id)
+        else:
+            note = NoteData(id=note_id, **fields)
+            note.updated_at = record.get("updated_at", 0.0)
+            to_add[note_id] = note
+        self.state.notes[note_id] = {"vv": record["vv"], "hash": _sync_content(record["fields"])}
+        result.imported += 1
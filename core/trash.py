@@ -0,0 +1,184 @@
+"""ごみ箱 - 削除した付箋を通常の付箋とは別のファイルに保管する（GUIに依存しない）
+
+削除した付箋はデータファイルの隣の JSON Lines ファイル（<データファイル>.trash.jsonl）に追記するので、
+ごみ箱の中身は起動時の読み込みや一覧・検索・保存の対象にならない。
+ファイルは最初に一覧を表示するか、元に戻す・完全に削除するときに初めて読み込む。
+保管期間（日数）と合計サイズを超えた古い付箋は BackgroundPruner から purge_expired で完全に削除する。
+完全に削除した付箋のIDは on_purged に渡すので、履歴などの付箋に紐づくデータも合わせて削除できる。
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+from models.note_model import NoteData
+from utils.constants import TRASH_MAX_AGE_DAYS, TRASH_MAX_BYTES
+
+
+@dataclass
+class TrashItem:
+    """ごみ箱の中の付箋"""
+    note: NoteData
+    deleted_at: float  # 削除した時刻（UNIX時間）
+    size: int  # ファイル内の1行のバイト数
+
+
+def _encode(note: NoteData, deleted_at: float) -> str:
+    """ファイルに書き込む1行"""
+    return json.dumps({"deleted_at": deleted_at, "note": note.to_dict()}, ensure_ascii=False)
+
+
+class TrashStore:
+    """削除した付箋を保管するストア（メインスレッドとバックグラウンドの削除処理から使うのでロックで排他する）"""
+    
+    def __init__(self, path: str, max_age_days: float = TRASH_MAX_AGE_DAYS, max_bytes: int = TRASH_MAX_BYTES):
+        self.path = path
+        # 0 以下は無制限
+        self.max_age_days = max_age_days
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._items: Optional[Dict[str, TrashItem]] = None  # 付箋ID -> 付箋（読み込むまではNone）
+        
+        # 付箋を完全に削除したときのコールバック（バックグラウンドのスレッドからも呼ばれる）
+        self.on_purged: Optional[Callable[[List[str]], None]] = None
+    
+    def add(self, notes: Iterable[NoteData], deleted_at: Optional[float] = None) -> int:
+        """付箋をごみ箱に移す（ファイルへの追記だけなので、ごみ箱を読み込んでいなくても速い）"""
+        deleted_at = deleted_at or time.time()
+        with self._lock:
+            lines = []
+            for note in notes:
+                line = _encode(note, deleted_at)
+                lines.append(line)
+                if self._items is not None:
+                    self._items[note.id] = TrashItem(note, deleted_at, len(line.encode("utf-8")) + 1)
+            if lines:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines))
+                    f.write("\n")
+            return len(lines)
+    
+    def list_items(self) -> List[TrashItem]:
+        """ごみ箱の中の付箋を新しく削除した順に取得"""
+        with self._lock:
+            self._ensure_loaded()
+            return sorted(self._items.values(), key=lambda item: item.deleted_at, reverse=True)
+    
+    def contains(self, note_id: str) -> bool:
+        """ごみ箱に付箋があるか"""
+        with self._lock:
+            self._ensure_loaded()
+            return note_id in self._items
+    
+    def take(self, note_ids: Iterable[str]) -> List[NoteData]:
+        """付箋をごみ箱から取り出す（元に戻す）"""
+        return [item.note for item in self._remove(note_ids)]
+    
+    def purge(self, note_ids: Iterable[str]) -> int:
+        """付箋を完全に削除"""
+        removed = self._remove(note_ids)
+        self._notify_purged([item.note.id for item in removed])
+        return len(removed)
+    
+    def discard(self, note_ids: Iterable[str]) -> None:
+        """ごみ箱にあれば取り除く（ごみ箱を経由せずに付箋が復元された場合）
+        
+        ごみ箱を読み込んでいなければ、読み込まずに取り除いた印の行を追記するだけにする。
+        """
+        note_ids = list(note_ids)
+        if not note_ids or not os.path.exists(self.path):
+            return
+        with self._lock:
+            if self._items is None:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    for note_id in note_ids:
+                        f.write(json.dumps({"removed": note_id}))
+                        f.write("\n")
+                return
+        self._remove(note_ids)
+    
+    def purge_all(self) -> int:
+        """ごみ箱を空にする"""
+        with self._lock:
+            self._ensure_loaded()
+            purged = list(self._items)
+            self._items = {}
+            self._rewrite()
+        self._notify_purged(purged)
+        return len(purged)
+    
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """保管期間を過ぎた付箋と、合計サイズの上限を超えた分の古い付箋を完全に削除"""
+        now = now if now is not None else time.time()
+        with self._lock:
+            self._ensure_loaded()
+            expired = set()
+            if self.max_age_days > 0:
+                cutoff = now - self.max_age_days * 86400
+                expired.update(note_id for note_id, item in self._items.items() if item.deleted_at < cutoff)
+            if self.max_bytes > 0:
+                total = sum(item.size for note_id, item in self._items.items() if note_id not in expired)
+                for item in sorted(self._items.values(), key=lambda item: item.deleted_at):
+                    if total <= self.max_bytes:
+                        break
+                    if item.note.id not in expired:
+                        expired.add(item.note.id)
+                        total -= item.size
+            if expired:
+                for note_id in expired:
+                    del self._items[note_id]
+                self._rewrite()
+        self._notify_purged(list(expired))
+        return len(expired)
+    
+    def _notify_purged(self, note_ids: List[str]) -> None:
+        """完全に削除した付箋を通知（ロックの外で呼ぶ）"""
+        if note_ids and self.on_purged:
+            self.on_purged(note_ids)
+    
+    def _remove(self, note_ids: Iterable[str]) -> List[TrashItem]:
+        """付箋をごみ箱から取り除いてファイルを書き直す"""
+        with self._lock:
+            self._ensure_loaded()
+            removed = [self._items.pop(note_id) for note_id in note_ids if note_id in self._items]
+            if removed:
+                self._rewrite()
+            return removed
+    
+    def _rewrite(self) -> None:
+        """残っている付箋でファイルを書き直す（一時ファイル経由）"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(prefix=".free_sticky_trash_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for item in self._items.values():
+                    f.write(_encode(item.note, item.deleted_at))
+                    f.write("\n")
+            os.replace(temp_path, self.path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    
+    def _ensure_loaded(self) -> None:
+        """最初に使うときにファイルを読み込む（同じIDの付箋が複数あれば最後に削除したものを残す）"""
+        if self._items is not None:
+            return
+        self._items = {}
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 書き込み途中で終了した行
+                if "removed" in record:
+                    self._items.pop(record["removed"], None)
+                    continue
+                note = NoteData.from_dict(record.get("note", {}))
+                if note.id:
+                    self._items[note.id] = TrashItem(note, record.get("deleted_at", 0.0),
+                                                     len(line.encode("utf-8")))
@@ -0,0 +1,194 @@
+"""元に戻す・やり直し - 付箋の操作の取り消し履歴（GUIに依存しない）
+
+各操作は、対象の付箋の操作前と操作後の状態（付箋ID -> 項目の辞書、存在しない場合はNone）として記録する。
+元に戻すときは操作前の状態を、やり直すときは操作後の状態を呼び出し側が適用する。
+
+削除した付箋の本文など大きな状態を無制限にメモリに残さないよう、記録の合計サイズが
+UNDO_MEMORY_BUDGET を超えたら古い操作から一時ファイルに書き出し、使うときに読み戻す。
+読み戻したり破棄したりして一時ファイル内の不要な部分が半分を超えたら、必要な記録だけで書き直す。
+"""
+import json
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, IO, List, Optional, Tuple
+from utils.constants import UNDO_MEMORY_BUDGET, UNDO_MAX_ENTRIES
+
+NoteStates = Dict[str, Optional[Dict[str, Any]]]
+# 記録した状態と同じ付箋・項目について現在の状態を取得する関数
+StateCapture = Callable[[NoteStates], NoteStates]
+
+
+@dataclass
+class UndoEntry:
+    """1回の操作の記録"""
+    label_key: str  # 操作名の翻訳キー
+    before: Optional[NoteStates]  # 一時ファイルに書き出している間はNone
+    after: Optional[NoteStates]
+    size: int  # 状態をJSONにしたときのバイト数
+    spill: Optional[Tuple[int, int]] = None  # 一時ファイル内の位置と長さ
+    
+    @property
+    def is_spilled(self) -> bool:
+        """状態を一時ファイルに書き出しているか"""
+        return self.before is None
+
+
+class UndoLog:
+    """元に戻す・やり直しのスタック（メモリの上限を超えた古い記録は一時ファイルに退避）"""
+    
+    def __init__(self, memory_budget: int = UNDO_MEMORY_BUDGET, max_entries: int = UNDO_MAX_ENTRIES):
+        self.memory_budget = memory_budget
+        self.max_entries = max_entries
+        self._undo_stack: List[UndoEntry] = []
+        self._redo_stack: List[UndoEntry] = []
+        self._memory_bytes = 0
+        self._spill_file: Optional[IO[bytes]] = None
+        self._spill_bytes = 0  # 一時ファイル内で使われている記録の合計サイズ
+    
+    @property
+    def can_undo(self) -> bool:
+        """元に戻せる操作があるか"""
+        return bool(self._undo_stack)
+    
+    @property
+    def can_redo(self) -> bool:
+        """やり直せる操作があるか"""
+        return bool(self._redo_stack)
+    
+    @property
+    def memory_bytes(self) -> int:
+        """メモリに保持している状態の合計サイズ"""
+        return self._memory_bytes
+    
+    def record(self, label_key: str, before: NoteStates, after: NoteStates) -> None:
+        """操作を記録（やり直しの履歴は破棄される）"""
+        if before == after:
+            return
+        size = len(json.dumps([before, after], ensure_ascii=False).encode("utf-8"))
+        self._undo_stack.append(UndoEntry(label_key, before, after, size))
+        self._memory_bytes += size
+        
+        released, self._redo_stack = self._redo_stack, []
+        while len(self._undo_stack) > self.max_entries:
+            released.append(self._undo_stack.pop(0))
+        for entry in released:
+            self._release(entry)
+        self._enforce_budget()
+    
+    def undo(self, capture: Optional[StateCapture] = None) -> Optional[Tuple[str, NoteStates]]:
+        """直前の操作を取り消し、操作名と適用すべき操作前の状態を返す
+        
+        capture を渡すと、操作後の状態を現在の状態で置き換える（操作の後の編集もやり直しで戻るように）。
+        """
+        if not self._undo_stack:
+            return None
+        entry = self._undo_stack.pop()
+        self._load(entry)
+        if capture is not None:
+            entry.after = capture(entry.after)
+            self._resize(entry)
+        self._redo_stack.append(entry)
+        before = entry.before
+        self._enforce_budget()
+        return entry.label_key, before
+    
+    def redo(self, capture: Optional[StateCapture] = None) -> Optional[Tuple[str, NoteStates]]:
+        """取り消した操作をやり直し、操作名と適用すべき操作後の状態を返す（capture は undo と同様）"""
+        if not self._redo_stack:
+            return None
+        entry = self._redo_stack.pop()
+        self._load(entry)
+        if capture is not None:
+            entry.before = capture(entry.before)
+            self._resize(entry)
+        self._undo_stack.append(entry)
+        after = entry.after
+        self._enforce_budget()
+        return entry.label_key, after
+    
+    def clear(self) -> None:
+        """すべての記録を破棄"""
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        self._memory_bytes = 0
+        self._spill_bytes = 0
+        self.close()
+    
+    def close(self) -> None:
+        """一時ファイルを閉じる（閉じると自動的に削除される）"""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+    
+    def _enforce_budget(self) -> None:
+        """メモリの上限を超えていれば、次に使われる見込みの低い記録から一時ファイルに書き出す"""
+        if self._memory_bytes <= self.memory_budget:
+            return
+        # 元に戻す側は古いものから、やり直し側は最後に取り消したものから遠い順に
+        for entry in self._undo_stack + self._redo_stack:
+            if self._memory_bytes <= self.memory_budget:
+                break
+            if not entry.is_spilled:
+                self._spill(entry)
+    
+    def _spill(self, entry: UndoEntry) -> None:
+        """記録の状態を一時ファイルに書き出してメモリから解放"""
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix="free_sticky_undo_")
+        data = json.dumps([entry.before, entry.after], ensure_ascii=False).encode("utf-8")
+        self._spill_file.seek(0, 2)
+        entry.spill = (self._spill_file.tell(), len(data))
+        self._spill_file.write(data)
+        self._spill_bytes += len(data)
+        entry.before = None
+        entry.after = None
+        self._memory_bytes -= entry.size
+    
+    def _load(self, entry: UndoEntry) -> None:
+        """一時ファイルに書き出した状態を読み戻す"""
+        if not entry.is_spilled:
+            return
+        offset, length = entry.spill
+        self._spill_file.seek(offset)
+        entry.before, entry.after = json.loads(self._spill_file.read(length).decode("utf-8"))
+        entry.spill = None
+        self._memory_bytes += entry.size
+        self._spill_bytes -= length
+        self._compact_spill()
+    
+    def _resize(self, entry: UndoEntry) -> None:
+        """状態を置き換えた記録のサイズを計算し直す"""
+        size = len(json.dumps([entry.before, entry.after], ensure_ascii=False).encode("utf-8"))
+        self._memory_bytes += size - entry.size
+        entry.size = size
+    
+    def _release(self, entry: UndoEntry) -> None:
+        """スタックから取り除いた記録のメモリ使用量または一時ファイル内のサイズを差し引く"""
+        if entry.is_spilled:
+            self._spill_bytes -= entry.spill[1]
+            entry.spill = None
+            self._compact_spill()
+        else:
+            self._memory_bytes -= entry.size
+    
+    def _compact_spill(self) -> None:
+        """一時ファイル内の不要な部分が半分を超えたら、使われている記録だけで書き直す"""
+        if self._spill_file is None:
+            return
+        self._spill_file.seek(0, 2)
+        if self._spill_file.tell() <= 2 * self._spill_bytes:
+            return
+        if not self._spill_bytes:
+            self._spill_file.seek(0)
+            self._spill_file.truncate()
+            return
+        
+        compacted = tempfile.TemporaryFile(prefix="free_sticky_undo_")
+        for entry in self._undo_stack + self._redo_stack:
+            if entry.is_spilled:
+                offset, length = entry.spill
+                self._spill_file.seek(offset)
+                entry.spill = (compacted.tell(), length)
+                compacted.write(self._spill_file.read(length))
+        self._spill_file.close()
+        self._spill_file = compacted
@@ -13,13 +13,19 @@ SOLID原則に基づいてモジュール化されたアーキテクチャ:
 アーキテクチャ構造:
 
 app.py                    # メインアプリケーションクラス
-controllers/             # ビジネスロジック層
-  note_controller.py     # 付箋のビジネスロジック
+cli.py                    # コマンドラインインターフェース
+core/                    # ドメインロジック層（tkinterに依存しない）
+  note_service.py        # 付箋の保持・検索・更新
+  save_scheduler.py      # 保存要求のまとめ実行
+  search.py              # 付箋検索
+controllers/             # アダプター層
+  note_controller.py     # 付箋ウィンドウとドメインロジックの仲介
 models/                  # データモデル層
   note_model.py          # 付箋データモデル
   note_repository.py     # データ永続化抽象化
 services/                # サービス層
   storage_service.py     # データストレージサービス
+  instance_service.py    # 単一インスタンスの待ち受けと要求の転送
   ui_service.py          # UI関連サービス
 views/                   # プレゼンテーション層
   main_window.py         # メインウィンドウ
@@ -31,15 +37,41 @@ utils/                   # ユーティリティ
   constants.py           # 定数定義
 
 使用方法:
-    python main.py
+    python main.py                        # GUIを起動（起動中ならそのメインウィンドウを表示）
+    python main.py --new-note [テキスト]  # 新しい付箋を作成（起動中ならそのアプリで作成）
+    python main.py note <コマンド>         # GUIを起動せずに付箋を操作（cli.py を参照）
 """
+import sys
+
+
+def build_startup_request(argv: list) -> dict:
+    """起動引数から、アプリに処理させる要求を作成"""
+    if argv[:1] == ["--new-note"]:
+        return {"command": "new_note", "text": " ".join(argv[1:])}
+    return {"command": "show"}
+
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "note":
+        # コマンドラインモード（tkinterを読み込まない）
+        from cli import main as cli_main
+        sys.exit(cli_main(sys.argv[2:]))
+    
+    # 既に起動しているインスタンスがあれば要求を転送して終了（tkinterを読み込む前に判定）
+    from services.instance_service import SingleInstanceServer, send_to_running_instance
+    startup_request = build_startup_request(sys.argv[1:])
+    instance_server = SingleInstanceServer()
+    if not instance_server.start():
+        if send_to_running_instance(startup_request):
+            sys.exit(0)
+        # ポートが他のプログラムに使われている場合は単独で起動する
+        instance_server = None
+    
     try:
         from app import StickyNoteApplication
         
         # アプリケーションの作成と実行
-        app = StickyNoteApplication()
+        app = StickyNoteApplication(instance_server, startup_request)
         app.run()
         
     except ImportError as e:
@@ -1,56 +1,249 @@
 """付箋データモデル"""
-from dataclasses import dataclass, asdict
-from typing import Dict, Any, Optional, TYPE_CHECKING
+import base64
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from sys import intern
+from typing import Dict, Any, Optional, Union, TYPE_CHECKING
 from datetime import datetime
-from utils.constants import DEFAULT_NOTE_COLOR, ID_DATE_FORMAT
+from utils.constants import DEFAULT_NOTE_COLOR, ID_DATE_FORMAT, BODY_COMPRESS_LEVEL, BODY_CACHE_SIZE
+from utils.id_generator import get_id_generator
 
 if TYPE_CHECKING:
     from services.language_service import LanguageService
 
 
-@dataclass
+# 保存するレコードで本文の圧縮方式を示す項目と、その値
+TEXT_CODEC_FIELD = "text_codec"
+TEXT_CODEC_ZLIB = "zlib"
+
+
+@dataclass(frozen=True)
+class CompressedBody:
+    """圧縮したまま保持している本文（payload はzlibで圧縮してBase64にした文字列）"""
+    codec: str
+    payload: str
+    
+    @classmethod
+    def compress(cls, text: str) -> 'CompressedBody':
+        """本文を圧縮"""
+        data = zlib.compress(text.encode("utf-8"), BODY_COMPRESS_LEVEL)
+        return cls(TEXT_CODEC_ZLIB, base64.b64encode(data).decode("ascii"))
+    
+    def decompress(self) -> str:
+        """本文を展開"""
+        if self.codec != TEXT_CODEC_ZLIB:
+            raise ValueError(f"未対応の圧縮方式です: {self.codec}")
+        return zlib.decompress(base64.b64decode(self.payload)).decode("utf-8")
+
+
+class BodyCache:
+    """展開した本文のLRUキャッシュ（圧縮した本文 -> 展開した本文）"""
+    
+    def __init__(self, max_size: int = BODY_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: 'OrderedDict[CompressedBody, str]' = OrderedDict()
+    
+    def get(self, body: CompressedBody) -> str:
+        """展開した本文を取得（キャッシュになければ展開して追加）"""
+        text = self._entries.get(body)
+        if text is None:
+            text = body.decompress()
+            self.put(body, text)
+        else:
+            self._entries.move_to_end(body)
+        return text
+    
+    def put(self, body: CompressedBody, text: str) -> None:
+        """展開した本文を追加し、古いものから上限を超えた分を捨てる"""
+        self._entries[body] = text
+        self._entries.move_to_end(body)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """キャッシュを空にする"""
+        self._entries.clear()
+
+
+_body_cache = BodyCache()
+
+
+def get_body_cache() -> BodyCache:
+    """展開した本文のキャッシュを取得"""
+    return _body_cache
+
+
+class LazyText:
+    """圧縮した本文を読み出すときに初めて展開する記述子（値は付箋の _body に保持）"""
+    
+    def __get__(self, obj: Any, objtype: Any = None) -> str:
+        if obj is None:
+            return ""  # クラスから参照した場合（NoteData.text）はインスタンスの本文がないので空文字列
+        body = obj._body
+        if isinstance(body, CompressedBody):
+            return _body_cache.get(body)
+        return body
+    
+    def __set__(self, obj: Any, value: Union[str, CompressedBody]) -> None:
+        obj._body = value
+
+
+# 開閉・アーカイブの状態をまとめたビットフラグ
+FLAG_OPEN = 1
+FLAG_WAS_OPEN = 2
+FLAG_ARCHIVED = 4
+
+
 class NoteData:
-    """付箋データを表すデータクラス"""
-    id: str
-    text: str = ""
-    x: Optional[int] = None
-    y: Optional[int] = None
-    width: int = 200
-    height: int = 200
-    color: str = DEFAULT_NOTE_COLOR
-    is_open: bool = False
-    was_open: bool = False
+    """付箋データ
+    
+    大量の付箋を保持するため __slots__ でインスタンスごとの辞書を持たない。
+    開閉・アーカイブの3つの状態は1つの整数にまとめ、色の文字列は intern して同じ色の付箋で共有する。
+    """
+    __slots__ = ("id", "_body", "x", "y", "width", "height", "color", "_flags", "revision", "updated_at")
+    
+    # 項目名（to_dict のキーの順序）
+    FIELDS = ("id", "text", "x", "y", "width", "height", "color", "is_open", "was_open", "archived",
+              "revision", "updated_at")
+    
+    text = LazyText()
+    
+    def __init__(self, id: str, text: Union[str, CompressedBody] = "", x: Optional[int] = None,
+                 y: Optional[int] = None, width: int = 200, height: int = 200, color: str = DEFAULT_NOTE_COLOR,
+                 is_open: bool = False, was_open: bool = False, archived: bool = False,
+                 revision: int = 0, updated_at: float = 0.0):
+        self.id = id
+        self._body = text
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.color = intern(color) if type(color) is str else color
+        self._flags = (FLAG_OPEN if is_open else 0) | (FLAG_WAS_OPEN if was_open else 0) | (FLAG_ARCHIVED if archived else 0)
+        self.revision = revision  # 保存されるたびに増える版番号（他プロセスの変更との統合に使用）
+        self.updated_at = updated_at  # 最後に内容が変わって保存された時刻（UNIX時間）
+    
+    @property
+    def is_open(self) -> bool:
+        """ウィンドウを開いているか"""
+        return bool(self._flags & FLAG_OPEN)
+    
+    @is_open.setter
+    def is_open(self, value: bool) -> None:
+        self._flags = self._flags | FLAG_OPEN if value else self._flags & ~FLAG_OPEN
+    
+    @property
+    def was_open(self) -> bool:
+        """前回開いていたか（起動時に復元する）"""
+        return bool(self._flags & FLAG_WAS_OPEN)
+    
+    @was_open.setter
+    def was_open(self, value: bool) -> None:
+        self._flags = self._flags | FLAG_WAS_OPEN if value else self._flags & ~FLAG_WAS_OPEN
+    
+    @property
+    def archived(self) -> bool:
+        """アーカイブ済みか"""
+        return bool(self._flags & FLAG_ARCHIVED)
+    
+    @archived.setter
+    def archived(self, value: bool) -> None:
+        self._flags = self._flags | FLAG_ARCHIVED if value else self._flags & ~FLAG_ARCHIVED
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NoteData):
+            return NotImplemented
+        return self.to_tuple() == other.to_tuple()
+    
+    __hash__ = None  # 内容が変わるのでハッシュ化しない
+    
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"NoteData({values})"
     
     @classmethod
     def create_new(cls, text: str = "", x: Optional[int] = None, y: Optional[int] = None) -> 'NoteData':
         """新しい付箋データを作成"""
-        note_id = datetime.now().strftime(ID_DATE_FORMAT)
+        note_id = get_id_generator().next_id()
         return cls(id=note_id, text=text, x=x, y=y, is_open=True, was_open=True)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'NoteData':
-        """辞書から付箋データを作成"""
-        return cls(
-            id=data.get("id", ""),
-            text=data.get("text", ""),
-            x=data.get("x"),
-            y=data.get("y"),
-            width=data.get("width", 200),
-            height=data.get("height", 200),
-            color=data.get("color", DEFAULT_NOTE_COLOR),
-            is_open=data.get("is_open", False),
-            was_open=data.get("was_open", False)
-        )
+        """辞書から付箋データを作成（圧縮された本文は展開せずに保持）"""
+        get = data.get
+        note = cls.__new__(cls)
+        note.id = get("id", "")
+        codec = get(TEXT_CODEC_FIELD)
+        note._body = get("text", "") if codec is None else CompressedBody(codec, get("text", ""))
+        note.x = get("x")
+        note.y = get("y")
+        note.width = get("width", 200)
+        note.height = get("height", 200)
+        color = get("color", DEFAULT_NOTE_COLOR)
+        note.color = intern(color) if type(color) is str else color
+        note._flags = ((FLAG_OPEN if get("is_open") else 0) | (FLAG_WAS_OPEN if get("was_open") else 0)
+                       | (FLAG_ARCHIVED if get("archived") else 0))
+        note.revision = get("revision", 0)
+        note.updated_at = get("updated_at", 0.0)
+        return note
     
     def to_dict(self) -> Dict[str, Any]:
-        """辞書形式に変換"""
-        return asdict(self)
+        """辞書形式に変換（圧縮した本文は展開する）"""
+        flags = self._flags
+        return {"id": self.id, "text": self.text, "x": self.x, "y": self.y, "width": self.width,
+                "height": self.height, "color": self.color, "is_open": bool(flags & FLAG_OPEN),
+                "was_open": bool(flags & FLAG_WAS_OPEN), "archived": bool(flags & FLAG_ARCHIVED),
+                "revision": self.revision, "updated_at": self.updated_at}
+    
+    def to_record(self, compress_threshold: int = 0) -> Dict[str, Any]:
+        """保存用の辞書に変換（compress_threshold 文字以上の本文は圧縮し、圧縮方式を記録）
+        
+        圧縮した本文は次の保存で圧縮し直さないよう付箋に保持する（展開した本文はキャッシュに残す）。
+        """
+        body = self._body
+        if compress_threshold > 0 and isinstance(body, str) and len(body) >= compress_threshold:
+            compressed = CompressedBody.compress(body)
+            _body_cache.put(compressed, body)
+            self._body = body = compressed
+        if compress_threshold <= 0 or not isinstance(body, CompressedBody):
+            return self.to_dict()
+        record = self._fields_without_text()
+        record["text"] = body.payload
+        record[TEXT_CODEC_FIELD] = body.codec
+        return record
+    
+    def _fields_without_text(self) -> Dict[str, Any]:
+        """本文以外の項目の辞書（本文を展開しない）"""
+        flags = self._flags
+        return {"id": self.id, "x": self.x, "y": self.y, "width": self.width, "height": self.height,
+                "color": self.color, "is_open": bool(flags & FLAG_OPEN), "was_open": bool(flags & FLAG_WAS_OPEN),
+                "archived": bool(flags & FLAG_ARCHIVED), "revision": self.revision, "updated_at": self.updated_at}
+    
+    def to_tuple(self) -> tuple:
+        """項目を固定順のタプルに変換（開閉・アーカイブの状態はビットフラグのまま。from_tuple で戻す）"""
+        return (self.id, self.text, self.x, self.y, self.width, self.height, self.color, self._flags,
+                self.revision, self.updated_at)
+    
+    @classmethod
+    def from_tuple(cls, values: tuple) -> 'NoteData':
+        """to_tuple で変換したタプルから付箋データを作成"""
+        note = cls.__new__(cls)
+        (note.id, note._body, note.x, note.y, note.width, note.height, color, note._flags,
+         note.revision, note.updated_at) = values
+        note.color = intern(color) if type(color) is str else color
+        return note
+    
+    @property
+    def stored_text(self) -> Union[str, CompressedBody]:
+        """保持している本文（圧縮している場合は展開しない。変更の検出に使う）"""
+        return self._body
     
     def get_formatted_date(self) -> str:
         """日時をフォーマット済み文字列で取得"""
-        if len(self.id) == 14 and self.id.isdigit():
+        if len(self.id) >= 14 and self.id.isdigit():
             try:
-                date_obj = datetime.strptime(self.id, ID_DATE_FORMAT)
+                date_obj = datetime.strptime(self.id[:14], ID_DATE_FORMAT)
                 return date_obj.strftime("%Y/%m/%d %H:%M")
             except ValueError:
                 return self.id
@@ -71,6 +264,8 @@ class NoteData:
     
     def get_status_text(self, language_service: Optional['LanguageService'] = None) -> str:
         """状態テキストを取得"""
+        if self.archived:
+            return language_service.translate("status_archived") if language_service else "アーカイブ済み"
         if language_service:
             return language_service.translate("status_open") if self.is_open else language_service.translate("status_closed")
         else:
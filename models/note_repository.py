@@ -1,10 +1,30 @@
 """付箋データのリポジトリパターン実装"""
-from typing import List, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 from abc import abstractmethod
 import json
 import os
+import tempfile
+import time
 from models.note_model import NoteData
-from utils.constants import NOTES_FILE
+from utils.file_lock import FileLock
+from utils.constants import (
+    NOTES_FILE, FSYNC_ALWAYS, FSYNC_PERIODIC, FSYNC_POLICIES, DEFAULT_FSYNC_POLICY, FSYNC_INTERVAL,
+    BODY_COMPRESS_THRESHOLD
+)
+
+
+def _fsync_directory(directory: str) -> None:
+    """置き換え（rename）自体をディスクに反映させる（ディレクトリを開けないWindowsでは何もしない）"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 class NoteRepositoryInterface(Protocol):
@@ -42,12 +62,29 @@ class NoteRepositoryInterface(Protocol):
 
 
 class JsonNoteRepository:
-    """JSON形式での付箋データ永続化"""
-    
-    def __init__(self, file_path: str = NOTES_FILE):
+    """JSON形式での付箋データ永続化
+    
+    書き込みは「ロックファイルで他の書き込みプロセスを待つ → 一時ファイルに書く → os.replace で置き換える」
+    の順に行うので、書き込み中にクラッシュしても元のファイルは壊れない。
+    fsync_policy でディスクへの書き込みを待つ頻度（耐久性と保存の速さのトレードオフ）を選べる。
+    compress_threshold 文字以上の本文はzlibで圧縮して保存し、読み込み後も参照されるまで展開しない。
+    """
+    
+    def __init__(self, file_path: str = NOTES_FILE, fsync_policy: str = DEFAULT_FSYNC_POLICY,
+                 fsync_interval: float = FSYNC_INTERVAL, compress_threshold: int = BODY_COMPRESS_THRESHOLD):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"不明なfsyncポリシーです: {fsync_policy}")
         self.file_path = file_path
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+        self.compress_threshold = compress_threshold
+        self.file_lock = FileLock(f"{file_path}.lock")
         self._notes_cache: List[NoteData] = []
         self._cache_loaded = False
+        # 最後に読み書きした時点のファイル状態（他プロセスによる変更の検出用）
+        self._file_signature: Optional[Tuple[int, int]] = None
+        self._last_fsync: Optional[float] = None
+        self._has_unsynced_write = False
     
     def load_all(self) -> List[NoteData]:
         """すべての付箋データを読み込み"""
@@ -58,14 +95,62 @@ class JsonNoteRepository:
     def save_all(self, notes: List[NoteData]) -> bool:
         """すべての付箋データを保存"""
         try:
-            data = [note.to_dict() for note in notes]
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            data = [note.to_record(self.compress_threshold) for note in notes]
+            with self.file_lock:
+                self._write_atomically(data, durable=self._should_fsync())
+                self._file_signature = self.get_file_signature()
             self._notes_cache = notes.copy()
             return True
         except Exception:
             return False
     
+    def lock(self) -> FileLock:
+        """他のプロセスの書き込みと排他するロック（読み込みから保存までをまとめて守る場合に使う）"""
+        return self.file_lock
+    
+    def _should_fsync(self) -> bool:
+        """今回の書き込みでディスクへの反映を待つか"""
+        if self.fsync_policy == FSYNC_ALWAYS:
+            return True
+        if self.fsync_policy == FSYNC_PERIODIC:
+            return self._last_fsync is None or time.monotonic() - self._last_fsync >= self.fsync_interval
+        return False
+    
+    def _write_atomically(self, data: list, durable: bool = True) -> None:
+        """一時ファイルに書き込んでから置き換える（読み手が書きかけのファイルを見ないように）"""
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        fd, temp_path = tempfile.mkstemp(prefix=".free_sticky_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            if os.path.exists(self.file_path):
+                os.chmod(temp_path, os.stat(self.file_path).st_mode)
+            os.replace(temp_path, self.file_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        
+        if durable:
+            _fsync_directory(directory)
+            self._last_fsync = time.monotonic()
+            self._has_unsynced_write = False
+        else:
+            self._has_unsynced_write = True
+    
+    def sync_to_disk(self) -> None:
+        """fsyncを省略した書き込みがあれば、ディスクへの反映を待つ（終了時に呼ぶ）"""
+        if not self._has_unsynced_write or not os.path.exists(self.file_path):
+            return
+        with open(self.file_path, "ab") as f:
+            os.fsync(f.fileno())
+        _fsync_directory(os.path.dirname(os.path.abspath(self.file_path)))
+        self._last_fsync = time.monotonic()
+        self._has_unsynced_write = False
+    
     def find_by_id(self, note_id: str) -> Optional[NoteData]:
         """IDで付箋を検索"""
         if not self._cache_loaded:
@@ -114,18 +199,48 @@ class JsonNoteRepository:
     
     def _load_from_file(self) -> None:
         """ファイルからデータを読み込み"""
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                self._notes_cache = [NoteData.from_dict(item) for item in data]
-            except Exception:
-                self._notes_cache = []
-        else:
-            self._notes_cache = []
-        
+        self._file_signature = self.get_file_signature()
+        self._notes_cache = self.read_file()
         self._cache_loaded = True
     
+    def read_file(self) -> List[NoteData]:
+        """キャッシュを使わずにファイルの現在の内容を読み込み"""
+        try:
+            return [NoteData.from_dict(item) for item in self._read_records()]
+        except Exception:
+            return []
+    
+    def read_external_records(self) -> List[Dict[str, Any]]:
+        """他プロセスが書き込んだ現在の内容を辞書のまま読み込み、読み込み済みの状態として記録
+        
+        付箋データへの変換は呼び出し側で変更のあったレコードだけに行えるよう、辞書のまま返す。
+        書きかけのファイルなどで読み込めない場合は例外を送出する（空として扱うと全件削除と区別できない）。
+        """
+        signature = self.get_file_signature()
+        records = self._read_records()
+        self._file_signature = signature
+        return records
+    
+    def _read_records(self) -> List[Dict[str, Any]]:
+        """ファイルのレコードを辞書のまま読み込み（読み込めない場合は例外を送出）"""
+        if not os.path.exists(self.file_path):
+            return []
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return [item for item in data if isinstance(item, dict)]
+    
+    def get_file_signature(self) -> Optional[Tuple[int, int]]:
+        """ファイルの更新時刻とサイズを取得（存在しなければNone）"""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def has_external_changes(self) -> bool:
+        """最後の読み書きの後に他プロセスがファイルを変更したか"""
+        return self._cache_loaded and self.get_file_signature() != self._file_signature
+    
     def file_exists(self) -> bool:
         """データファイルが存在するかチェック"""
         return os.path.exists(self.file_path)
@@ -0,0 +1,122 @@
+"""単一インスタンスサービス - 2回目以降の起動要求を起動中のアプリに転送
+
+tkinterを読み込まないので、2回目の起動はGUIを作らずに数ミリ秒で終了できる。
+待ち受けポートはデータファイルの絶対パスから決まるため、同じデータファイルを
+使うアプリだけが1つにまとめられる。
+"""
+import json
+import os
+import socket
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+from utils.constants import (
+    NOTES_FILE, INSTANCE_APP_ID, INSTANCE_HOST, INSTANCE_PORT_BASE, INSTANCE_PORT_RANGE,
+    INSTANCE_CONNECT_TIMEOUT, INSTANCE_MAX_REQUEST_BYTES
+)
+
+_REPLY = f"{INSTANCE_APP_ID} ok\n".encode("utf-8")
+
+
+def get_instance_port(notes_file: str = NOTES_FILE) -> int:
+    """データファイルに対応する待ち受けポートを取得"""
+    key = os.path.normcase(os.path.abspath(notes_file)).encode("utf-8")
+    return INSTANCE_PORT_BASE + zlib.crc32(key) % INSTANCE_PORT_RANGE
+
+
+def send_to_running_instance(request: Dict[str, Any], port: Optional[int] = None,
+                             timeout: float = INSTANCE_CONNECT_TIMEOUT) -> bool:
+    """起動中のインスタンスに要求を送信（受け付けられなかった場合はFalse）"""
+    if port is None:
+        port = get_instance_port()
+    message = dict(request, app=INSTANCE_APP_ID)
+    try:
+        with socket.create_connection((INSTANCE_HOST, port), timeout=timeout) as conn:
+            conn.sendall(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+            reply = conn.makefile("rb").readline(len(_REPLY))
+    except OSError:
+        return False
+    return reply == _REPLY
+
+
+class SingleInstanceServer:
+    """ローカルのソケットで待ち受け、後から起動されたインスタンスの要求を受け取るサーバー"""
+    
+    def __init__(self, port: Optional[int] = None):
+        self.port = port if port is not None else get_instance_port()
+        self._socket: Optional[socket.socket] = None
+        self._handler: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+    
+    def start(self) -> bool:
+        """待ち受けを開始（既に他のインスタンスが待ち受けている場合はFalse）"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+                # Windowsでは他のプロセスに同じポートを奪われないようにする
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+            else:
+                # 終了直後のTIME_WAITで再起動できなくならないようにする（待ち受け中のポートは共有されない）
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((INSTANCE_HOST, self.port))
+            sock.listen(5)
+        except OSError:
+            sock.close()
+            return False
+        
+        self._socket = sock
+        threading.Thread(target=self._serve, args=(sock,), name="single-instance", daemon=True).start()
+        return True
+    
+    def set_request_handler(self, handler: Callable[[Dict[str, Any]], None]) -> None:
+        """要求を受け取る処理を設定（それまでに届いた要求もここで渡す）"""
+        with self._lock:
+            self._handler = handler
+            pending, self._pending = self._pending, []
+        for request in pending:
+            handler(request)
+    
+    def stop(self) -> None:
+        """待ち受けを終了"""
+        if self._socket is not None:
+            try:
+                # accept() で待機中のスレッドを起こす
+                self._socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._socket.close()
+            self._socket = None
+    
+    def _serve(self, sock: socket.socket) -> None:
+        """接続を順に受け付ける（ワーカースレッドで実行）"""
+        while True:
+            try:
+                conn, _ = sock.accept()
+            except OSError:
+                return  # stop() で閉じられた
+            with conn:
+                conn.settimeout(INSTANCE_CONNECT_TIMEOUT)
+                self._handle_connection(conn)
+    
+    def _handle_connection(self, conn: socket.socket) -> None:
+        """1件の要求を読み込んで処理に渡し、受け付けたことを返信"""
+        try:
+            line = conn.makefile("rb").readline(INSTANCE_MAX_REQUEST_BYTES)
+            request = json.loads(line.decode("utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(request, dict) or request.pop("app", None) != INSTANCE_APP_ID:
+            return
+        
+        with self._lock:
+            handler = self._handler
+            if handler is None:
+                self._pending.append(request)
+        if handler is not None:
+            handler(request)
+        
+        try:
+            conn.sendall(_REPLY)
+        except OSError:
+            pass
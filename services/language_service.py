@@ -1,24 +1,32 @@
 """言語管理サービス"""
-import json
-import os
-from typing import Optional, Callable
-from utils.translations import TRANSLATIONS, AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE, get_translation, get_language_name
+from typing import Optional, Callable, List
+from services.settings_service import get_settings_service
+from utils.translations import AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE, get_translation, get_language_name
 
 
 class LanguageService:
     """言語設定とローカライゼーションを管理するサービス"""
     
-    SETTINGS_FILE = "free_sticky_settings.json"
-    
     def __init__(self):
+        self._settings_service = get_settings_service()
         self._current_language = DEFAULT_LANGUAGE
         self._language_changed_callback: Optional[Callable[[str], None]] = None
+        self._language_changed_listeners: List[Callable[[str], None]] = []
         self._load_settings()
     
     def set_language_changed_callback(self, callback: Callable[[str], None]) -> None:
         """言語変更コールバックを設定"""
         self._language_changed_callback = callback
     
+    def add_language_changed_listener(self, listener: Callable[[str], None]) -> None:
+        """言語変更リスナーを追加"""
+        self._language_changed_listeners.append(listener)
+    
+    def remove_language_changed_listener(self, listener: Callable[[str], None]) -> None:
+        """言語変更リスナーを削除"""
+        if listener in self._language_changed_listeners:
+            self._language_changed_listeners.remove(listener)
+    
     def get_current_language(self) -> str:
         """現在の言語を取得"""
         return self._current_language
@@ -28,6 +36,8 @@ class LanguageService:
         if language_code in AVAILABLE_LANGUAGES:
             self._current_language = language_code
             self._save_settings()
+            for listener in list(self._language_changed_listeners):
+                listener(language_code)
             if self._language_changed_callback:
                 self._language_changed_callback(language_code)
             return True
@@ -43,33 +53,21 @@ class LanguageService:
     
     def _load_settings(self) -> None:
         """設定を読み込み"""
-        if os.path.exists(self.SETTINGS_FILE):
-            try:
-                with open(self.SETTINGS_FILE, "r", encoding="utf-8") as f:
-                    settings = json.load(f)
-                    language = settings.get("language", DEFAULT_LANGUAGE)
-                    if language in AVAILABLE_LANGUAGES:
-                        self._current_language = language
-            except Exception:
-                # 設定ファイルの読み込みに失敗した場合はデフォルトを使用
-                pass
+        language = self._settings_service.get("language", DEFAULT_LANGUAGE)
+        if language in AVAILABLE_LANGUAGES:
+            self._current_language = language
     
     def _save_settings(self) -> None:
         """設定を保存"""
-        try:
-            settings = {
-                "language": self._current_language
-            }
-            with open(self.SETTINGS_FILE, "w", encoding="utf-8") as f:
-                json.dump(settings, f, ensure_ascii=False, indent=2)
-        except Exception:
-            # 設定ファイルの保存に失敗した場合は無視
-            pass
+        self._settings_service.set("language", self._current_language)
 
 
-# グローバルインスタンス
-_language_service = LanguageService()
+# グローバルインスタンス（import時に設定ファイルを読まないよう初回利用時に作成）
+_language_service: Optional[LanguageService] = None
 
 def get_language_service() -> LanguageService:
     """言語サービスのシングルトンインスタンスを取得"""
+    global _language_service
+    if _language_service is None:
+        _language_service = LanguageService()
     return _language_service
@@ -0,0 +1,50 @@
+"""メインスレッドディスパッチャー - ワーカースレッドからTkスレッドへの受け渡し"""
+import queue
+import tkinter as tk
+from typing import Any, Callable, Optional
+from utils.constants import DISPATCH_POLL_INTERVAL, DISPATCH_BATCH_SIZE
+
+
+class MainThreadDispatcher:
+    """他のスレッドから投入された処理をafter()でTkのメインスレッドに実行させるキュー"""
+    
+    def __init__(self, widget: tk.Misc, interval: int = DISPATCH_POLL_INTERVAL,
+                 batch_size: int = DISPATCH_BATCH_SIZE):
+        self.widget = widget
+        self.interval = interval
+        self.batch_size = batch_size
+        self._queue: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._job: Optional[str] = None
+    
+    def post(self, func: Callable[..., Any], *args: Any) -> None:
+        """メインスレッドで実行する処理を投入（どのスレッドからでも呼び出し可能）"""
+        self._queue.put((func, args))
+    
+    def start(self) -> None:
+        """キューの監視を開始"""
+        if self._job is None:
+            self._job = self.widget.after(self.interval, self._poll)
+    
+    def stop(self) -> None:
+        """キューの監視を停止"""
+        if self._job is not None:
+            try:
+                self.widget.after_cancel(self._job)
+            except tk.TclError:
+                pass
+            self._job = None
+    
+    def _poll(self) -> None:
+        """キューにたまった処理を1回あたり batch_size 件まで実行"""
+        self._job = None
+        try:
+            for _ in range(self.batch_size):
+                try:
+                    func, args = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                func(*args)
+        finally:
+            # 処理中に例外が起きても監視は続ける
+            if self.widget.winfo_exists():
+                self._job = self.widget.after(self.interval, self._poll)
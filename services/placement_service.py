@@ -0,0 +1,194 @@
+"""付箋配置サービス - 空間インデックスを使った重ならない配置"""
+from typing import Dict, Hashable, Iterator, List, Optional, Set, Tuple
+from utils.constants import (
+    PLACEMENT_CELL_SIZE, PLACEMENT_STEP, PLACEMENT_GAP, PLACEMENT_MARGIN
+)
+
+# (x, y, 幅, 高さ)
+Rect = Tuple[int, int, int, int]
+
+
+class SpatialGrid:
+    """一様グリッドによる矩形の空間インデックス"""
+    
+    def __init__(self, cell_size: int = PLACEMENT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._rects: Dict[Hashable, Rect] = {}
+    
+    def __len__(self) -> int:
+        return len(self._rects)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rects
+    
+    def insert(self, key: Hashable, rect: Rect) -> None:
+        """矩形を登録（既に登録済みなら置き換え）"""
+        if key in self._rects:
+            self.remove(key)
+        self._rects[key] = rect
+        for cell in self._cells_for(rect):
+            self._cells.setdefault(cell, set()).add(key)
+    
+    def remove(self, key: Hashable) -> None:
+        """矩形を削除"""
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return
+        for cell in self._cells_for(rect):
+            keys = self._cells.get(cell)
+            if keys:
+                keys.discard(key)
+                if not keys:
+                    del self._cells[cell]
+    
+    def clear(self) -> None:
+        """すべての矩形を削除"""
+        self._cells.clear()
+        self._rects.clear()
+    
+    def get(self, key: Hashable) -> Optional[Rect]:
+        """登録済みの矩形を取得"""
+        return self._rects.get(key)
+    
+    def query(self, rect: Rect) -> Set[Hashable]:
+        """指定矩形と重なる矩形のキーを取得"""
+        found: Set[Hashable] = set()
+        for cell in self._cells_for(rect):
+            for key in self._cells.get(cell, ()):
+                if key not in found and _overlaps(self._rects[key], rect):
+                    found.add(key)
+        return found
+    
+    def intersects(self, rect: Rect) -> bool:
+        """指定矩形と重なる矩形があるか"""
+        for cell in self._cells_for(rect):
+            for key in self._cells.get(cell, ()):
+                if _overlaps(self._rects[key], rect):
+                    return True
+        return False
+    
+    def _cells_for(self, rect: Rect) -> Iterator[Tuple[int, int]]:
+        """矩形が占めるセルを列挙"""
+        x, y, width, height = rect
+        size = self.cell_size
+        for cx in range(x // size, (x + max(width, 1) - 1) // size + 1):
+            for cy in range(y // size, (y + max(height, 1) - 1) // size + 1):
+                yield cx, cy
+
+
+def _overlaps(a: Rect, b: Rect) -> bool:
+    """2つの矩形が重なっているか"""
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+
+class PlacementService:
+    """開いている付箋の位置を管理し、新しい付箋の空き位置を探すサービス"""
+    
+    def __init__(self, cell_size: int = PLACEMENT_CELL_SIZE, step: int = PLACEMENT_STEP,
+                 gap: int = PLACEMENT_GAP, margin: int = PLACEMENT_MARGIN):
+        self.grid = SpatialGrid(cell_size)
+        self.step = step
+        self.gap = gap
+        self.margin = margin
+        # 空きが見つからなかった探索条件（空きが増えるまで再探索しない）
+        self._exhausted: Optional[Tuple[int, int, int, int]] = None
+    
+    def register(self, key: Hashable, x: int, y: int, width: int, height: int) -> None:
+        """付箋の位置を登録・更新"""
+        if key in self.grid:
+            self._exhausted = None
+        self.grid.insert(key, (x, y, width, height))
+    
+    def unregister(self, key: Hashable) -> None:
+        """付箋の位置を削除"""
+        if key in self.grid:
+            self._exhausted = None
+        self.grid.remove(key)
+    
+    def clear(self) -> None:
+        """登録済みの位置をすべて削除"""
+        self._exhausted = None
+        self.grid.clear()
+    
+    def is_on_screen(self, x: int, y: int, width: int, height: int,
+                     screen_width: int, screen_height: int,
+                     origin_x: int = 0, origin_y: int = 0) -> bool:
+        """付箋が画面内に収まっているか（origin は仮想デスクトップ左上の座標）"""
+        return (origin_x <= x and origin_y <= y and
+                x + width <= origin_x + screen_width and y + height <= origin_y + screen_height)
+    
+    def find_free_position(self, width: int, height: int, screen_width: int, screen_height: int,
+                           preferred: Optional[Tuple[int, int]] = None) -> Tuple[int, int]:
+        """希望位置に最も近い、他の付箋と重ならない位置を探す"""
+        max_x = max(self.margin, screen_width - width - self.margin)
+        max_y = max(self.margin, screen_height - height - self.margin)
+        origin_x, origin_y = preferred if preferred else (self.margin, self.margin)
+        origin_x = min(max(origin_x, self.margin), max_x)
+        origin_y = min(max(origin_y, self.margin), max_y)
+        
+        # 希望位置を中心に格子点をリング状に広げて探索する
+        search_key = (width, height, screen_width, screen_height)
+        max_ring = max(max_x - self.margin, max_y - self.margin) // self.step + 1
+        if self._exhausted == search_key:
+            max_ring = -1
+        for ring in range(max_ring + 1):
+            best: Optional[Tuple[int, int]] = None
+            best_distance = 0
+            for x, y in self._ring_points(origin_x, origin_y, ring, max_x, max_y):
+                distance = (x - origin_x) ** 2 + (y - origin_y) ** 2
+                if best is not None and distance >= best_distance:
+                    continue
+                padded = (x - self.gap, y - self.gap, width + 2 * self.gap, height + 2 * self.gap)
+                if not self.grid.intersects(padded):
+                    best, best_distance = (x, y), distance
+            if best is not None:
+                return best
+        
+        # 空きがない場合は登録数に応じて少しずつずらして重ねる
+        self._exhausted = search_key
+        offset = (len(self.grid) * self.step) % max(1, min(max_x, max_y) - self.margin + 1)
+        return min(origin_x + offset, max_x), min(origin_y + offset, max_y)
+    
+    def arrange(self, sizes: List[Tuple[Hashable, int, int]], screen_width: int,
+                screen_height: int) -> Dict[Hashable, Tuple[int, int]]:
+        """付箋を画面左上から行単位でタイル状に並べた位置を計算"""
+        positions: Dict[Hashable, Tuple[int, int]] = {}
+        x, y = self.margin, self.margin
+        row_height = 0
+        page = 0
+        for key, width, height in sizes:
+            if x > self.margin and x + width > screen_width - self.margin:
+                x = self.margin + page * self.step
+                y += row_height + self.gap
+                row_height = 0
+            if y > self.margin and y + height > screen_height - self.margin:
+                # 画面に収まらない分は少しずらして次のページとして重ねる
+                page += 1
+                x = self.margin + page * self.step
+                y = self.margin + page * self.step
+                row_height = 0
+            positions[key] = (x, y)
+            x += width + self.gap
+            row_height = max(row_height, height)
+        return positions
+    
+    def _ring_points(self, origin_x: int, origin_y: int, ring: int,
+                     max_x: int, max_y: int) -> Iterator[Tuple[int, int]]:
+        """中心から ring 段目の格子点（画面内のもののみ）を列挙"""
+        offset = ring * self.step
+        left, right = origin_x - offset, origin_x + offset
+        top, bottom = origin_y - offset, origin_y + offset
+        xs = range(left, right + 1, self.step)
+        ys = range(top + self.step, bottom, self.step)
+        rows = (top, bottom) if ring else (top,)
+        for y in rows:
+            if self.margin <= y <= max_y:
+                for x in xs:
+                    if self.margin <= x <= max_x:
+                        yield x, y
+        for x in ((left, right) if ring else ()):
+            if self.margin <= x <= max_x:
+                for y in ys:
+                    if self.margin <= y <= max_y:
+                        yield x, y
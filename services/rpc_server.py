@@ -0,0 +1,123 @@
+"""自動化APIサーバー - 127.0.0.1 で JSON-RPC 2.0 の要求を HTTP POST で受け付ける
+
+要求の解析と応答の送信はワーカースレッドで行い、付箋の操作は post（MainThreadDispatcher.post）で
+メインスレッドに渡すので、Tkのウィジェットにはメインスレッドからしか触れない。
+
+使用例:
+    curl -H "Content-Type: application/json" -d '{"jsonrpc": "2.0", "id": 1, "method": "notes.list"}' \\
+        http://127.0.0.1:47180/
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+from core.rpc import PARSE_ERROR, INTERNAL_ERROR, error_response
+from utils.constants import RPC_HOST, RPC_DEFAULT_PORT, RPC_CALL_TIMEOUT, RPC_MAX_REQUEST_BYTES
+
+
+class _RpcRequestHandler(BaseHTTPRequestHandler):
+    """1件のHTTP要求を処理するハンドラー"""
+    
+    server: "_RpcHttpServer"
+    
+    def do_POST(self) -> None:
+        """JSON-RPCの要求を処理"""
+        # ブラウザからの送信（CSRF）やDNSリバインディングを受け付けない
+        host = self.headers.get("Host", "").rsplit(":", 1)[0]
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip()
+        if host not in (RPC_HOST, "localhost") or content_type != "application/json":
+            self.send_error(403)
+            return
+        
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > RPC_MAX_REQUEST_BYTES:
+            self.send_error(413)
+            return
+        
+        try:
+            payload = json.loads(self.rfile.read(length).decode("utf-8"))
+        except (UnicodeDecodeError, ValueError):
+            self._send_json(error_response(None, PARSE_ERROR, "JSONを解析できません"))
+            return
+        
+        response = self.server.rpc_server.execute(payload)
+        if response is None:
+            self.send_response(204)
+            self.end_headers()
+        else:
+            self._send_json(response)
+    
+    def _send_json(self, response: Any) -> None:
+        """JSONの応答を送信"""
+        body = json.dumps(response, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        """アクセスログは出力しない"""
+        pass
+
+
+class _RpcHttpServer(ThreadingHTTPServer):
+    """RpcServerへの参照を持つHTTPサーバー"""
+    
+    daemon_threads = True
+    
+    def __init__(self, address: tuple, rpc_server: "RpcServer"):
+        self.rpc_server = rpc_server
+        super().__init__(address, _RpcRequestHandler)
+
+
+class RpcServer:
+    """自動化APIのHTTPサーバーを管理するクラス"""
+    
+    def __init__(self, handle: Callable[[Any], Any], post: Callable[..., None], port: int = RPC_DEFAULT_PORT):
+        """handle は解析済みの要求を処理する関数（NoteRpcHandler.handle）、post はメインスレッドへの投入関数"""
+        self.handle = handle
+        self.post = post
+        self.port = port
+        self._http_server: Optional[_RpcHttpServer] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """待ち受け中か"""
+        return self._http_server is not None
+    
+    def start(self) -> bool:
+        """待ち受けを開始（ポートを使えない場合はFalse）"""
+        if self._http_server is not None:
+            return True
+        try:
+            self._http_server = _RpcHttpServer((RPC_HOST, self.port), self)
+        except OSError:
+            return False
+        threading.Thread(target=self._http_server.serve_forever, name="rpc-server", daemon=True).start()
+        return True
+    
+    def stop(self) -> None:
+        """待ち受けを終了"""
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+    
+    def execute(self, payload: Any) -> Any:
+        """要求をメインスレッドで処理させ、完了を待って応答を返す（ワーカースレッドから呼ばれる）"""
+        done = threading.Event()
+        result: dict = {}
+        
+        def run() -> None:
+            try:
+                result["response"] = self.handle(payload)
+            except Exception as e:
+                result["response"] = error_response(None, INTERNAL_ERROR, str(e))
+            finally:
+                done.set()
+        
+        self.post(run)
+        if not done.wait(RPC_CALL_TIMEOUT):
+            return error_response(None, INTERNAL_ERROR, "メインスレッドでの処理がタイムアウトしました")
+        return result["response"]
@@ -0,0 +1,72 @@
+"""設定サービス - アプリ設定ファイルの読み書きを管理"""
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional
+from utils.constants import SETTINGS_FILE
+
+
+class SettingsService:
+    """設定ファイル（キーと値のJSON）を保持し、変更をリスナーに通知するサービス
+    
+    保存時は既存のキーを残したまま書き込むので、言語設定など他の設定を上書きしない。
+    """
+    
+    def __init__(self, settings_file: str = SETTINGS_FILE):
+        self.settings_file = settings_file
+        self._settings: Dict[str, Any] = self._load()
+        self._listeners: List[Callable[[str, Any], None]] = []
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """設定値を取得"""
+        return self._settings.get(key, default)
+    
+    def set(self, key: str, value: Any) -> None:
+        """設定値を変更して保存し、リスナーに通知"""
+        if self._settings.get(key) == value and key in self._settings:
+            return
+        self._settings[key] = value
+        self._save()
+        for listener in list(self._listeners):
+            listener(key, value)
+    
+    def add_setting_changed_listener(self, listener: Callable[[str, Any], None]) -> None:
+        """設定変更リスナーを追加（キーと新しい値を受け取る）"""
+        self._listeners.append(listener)
+    
+    def remove_setting_changed_listener(self, listener: Callable[[str, Any], None]) -> None:
+        """設定変更リスナーを削除"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _load(self) -> Dict[str, Any]:
+        """設定を読み込み"""
+        if os.path.exists(self.settings_file):
+            try:
+                with open(self.settings_file, "r", encoding="utf-8") as f:
+                    settings = json.load(f)
+                if isinstance(settings, dict):
+                    return settings
+            except Exception:
+                # 設定ファイルの読み込みに失敗した場合はデフォルトを使用
+                pass
+        return {}
+    
+    def _save(self) -> None:
+        """設定を保存"""
+        try:
+            with open(self.settings_file, "w", encoding="utf-8") as f:
+                json.dump(self._settings, f, ensure_ascii=False, indent=2)
+        except Exception:
+            # 設定ファイルの保存に失敗した場合は無視
+            pass
+
+
+# グローバルインスタンス（import時に設定ファイルを読まないよう初回利用時に作成）
+_settings_service: Optional[SettingsService] = None
+
+def get_settings_service() -> SettingsService:
+    """設定サービスのシングルトンインスタンスを取得"""
+    global _settings_service
+    if _settings_service is None:
+        _settings_service = SettingsService()
+    return _settings_service
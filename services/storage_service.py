@@ -1,7 +1,10 @@
 """ストレージサービス - データの永続化を担当"""
-from typing import List, Optional, Callable
+import contextlib
+import threading
+from typing import Any, ContextManager, List, Optional, Callable
 from models.note_model import NoteData
 from models.note_repository import JsonNoteRepository, NoteRepositoryInterface
+from utils.metrics import timed, measure, increment
 
 
 class StorageService:
@@ -20,6 +23,7 @@ class StorageService:
         """成功コールバックを設定"""
         self._success_callback = callback
     
+    @timed("storage.load_all_notes")
     def load_all_notes(self) -> List[NoteData]:
         """すべての付箋を読み込み"""
         try:
@@ -32,16 +36,52 @@ class StorageService:
                 self._error_callback(f"ノートの読み込み中にエラーが発生しました: {e}")
             return []
     
+    def load_all_notes_in_background(self, post: Callable[..., None],
+                                     on_loaded: Callable[[List[NoteData]], None]) -> threading.Thread:
+        """ワーカースレッドで付箋を読み込み、結果を post 経由で呼び出し元のスレッドに返す
+        
+        post は (関数, *引数) を受け取り、UIスレッドで実行させる関数（MainThreadDispatcher.post など）。
+        成功・エラーのコールバックと on_loaded はすべて post 経由で呼び出される。
+        """
+        def worker() -> None:
+            try:
+                with measure("storage.load_all_notes"):
+                    notes = self.repository.load_all()
+            except Exception as e:
+                post(self._notify_load_error, e, on_loaded)
+                return
+            post(self._notify_loaded, notes, on_loaded)
+        
+        thread = threading.Thread(target=worker, name="note-loader", daemon=True)
+        thread.start()
+        return thread
+    
+    def _notify_loaded(self, notes: List[NoteData], on_loaded: Callable[[List[NoteData]], None]) -> None:
+        """読み込み完了を通知"""
+        if self._success_callback:
+            self._success_callback(f"{len(notes)}個の付箋データを読み込みました")
+        on_loaded(notes)
+    
+    def _notify_load_error(self, error: Any, on_loaded: Callable[[List[NoteData]], None]) -> None:
+        """読み込みエラーを通知"""
+        if self._error_callback:
+            self._error_callback(f"ノートの読み込み中にエラーが発生しました: {error}")
+        on_loaded([])
+    
+    @timed("storage.save_all_notes")
     def save_all_notes(self, notes: List[NoteData]) -> bool:
         """すべての付箋を保存"""
         try:
             success = self.repository.save_all(notes)
+            if not success:
+                increment("storage.save_failed")
             if success and self._success_callback:
                 self._success_callback(f"{len(notes)}個の付箋を保存しました")
             elif not success and self._error_callback:
                 self._error_callback("ノートの保存に失敗しました")
             return success
         except Exception as e:
+            increment("storage.save_failed")
             if self._error_callback:
                 self._error_callback(f"ノートの保存中にエラーが発生しました: {e}")
             return False
@@ -62,6 +102,49 @@ class StorageService:
         """付箋を削除"""
         return self.repository.delete(note_id)
     
+    def has_external_changes(self) -> bool:
+        """他プロセスがデータファイルを変更したかチェック"""
+        if hasattr(self.repository, 'has_external_changes'):
+            return self.repository.has_external_changes()
+        return False
+    
+    def read_stored_notes(self) -> List[NoteData]:
+        """キャッシュを使わずに保存済みの付箋を読み込み"""
+        if hasattr(self.repository, 'read_file'):
+            return self.repository.read_file()
+        return self.repository.load_all()
+    
+    def read_external_records(self) -> List[dict]:
+        """他プロセスによる変更を取り込むために、保存済みのレコードを辞書のまま読み込み"""
+        if hasattr(self.repository, 'read_external_records'):
+            return self.repository.read_external_records()
+        return [note.to_dict() for note in self.read_stored_notes()]
+    
+    def get_file_signature(self) -> Optional[tuple]:
+        """データファイルの状態（更新時刻とサイズ）を取得"""
+        if hasattr(self.repository, 'get_file_signature'):
+            return self.repository.get_file_signature()
+        return None
+    
+    def write_lock(self) -> ContextManager:
+        """他プロセスの書き込みと排他するロック（リポジトリが対応していなければ何もしない）"""
+        if hasattr(self.repository, 'lock'):
+            return self.repository.lock()
+        return contextlib.nullcontext()
+    
+    def sync_to_disk(self) -> None:
+        """遅延していたディスクへの書き込みを完了させる"""
+        if hasattr(self.repository, 'sync_to_disk'):
+            try:
+                self.repository.sync_to_disk()
+            except OSError as e:
+                self.notify_error(f"ノートの保存中にエラーが発生しました: {e}")
+    
+    def notify_error(self, message: str) -> None:
+        """エラーコールバックに通知"""
+        if self._error_callback:
+            self._error_callback(message)
+    
     def is_file_exists(self) -> bool:
         """データファイルが存在するかチェック"""
         if hasattr(self.repository, 'file_exists'):
@@ -2,7 +2,7 @@
 UI関連の共通サービス
 """
 import tkinter as tk
-from tkinter import messagebox, colorchooser
+from tkinter import messagebox, colorchooser, filedialog
 import random
 from typing import Optional, Tuple
 from services.language_service import get_language_service
@@ -46,11 +46,14 @@ UI操作の共通サービスクラス
         messagebox.showerror(title, message)
     
     @staticmethod
-    def confirm_delete() -> bool:
+    def confirm_delete(count: int = 1) -> bool:
         """削除確認ダイアログを表示"""
         language_service = get_language_service()
         title = language_service.translate("confirm")
-        message = language_service.translate("msg_confirm_delete")
+        if count > 1:
+            message = language_service.translate("msg_confirm_delete_many", count)
+        else:
+            message = language_service.translate("msg_confirm_delete")
         return messagebox.askyesno(title, message)
     
     @staticmethod
@@ -61,7 +64,9 @@ UI操作の共通サービスクラス
         message_keys = {
             "open": "msg_select_note_to_open",
             "delete": "msg_select_note_to_delete",
-            "color": "msg_select_note_for_color"
+            "color": "msg_select_note_for_color",
+            "close": "msg_select_note_to_close",
+            "archive": "msg_select_note_to_archive"
         }
         
         message_key = message_keys.get(action, "msg_select_note_to_open")
@@ -74,6 +79,13 @@ UI操作の共通サービスクラス
         result = colorchooser.askcolor(initialcolor=initial_color)
         return result[1] if result[1] else None
     
+    @staticmethod
+    def ask_save_json_path(initial_file: str) -> Optional[str]:
+        """JSONファイルの保存先を選択するダイアログを表示"""
+        path = filedialog.asksaveasfilename(initialfile=initial_file, defaultextension=".json",
+                                            filetypes=[("JSON", "*.json")])
+        return path or None
+    
     @staticmethod
     def configure_window_style(window: tk.Tk, style: Optional[object] = None) -> None:
         """ウィンドウのスタイルを設定"""
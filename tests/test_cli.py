@@ -0,0 +1,49 @@
+"""コマンドラインからの書き込みのテスト"""
+import io
+import threading
+import time
+from cli import _read_records, main as cli_main
+from models.note_model import NoteData
+from models.note_repository import JsonNoteRepository
+
+
+class LineOnlySource(io.StringIO):
+    """1行ずつ読む場合だけ許可する入力"""
+    
+    def read(self, *args):
+        raise AssertionError("全体を読み込んだ")
+
+
+def test_write_command_waits_for_other_writer(tmp_path, capsys):
+    """他のプロセスが書き込み中なら、書き込み終了を待ってから読み込むので変更を消さない"""
+    path = str(tmp_path / "notes.json")
+    other = JsonNoteRepository(path)
+    other.file_lock.acquire()
+    thread = threading.Thread(target=cli_main, args=(["--file", path, "add", "cli"],))
+    thread.start()
+    time.sleep(0.2)
+    assert other.save_all([NoteData(id="20240101000000000001", text="gui")])
+    other.file_lock.release()
+    thread.join()
+    
+    texts = sorted(note.text for note in JsonNoteRepository(path).read_file())
+    assert texts == ["cli", "gui"]
+
+
+def test_read_records_streams_json_lines():
+    source = LineOnlySource('\n{"id": "1", "text": "a"}\n\n{"id": "2", "text": "b"}\n')
+    assert [record["id"] for record in _read_records(source)] == ["1", "2"]
+
+
+def test_read_records_loads_json_array():
+    source = io.StringIO('  \n[{"id": "1"},\n {"id": "2"}]\n')
+    assert [record["id"] for record in _read_records(source)] == ["1", "2"]
+
+
+def test_add_rejects_invalid_color(tmp_path, capsys):
+    """Tkが解釈できない色の付箋は追加しない"""
+    path = str(tmp_path / "notes.json")
+    assert cli_main(["--file", path, "add", "hi", "--color", "notacolor"]) == 2
+    assert "color" in capsys.readouterr().err
+    assert cli_main(["--file", path, "add", "hi", "--color", "#CCFFCC"]) == 0
+    assert [note.color for note in JsonNoteRepository(path).read_file()] == ["#CCFFCC"]
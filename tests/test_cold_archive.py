@@ -0,0 +1,101 @@
+"""アーカイブファイル（長く使われていない付箋の移動先）のテスト"""
+import json
+import time
+from cli import main as cli_main
+from core.cold_archive import ColdArchive, is_cold
+from core.note_service import NoteService
+from models.note_model import NoteData
+from models.note_repository import JsonNoteRepository
+from services.storage_service import StorageService
+from utils.constants import COLD_ARCHIVE_FILE_SUFFIX, COLD_ARCHIVE_INDEX_SUFFIX
+
+OLD = 1_000_000_000.0
+CUTOFF = OLD + 86400
+
+
+class CountingLock:
+    """取得した回数と、ロック中かどうかを記録するロック"""
+    
+    def __init__(self):
+        self.entered = 0
+        self.held = False
+    
+    def __enter__(self):
+        self.entered += 1
+        self.held = True
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.held = False
+
+
+def old_note(index: int, **fields) -> NoteData:
+    """長く変更されていない付箋"""
+    return NoteData(id=f"2001010100000000{index}", text=f"old {index}", updated_at=OLD, **fields)
+
+
+def make_archive(tmp_path, lock=None) -> ColdArchive:
+    path = str(tmp_path / "notes.json")
+    return ColdArchive(path + COLD_ARCHIVE_FILE_SUFFIX, path + COLD_ARCHIVE_INDEX_SUFFIX, block_notes=2, lock=lock)
+
+
+def test_closed_note_goes_cold_even_if_it_was_open():
+    # GUIで閉じた付箋（以前に開いたことがある付箋）も対象にする
+    assert is_cold(old_note(0, is_open=False, was_open=True), CUTOFF)
+    assert is_cold(old_note(1, is_open=False, was_open=False), CUTOFF)
+    assert not is_cold(old_note(2, is_open=True, was_open=True), CUTOFF)
+    assert not is_cold(NoteData(id="20010101000000003", updated_at=CUTOFF + 1), CUTOFF)
+
+
+def test_writes_take_the_lock(tmp_path):
+    lock = CountingLock()
+    archive = make_archive(tmp_path, lock)
+    archive.add([old_note(i) for i in range(4)])
+    assert lock.entered == 1
+    entered = lock.entered
+    archive.take([old_note(0).id])
+    archive.compact()
+    assert lock.entered > entered and not lock.held
+    assert sorted(note.id for note in make_archive(tmp_path).load_all()) == [old_note(i).id for i in range(1, 4)]
+
+
+def test_index_written_by_another_instance_is_reloaded(tmp_path):
+    gui = make_archive(tmp_path)
+    cli = make_archive(tmp_path)
+    gui.add([old_note(0)])
+    assert old_note(0).id in cli
+    cli.take([old_note(0).id])
+    gui.add([old_note(1)])
+    assert [note.id for note in gui.load_all()] == [old_note(1).id]
+
+
+def archive_notes(tmp_path):
+    """付箋を2件作成し、1件をアーカイブファイルに移す"""
+    path = str(tmp_path / "notes.json")
+    JsonNoteRepository(path).save_all([old_note(0), NoteData(id="20240101000000000", text="new",
+                                                             updated_at=time.time())])
+    service = NoteService(StorageService(JsonNoteRepository(path)))
+    service.cold_archive = ColdArchive(path + COLD_ARCHIVE_FILE_SUFFIX, path + COLD_ARCHIVE_INDEX_SUFFIX)
+    service.load()
+    assert [note.id for note in service.archive_cold(1)] == [old_note(0).id]
+    return path
+
+
+def test_cli_export_includes_archived_notes(tmp_path, capsys):
+    path = archive_notes(tmp_path)
+    capsys.readouterr()
+    assert cli_main(["--file", path, "export"]) == 0
+    exported = json.loads(capsys.readouterr().out)
+    assert sorted(record["id"] for record in exported) == [old_note(0).id, "20240101000000000"]
+    
+    assert cli_main(["--file", path, "export", "--format", "jsonl", "--no-include-archive"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["20240101000000000"]
+
+
+def test_cli_list_includes_archived_notes(tmp_path, capsys):
+    path = archive_notes(tmp_path)
+    capsys.readouterr()
+    assert cli_main(["--file", path, "list"]) == 0
+    listed = [line.split("\t")[0] for line in capsys.readouterr().out.splitlines()]
+    assert sorted(listed) == [old_note(0).id, "20240101000000000"]
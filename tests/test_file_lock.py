@@ -0,0 +1,55 @@
+"""ロックファイルによる排他制御のテスト"""
+import threading
+from core.note_service import NoteService
+from models.note_repository import JsonNoteRepository
+from services.storage_service import StorageService
+from utils.file_lock import FileLock
+
+
+def test_reentrant_in_same_thread(tmp_path):
+    lock = FileLock(str(tmp_path / "notes.json.lock"), timeout=0.1)
+    with lock:
+        with lock:
+            assert lock.is_locked
+        assert lock.is_locked
+    assert not lock.is_locked
+
+
+def test_other_thread_waits_for_release(tmp_path):
+    """別スレッドは再入扱いにならず、保持しているスレッドが解放するまで待つ"""
+    lock = FileLock(str(tmp_path / "notes.json.lock"), timeout=0.1, poll_interval=0.01)
+    results = []
+    
+    def try_acquire():
+        try:
+            with lock:
+                results.append("acquired")
+        except TimeoutError:
+            results.append("timeout")
+    
+    with lock:
+        thread = threading.Thread(target=try_acquire)
+        thread.start()
+        thread.join()
+    assert results == ["timeout"]
+    assert not lock.is_locked
+    
+    thread = threading.Thread(target=try_acquire)
+    thread.start()
+    thread.join()
+    assert results == ["timeout", "acquired"]
+
+
+def test_lock_file_error_is_reported_as_save_error(tmp_path):
+    """ロックファイルを作成できない場合も保存エラーとして通知する"""
+    storage = StorageService(JsonNoteRepository(str(tmp_path / "notes.json")))
+    errors = []
+    storage.set_error_callback(errors.append)
+    service = NoteService(storage)
+    service.set_notes([])
+    storage.repository.file_lock.path = str(tmp_path / "missing" / "notes.json.lock")
+    
+    service.create_many([{"text": "hello"}])
+    assert len(errors) == 1
+    assert "保存中にエラー" in errors[0]
+    assert not storage.repository.file_lock.is_locked
@@ -0,0 +1,101 @@
+"""本文の履歴（差分とキーフレーム）のテスト"""
+import random
+from core.history import RevisionStore, apply_delta, make_delta
+
+NOTE_ID = "20240101000000000001"
+
+
+def edited_texts(count: int, seed: int = 0):
+    """少しずつ編集された本文の列"""
+    rng = random.Random(seed)
+    text = "\n".join(f"行 {i} の内容" for i in range(40))
+    texts = []
+    for _ in range(count):
+        position = rng.randrange(len(text))
+        text = text[:position] + rng.choice(["追加", "x", "\n新しい行"]) + text[position + rng.randrange(3):]
+        texts.append(text)
+    return texts
+
+
+def make_store(tmp_path, **limits) -> RevisionStore:
+    options = {"keyframe_interval": 4, "max_revisions": 0, "max_age_days": 0, "max_bytes": 0}
+    options.update(limits)
+    return RevisionStore(str(tmp_path / "notes.json.history.jsonl"), **options)
+
+
+def test_delta_round_trip():
+    for old, new in [("", "abc"), ("abc", ""), ("hello world", "hello brave new world"),
+                     ("あいうえお", "あいXうえおか"), ("same", "same")]:
+        assert apply_delta(old, make_delta(old, new)) == new
+
+
+def test_every_revision_is_restored_and_keyframes_are_spaced(tmp_path):
+    store = make_store(tmp_path)
+    texts = edited_texts(10)
+    for index, text in enumerate(texts):
+        assert store.record(NOTE_ID, text, timestamp=1000.0 + index)
+    assert not store.record(NOTE_ID, texts[-1])  # 最新の版と同じ本文は記録しない
+    
+    revisions = list(reversed(store.list_revisions(NOTE_ID)))
+    assert [revision.number for revision in revisions] == list(range(1, 11))
+    assert [revision.is_keyframe for revision in revisions] == [index % 4 == 0 for index in range(10)]
+    for revision, text in zip(revisions, texts):
+        assert store.get_text(NOTE_ID, revision.number) == text
+        assert revision.length == len(text)
+
+
+def test_reload_from_file(tmp_path):
+    store = make_store(tmp_path)
+    texts = edited_texts(6)
+    store.record_many((NOTE_ID, text, 1000.0 + index) for index, text in enumerate(texts))
+    
+    reloaded = make_store(tmp_path)
+    assert reloaded.total_bytes == store.total_bytes
+    assert [reloaded.get_text(NOTE_ID, number) for number in range(1, 7)] == texts
+    # 読み込み直した履歴にも差分で続けて記録できる
+    assert reloaded.record(NOTE_ID, texts[-1] + " 追記", timestamp=2000.0)
+    assert make_store(tmp_path).get_text(NOTE_ID, 7) == texts[-1] + " 追記"
+
+
+def test_prune_turns_first_kept_delta_into_keyframe(tmp_path):
+    store = make_store(tmp_path, max_revisions=3)
+    texts = edited_texts(6)
+    for index, text in enumerate(texts):
+        store.record(NOTE_ID, text, timestamp=1000.0 + index)
+    
+    assert store.prune(now=2000.0) == 3
+    for reopened in (store, make_store(tmp_path, max_revisions=3)):
+        revisions = list(reversed(reopened.list_revisions(NOTE_ID)))
+        assert [revision.number for revision in revisions] == [4, 5, 6]
+        assert revisions[0].is_keyframe
+        assert [reopened.get_text(NOTE_ID, number) for number in (4, 5, 6)] == texts[3:]
+
+
+def test_prune_by_age(tmp_path):
+    store = make_store(tmp_path, max_age_days=1)
+    texts = edited_texts(4)
+    for index, text in enumerate(texts):
+        store.record(NOTE_ID, text, timestamp=(index + 1) * 86400.0)
+    assert store.prune(now=4.5 * 86400) == 3
+    assert [revision.number for revision in store.list_revisions(NOTE_ID)] == [4]
+    assert store.get_text(NOTE_ID, 4) == texts[3]
+
+
+def test_prune_by_total_bytes_drops_oldest_across_notes(tmp_path):
+    store = make_store(tmp_path)
+    other_id = "20240101000000000002"
+    for index, text in enumerate(edited_texts(5)):
+        store.record(NOTE_ID, text, timestamp=1000.0 + 2 * index)
+        store.record(other_id, text + "!", timestamp=1001.0 + 2 * index)
+    store.max_bytes = store.total_bytes // 2
+    
+    assert store.prune(now=2000.0) > 0
+    assert store.total_bytes <= store.max_bytes
+    assert make_store(tmp_path).total_bytes == store.total_bytes
+    # 残った版は新しいものだけで、どれも復元できる
+    kept = [(note_id, revision.timestamp) for note_id in (NOTE_ID, other_id)
+            for revision in store.list_revisions(note_id)]
+    assert min(timestamp for _, timestamp in kept) > 1000.0
+    for note_id in (NOTE_ID, other_id):
+        for revision in store.list_revisions(note_id):
+            assert store.get_text(note_id, revision.number) is not None
@@ -0,0 +1,31 @@
+"""付箋IDの生成器のテスト"""
+from datetime import datetime
+from models.note_model import NoteData
+from utils.constants import ID_SEQUENCE_DIGITS
+from utils.id_generator import MonotonicIdGenerator
+
+SEQUENCES = 10 ** ID_SEQUENCE_DIGITS
+
+
+def test_ids_in_the_same_second_are_increasing():
+    generator = MonotonicIdGenerator(lambda: datetime(2024, 5, 1, 12, 0, 0))
+    ids = [generator.next_id() for _ in range(5)]
+    assert ids == sorted(ids) and len(set(ids)) == 5
+    assert all(note_id.startswith("20240501120000") for note_id in ids)
+
+
+def test_exhausted_sequence_moves_to_the_next_second():
+    generator = MonotonicIdGenerator(lambda: datetime(2024, 12, 31, 23, 59, 59))
+    ids = [generator.next_id() for _ in range(SEQUENCES + 2)]
+    assert ids == sorted(ids) and len(set(ids)) == len(ids)
+    assert ids[SEQUENCES - 1] == "20241231235959" + "9" * ID_SEQUENCE_DIGITS
+    # 繰り上がりで日時が壊れず、年をまたいだ次の秒の連番0になる
+    assert ids[SEQUENCES] == "20250101000000" + "0" * ID_SEQUENCE_DIGITS
+    assert NoteData(id=ids[SEQUENCES]).get_formatted_date() == "2025/01/01 00:00"
+    assert all(len(note_id) == 14 + ID_SEQUENCE_DIGITS for note_id in ids)
+
+
+def test_observed_ids_are_not_reused():
+    generator = MonotonicIdGenerator(lambda: datetime(2024, 5, 1, 12, 0, 0))
+    generator.observe(["20240501120000" + "9" * ID_SEQUENCE_DIGITS])
+    assert generator.next_id() == "20240501120001" + "0" * ID_SEQUENCE_DIGITS
@@ -0,0 +1,20 @@
+"""付箋コントローラーの元に戻す操作のテスト"""
+from controllers.note_controller import NoteController
+from models.note_model import NoteData
+from models.note_repository import JsonNoteRepository
+from services.storage_service import StorageService
+
+
+def test_color_change_from_note_window_can_be_undone(tmp_path):
+    """付箋ウィンドウのメニューからの色の変更も元に戻せる"""
+    controller = NoteController(StorageService(JsonNoteRepository(str(tmp_path / "notes.json"))))
+    controller.load_notes([NoteData(id="20240101000000000001", color="#FFFF99")])
+    
+    controller._on_note_color_changed("20240101000000000001", "#CCFFCC")
+    note = controller.note_service.find("20240101000000000001")
+    assert note.color == "#CCFFCC"
+    
+    controller.undo()
+    assert note.color == "#FFFF99"
+    controller.redo()
+    assert note.color == "#CCFFCC"
@@ -0,0 +1,74 @@
+"""付箋サービスの開閉状態・外部変更の統合・項目の検証のテスト"""
+import pytest
+from core.note_service import NoteService, validate_note_fields
+from models.note_model import NoteData
+from models.note_repository import JsonNoteRepository
+from services.storage_service import StorageService
+
+
+def test_single_and_bulk_close_restore_the_same(tmp_path):
+    """1件ずつ閉じてもまとめて閉じても、次回起動時に復元しない"""
+    service = NoteService(StorageService(JsonNoteRepository(str(tmp_path / "notes.json"))))
+    service.set_notes([NoteData(id=f"2024010100000{i:04d}", is_open=True, was_open=True) for i in range(3)])
+    single, *bulk = service.notes
+    
+    service.set_open(single.id, False)
+    # 複数の付箋を閉じるときにコントローラーが適用する変更と同じ
+    service.update_many({note.id: {"is_open": False, "was_open": False} for note in bulk})
+    
+    assert [(note.is_open, note.was_open) for note in service.notes] == [(False, False)] * 3
+    assert service.get_open_notes() == []
+
+
+def open_replicas(tmp_path):
+    """同じデータファイルを使う2つのプロセスの付箋サービス"""
+    path = str(tmp_path / "notes.json")
+    JsonNoteRepository(path).save_all([NoteData(id="20240101000000000001", text="base", x=10, y=10)])
+    services = []
+    for _ in range(2):
+        service = NoteService(StorageService(JsonNoteRepository(path)))
+        service.conflict_prefix = "[conflict] "
+        service.load()
+        services.append(service)
+    return path, services
+
+
+def test_external_change_merges_fields_into_dirty_local_note(tmp_path):
+    """未保存の変更がある付箋でも、ファイル側だけで変わった項目は取り込む"""
+    path, (local, other) = open_replicas(tmp_path)
+    local.notes[0].x = 50  # 未保存の移動
+    other.update_many({"20240101000000000001": {"text": "edited", "color": "#CCFFCC"}})
+    
+    changes = local.sync_external_changes()
+    note = local.notes[0]
+    assert changes.updated == {note.id: {"text", "color"}}
+    assert (note.text, note.color, note.x) == ("edited", "#CCFFCC", 50)
+    
+    local.save()
+    stored, = JsonNoteRepository(path).read_file()
+    assert (stored.text, stored.color, stored.x) == ("edited", "#CCFFCC", 50)
+
+
+def test_conflicting_text_keeps_a_copy_of_the_stored_version(tmp_path):
+    """両方で本文を変更した場合は手元の本文を残し、ファイル側の本文をコピーとして残す"""
+    path, (local, other) = open_replicas(tmp_path)
+    local.notes[0].text = "mine"
+    other.update_many({"20240101000000000001": {"text": "theirs"}})
+    
+    changes = local.sync_external_changes()
+    assert [note.text for note in changes.added] == ["[conflict] theirs"]
+    local.save()
+    texts = sorted(note.text for note in JsonNoteRepository(path).read_file())
+    assert texts == ["[conflict] theirs", "mine"]
+
+
+@pytest.mark.parametrize("color", ["#FFF", "#ffff99", "#FFFF0000CCCC"])
+def test_validate_accepts_hex_colors(color):
+    validate_note_fields({"color": color})
+
+
+@pytest.mark.parametrize("color", ["#zzzzzz", "#FFFF9", "notacolor", "#FFFF99 ", "#GGG"])
+def test_validate_rejects_invalid_colors(color):
+    """Tkが解釈できない色は付箋に設定させない"""
+    with pytest.raises(ValueError):
+        validate_note_fields({"color": color})
@@ -0,0 +1,63 @@
+"""列指向の付箋テーブルを変更された行だけ書き換えても、作り直した結果と一致することのテスト"""
+import random
+from core.note_service import NoteService
+from core.note_table import NoteTable
+from models.note_model import NoteData
+from models.note_repository import JsonNoteRepository
+from services.storage_service import StorageService
+
+COLORS = ("#FFFF99", "#FFCCCC", "#CCFFCC")
+
+
+def assert_matches_rebuild(service: NoteService) -> None:
+    """サービスのテーブルが付箋リストから作り直したテーブルと同じ内容か"""
+    table = service.table
+    expected = NoteTable()
+    expected.rebuild(service.notes)
+    assert table.ids == expected.ids
+    assert table.columns == expected.columns
+    assert [table.colors[code] for code in table.color_codes] == [expected.colors[code] for code in
+                                                                  expected.color_codes]
+    assert table.count_by_color() == expected.count_by_color()
+    for color in COLORS:
+        assert table.select(color=color, is_open=False) == expected.select(color=color, is_open=False)
+
+
+def test_incremental_updates_match_rebuild(tmp_path):
+    rng = random.Random(0)
+    service = NoteService(StorageService(JsonNoteRepository(str(tmp_path / "notes.json"))))
+    service.set_notes([NoteData(id=f"2024010100000{i:04d}", x=i, y=i, color=COLORS[i % 3]) for i in range(30)])
+    service.table.count_by_color()  # 色ごとの索引を作成した状態から始める
+    for _ in range(300):
+        note = rng.choice(service.notes)
+        action = rng.randrange(7)
+        if action == 0:
+            service.set_color(note.id, rng.choice(COLORS))
+        elif action == 1:
+            service.set_open(note.id, not note.is_open)
+        elif action == 2:
+            service.update_many({note.id: {"x": rng.randrange(100), "archived": not note.archived}})
+        elif action == 3:
+            note.y = rng.randrange(100)
+            note.text = "edited"
+            service.update(note, save=rng.random() < 0.5)
+        elif action == 4:
+            service.create_many([{"text": "new", "color": rng.choice(COLORS)}])
+        elif action == 5 and len(service.notes) > 5:
+            service.delete(note.id)
+        else:
+            service.sync_open_state(n.id for n in service.notes if rng.random() < 0.3)
+            service.save()
+        assert_matches_rebuild(service)
+
+
+def test_text_edit_does_not_rebuild(tmp_path, monkeypatch):
+    service = NoteService(StorageService(JsonNoteRepository(str(tmp_path / "notes.json"))))
+    service.set_notes([NoteData(id=f"2024010100000{i:04d}") for i in range(10)])
+    service.table
+    monkeypatch.setattr(NoteTable, "rebuild", lambda self, notes: (_ for _ in ()).throw(AssertionError("rebuilt")))
+    note = service.notes[3]
+    note.text = "changed"
+    service.update(note)  # 保存で版番号と更新時刻が変わる
+    assert service.table.columns["revision"][3] == note.revision
+    assert service.table.columns["updated_at"][3] == note.updated_at
@@ -0,0 +1,18 @@
+"""付箋の画面内判定のテスト"""
+from services.placement_service import PlacementService
+
+
+def test_is_on_screen_accepts_secondary_monitor_position():
+    """仮想デスクトップ内であればプライマリ画面外の位置も画面内とみなす"""
+    service = PlacementService()
+    # 1920x1080 のプライマリの左に同じ大きさのモニタがある構成
+    assert service.is_on_screen(-1500, 100, 250, 250, 3840, 1080, -1920, 0)
+    assert service.is_on_screen(2000, 100, 250, 250, 3840, 1080, 0, 0)
+    assert not service.is_on_screen(-1500, 100, 250, 250, 1920, 1080)
+
+
+def test_is_on_screen_rejects_position_outside_virtual_desktop():
+    """仮想デスクトップからはみ出す位置は画面外とみなす"""
+    service = PlacementService()
+    assert not service.is_on_screen(-2000, 100, 250, 250, 3840, 1080, -1920, 0)
+    assert not service.is_on_screen(1800, 900, 250, 250, 3840, 1080, -1920, 0)
@@ -0,0 +1,64 @@
+"""クイックオープンの絞り込みと順位付けのテスト"""
+import random
+from core.quick_open import QuickOpenIndex, QuickOpenMatcher, fuzzy_score, recent_bonus
+from models.note_model import NoteData
+
+WORDS = ("alpha", "beta", "gamma", "delta", "meeting", "memo", "買い物", "会議", "todo", "release")
+
+
+def make_items(count: int = 300, seed: int = 0):
+    rng = random.Random(seed)
+    notes = []
+    for i in range(count):
+        words = [rng.choice(WORDS) for _ in range(rng.randrange(1, 5))]
+        # 先頭が同じ付箋を多くして、前方一致での打ち切りも通るようにする
+        prefix = "memo " if i % 3 == 0 else ""
+        notes.append(NoteData(id=f"{20240101000000000 + i}", text=prefix + " ".join(words)))
+    return QuickOpenIndex().items(notes)
+
+
+def full_rescan(items, recent_ranks, query: str, max_results: int):
+    """すべての候補を fuzzy_score で採点し直した結果"""
+    query = "".join(query.split()).casefold()
+    scored = []
+    for index, item in enumerate(items):
+        score = fuzzy_score(query, item.haystack)
+        if score is not None:
+            scored.append((score + recent_bonus(recent_ranks.get(item.note_id)), -index, item))
+    scored.sort(key=lambda entry: entry[:2], reverse=True)
+    return [item.note_id for _, _, item in scored[:max_results]]
+
+
+def test_typing_forward_and_deleting_back_matches_full_rescan():
+    items = make_items()
+    recent_ranks = {items[i].note_id: rank for rank, i in enumerate((250, 7, 120, 33))}
+    matcher = QuickOpenMatcher(items, recent_ranks, max_results=5)
+    queries = ["m", "me", "mem", "memo", "memo a", "memo al", "me", "mee", "meet", "m",
+               "", "r", "re", "rel", "会", "会議", "t", "td", "tdo", "t", "MEMO", "xyz", "x", ""]
+    for query in queries:
+        expected = full_rescan(items, recent_ranks, query, 5) if query else None
+        result = [item.note_id for item in matcher.match(query)]
+        if expected is not None:
+            assert result == expected, query
+        assert matcher.candidate_count(query) == sum(
+            1 for item in items if fuzzy_score("".join(query.split()).casefold(), item.haystack) is not None)
+
+
+def test_empty_query_lists_recent_notes_first():
+    items = make_items(20)
+    recent_ranks = {items[5].note_id: 0, items[2].note_id: 1}
+    matcher = QuickOpenMatcher(items, recent_ranks, max_results=4)
+    assert [item.note_id for item in matcher.match("")] == [
+        items[5].note_id, items[2].note_id, items[0].note_id, items[1].note_id]
+
+
+def test_recent_note_outranks_better_match():
+    """最近開いた付箋は、一致の良さで劣っていても加点で上位になりうる"""
+    notes = [NoteData(id=f"{20240101000000000 + i}", text=text)
+             for i, text in enumerate(["memo", "x memo", "m e m o"])]
+    items = QuickOpenIndex().items(notes)
+    plain = QuickOpenMatcher(items, {}, max_results=3).match("memo")
+    assert [item.note_id for item in plain][0] == notes[0].id
+    boosted = [item.note_id for item in QuickOpenMatcher(items, {notes[2].id: 0}, max_results=3).match("memo")]
+    assert boosted[0] == notes[2].id
+    assert boosted == full_rescan(items, {notes[2].id: 0}, "memo", 3)
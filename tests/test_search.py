@@ -0,0 +1,16 @@
+"""付箋検索のテスト"""
+from core.search import search_notes
+from models.note_model import CompressedBody, NoteData, get_body_cache
+
+
+def test_search_compressed_body_without_filling_body_cache():
+    """圧縮した本文も検索でき、展開した本文のキャッシュには入らない"""
+    get_body_cache().clear()
+    note = NoteData(id="20240101000000000001", text=CompressedBody.compress("Hello World"))
+    assert search_notes([note], "WORLD") == [note]
+    assert search_notes([note], "world") == [note]
+    assert len(get_body_cache()._entries) == 0
+    
+    note.text = CompressedBody.compress("changed")
+    assert search_notes([note], "world") == []
+    assert search_notes([note], "CHANGED") == [note]
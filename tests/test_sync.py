@@ -0,0 +1,129 @@
+"""共有フォルダーを介した同期（FolderSyncEngine）のテスト"""
+import json
+import os
+import pytest
+from core.note_service import NoteService
+from core.sync import FolderSyncEngine, validate_record
+from models.note_repository import JsonNoteRepository
+from services.storage_service import StorageService
+from utils.constants import SYNC_LOG_SUFFIX
+
+
+class Replica:
+    """1台のマシン（データファイルと同期状態ファイル）"""
+    
+    def __init__(self, tmp_path, name: str):
+        self.path = str(tmp_path / f"{name}.json")
+        self.folder = str(tmp_path / "shared")
+    
+    def service(self) -> NoteService:
+        """データファイルを読み込んだサービス"""
+        service = NoteService(StorageService(JsonNoteRepository(self.path)))
+        service.load()
+        return service
+    
+    def sync(self, service: NoteService = None):
+        """同期して結果を返す"""
+        service = service or self.service()
+        return FolderSyncEngine(service, self.path, self.folder, "[conflict] ").sync()
+    
+    def texts(self):
+        return sorted(note.text for note in self.service().notes)
+
+
+@pytest.fixture
+def replicas(tmp_path):
+    return Replica(tmp_path, "a"), Replica(tmp_path, "b")
+
+
+def test_export_and_import(replicas):
+    a, b = replicas
+    a.service().create_many([{"text": "one"}, {"text": "two", "color": "#FFCCCC"}])
+    assert a.sync().exported == 2
+    result = b.sync()
+    assert result.imported == 2 and not result.skipped
+    assert b.texts() == ["one", "two"]
+    assert {note.color for note in b.service().notes} == {"#FFFF99", "#FFCCCC"}
+    
+    # 変更した付箋だけが送られる
+    service = b.service()
+    note = next(note for note in service.notes if note.text == "one")
+    service.update_many({note.id: {"text": "one edited"}})
+    assert b.sync(service).exported == 1
+    assert a.sync().imported == 1
+    assert a.texts() == ["one edited", "two"]
+    assert a.sync().exported == 0 and b.sync().imported == 0
+
+
+def test_deletion_is_propagated(replicas):
+    a, b = replicas
+    a.service().create_many([{"text": "keep"}, {"text": "remove"}])
+    a.sync()
+    b.sync()
+    service = a.service()
+    service.delete_many([note.id for note in service.notes if note.text == "remove"])
+    a.sync(service)
+    assert b.sync().deleted == 1
+    assert b.texts() == ["keep"]
+
+
+def test_concurrent_edits_keep_a_conflict_copy(replicas):
+    a, b = replicas
+    a.service().create_many([{"text": "original"}])
+    a.sync()
+    b.sync()
+    for replica, text in ((a, "from a"), (b, "from b")):
+        service = replica.service()
+        service.update_many({service.notes[0].id: {"text": text}})
+    a.sync()
+    b.sync()
+    a.sync()
+    b.sync()
+    assert a.texts() == b.texts()
+    texts = a.texts()
+    assert len(texts) == 2
+    # 勝った版と、負けた側の版の競合コピーが残る
+    assert sorted(text.replace("[conflict] ", "") for text in texts) == ["from a", "from b"]
+    assert sum(text.startswith("[conflict] ") for text in texts) == 1
+
+
+def test_malformed_peer_log_is_skipped_without_partial_apply(replicas):
+    a, b = replicas
+    a.service().create_many([{"text": "good"}])
+    a.sync()
+    log = next(name for name in os.listdir(a.folder) if name.endswith(SYNC_LOG_SUFFIX))
+    with open(os.path.join(a.folder, log), "a", encoding="utf-8") as f:
+        f.write(json.dumps({"id": "20240101000000000", "vv": {"x": 1}, "deleted": False,
+                            "fields": {"text": "bad", "color": 5}}) + "\n")
+    result = b.sync()
+    assert list(result.skipped) == [log[:-len(SYNC_LOG_SUFFIX)]]
+    assert result.imported == 0
+    assert b.texts() == []
+
+
+def test_imports_are_saved_once(tmp_path, replicas, monkeypatch):
+    a, b = replicas
+    for text in ("x", "y"):
+        a.service().create_many([{"text": text}])
+        a.sync()
+    c = Replica(tmp_path, "c")
+    c.service().create_many([{"text": "z"}])
+    c.sync()
+    
+    saves = []
+    original = StorageService.save_all_notes
+    monkeypatch.setattr(StorageService, "save_all_notes",
+                        lambda self, notes: saves.append(len(notes)) or original(self, notes))
+    assert b.sync().imported == 3
+    assert saves == [3]
+
+
+def test_validate_record():
+    validate_record({"id": "1", "vv": {"r": 1}, "deleted": True})
+    validate_record({"id": "1", "vv": {"r": 1}, "deleted": False, "updated_at": 1.0,
+                     "fields": {"text": "t", "color": "#FFFFFF", "archived": False}})
+    for record in ([], {"vv": {}, "deleted": True}, {"id": "1", "vv": {"r": "1"}, "deleted": True},
+                   {"id": "1", "vv": {}, "deleted": "no"}, {"id": "1", "vv": {}, "deleted": False},
+                   {"id": "1", "vv": {}, "deleted": False, "fields": {"archived": "yes"}}):
+        with pytest.raises(ValueError):
+            validate_record(record)
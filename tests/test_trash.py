@@ -0,0 +1,72 @@
+"""ごみ箱から完全に削除した付箋の履歴が残らないことのテスト"""
+import os
+from core.history import RevisionStore
+from core.note_service import NoteService
+from core.trash import TrashStore
+from models.note_model import NoteData
+from models.note_repository import JsonNoteRepository
+from services.storage_service import StorageService
+
+
+def make_stores(tmp_path):
+    """履歴とごみ箱を作成し、完全に削除したときに履歴を削除するようにつなぐ"""
+    history = RevisionStore(str(tmp_path / "notes.json.history.jsonl"), max_revisions=0, max_age_days=0, max_bytes=0)
+    trash = TrashStore(str(tmp_path / "notes.json.trash.jsonl"), max_age_days=0, max_bytes=0)
+    trash.on_purged = history.forget
+    return history, trash
+
+
+def trash_notes(history, trash, count, deleted_at=None):
+    """履歴のある付箋をごみ箱に移す"""
+    notes = [NoteData(id=f"2024010100000000{i}", text=f"text {i}") for i in range(count)]
+    for note in notes:
+        history.record(note.id, note.text)
+        history.record(note.id, note.text + " edited")
+    trash.add(notes, deleted_at=deleted_at)
+    return notes
+
+
+def reopened(history):
+    """ファイルから読み直した履歴"""
+    return RevisionStore(history.path, max_revisions=0, max_age_days=0, max_bytes=0)
+
+
+def test_purge_forgets_history(tmp_path):
+    history, trash = make_stores(tmp_path)
+    notes = trash_notes(history, trash, 2)
+    assert trash.purge([notes[0].id]) == 1
+    assert reopened(history).list_revisions(notes[0].id) == []
+    assert len(reopened(history).list_revisions(notes[1].id)) == 2
+
+
+def test_purge_all_forgets_history(tmp_path):
+    history, trash = make_stores(tmp_path)
+    trash_notes(history, trash, 3)
+    assert trash.purge_all() == 3
+    assert os.path.getsize(history.path) == 0
+    assert reopened(history).total_bytes == 0
+
+
+def test_purge_expired_forgets_history(tmp_path):
+    history, trash = make_stores(tmp_path)
+    trash.max_age_days = 1
+    notes = trash_notes(history, trash, 2, deleted_at=1000.0)
+    assert trash.purge_expired(now=1000.0 + 2 * 86400) == 2
+    assert all(reopened(history).list_revisions(note.id) == [] for note in notes)
+
+
+def test_restore_keeps_history(tmp_path):
+    history, trash = make_stores(tmp_path)
+    notes = trash_notes(history, trash, 1)
+    assert [note.id for note in trash.take([notes[0].id])] == [notes[0].id]
+    assert len(reopened(history).list_revisions(notes[0].id)) == 2
+
+
+def test_delete_without_trash_forgets_history(tmp_path):
+    service = NoteService(StorageService(JsonNoteRepository(str(tmp_path / "notes.json"))))
+    service.history, _ = make_stores(tmp_path)
+    service.set_notes([])
+    note = service.create_many([{"text": "hello"}])[0]
+    assert service.history.list_revisions(note.id)
+    service.delete(note.id)
+    assert reopened(service.history).list_revisions(note.id) == []
@@ -0,0 +1,40 @@
+"""元に戻す履歴の一時ファイルのテスト"""
+from core.undo import UndoLog
+
+
+def states(index: int, text: str) -> dict:
+    return {f"note{index}": {"text": text * 100}}
+
+
+def spill_file_size(log: UndoLog) -> int:
+    log._spill_file.seek(0, 2)
+    return log._spill_file.tell()
+
+
+def test_spill_file_is_compacted_when_entries_are_dropped():
+    """古い記録が破棄され続けても、一時ファイルは使われている記録の2倍までに収まる"""
+    log = UndoLog(memory_budget=0, max_entries=5)
+    for index in range(200):
+        log.record("edit", states(index, "a"), states(index, "b"))
+        assert spill_file_size(log) <= 2 * log._spill_bytes
+    
+    for index in reversed(range(195, 200)):
+        label, before = log.undo()
+        assert before == states(index, "a")
+    assert not log.can_undo
+    for index in range(195, 200):
+        label, after = log.redo()
+        assert after == states(index, "b")
+
+
+def test_spill_file_is_truncated_when_cleared_by_new_record():
+    log = UndoLog(memory_budget=0, max_entries=5)
+    for index in range(3):
+        log.record("edit", states(index, "a"), states(index, "b"))
+    for _ in range(3):
+        log.undo()
+    log.record("edit", states(9, "a"), states(9, "b"))
+    assert log._spill_bytes == spill_file_size(log) > 0
+    # 読み戻した記録はやり直し側として書き直され、古い部分は残らない
+    assert log.undo()[1] == states(9, "a")
+    assert spill_file_size(log) == log._spill_bytes
@@ -2,6 +2,7 @@
 
 # ファイル名
 NOTES_FILE = "free_sticky.json"
+SETTINGS_FILE = "free_sticky_settings.json"
 
 # デフォルト値
 DEFAULT_NOTE_COLOR = "#FFFF99"
@@ -36,17 +37,135 @@ STATUS_BAR_HEIGHT = 1  # ステータスバーの固定高さ（行数）
 TEXT_PREVIEW_MAX_LENGTH = 80
 DATE_FORMAT = "%Y/%m/%d %H:%M"
 ID_DATE_FORMAT = "%Y%m%d%H%M%S"
+ID_SEQUENCE_DIGITS = 3  # IDの末尾に付ける同一秒内の連番の桁数
+
+# 大きな付箋の設定
+LARGE_NOTE_THRESHOLD = 100_000  # この文字数を超える本文は分割して挿入する
+TEXT_INSERT_CHUNK_SIZE = 20_000  # 1回のafter()で挿入する文字数
+TEXT_INSERT_CHUNK_DELAY = 1  # 分割挿入の間隔（ミリ秒）
+PREVIEW_MAX_CHARS = 5_000  # プレビューに最初に表示する最大文字数
 
 # ウィンドウ設定
 ALWAYS_ON_TOP = True
 RANDOM_POSITION_MARGIN = 50
 RANDOM_POSITION_OFFSET = 250
 
+# 配置設定（空き位置の探索）
+PLACEMENT_CELL_SIZE = 100  # 空間インデックスのセルサイズ（ピクセル）
+PLACEMENT_STEP = 30  # 候補位置の格子間隔（ピクセル）
+PLACEMENT_GAP = 10  # 付箋同士の最小間隔（ピクセル）
+PLACEMENT_MARGIN = RANDOM_POSITION_MARGIN
+
+# コンテキストメニュー名（メニューキャッシュのキー）
+NOTE_CONTEXT_MENU = "note_window"
+NOTE_LIST_CONTEXT_MENU = "note_list"
+
+# 保存設定
+SAVE_DEBOUNCE_DELAY = 300  # GUIで連続した保存要求をまとめる待ち時間（ミリ秒）
+
+# 起動・スレッド間受け渡し設定
+DISPATCH_POLL_INTERVAL = 20  # ワーカースレッドからの結果を確認する間隔（ミリ秒）
+DISPATCH_BATCH_SIZE = 50  # 1回の確認で実行する処理の最大数
+STARTUP_RESTORE_BATCH_SIZE = 5  # 起動時に1回のafter()で復元する付箋ウィンドウ数
+
+# データファイルの書き込み設定
+FSYNC_ALWAYS = "always"  # 保存のたびにディスクへの書き込みを待つ（最も安全・最も遅い）
+FSYNC_PERIODIC = "periodic"  # 前回から FSYNC_INTERVAL 秒以上たった保存のときだけ待つ
+FSYNC_ON_SHUTDOWN = "shutdown"  # 終了時にだけ待つ（最も速い）
+FSYNC_POLICIES = (FSYNC_ALWAYS, FSYNC_PERIODIC, FSYNC_ON_SHUTDOWN)
+DEFAULT_FSYNC_POLICY = FSYNC_PERIODIC
+FSYNC_INTERVAL = 30.0  # periodic のときのfsyncの間隔（秒）
+FILE_LOCK_TIMEOUT = 5.0  # 他のプロセスの書き込み完了を待つ上限（秒）
+FILE_LOCK_POLL_INTERVAL = 0.01  # ロック取得を再試行する間隔（秒）
+SETTING_FSYNC_POLICY = "fsync_policy"  # 設定ファイルのキー
+BODY_COMPRESS_THRESHOLD = 8192  # この文字数以上の本文を圧縮して保存する（0以下で圧縮しない）
+BODY_COMPRESS_LEVEL = 6  # zlibの圧縮レベル
+BODY_CACHE_SIZE = 16  # 展開した本文をメモリに残しておく数
+SETTING_BODY_COMPRESS_THRESHOLD = "body_compress_threshold"  # 設定ファイルのキー
+
+# フォルダー同期設定
+SYNC_FIELDS = ("text", "color", "archived")  # マシン間で同期する項目（位置や開閉状態は同期しない）
+SYNC_STATE_SUFFIX = ".sync.json"  # データファイルの隣に置く同期状態ファイルの接尾辞
+SYNC_LOG_SUFFIX = ".jsonl"  # 共有フォルダーに置く変更ログの接尾辞
+
+# 履歴設定
+HISTORY_FILE_SUFFIX = ".history.jsonl"  # データファイルの隣に置く履歴ファイルの接尾辞
+HISTORY_KEYFRAME_INTERVAL = 10  # この版数ごとに本文全体を保存する（復元時に適用する差分の上限）
+HISTORY_MAX_REVISIONS = 100  # 付箋ごとに残す版数（0以下で無制限）
+HISTORY_MAX_AGE_DAYS = 90  # 版を残す日数（0以下で無制限）
+HISTORY_MAX_BYTES = 20 * 1024 * 1024  # 履歴ファイル全体の上限（0以下で無制限）
+HISTORY_PRUNE_INTERVAL = 600.0  # 古い版を削除する間隔（秒）
+SETTING_HISTORY_MAX_REVISIONS = "history_max_revisions"  # 設定ファイルのキー
+SETTING_HISTORY_MAX_AGE_DAYS = "history_max_age_days"
+SETTING_HISTORY_MAX_BYTES = "history_max_bytes"
+HISTORY_WINDOW_SIZE = "560x360"  # 履歴ビューアの初期サイズ
+
+# ごみ箱設定
+TRASH_FILE_SUFFIX = ".trash.jsonl"  # データファイルの隣に置くごみ箱ファイルの接尾辞
+TRASH_MAX_AGE_DAYS = 30  # 削除した付箋を保管する日数（0以下で無制限）
+TRASH_MAX_BYTES = 50 * 1024 * 1024  # ごみ箱ファイルの上限（0以下で無制限）
+TRASH_PURGE_INTERVAL = 3600.0  # 保管期間を過ぎた付箋を削除する間隔（秒）
+TRASH_PURGE_INITIAL_DELAY = 600.0  # 起動から最初に削除するまでの時間（秒。起動時にごみ箱を読み込まない）
+SETTING_TRASH_MAX_AGE_DAYS = "trash_max_age_days"  # 設定ファイルのキー
+SETTING_TRASH_MAX_BYTES = "trash_max_bytes"
+
+# アーカイブファイル（長く使われていない付箋の圧縮保管）設定
+COLD_ARCHIVE_FILE_SUFFIX = ".archive"  # データファイルの隣に置くアーカイブファイルの接尾辞
+COLD_ARCHIVE_INDEX_SUFFIX = ".archive.idx.json"  # アーカイブファイルの索引の接尾辞
+COLD_ARCHIVE_CODEC = "zlib"  # 圧縮方式（"zlib" または "lzma"）
+COLD_ARCHIVE_BLOCK_NOTES = 64  # まとめて圧縮する付箋の数（1件を取り出すときに展開する単位）
+COLD_ARCHIVE_COMPACT_RATIO = 0.5  # 取り出し済みの領域がこの割合を超えたらファイルを詰め直す
+COLD_ARCHIVE_AFTER_DAYS = 90  # 閉じたままこの日数変更されていない付箋を移す（0以下で移さない）
+COLD_ARCHIVE_INTERVAL = 3600.0  # 移す付箋を確認する間隔（秒）
+SETTING_COLD_ARCHIVE_AFTER_DAYS = "cold_archive_after_days"  # 設定ファイルのキー
+
+# 診断（処理時間の計測）設定
+METRICS_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)  # ヒストグラムの区切り（ミリ秒）
+METRICS_ENABLED_DEFAULT = True  # 計測を既定で有効にするか
+SETTING_DIAGNOSTICS_ENABLED = "diagnostics_enabled"  # 設定ファイルのキー
+DIAGNOSTICS_REFRESH_INTERVAL = 2000  # 診断タブを表示している間の更新間隔（ミリ秒）
+
+# クイックオープン設定
+RECENT_NOTES_FILE_SUFFIX = ".recent.json"  # データファイルの隣に置く最近開いた付箋の索引の接尾辞
+RECENT_NOTES_MAX = 100  # 記録する最近開いた付箋の数
+QUICK_OPEN_PREVIEW_LENGTH = 120  # 検索対象・表示にする本文の先頭の文字数
+QUICK_OPEN_MAX_RESULTS = 50  # 表示する候補の数
+QUICK_OPEN_RECENT_BONUS = 10.0  # 最も最近開いた付箋の加点（古くなるほど小さくなる）
+QUICK_OPEN_WINDOW_SIZE = "520x320"  # クイックオープンのウィンドウのサイズ
+QUICK_OPEN_SHORTCUT = "<Control-p>"  # クイックオープンを表示するキー（付箋ウィンドウでも有効）
+
+# 元に戻す・やり直し設定
+UNDO_MAX_ENTRIES = 100  # 元に戻せる操作の数
+UNDO_MEMORY_BUDGET = 1024 * 1024  # メモリに保持する操作前後の状態の上限（超えた分は一時ファイルに退避）
+
+# 他プロセスによるデータファイル変更の監視
+FILE_WATCH_MIN_INTERVAL = 500  # 変更を検出した直後の確認間隔（ミリ秒）
+FILE_WATCH_MAX_INTERVAL = 5000  # 変更がない間に延ばす確認間隔の上限（ミリ秒）
+
+# 単一インスタンス設定
+INSTANCE_APP_ID = "free_sticky"  # 起動中のインスタンスとの通信で使うアプリ識別子
+INSTANCE_HOST = "127.0.0.1"
+INSTANCE_PORT_BASE = 47200  # データファイルごとの待ち受けポートはこの値からの範囲で決まる
+INSTANCE_PORT_RANGE = 1000
+INSTANCE_CONNECT_TIMEOUT = 0.5  # 起動中のインスタンスへの接続・応答待ちの上限（秒）
+INSTANCE_MAX_REQUEST_BYTES = 1024 * 1024  # 1回の要求の最大サイズ
+
+# 自動化API（JSON-RPC）設定
+RPC_HOST = "127.0.0.1"  # ローカルからの接続だけを受け付ける
+RPC_DEFAULT_PORT = 47180
+RPC_CALL_TIMEOUT = 10.0  # メインスレッドでの処理完了を待つ上限（秒）
+RPC_MAX_REQUEST_BYTES = 16 * 1024 * 1024  # 1回の要求の最大サイズ
+SETTING_RPC_ENABLED = "rpc_enabled"  # 設定ファイルのキー
+SETTING_RPC_PORT = "rpc_port"
+
 # リストビューカラム幅
 COLUMN_ID_WIDTH = 0
 COLUMN_DATE_WIDTH = 140
 COLUMN_PREVIEW_WIDTH = 350
 COLUMN_STATUS_WIDTH = 80
+SORT_FULL_RESORT_RATIO = 0.125  # 変更された行がこの割合を超えたら差し込まずに並べ替え直す
+SORT_ASCENDING_MARK = " ▲"  # 並べ替えている列の見出しに付ける印
+SORT_DESCENDING_MARK = " ▼"
 
 # メッセージ
 MSG_SELECT_NOTE_TO_OPEN = "開く付箋を選択してください。"
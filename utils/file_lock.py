@@ -0,0 +1,102 @@
+"""ロックファイルによるプロセス間の排他制御"""
+import os
+import threading
+import time
+from typing import Optional
+from utils.constants import FILE_LOCK_TIMEOUT, FILE_LOCK_POLL_INTERVAL
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _try_lock(fd: int) -> None:
+    """ロックを取得（取得できなければOSError）"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+
+def _unlock(fd: int) -> None:
+    """ロックを解放"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class FileLock:
+    """ロックファイルを使った勧告ロック（同じスレッドからは再入でき、他のスレッドは解放まで待つ）
+    
+    ロックを取得するのは書き込むプロセス同士だけで、読み込みは一時ファイルからの置き換えにより
+    ロックなしでも書きかけの内容を見ない。ロックファイルは競合を避けるため削除しない。
+    """
+    
+    def __init__(self, path: str, timeout: float = FILE_LOCK_TIMEOUT,
+                 poll_interval: float = FILE_LOCK_POLL_INTERVAL):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+        self._depth = 0
+        # 再入の深さは保持しているスレッドだけが変更する（他スレッドは解放まで待つ）
+        self._thread_lock = threading.RLock()
+    
+    @property
+    def is_locked(self) -> bool:
+        """このインスタンスがロックを保持しているか"""
+        return self._depth > 0
+    
+    def acquire(self) -> None:
+        """ロックを取得（timeout 秒以内に取得できなければTimeoutError）"""
+        deadline = time.monotonic() + self.timeout
+        if not self._thread_lock.acquire(timeout=max(0.0, self.timeout)):
+            raise TimeoutError(f"ロックを取得できませんでした: {self.path}")
+        if self._depth:
+            self._depth += 1
+            return
+        
+        try:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        except OSError:
+            self._thread_lock.release()
+            raise
+        while True:
+            try:
+                _try_lock(fd)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    self._thread_lock.release()
+                    raise TimeoutError(f"ロックを取得できませんでした: {self.path}")
+                time.sleep(self.poll_interval)
+        self._fd = fd
+        self._depth = 1
+    
+    def release(self) -> None:
+        """ロックを解放"""
+        if not self._depth:
+            return
+        try:
+            self._depth -= 1
+            if self._depth == 0 and self._fd is not None:
+                try:
+                    _unlock(self._fd)
+                finally:
+                    os.close(self._fd)
+                    self._fd = None
+        finally:
+            self._thread_lock.release()
+    
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
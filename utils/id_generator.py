@@ -0,0 +1,67 @@
+"""付箋IDの生成"""
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Iterable
+from utils.constants import ID_DATE_FORMAT, ID_SEQUENCE_DIGITS
+
+
+class MonotonicIdGenerator:
+    """時刻ベースで単調増加し、文字列のままソートできる付箋IDの生成器
+    
+    IDは「年月日時分秒（14桁）+ 連番（ID_SEQUENCE_DIGITS桁）」の数字列。
+    同じ秒に何件作成しても、時計が戻っても、前回より大きいIDを返す。
+    同じ秒の連番を使い切った場合は、時計を待たずに次の秒の連番0に進む（IDの日時は常に正しい日時になる）。
+    """
+    
+    def __init__(self, clock: Callable[[], datetime] = datetime.now):
+        self._clock = clock
+        self._scale = 10 ** ID_SEQUENCE_DIGITS
+        self._last = 0
+        self._lock = threading.Lock()
+    
+    def observe(self, note_ids: Iterable[str]) -> None:
+        """既存のIDを登録し、以降はそれより大きいIDを生成する"""
+        with self._lock:
+            for note_id in note_ids:
+                value = self._to_value(note_id)
+                if value > self._last:
+                    self._last = value
+    
+    def next_id(self) -> str:
+        """新しいIDを生成"""
+        with self._lock:
+            value = int(self._clock().strftime(ID_DATE_FORMAT)) * self._scale
+            if value <= self._last:
+                value = self._last + 1
+                if value % self._scale == 0:
+                    # 連番の繰り上がりで日時の桁が不正な値にならないよう、次の秒に進める
+                    value = self._next_second(self._last // self._scale) * self._scale
+            self._last = value
+            return str(value)
+    
+    @staticmethod
+    def _next_second(timestamp: int) -> int:
+        """年月日時分秒の14桁の数値の1秒後（日時として読めない値はそのまま1を足す）"""
+        try:
+            moment = datetime.strptime(str(timestamp), ID_DATE_FORMAT)
+        except ValueError:
+            return timestamp + 1
+        return int((moment + timedelta(seconds=1)).strftime(ID_DATE_FORMAT))
+    
+    def _to_value(self, note_id: str) -> int:
+        """IDを比較用の整数に変換（旧形式の14桁IDは連番0として扱う）"""
+        timestamp = note_id[:14]
+        if len(timestamp) != 14 or not timestamp.isdigit():
+            return 0
+        sequence = note_id[14:]
+        if len(sequence) == ID_SEQUENCE_DIGITS and sequence.isdigit():
+            return int(timestamp) * self._scale + int(sequence)
+        return int(timestamp) * self._scale
+
+
+# グローバルインスタンス
+_id_generator = MonotonicIdGenerator()
+
+def get_id_generator() -> MonotonicIdGenerator:
+    """ID生成器のシングルトンインスタンスを取得"""
+    return _id_generator
@@ -0,0 +1,107 @@
+"""翻訳データ: العربية (ar)"""
+
+TRANSLATIONS = {
+    "language_name": "العربية",
+    "app_title": "مدير الملاحظات اللاصقة",
+    "all_notes": "جميع الملاحظات",
+    "settings": "الإعدادات",
+    "language": "اللغة",
+    "search": "البحث:",
+    "new_note": "ملاحظة جديدة",
+    "open": "فتح",
+    "delete": "حذف",
+    "color_change": "تغيير اللون",
+    "refresh": "تحديث",
+    "preview": "معاينة:",
+    "id": "المعرف",
+    "date": "التاريخ",
+    "content": "المحتوى",
+    "status": "الحالة",
+    "status_open": "مفتوح",
+    "status_closed": "مغلق",
+    "status_ready": "جاهز",
+    "status_created": "تم إنشاء الملاحظة (المعرف: {})",
+    "status_editing": "تحرير الملاحظة (المعرف: {})",
+    "status_deleted": "تم حذف الملاحظة (المعرف: {})",
+    "status_color_changed": "تم تغيير لون الملاحظة (المعرف: {})",
+    "status_loaded": "تم تحميل {} ملاحظة",
+    "status_saved": "تم حفظ {} ملاحظة",
+    "status_load_failed": "فشل في تحميل الملاحظات",
+    "status_save_failed": "فشل في حفظ الملاحظات",
+    "status_new_file": "إنشاء ملف بيانات جديد",
+    "msg_select_note_to_open": "يرجى اختيار ملاحظة لفتحها.",
+    "msg_select_note_to_delete": "يرجى اختيار ملاحظة لحذفها.",
+    "msg_select_note_for_color": "يرجى اختيار ملاحظة لتغيير لونها.",
+    "msg_confirm_delete": "هل أنت متأكد من أنك تريد حذف الملاحظة المحددة؟\nلا يمكن التراجع عن هذا الإجراء.",
+    "msg_error_note_data": "فشل في استرداد بيانات الملاحظة.",
+    "msg_empty_content": "(لا يوجد محتوى)",
+    "confirm": "تأكيد",
+    "info": "معلومات",
+    "error": "خطأ",
+    "close": "إغلاق",
+    "settings_menu": "القائمة",
+    "change_color": "تغيير اللون",
+    "show_all": "عرض الكل ({} حرفًا)",
+    "arrange_all": "ترتيب",
+    "status_arranged": "تم ترتيب {} ملاحظة",
+    "status_loading": "جارٍ تحميل الملاحظات...",
+    "status_created_many": "تم إنشاء {} ملاحظة",
+    "status_updated_many": "تم تحديث {} ملاحظة",
+    "status_deleted_many": "تم حذف {} ملاحظة",
+    "msg_confirm_delete_many": "هل تريد بالتأكيد حذف {} ملاحظة محددة؟\nلا يمكن التراجع عن هذا الإجراء.",
+    "archive": "أرشفة",
+    "unarchive": "إلغاء الأرشفة",
+    "show_archived": "إظهار المؤرشفة",
+    "status_archived": "مؤرشفة",
+    "status_opened_many": "تم فتح {} ملاحظة",
+    "status_closed_many": "تم إغلاق {} ملاحظة",
+    "status_color_changed_many": "تم تغيير لون {} ملاحظة",
+    "status_archived_many": "تمت أرشفة {} ملاحظة",
+    "status_unarchived_many": "تم إلغاء أرشفة {} ملاحظة",
+    "msg_select_note_to_close": "يرجى تحديد ملاحظة لإغلاقها.",
+    "msg_select_note_to_archive": "يرجى تحديد ملاحظة لأرشفتها.",
+    "automation_api": "واجهة الأتمتة",
+    "enable_automation_api": "تمكين واجهة الأتمتة المحلية (127.0.0.1:{})",
+    "status_rpc_started": "تم تشغيل واجهة الأتمتة (127.0.0.1:{})",
+    "status_rpc_stopped": "تم إيقاف واجهة الأتمتة",
+    "status_rpc_failed": "تعذر تشغيل واجهة الأتمتة (المنفذ {} قيد الاستخدام)",
+    "status_external_changes": "تم تحميل تغييرات برنامج آخر على {} ملاحظة",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
@@ -0,0 +1,107 @@
+"""翻訳データ: Čeština (cs)"""
+
+TRANSLATIONS = {
+    "language_name": "Čeština",
+    "app_title": "Správce Lepících Poznámek",
+    "all_notes": "Všechny Poznámky",
+    "settings": "Nastavení",
+    "language": "Jazyk",
+    "search": "Hledat:",
+    "new_note": "Nová Poznámka",
+    "open": "Otevřít",
+    "delete": "Smazat",
+    "color_change": "Změnit Barvu",
+    "refresh": "Obnovit",
+    "preview": "Náhled:",
+    "id": "ID",
+    "date": "Datum",
+    "content": "Obsah",
+    "status": "Stav",
+    "status_open": "Otevřená",
+    "status_closed": "Zavřená",
+    "status_ready": "Připraveno",
+    "status_created": "Poznámka vytvořena (ID: {})",
+    "status_editing": "Úprava poznámky (ID: {})",
+    "status_deleted": "Poznámka smazána (ID: {})",
+    "status_color_changed": "Barva poznámky změněna (ID: {})",
+    "status_loaded": "Načteno {} poznámek",
+    "status_saved": "Uloženo {} poznámek",
+    "status_load_failed": "Načítání poznámek selhalo",
+    "status_save_failed": "Ukládání poznámek selhalo",
+    "status_new_file": "Vytváření nového datového souboru",
+    "msg_select_note_to_open": "Vyberte poznámku k otevření.",
+    "msg_select_note_to_delete": "Vyberte poznámku ke smazání.",
+    "msg_select_note_for_color": "Vyberte poznámku pro změnu barvy.",
+    "msg_confirm_delete": "Opravdu chcete smazat vybranou poznámku?\nTuto akci nelze vrátit zpět.",
+    "msg_error_note_data": "Nepodařilo se získat data poznámky.",
+    "msg_empty_content": "(žádný obsah)",
+    "confirm": "Potvrdit",
+    "info": "Informace",
+    "error": "Chyba",
+    "close": "Zavřít",
+    "settings_menu": "Menu",
+    "change_color": "Změnit Barvu",
+    "show_all": "Zobrazit vše ({} znaků)",
+    "arrange_all": "Uspořádat",
+    "status_arranged": "Uspořádáno poznámek: {}",
+    "status_loading": "Načítání poznámek...",
+    "status_created_many": "Vytvořeno poznámek: {}",
+    "status_updated_many": "Aktualizováno poznámek: {}",
+    "status_deleted_many": "Smazáno poznámek: {}",
+    "msg_confirm_delete_many": "Opravdu chcete smazat {} vybraných poznámek?\nTuto akci nelze vrátit zpět.",
+    "archive": "Archivovat",
+    "unarchive": "Obnovit z archivu",
+    "show_archived": "Zobrazit archivované",
+    "status_archived": "Archivováno",
+    "status_opened_many": "Otevřeno poznámek: {}",
+    "status_closed_many": "Zavřeno poznámek: {}",
+    "status_color_changed_many": "Změněna barva poznámek: {}",
+    "status_archived_many": "Archivováno poznámek: {}",
+    "status_unarchived_many": "Obnoveno z archivu poznámek: {}",
+    "msg_select_note_to_close": "Vyberte poznámku k zavření.",
+    "msg_select_note_to_archive": "Vyberte poznámku k archivaci.",
+    "automation_api": "API pro automatizaci",
+    "enable_automation_api": "Povolit místní API pro automatizaci (127.0.0.1:{})",
+    "status_rpc_started": "API pro automatizaci spuštěno (127.0.0.1:{})",
+    "status_rpc_stopped": "API pro automatizaci zastaveno",
+    "status_rpc_failed": "API pro automatizaci nelze spustit (port {} je obsazen)",
+    "status_external_changes": "Načteny změny jiného programu v poznámkách: {}",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
@@ -0,0 +1,107 @@
+"""翻訳データ: Dansk (da)"""
+
+TRANSLATIONS = {
+    "language_name": "Dansk",
+    "app_title": "Klæbende Noter Manager",
+    "all_notes": "Alle Noter",
+    "settings": "Indstillinger",
+    "language": "Sprog",
+    "search": "Søg:",
+    "new_note": "Ny Note",
+    "open": "Åbn",
+    "delete": "Slet",
+    "color_change": "Skift Farve",
+    "refresh": "Opdater",
+    "preview": "Forhåndsvisning:",
+    "id": "ID",
+    "date": "Dato",
+    "content": "Indhold",
+    "status": "Status",
+    "status_open": "Åben",
+    "status_closed": "Lukket",
+    "status_ready": "Klar",
+    "status_created": "Note oprettet (ID: {})",
+    "status_editing": "Redigerer note (ID: {})",
+    "status_deleted": "Note slettet (ID: {})",
+    "status_color_changed": "Note farve ændret (ID: {})",
+    "status_loaded": "Indlæste {} noter",
+    "status_saved": "Gemte {} noter",
+    "status_load_failed": "Kunne ikke indlæse noter",
+    "status_save_failed": "Kunne ikke gemme noter",
+    "status_new_file": "Opretter ny datafil",
+    "msg_select_note_to_open": "Vælg en note at åbne.",
+    "msg_select_note_to_delete": "Vælg en note at slette.",
+    "msg_select_note_for_color": "Vælg en note til at ændre farve.",
+    "msg_confirm_delete": "Er du sikker på, at du vil slette den valgte note?\nDenne handling kan ikke fortrydes.",
+    "msg_error_note_data": "Kunne ikke hente note data.",
+    "msg_empty_content": "(intet indhold)",
+    "confirm": "Bekræft",
+    "info": "Information",
+    "error": "Fejl",
+    "close": "Luk",
+    "settings_menu": "Menu",
+    "change_color": "Skift Farve",
+    "show_all": "Vis alt ({} tegn)",
+    "arrange_all": "Arranger",
+    "status_arranged": "{} noter arrangeret",
+    "status_loading": "Indlæser noter...",
+    "status_created_many": "{} noter oprettet",
+    "status_updated_many": "{} noter opdateret",
+    "status_deleted_many": "{} noter slettet",
+    "msg_confirm_delete_many": "Er du sikker på, at du vil slette de {} valgte noter?\nDenne handling kan ikke fortrydes.",
+    "archive": "Arkivér",
+    "unarchive": "Gendan fra arkiv",
+    "show_archived": "Vis arkiverede",
+    "status_archived": "Arkiveret",
+    "status_opened_many": "{} noter åbnet",
+    "status_closed_many": "{} noter lukket",
+    "status_color_changed_many": "Farve ændret for {} noter",
+    "status_archived_many": "{} noter arkiveret",
+    "status_unarchived_many": "{} noter gendannet fra arkivet",
+    "msg_select_note_to_close": "Vælg en note, der skal lukkes.",
+    "msg_select_note_to_archive": "Vælg en note, der skal arkiveres.",
+    "automation_api": "Automatiserings-API",
+    "enable_automation_api": "Aktivér lokalt automatiserings-API (127.0.0.1:{})",
+    "status_rpc_started": "Automatiserings-API startet (127.0.0.1:{})",
+    "status_rpc_stopped": "Automatiserings-API stoppet",
+    "status_rpc_failed": "Kunne ikke starte automatiserings-API (port {} er i brug)",
+    "status_external_changes": "Indlæste ændringer i {} noter fra et andet program",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
@@ -0,0 +1,107 @@
+"""翻訳データ: Deutsch (de)"""
+
+TRANSLATIONS = {
+    "language_name": "Deutsch",
+    "app_title": "Haftnotizen-Manager",
+    "all_notes": "Alle Notizen",
+    "settings": "Einstellungen",
+    "language": "Sprache",
+    "search": "Suchen:",
+    "new_note": "Neue Notiz",
+    "open": "Öffnen",
+    "delete": "Löschen",
+    "color_change": "Farbe ändern",
+    "refresh": "Aktualisieren",
+    "preview": "Vorschau:",
+    "id": "ID",
+    "date": "Datum",
+    "content": "Inhalt",
+    "status": "Status",
+    "status_open": "Geöffnet",
+    "status_closed": "Geschlossen",
+    "status_ready": "Bereit",
+    "status_created": "Notiz erstellt (ID: {})",
+    "status_editing": "Notiz bearbeiten (ID: {})",
+    "status_deleted": "Notiz gelöscht (ID: {})",
+    "status_color_changed": "Notizfarbe geändert (ID: {})",
+    "status_loaded": "{} Notizen geladen",
+    "status_saved": "{} Notizen gespeichert",
+    "status_load_failed": "Laden der Notizen fehlgeschlagen",
+    "status_save_failed": "Speichern der Notizen fehlgeschlagen",
+    "status_new_file": "Neue Datendatei wird erstellt",
+    "msg_select_note_to_open": "Bitte wählen Sie eine Notiz zum Öffnen aus.",
+    "msg_select_note_to_delete": "Bitte wählen Sie eine Notiz zum Löschen aus.",
+    "msg_select_note_for_color": "Bitte wählen Sie eine Notiz zum Farbwechsel aus.",
+    "msg_confirm_delete": "Sind Sie sicher, dass Sie die ausgewählte Notiz löschen möchten?\nDiese Aktion kann nicht rückgängig gemacht werden.",
+    "msg_error_note_data": "Fehler beim Abrufen der Notizdaten.",
+    "msg_empty_content": "(kein Inhalt)",
+    "confirm": "Bestätigen",
+    "info": "Information",
+    "error": "Fehler",
+    "close": "Schließen",
+    "settings_menu": "Menü",
+    "change_color": "Farbe ändern",
+    "show_all": "Alles anzeigen ({} Zeichen)",
+    "arrange_all": "Anordnen",
+    "status_arranged": "{} Notizen angeordnet",
+    "status_loading": "Notizen werden geladen...",
+    "status_created_many": "{} Notizen erstellt",
+    "status_updated_many": "{} Notizen aktualisiert",
+    "status_deleted_many": "{} Notizen gelöscht",
+    "msg_confirm_delete_many": "Möchten Sie die {} ausgewählten Notizen wirklich löschen?\nDiese Aktion kann nicht rückgängig gemacht werden.",
+    "archive": "Archivieren",
+    "unarchive": "Aus Archiv holen",
+    "show_archived": "Archivierte anzeigen",
+    "status_archived": "Archiviert",
+    "status_opened_many": "{} Notizen geöffnet",
+    "status_closed_many": "{} Notizen geschlossen",
+    "status_color_changed_many": "Farbe von {} Notizen geändert",
+    "status_archived_many": "{} Notizen archiviert",
+    "status_unarchived_many": "{} Notizen aus dem Archiv geholt",
+    "msg_select_note_to_close": "Bitte wählen Sie eine Notiz zum Schließen aus.",
+    "msg_select_note_to_archive": "Bitte wählen Sie eine Notiz zum Archivieren aus.",
+    "automation_api": "Automatisierungs-API",
+    "enable_automation_api": "Lokale Automatisierungs-API aktivieren (127.0.0.1:{})",
+    "status_rpc_started": "Automatisierungs-API gestartet (127.0.0.1:{})",
+    "status_rpc_stopped": "Automatisierungs-API beendet",
+    "status_rpc_failed": "Automatisierungs-API konnte nicht gestartet werden (Port {} belegt)",
+    "status_external_changes": "Änderungen an {} Notizen durch ein anderes Programm geladen",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
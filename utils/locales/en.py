@@ -0,0 +1,107 @@
+"""翻訳データ: English (en)"""
+
+TRANSLATIONS = {
+    "language_name": "English",
+    "app_title": "Sticky Notes Manager",
+    "all_notes": "All Notes",
+    "settings": "Settings",
+    "language": "Language",
+    "search": "Search:",
+    "new_note": "New Note",
+    "open": "Open",
+    "delete": "Delete",
+    "color_change": "Change Color",
+    "refresh": "Refresh",
+    "preview": "Preview:",
+    "id": "ID",
+    "date": "Date",
+    "content": "Content",
+    "status": "Status",
+    "status_open": "Open",
+    "status_closed": "Closed",
+    "status_ready": "Ready",
+    "status_created": "Note created (ID: {})",
+    "status_editing": "Editing note (ID: {})",
+    "status_deleted": "Note deleted (ID: {})",
+    "status_color_changed": "Note color changed (ID: {})",
+    "status_loaded": "Loaded {} notes",
+    "status_saved": "Saved {} notes",
+    "status_load_failed": "Failed to load notes",
+    "status_save_failed": "Failed to save notes",
+    "status_new_file": "Creating new data file",
+    "msg_select_note_to_open": "Please select a note to open.",
+    "msg_select_note_to_delete": "Please select a note to delete.",
+    "msg_select_note_for_color": "Please select a note to change color.",
+    "msg_confirm_delete": "Are you sure you want to delete the selected note?\nThis action cannot be undone.",
+    "msg_error_note_data": "Failed to retrieve note data.",
+    "msg_empty_content": "(no content)",
+    "confirm": "Confirm",
+    "info": "Information",
+    "error": "Error",
+    "close": "Close",
+    "settings_menu": "Menu",
+    "change_color": "Change Color",
+    "show_all": "Show all ({} chars)",
+    "arrange_all": "Arrange",
+    "status_arranged": "Arranged {} notes",
+    "status_loading": "Loading notes...",
+    "status_created_many": "Created {} notes",
+    "status_updated_many": "Updated {} notes",
+    "status_deleted_many": "Deleted {} notes",
+    "msg_confirm_delete_many": "Are you sure you want to delete the {} selected notes?\nThis action cannot be undone.",
+    "archive": "Archive",
+    "unarchive": "Unarchive",
+    "show_archived": "Show archived",
+    "status_archived": "Archived",
+    "status_opened_many": "Opened {} notes",
+    "status_closed_many": "Closed {} notes",
+    "status_color_changed_many": "Changed the color of {} notes",
+    "status_archived_many": "Archived {} notes",
+    "status_unarchived_many": "Restored {} notes from the archive",
+    "msg_select_note_to_close": "Please select a note to close.",
+    "msg_select_note_to_archive": "Please select a note to archive.",
+    "automation_api": "Automation API",
+    "enable_automation_api": "Enable the local automation API (127.0.0.1:{})",
+    "status_rpc_started": "Automation API started (127.0.0.1:{})",
+    "status_rpc_stopped": "Automation API stopped",
+    "status_rpc_failed": "Could not start the automation API (port {} is in use)",
+    "status_external_changes": "Loaded changes to {} notes made by another program",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
@@ -0,0 +1,107 @@
+"""翻訳データ: Español (es)"""
+
+TRANSLATIONS = {
+    "language_name": "Español",
+    "app_title": "Gestor de Notas Adhesivas",
+    "all_notes": "Todas las Notas",
+    "settings": "Configuración",
+    "language": "Idioma",
+    "search": "Buscar:",
+    "new_note": "Nueva Nota",
+    "open": "Abrir",
+    "delete": "Eliminar",
+    "color_change": "Cambiar Color",
+    "refresh": "Actualizar",
+    "preview": "Vista previa:",
+    "id": "ID",
+    "date": "Fecha",
+    "content": "Contenido",
+    "status": "Estado",
+    "status_open": "Abierto",
+    "status_closed": "Cerrado",
+    "status_ready": "Listo",
+    "status_created": "Nota creada (ID: {})",
+    "status_editing": "Editando nota (ID: {})",
+    "status_deleted": "Nota eliminada (ID: {})",
+    "status_color_changed": "Color de nota cambiado (ID: {})",
+    "status_loaded": "Cargadas {} notas",
+    "status_saved": "Guardadas {} notas",
+    "status_load_failed": "Error al cargar notas",
+    "status_save_failed": "Error al guardar notas",
+    "status_new_file": "Creando nuevo archivo de datos",
+    "msg_select_note_to_open": "Por favor seleccione una nota para abrir.",
+    "msg_select_note_to_delete": "Por favor seleccione una nota para eliminar.",
+    "msg_select_note_for_color": "Por favor seleccione una nota para cambiar color.",
+    "msg_confirm_delete": "¿Está seguro de que desea eliminar la nota seleccionada?\nEsta acción no se puede deshacer.",
+    "msg_error_note_data": "Error al obtener datos de la nota.",
+    "msg_empty_content": "(sin contenido)",
+    "confirm": "Confirmar",
+    "info": "Información",
+    "error": "Error",
+    "close": "Cerrar",
+    "settings_menu": "Menú",
+    "change_color": "Cambiar Color",
+    "show_all": "Mostrar todo ({} caracteres)",
+    "arrange_all": "Organizar",
+    "status_arranged": "{} notas organizadas",
+    "status_loading": "Cargando notas...",
+    "status_created_many": "{} notas creadas",
+    "status_updated_many": "{} notas actualizadas",
+    "status_deleted_many": "{} notas eliminadas",
+    "msg_confirm_delete_many": "¿Seguro que desea eliminar las {} notas seleccionadas?\nEsta acción no se puede deshacer.",
+    "archive": "Archivar",
+    "unarchive": "Desarchivar",
+    "show_archived": "Mostrar archivadas",
+    "status_archived": "Archivada",
+    "status_opened_many": "{} notas abiertas",
+    "status_closed_many": "{} notas cerradas",
+    "status_color_changed_many": "Color cambiado en {} notas",
+    "status_archived_many": "{} notas archivadas",
+    "status_unarchived_many": "{} notas desarchivadas",
+    "msg_select_note_to_close": "Seleccione una nota para cerrar.",
+    "msg_select_note_to_archive": "Seleccione una nota para archivar.",
+    "automation_api": "API de automatización",
+    "enable_automation_api": "Activar la API de automatización local (127.0.0.1:{})",
+    "status_rpc_started": "API de automatización iniciada (127.0.0.1:{})",
+    "status_rpc_stopped": "API de automatización detenida",
+    "status_rpc_failed": "No se pudo iniciar la API de automatización (puerto {} en uso)",
+    "status_external_changes": "Cargados los cambios de otro programa en {} notas",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
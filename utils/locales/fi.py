@@ -0,0 +1,107 @@
+"""翻訳データ: Suomi (fi)"""
+
+TRANSLATIONS = {
+    "language_name": "Suomi",
+    "app_title": "Tarralappu Hallinta",
+    "all_notes": "Kaikki Muistiinpanot",
+    "settings": "Asetukset",
+    "language": "Kieli",
+    "search": "Etsi:",
+    "new_note": "Uusi Muistiinpano",
+    "open": "Avaa",
+    "delete": "Poista",
+    "color_change": "Vaihda Väri",
+    "refresh": "Päivitä",
+    "preview": "Esikatselu:",
+    "id": "ID",
+    "date": "Päivämäärä",
+    "content": "Sisältö",
+    "status": "Tila",
+    "status_open": "Avoinna",
+    "status_closed": "Suljettu",
+    "status_ready": "Valmis",
+    "status_created": "Muistiinpano luotu (ID: {})",
+    "status_editing": "Muokataan muistiinpanoa (ID: {})",
+    "status_deleted": "Muistiinpano poistettu (ID: {})",
+    "status_color_changed": "Muistiinpanon väri vaihdettu (ID: {})",
+    "status_loaded": "Ladattiin {} muistiinpanoa",
+    "status_saved": "Tallennettiin {} muistiinpanoa",
+    "status_load_failed": "Muistiinpanojen lataus epäonnistui",
+    "status_save_failed": "Muistiinpanojen tallennus epäonnistui",
+    "status_new_file": "Luodaan uusi datatiedosto",
+    "msg_select_note_to_open": "Valitse avattava muistiinpano.",
+    "msg_select_note_to_delete": "Valitse poistettava muistiinpano.",
+    "msg_select_note_for_color": "Valitse muistiinpano värin vaihtamiseksi.",
+    "msg_confirm_delete": "Oletko varma että haluat poistaa valitun muistiinpanon?\nTätä toimintoa ei voi perua.",
+    "msg_error_note_data": "Muistiinpanon tietojen hakeminen epäonnistui.",
+    "msg_empty_content": "(ei sisältöä)",
+    "confirm": "Vahvista",
+    "info": "Tiedot",
+    "error": "Virhe",
+    "close": "Sulje",
+    "settings_menu": "Valikko",
+    "change_color": "Vaihda Väri",
+    "show_all": "Näytä kaikki ({} merkkiä)",
+    "arrange_all": "Järjestä",
+    "status_arranged": "{} muistilappua järjestetty",
+    "status_loading": "Ladataan muistilappuja...",
+    "status_created_many": "{} muistilappua luotu",
+    "status_updated_many": "{} muistilappua päivitetty",
+    "status_deleted_many": "{} muistilappua poistettu",
+    "msg_confirm_delete_many": "Haluatko varmasti poistaa {} valittua muistilappua?\nToimintoa ei voi kumota.",
+    "archive": "Arkistoi",
+    "unarchive": "Palauta arkistosta",
+    "show_archived": "Näytä arkistoidut",
+    "status_archived": "Arkistoitu",
+    "status_opened_many": "{} muistilappua avattu",
+    "status_closed_many": "{} muistilappua suljettu",
+    "status_color_changed_many": "{} muistilapun väri vaihdettu",
+    "status_archived_many": "{} muistilappua arkistoitu",
+    "status_unarchived_many": "{} muistilappua palautettu arkistosta",
+    "msg_select_note_to_close": "Valitse suljettava muistilappu.",
+    "msg_select_note_to_archive": "Valitse arkistoitava muistilappu.",
+    "automation_api": "Automaatiorajapinta",
+    "enable_automation_api": "Ota paikallinen automaatiorajapinta käyttöön (127.0.0.1:{})",
+    "status_rpc_started": "Automaatiorajapinta käynnistetty (127.0.0.1:{})",
+    "status_rpc_stopped": "Automaatiorajapinta pysäytetty",
+    "status_rpc_failed": "Automaatiorajapintaa ei voitu käynnistää (portti {} on käytössä)",
+    "status_external_changes": "Ladattiin toisen ohjelman muutokset {} muistilappuun",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
@@ -0,0 +1,107 @@
+"""翻訳データ: Français (fr)"""
+
+TRANSLATIONS = {
+    "language_name": "Français",
+    "app_title": "Gestionnaire de Notes Adhésives",
+    "all_notes": "Toutes les Notes",
+    "settings": "Paramètres",
+    "language": "Langue",
+    "search": "Rechercher:",
+    "new_note": "Nouvelle Note",
+    "open": "Ouvrir",
+    "delete": "Supprimer",
+    "color_change": "Changer Couleur",
+    "refresh": "Actualiser",
+    "preview": "Aperçu:",
+    "id": "ID",
+    "date": "Date",
+    "content": "Contenu",
+    "status": "Statut",
+    "status_open": "Ouvert",
+    "status_closed": "Fermé",
+    "status_ready": "Prêt",
+    "status_created": "Note créée (ID: {})",
+    "status_editing": "Édition de la note (ID: {})",
+    "status_deleted": "Note supprimée (ID: {})",
+    "status_color_changed": "Couleur de la note changée (ID: {})",
+    "status_loaded": "{} notes chargées",
+    "status_saved": "{} notes sauvegardées",
+    "status_load_failed": "Échec du chargement des notes",
+    "status_save_failed": "Échec de la sauvegarde des notes",
+    "status_new_file": "Création d'un nouveau fichier de données",
+    "msg_select_note_to_open": "Veuillez sélectionner une note à ouvrir.",
+    "msg_select_note_to_delete": "Veuillez sélectionner une note à supprimer.",
+    "msg_select_note_for_color": "Veuillez sélectionner une note pour changer la couleur.",
+    "msg_confirm_delete": "Êtes-vous sûr de vouloir supprimer la note sélectionnée?\nCette action ne peut pas être annulée.",
+    "msg_error_note_data": "Échec de la récupération des données de la note.",
+    "msg_empty_content": "(aucun contenu)",
+    "confirm": "Confirmer",
+    "info": "Information",
+    "error": "Erreur",
+    "close": "Fermer",
+    "settings_menu": "Menu",
+    "change_color": "Changer la Couleur",
+    "show_all": "Tout afficher ({} caractères)",
+    "arrange_all": "Organiser",
+    "status_arranged": "{} notes organisées",
+    "status_loading": "Chargement des notes...",
+    "status_created_many": "{} notes créées",
+    "status_updated_many": "{} notes mises à jour",
+    "status_deleted_many": "{} notes supprimées",
+    "msg_confirm_delete_many": "Voulez-vous vraiment supprimer les {} notes sélectionnées ?\nCette action est irréversible.",
+    "archive": "Archiver",
+    "unarchive": "Désarchiver",
+    "show_archived": "Afficher les archives",
+    "status_archived": "Archivée",
+    "status_opened_many": "{} notes ouvertes",
+    "status_closed_many": "{} notes fermées",
+    "status_color_changed_many": "Couleur de {} notes modifiée",
+    "status_archived_many": "{} notes archivées",
+    "status_unarchived_many": "{} notes désarchivées",
+    "msg_select_note_to_close": "Veuillez sélectionner une note à fermer.",
+    "msg_select_note_to_archive": "Veuillez sélectionner une note à archiver.",
+    "automation_api": "API d'automatisation",
+    "enable_automation_api": "Activer l'API d'automatisation locale (127.0.0.1:{})",
+    "status_rpc_started": "API d'automatisation démarrée (127.0.0.1:{})",
+    "status_rpc_stopped": "API d'automatisation arrêtée",
+    "status_rpc_failed": "Impossible de démarrer l'API d'automatisation (port {} occupé)",
+    "status_external_changes": "Modifications de {} notes par un autre programme chargées",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
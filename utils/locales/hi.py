@@ -0,0 +1,107 @@
+"""翻訳データ: हिन्दी (hi)"""
+
+TRANSLATIONS = {
+    "language_name": "हिन्दी",
+    "app_title": "स्टिकी नोट्स प्रबंधक",
+    "all_notes": "सभी नोट्स",
+    "settings": "सेटिंग्स",
+    "language": "भाषा",
+    "search": "खोजें:",
+    "new_note": "नया नोट",
+    "open": "खोलें",
+    "delete": "हटाएं",
+    "color_change": "रंग बदलें",
+    "refresh": "रीफ्रेश",
+    "preview": "पूर्वावलोकन:",
+    "id": "आईडी",
+    "date": "दिनांक",
+    "content": "सामग्री",
+    "status": "स्थिति",
+    "status_open": "खुला",
+    "status_closed": "बंद",
+    "status_ready": "तैयार",
+    "status_created": "नोट बनाया गया (आईडी: {})",
+    "status_editing": "नोट संपादित कर रहे हैं (आईडी: {})",
+    "status_deleted": "नोट हटाया गया (आईडी: {})",
+    "status_color_changed": "नोट का रंग बदला गया (आईडी: {})",
+    "status_loaded": "{} नोट्स लोड किए गए",
+    "status_saved": "{} नोट्स सहेजे गए",
+    "status_load_failed": "नोट्स लोड करने में विफल",
+    "status_save_failed": "नोट्स सहेजने में विफल",
+    "status_new_file": "नई डेटा फ़ाइल बना रहे हैं",
+    "msg_select_note_to_open": "कृपया खोलने के लिए एक नोट चुनें।",
+    "msg_select_note_to_delete": "कृपया हटाने के लिए एक नोट चुनें।",
+    "msg_select_note_for_color": "कृपया रंग बदलने के लिए एक नोट चुनें।",
+    "msg_confirm_delete": "क्या आप वाकई चयनित नोट को हटाना चाहते हैं?\nयह क्रिया पूर्ववत नहीं की जा सकती।",
+    "msg_error_note_data": "नोट डेटा प्राप्त करने में विफल।",
+    "msg_empty_content": "(कोई सामग्री नहीं)",
+    "confirm": "पुष्टि करें",
+    "info": "जानकारी",
+    "error": "त्रुटि",
+    "close": "बंद करें",
+    "settings_menu": "मेनू",
+    "change_color": "रंग बदलें",
+    "show_all": "सभी दिखाएँ ({} अक्षर)",
+    "arrange_all": "व्यवस्थित करें",
+    "status_arranged": "{} नोट्स व्यवस्थित किए गए",
+    "status_loading": "नोट्स लोड हो रहे हैं...",
+    "status_created_many": "{} नोट्स बनाए गए",
+    "status_updated_many": "{} नोट्स अपडेट किए गए",
+    "status_deleted_many": "{} नोट्स हटाए गए",
+    "msg_confirm_delete_many": "क्या आप चयनित {} नोट्स हटाना चाहते हैं?\nयह क्रिया पूर्ववत नहीं की जा सकती।",
+    "archive": "संग्रहित करें",
+    "unarchive": "संग्रह से वापस लाएँ",
+    "show_archived": "संग्रहित दिखाएँ",
+    "status_archived": "संग्रहित",
+    "status_opened_many": "{} नोट्स खोले गए",
+    "status_closed_many": "{} नोट्स बंद किए गए",
+    "status_color_changed_many": "{} नोट्स का रंग बदला गया",
+    "status_archived_many": "{} नोट्स संग्रहित किए गए",
+    "status_unarchived_many": "{} नोट्स संग्रह से वापस लाए गए",
+    "msg_select_note_to_close": "कृपया बंद करने के लिए एक नोट चुनें।",
+    "msg_select_note_to_archive": "कृपया संग्रहित करने के लिए एक नोट चुनें।",
+    "automation_api": "स्वचालन API",
+    "enable_automation_api": "स्थानीय स्वचालन API सक्षम करें (127.0.0.1:{})",
+    "status_rpc_started": "स्वचालन API शुरू हुआ (127.0.0.1:{})",
+    "status_rpc_stopped": "स्वचालन API बंद हुआ",
+    "status_rpc_failed": "स्वचालन API शुरू नहीं हो सका (पोर्ट {} उपयोग में है)",
+    "status_external_changes": "दूसरे प्रोग्राम द्वारा {} नोट्स में किए गए बदलाव लोड किए गए",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
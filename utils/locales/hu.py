@@ -0,0 +1,107 @@
+"""翻訳データ: Magyar (hu)"""
+
+TRANSLATIONS = {
+    "language_name": "Magyar",
+    "app_title": "Öntapadó Jegyzet Kezelő",
+    "all_notes": "Összes Jegyzet",
+    "settings": "Beállítások",
+    "language": "Nyelv",
+    "search": "Keresés:",
+    "new_note": "Új Jegyzet",
+    "open": "Megnyitás",
+    "delete": "Törlés",
+    "color_change": "Szín Változtatás",
+    "refresh": "Frissítés",
+    "preview": "Előnézet:",
+    "id": "ID",
+    "date": "Dátum",
+    "content": "Tartalom",
+    "status": "Állapot",
+    "status_open": "Nyitva",
+    "status_closed": "Zárva",
+    "status_ready": "Kész",
+    "status_created": "Jegyzet létrehozva (ID: {})",
+    "status_editing": "Jegyzet szerkesztése (ID: {})",
+    "status_deleted": "Jegyzet törölve (ID: {})",
+    "status_color_changed": "Jegyzet színe megváltoztatva (ID: {})",
+    "status_loaded": "{} jegyzet betöltve",
+    "status_saved": "{} jegyzet mentve",
+    "status_load_failed": "Jegyzetek betöltése sikertelen",
+    "status_save_failed": "Jegyzetek mentése sikertelen",
+    "status_new_file": "Új adatfájl létrehozása",
+    "msg_select_note_to_open": "Válasszon egy jegyzetet a megnyitáshoz.",
+    "msg_select_note_to_delete": "Válasszon egy jegyzetet a törléshez.",
+    "msg_select_note_for_color": "Válasszon egy jegyzetet a szín változtatásához.",
+    "msg_confirm_delete": "Biztosan törölni szeretné a kiválasztott jegyzetet?\nEz a művelet nem vonható vissza.",
+    "msg_error_note_data": "Jegyzetek adatainak lekérése sikertelen.",
+    "msg_empty_content": "(nincs tartalom)",
+    "confirm": "Megerősítés",
+    "info": "Információ",
+    "error": "Hiba",
+    "close": "Bezárás",
+    "settings_menu": "Menü",
+    "change_color": "Szín Változtatás",
+    "show_all": "Összes megjelenítése ({} karakter)",
+    "arrange_all": "Elrendezés",
+    "status_arranged": "{} jegyzet elrendezve",
+    "status_loading": "Jegyzetek betöltése...",
+    "status_created_many": "{} jegyzet létrehozva",
+    "status_updated_many": "{} jegyzet frissítve",
+    "status_deleted_many": "{} jegyzet törölve",
+    "msg_confirm_delete_many": "Biztosan törölni szeretné a kiválasztott {} jegyzetet?\nEz a művelet nem vonható vissza.",
+    "archive": "Archiválás",
+    "unarchive": "Visszaállítás archívumból",
+    "show_archived": "Archiváltak megjelenítése",
+    "status_archived": "Archivált",
+    "status_opened_many": "{} jegyzet megnyitva",
+    "status_closed_many": "{} jegyzet bezárva",
+    "status_color_changed_many": "{} jegyzet színe módosítva",
+    "status_archived_many": "{} jegyzet archiválva",
+    "status_unarchived_many": "{} jegyzet visszaállítva az archívumból",
+    "msg_select_note_to_close": "Válasszon ki egy bezárandó jegyzetet.",
+    "msg_select_note_to_archive": "Válasszon ki egy archiválandó jegyzetet.",
+    "automation_api": "Automatizálási API",
+    "enable_automation_api": "Helyi automatizálási API engedélyezése (127.0.0.1:{})",
+    "status_rpc_started": "Automatizálási API elindítva (127.0.0.1:{})",
+    "status_rpc_stopped": "Automatizálási API leállítva",
+    "status_rpc_failed": "Az automatizálási API nem indítható (a(z) {} port foglalt)",
+    "status_external_changes": "Betöltve egy másik program módosításai {} jegyzetben",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
@@ -0,0 +1,107 @@
+"""翻訳データ: Italiano (it)"""
+
+TRANSLATIONS = {
+    "language_name": "Italiano",
+    "app_title": "Gestore Note Adesive",
+    "all_notes": "Tutte le Note",
+    "settings": "Impostazioni",
+    "language": "Lingua",
+    "search": "Cerca:",
+    "new_note": "Nuova Nota",
+    "open": "Apri",
+    "delete": "Elimina",
+    "color_change": "Cambia Colore",
+    "refresh": "Aggiorna",
+    "preview": "Anteprima:",
+    "id": "ID",
+    "date": "Data",
+    "content": "Contenuto",
+    "status": "Stato",
+    "status_open": "Aperto",
+    "status_closed": "Chiuso",
+    "status_ready": "Pronto",
+    "status_created": "Nota creata (ID: {})",
+    "status_editing": "Modifica nota (ID: {})",
+    "status_deleted": "Nota eliminata (ID: {})",
+    "status_color_changed": "Colore nota cambiato (ID: {})",
+    "status_loaded": "Caricate {} note",
+    "status_saved": "Salvate {} note",
+    "status_load_failed": "Caricamento note fallito",
+    "status_save_failed": "Salvataggio note fallito",
+    "status_new_file": "Creazione nuovo file dati",
+    "msg_select_note_to_open": "Seleziona una nota da aprire.",
+    "msg_select_note_to_delete": "Seleziona una nota da eliminare.",
+    "msg_select_note_for_color": "Seleziona una nota per cambiare colore.",
+    "msg_confirm_delete": "Sei sicuro di voler eliminare la nota selezionata?\nQuesta azione non può essere annullata.",
+    "msg_error_note_data": "Errore nel recupero dati nota.",
+    "msg_empty_content": "(nessun contenuto)",
+    "confirm": "Conferma",
+    "info": "Informazione",
+    "error": "Errore",
+    "close": "Chiudi",
+    "settings_menu": "Menu",
+    "change_color": "Cambia Colore",
+    "show_all": "Mostra tutto ({} caratteri)",
+    "arrange_all": "Disponi",
+    "status_arranged": "{} note disposte",
+    "status_loading": "Caricamento note...",
+    "status_created_many": "{} note create",
+    "status_updated_many": "{} note aggiornate",
+    "status_deleted_many": "{} note eliminate",
+    "msg_confirm_delete_many": "Eliminare le {} note selezionate?\nQuesta azione non può essere annullata.",
+    "archive": "Archivia",
+    "unarchive": "Ripristina dall'archivio",
+    "show_archived": "Mostra archiviate",
+    "status_archived": "Archiviata",
+    "status_opened_many": "{} note aperte",
+    "status_closed_many": "{} note chiuse",
+    "status_color_changed_many": "Colore cambiato per {} note",
+    "status_archived_many": "{} note archiviate",
+    "status_unarchived_many": "{} note ripristinate dall'archivio",
+    "msg_select_note_to_close": "Seleziona una nota da chiudere.",
+    "msg_select_note_to_archive": "Seleziona una nota da archiviare.",
+    "automation_api": "API di automazione",
+    "enable_automation_api": "Abilita l'API di automazione locale (127.0.0.1:{})",
+    "status_rpc_started": "API di automazione avviata (127.0.0.1:{})",
+    "status_rpc_stopped": "API di automazione arrestata",
+    "status_rpc_failed": "Impossibile avviare l'API di automazione (porta {} in uso)",
+    "status_external_changes": "Caricate le modifiche di un altro programma a {} note",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
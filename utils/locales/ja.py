@@ -0,0 +1,107 @@
+"""翻訳データ: 日本語 (ja)"""
+
+TRANSLATIONS = {
+    "language_name": "日本語",
+    "app_title": "付箋管理アプリ",
+    "all_notes": "すべての付箋",
+    "settings": "設定",
+    "language": "言語",
+    "search": "検索:",
+    "new_note": "新規作成",
+    "open": "開く",
+    "delete": "削除",
+    "color_change": "色変更",
+    "refresh": "更新",
+    "preview": "プレビュー:",
+    "id": "ID",
+    "date": "日時",
+    "content": "内容",
+    "status": "状態",
+    "status_open": "開いている",
+    "status_closed": "閉じている",
+    "status_ready": "準備完了",
+    "status_created": "付箋を作成しました（ID: {}）",
+    "status_editing": "付箋を編集中（ID: {}）",
+    "status_deleted": "付箋を削除しました（ID: {}）",
+    "status_color_changed": "付箋の色を変更しました（ID: {}）",
+    "status_loaded": "{}個の付箋データを読み込みました",
+    "status_saved": "{}個の付箋を保存しました",
+    "status_load_failed": "ノートの読み込みに失敗しました",
+    "status_save_failed": "ノートの保存に失敗しました",
+    "status_new_file": "新規データファイルを作成します",
+    "msg_select_note_to_open": "開く付箋を選択してください。",
+    "msg_select_note_to_delete": "削除する付箋を選択してください。",
+    "msg_select_note_for_color": "色を変更する付箋を選択してください。",
+    "msg_confirm_delete": "選択した付箋を完全に削除しますか？\nこの操作は元に戻せません。",
+    "msg_error_note_data": "付箋データの取得に失敗しました。",
+    "msg_empty_content": "(内容なし)",
+    "confirm": "確認",
+    "info": "情報",
+    "error": "エラー",
+    "close": "閉じる",
+    "settings_menu": "操作",
+    "change_color": "色の変更",
+    "show_all": "すべて表示（{}文字）",
+    "arrange_all": "整列",
+    "status_arranged": "{}個の付箋を整列しました",
+    "status_loading": "付箋を読み込み中...",
+    "status_created_many": "{}個の付箋を作成しました",
+    "status_updated_many": "{}個の付箋を更新しました",
+    "status_deleted_many": "{}個の付箋を削除しました",
+    "msg_confirm_delete_many": "選択した{}個の付箋を完全に削除しますか？\nこの操作は元に戻せません。",
+    "archive": "アーカイブ",
+    "unarchive": "アーカイブから戻す",
+    "show_archived": "アーカイブを表示",
+    "status_archived": "アーカイブ済み",
+    "status_opened_many": "{}個の付箋を開きました",
+    "status_closed_many": "{}個の付箋を閉じました",
+    "status_color_changed_many": "{}個の付箋の色を変更しました",
+    "status_archived_many": "{}個の付箋をアーカイブしました",
+    "status_unarchived_many": "{}個の付箋をアーカイブから戻しました",
+    "msg_select_note_to_close": "閉じる付箋を選択してください。",
+    "msg_select_note_to_archive": "アーカイブする付箋を選択してください。",
+    "automation_api": "自動化API",
+    "enable_automation_api": "ローカルの自動化APIを有効にする（127.0.0.1:{}）",
+    "status_rpc_started": "自動化APIを開始しました（127.0.0.1:{}）",
+    "status_rpc_stopped": "自動化APIを停止しました",
+    "status_rpc_failed": "自動化APIを開始できませんでした（ポート {} は使用中です）",
+    "status_external_changes": "他のプログラムによる{}個の付箋の変更を読み込みました",
+    "sync_conflict_prefix": "【同期の競合】",
+    "history": "履歴",
+    "characters": "文字数",
+    "restore": "この版に戻す",
+    "msg_no_history": "この付箋の履歴はまだありません。",
+    "status_history_restored": "付箋を過去の版に戻しました（ID: {}）",
+    "edit": "編集",
+    "status_undone": "元に戻しました（{}）",
+    "status_redone": "やり直しました（{}）",
+    "status_nothing_to_undo": "元に戻す操作はありません",
+    "status_nothing_to_redo": "やり直す操作はありません",
+    "trash": "ごみ箱",
+    "deleted_at": "削除日時",
+    "restore_from_trash": "元に戻す",
+    "delete_permanently": "完全に削除",
+    "empty_trash": "ごみ箱を空にする",
+    "status_trashed": "付箋をごみ箱に移動しました（ID: {}）",
+    "status_trashed_many": "{}個の付箋をごみ箱に移動しました",
+    "status_restored_many": "{}個の付箋をごみ箱から元に戻しました",
+    "status_purged_many": "{}個の付箋を完全に削除しました",
+    "include_cold_archive": "保管庫も検索",
+    "status_cold_archived": "保管庫",
+    "status_cold_archived_many": "{}個の古い付箋を保管庫に移しました",
+    "quick_open": "付箋を開く",
+    "quick_open_matches": "{} 件が一致",
+    "diagnostics": "診断",
+    "diagnostics_enabled": "処理時間を計測する",
+    "diagnostics_export": "JSONに書き出し",
+    "diagnostics_reset": "リセット",
+    "diagnostics_name": "処理",
+    "diagnostics_count": "回数",
+    "diagnostics_mean": "平均 ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "最大 ms",
+    "diagnostics_updated": "{} に更新",
+    "msg_diagnostics_exported": "計測結果を書き出しました: {}",
+    "msg_diagnostics_export_failed": "計測結果の書き出しに失敗しました: {}"
+}
@@ -0,0 +1,107 @@
+"""翻訳データ: 한국어 (ko)"""
+
+TRANSLATIONS = {
+    "language_name": "한국어",
+    "app_title": "스티커 노트 관리자",
+    "all_notes": "모든 노트",
+    "settings": "설정",
+    "language": "언어",
+    "search": "검색:",
+    "new_note": "새 노트",
+    "open": "열기",
+    "delete": "삭제",
+    "color_change": "색상 변경",
+    "refresh": "새로고침",
+    "preview": "미리보기:",
+    "id": "ID",
+    "date": "날짜",
+    "content": "내용",
+    "status": "상태",
+    "status_open": "열림",
+    "status_closed": "닫힘",
+    "status_ready": "준비됨",
+    "status_created": "노트가 생성되었습니다 (ID: {})",
+    "status_editing": "노트 편집 중 (ID: {})",
+    "status_deleted": "노트가 삭제되었습니다 (ID: {})",
+    "status_color_changed": "노트 색상이 변경되었습니다 (ID: {})",
+    "status_loaded": "{}개 노트를 불러왔습니다",
+    "status_saved": "{}개 노트를 저장했습니다",
+    "status_load_failed": "노트 불러오기 실패",
+    "status_save_failed": "노트 저장 실패",
+    "status_new_file": "새 데이터 파일을 생성합니다",
+    "msg_select_note_to_open": "열 노트를 선택하세요.",
+    "msg_select_note_to_delete": "삭제할 노트를 선택하세요.",
+    "msg_select_note_for_color": "색상을 변경할 노트를 선택하세요.",
+    "msg_confirm_delete": "선택한 노트를 삭제하시겠습니까?\n이 작업은 되돌릴 수 없습니다.",
+    "msg_error_note_data": "노트 데이터 가져오기 실패.",
+    "msg_empty_content": "(내용 없음)",
+    "confirm": "확인",
+    "info": "정보",
+    "error": "오류",
+    "close": "닫기",
+    "settings_menu": "메뉴",
+    "change_color": "색상 변경",
+    "show_all": "전체 보기 ({}자)",
+    "arrange_all": "정렬",
+    "status_arranged": "메모 {}개를 정렬했습니다",
+    "status_loading": "메모를 불러오는 중...",
+    "status_created_many": "메모 {}개를 만들었습니다",
+    "status_updated_many": "메모 {}개를 업데이트했습니다",
+    "status_deleted_many": "메모 {}개를 삭제했습니다",
+    "msg_confirm_delete_many": "선택한 메모 {}개를 삭제하시겠습니까?\n이 작업은 되돌릴 수 없습니다.",
+    "archive": "보관",
+    "unarchive": "보관 해제",
+    "show_archived": "보관된 메모 표시",
+    "status_archived": "보관됨",
+    "status_opened_many": "메모 {}개를 열었습니다",
+    "status_closed_many": "메모 {}개를 닫았습니다",
+    "status_color_changed_many": "메모 {}개의 색상을 변경했습니다",
+    "status_archived_many": "메모 {}개를 보관했습니다",
+    "status_unarchived_many": "메모 {}개의 보관을 해제했습니다",
+    "msg_select_note_to_close": "닫을 메모를 선택하세요.",
+    "msg_select_note_to_archive": "보관할 메모를 선택하세요.",
+    "automation_api": "자동화 API",
+    "enable_automation_api": "로컬 자동화 API 사용 (127.0.0.1:{})",
+    "status_rpc_started": "자동화 API를 시작했습니다 (127.0.0.1:{})",
+    "status_rpc_stopped": "자동화 API를 중지했습니다",
+    "status_rpc_failed": "자동화 API를 시작할 수 없습니다 (포트 {} 사용 중)",
+    "status_external_changes": "다른 프로그램이 변경한 메모 {}개를 불러왔습니다",
+    "sync_conflict_prefix": "[동기화 충돌] ",
+    "history": "기록",
+    "characters": "글자 수",
+    "restore": "이 버전으로 복원",
+    "msg_no_history": "이 메모의 기록이 아직 없습니다.",
+    "status_history_restored": "메모를 이전 버전으로 복원했습니다 (ID: {})",
+    "edit": "편집",
+    "status_undone": "실행 취소: {}",
+    "status_redone": "다시 실행: {}",
+    "status_nothing_to_undo": "실행 취소할 작업이 없습니다",
+    "status_nothing_to_redo": "다시 실행할 작업이 없습니다",
+    "trash": "휴지통",
+    "deleted_at": "삭제 일시",
+    "restore_from_trash": "복원",
+    "delete_permanently": "영구 삭제",
+    "empty_trash": "휴지통 비우기",
+    "status_trashed": "메모를 휴지통으로 이동했습니다 (ID: {})",
+    "status_trashed_many": "메모 {}개를 휴지통으로 이동했습니다",
+    "status_restored_many": "휴지통에서 메모 {}개를 복원했습니다",
+    "status_purged_many": "메모 {}개를 영구 삭제했습니다",
+    "include_cold_archive": "보관함 포함",
+    "status_cold_archived": "보관함",
+    "status_cold_archived_many": "오래된 메모 {}개를 보관함으로 옮겼습니다",
+    "quick_open": "빠른 열기",
+    "quick_open_matches": "{}개 일치",
+    "diagnostics": "진단",
+    "diagnostics_enabled": "처리 시간 기록",
+    "diagnostics_export": "JSON 내보내기",
+    "diagnostics_reset": "초기화",
+    "diagnostics_name": "작업",
+    "diagnostics_count": "횟수",
+    "diagnostics_mean": "평균 ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "최대 ms",
+    "diagnostics_updated": "{}에 업데이트됨",
+    "msg_diagnostics_exported": "진단 정보를 내보냈습니다: {}",
+    "msg_diagnostics_export_failed": "진단 정보 내보내기 실패: {}"
+}
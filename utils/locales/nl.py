@@ -0,0 +1,107 @@
+"""翻訳データ: Nederlands (nl)"""
+
+TRANSLATIONS = {
+    "language_name": "Nederlands",
+    "app_title": "Plaknotitie Beheerder",
+    "all_notes": "Alle Notities",
+    "settings": "Instellingen",
+    "language": "Taal",
+    "search": "Zoeken:",
+    "new_note": "Nieuwe Notitie",
+    "open": "Openen",
+    "delete": "Verwijderen",
+    "color_change": "Kleur Wijzigen",
+    "refresh": "Vernieuwen",
+    "preview": "Voorbeeld:",
+    "id": "ID",
+    "date": "Datum",
+    "content": "Inhoud",
+    "status": "Status",
+    "status_open": "Open",
+    "status_closed": "Gesloten",
+    "status_ready": "Klaar",
+    "status_created": "Notitie aangemaakt (ID: {})",
+    "status_editing": "Notitie bewerken (ID: {})",
+    "status_deleted": "Notitie verwijderd (ID: {})",
+    "status_color_changed": "Notitie kleur gewijzigd (ID: {})",
+    "status_loaded": "{} notities geladen",
+    "status_saved": "{} notities opgeslagen",
+    "status_load_failed": "Laden van notities mislukt",
+    "status_save_failed": "Opslaan van notities mislukt",
+    "status_new_file": "Nieuw gegevensbestand maken",
+    "msg_select_note_to_open": "Selecteer een notitie om te openen.",
+    "msg_select_note_to_delete": "Selecteer een notitie om te verwijderen.",
+    "msg_select_note_for_color": "Selecteer een notitie om de kleur te wijzigen.",
+    "msg_confirm_delete": "Weet je zeker dat je de geselecteerde notitie wilt verwijderen?\nDeze actie kan niet ongedaan worden gemaakt.",
+    "msg_error_note_data": "Fout bij ophalen notitie gegevens.",
+    "msg_empty_content": "(geen inhoud)",
+    "confirm": "Bevestigen",
+    "info": "Informatie",
+    "error": "Fout",
+    "close": "Sluiten",
+    "settings_menu": "Menu",
+    "change_color": "Kleur Wijzigen",
+    "show_all": "Alles tonen ({} tekens)",
+    "arrange_all": "Schikken",
+    "status_arranged": "{} notities geschikt",
+    "status_loading": "Notities laden...",
+    "status_created_many": "{} notities aangemaakt",
+    "status_updated_many": "{} notities bijgewerkt",
+    "status_deleted_many": "{} notities verwijderd",
+    "msg_confirm_delete_many": "Weet u zeker dat u de {} geselecteerde notities wilt verwijderen?\nDeze actie kan niet ongedaan worden gemaakt.",
+    "archive": "Archiveren",
+    "unarchive": "Dearchiveren",
+    "show_archived": "Gearchiveerde tonen",
+    "status_archived": "Gearchiveerd",
+    "status_opened_many": "{} notities geopend",
+    "status_closed_many": "{} notities gesloten",
+    "status_color_changed_many": "Kleur van {} notities gewijzigd",
+    "status_archived_many": "{} notities gearchiveerd",
+    "status_unarchived_many": "{} notities gedearchiveerd",
+    "msg_select_note_to_close": "Selecteer een notitie om te sluiten.",
+    "msg_select_note_to_archive": "Selecteer een notitie om te archiveren.",
+    "automation_api": "Automatiserings-API",
+    "enable_automation_api": "Lokale automatiserings-API inschakelen (127.0.0.1:{})",
+    "status_rpc_started": "Automatiserings-API gestart (127.0.0.1:{})",
+    "status_rpc_stopped": "Automatiserings-API gestopt",
+    "status_rpc_failed": "Kan automatiserings-API niet starten (poort {} in gebruik)",
+    "status_external_changes": "Wijzigingen van een ander programma in {} notities geladen",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
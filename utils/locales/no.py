@@ -0,0 +1,107 @@
+"""翻訳データ: Norsk (no)"""
+
+TRANSLATIONS = {
+    "language_name": "Norsk",
+    "app_title": "Klistrelapp Administrator",
+    "all_notes": "Alle Notater",
+    "settings": "Innstillinger",
+    "language": "Språk",
+    "search": "Søk:",
+    "new_note": "Nytt Notat",
+    "open": "Åpne",
+    "delete": "Slett",
+    "color_change": "Endre Farge",
+    "refresh": "Oppdater",
+    "preview": "Forhåndsvisning:",
+    "id": "ID",
+    "date": "Dato",
+    "content": "Innhold",
+    "status": "Status",
+    "status_open": "Åpen",
+    "status_closed": "Lukket",
+    "status_ready": "Klar",
+    "status_created": "Notat opprettet (ID: {})",
+    "status_editing": "Redigerer notat (ID: {})",
+    "status_deleted": "Notat slettet (ID: {})",
+    "status_color_changed": "Notat farge endret (ID: {})",
+    "status_loaded": "Lastet inn {} notater",
+    "status_saved": "Lagret {} notater",
+    "status_load_failed": "Kunne ikke laste inn notater",
+    "status_save_failed": "Kunne ikke lagre notater",
+    "status_new_file": "Oppretter ny datafil",
+    "msg_select_note_to_open": "Velg et notat å åpne.",
+    "msg_select_note_to_delete": "Velg et notat å slette.",
+    "msg_select_note_for_color": "Velg et notat for å endre farge.",
+    "msg_confirm_delete": "Er du sikker på at du vil slette det valgte notatet?\nDenne handlingen kan ikke angres.",
+    "msg_error_note_data": "Kunne ikke hente notat data.",
+    "msg_empty_content": "(intet innhold)",
+    "confirm": "Bekreft",
+    "info": "Informasjon",
+    "error": "Feil",
+    "close": "Lukk",
+    "settings_menu": "Meny",
+    "change_color": "Endre Farge",
+    "show_all": "Vis alt ({} tegn)",
+    "arrange_all": "Ordne",
+    "status_arranged": "{} notater ordnet",
+    "status_loading": "Laster inn notater...",
+    "status_created_many": "{} notater opprettet",
+    "status_updated_many": "{} notater oppdatert",
+    "status_deleted_many": "{} notater slettet",
+    "msg_confirm_delete_many": "Er du sikker på at du vil slette de {} valgte notatene?\nDenne handlingen kan ikke angres.",
+    "archive": "Arkiver",
+    "unarchive": "Gjenopprett fra arkiv",
+    "show_archived": "Vis arkiverte",
+    "status_archived": "Arkivert",
+    "status_opened_many": "{} notater åpnet",
+    "status_closed_many": "{} notater lukket",
+    "status_color_changed_many": "Farge endret for {} notater",
+    "status_archived_many": "{} notater arkivert",
+    "status_unarchived_many": "{} notater gjenopprettet fra arkivet",
+    "msg_select_note_to_close": "Velg et notat som skal lukkes.",
+    "msg_select_note_to_archive": "Velg et notat som skal arkiveres.",
+    "automation_api": "Automatiserings-API",
+    "enable_automation_api": "Aktiver lokalt automatiserings-API (127.0.0.1:{})",
+    "status_rpc_started": "Automatiserings-API startet (127.0.0.1:{})",
+    "status_rpc_stopped": "Automatiserings-API stoppet",
+    "status_rpc_failed": "Kunne ikke starte automatiserings-API (port {} er i bruk)",
+    "status_external_changes": "Lastet inn endringer i {} notater fra et annet program",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
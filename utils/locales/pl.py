@@ -0,0 +1,107 @@
+"""翻訳データ: Polski (pl)"""
+
+TRANSLATIONS = {
+    "language_name": "Polski",
+    "app_title": "Menedżer Karteczek",
+    "all_notes": "Wszystkie Notatki",
+    "settings": "Ustawienia",
+    "language": "Język",
+    "search": "Szukaj:",
+    "new_note": "Nowa Notatka",
+    "open": "Otwórz",
+    "delete": "Usuń",
+    "color_change": "Zmień Kolor",
+    "refresh": "Odśwież",
+    "preview": "Podgląd:",
+    "id": "ID",
+    "date": "Data",
+    "content": "Zawartość",
+    "status": "Status",
+    "status_open": "Otwarta",
+    "status_closed": "Zamknięta",
+    "status_ready": "Gotowy",
+    "status_created": "Notatka utworzona (ID: {})",
+    "status_editing": "Edytowanie notatki (ID: {})",
+    "status_deleted": "Notatka usunięta (ID: {})",
+    "status_color_changed": "Kolor notatki zmieniony (ID: {})",
+    "status_loaded": "Załadowano {} notatek",
+    "status_saved": "Zapisano {} notatek",
+    "status_load_failed": "Nie udało się załadować notatek",
+    "status_save_failed": "Nie udało się zapisać notatek",
+    "status_new_file": "Tworzenie nowego pliku danych",
+    "msg_select_note_to_open": "Wybierz notatkę do otwarcia.",
+    "msg_select_note_to_delete": "Wybierz notatkę do usunięcia.",
+    "msg_select_note_for_color": "Wybierz notatkę do zmiany koloru.",
+    "msg_confirm_delete": "Czy na pewno chcesz usunąć wybraną notatkę?\nTej czynności nie można cofnąć.",
+    "msg_error_note_data": "Nie udało się pobrać danych notatki.",
+    "msg_empty_content": "(brak zawartości)",
+    "confirm": "Potwierdź",
+    "info": "Informacja",
+    "error": "Błąd",
+    "close": "Zamknij",
+    "settings_menu": "Menu",
+    "change_color": "Zmień Kolor",
+    "show_all": "Pokaż wszystko ({} znaków)",
+    "arrange_all": "Rozmieść",
+    "status_arranged": "Rozmieszczono notatki: {}",
+    "status_loading": "Wczytywanie notatek...",
+    "status_created_many": "Utworzono notatki: {}",
+    "status_updated_many": "Zaktualizowano notatki: {}",
+    "status_deleted_many": "Usunięto notatki: {}",
+    "msg_confirm_delete_many": "Czy na pewno usunąć zaznaczone notatki ({})?\nTej operacji nie można cofnąć.",
+    "archive": "Archiwizuj",
+    "unarchive": "Przywróć z archiwum",
+    "show_archived": "Pokaż zarchiwizowane",
+    "status_archived": "Zarchiwizowana",
+    "status_opened_many": "Otwarto notatki: {}",
+    "status_closed_many": "Zamknięto notatki: {}",
+    "status_color_changed_many": "Zmieniono kolor notatek: {}",
+    "status_archived_many": "Zarchiwizowano notatki: {}",
+    "status_unarchived_many": "Przywrócono z archiwum notatki: {}",
+    "msg_select_note_to_close": "Wybierz notatkę do zamknięcia.",
+    "msg_select_note_to_archive": "Wybierz notatkę do archiwizacji.",
+    "automation_api": "API automatyzacji",
+    "enable_automation_api": "Włącz lokalne API automatyzacji (127.0.0.1:{})",
+    "status_rpc_started": "Uruchomiono API automatyzacji (127.0.0.1:{})",
+    "status_rpc_stopped": "Zatrzymano API automatyzacji",
+    "status_rpc_failed": "Nie można uruchomić API automatyzacji (port {} jest zajęty)",
+    "status_external_changes": "Wczytano zmiany innego programu w notatkach: {}",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
@@ -0,0 +1,107 @@
+"""翻訳データ: Português (pt)"""
+
+TRANSLATIONS = {
+    "language_name": "Português",
+    "app_title": "Gerenciador de Notas Adesivas",
+    "all_notes": "Todas as Notas",
+    "settings": "Configurações",
+    "language": "Idioma",
+    "search": "Pesquisar:",
+    "new_note": "Nova Nota",
+    "open": "Abrir",
+    "delete": "Excluir",
+    "color_change": "Mudar Cor",
+    "refresh": "Atualizar",
+    "preview": "Visualização:",
+    "id": "ID",
+    "date": "Data",
+    "content": "Conteúdo",
+    "status": "Status",
+    "status_open": "Aberto",
+    "status_closed": "Fechado",
+    "status_ready": "Pronto",
+    "status_created": "Nota criada (ID: {})",
+    "status_editing": "Editando nota (ID: {})",
+    "status_deleted": "Nota excluída (ID: {})",
+    "status_color_changed": "Cor da nota alterada (ID: {})",
+    "status_loaded": "Carregadas {} notas",
+    "status_saved": "Salvas {} notas",
+    "status_load_failed": "Falha ao carregar notas",
+    "status_save_failed": "Falha ao salvar notas",
+    "status_new_file": "Criando novo arquivo de dados",
+    "msg_select_note_to_open": "Selecione uma nota para abrir.",
+    "msg_select_note_to_delete": "Selecione uma nota para excluir.",
+    "msg_select_note_for_color": "Selecione uma nota para mudar cor.",
+    "msg_confirm_delete": "Tem certeza de que deseja excluir a nota selecionada?\nEsta ação não pode ser desfeita.",
+    "msg_error_note_data": "Falha ao obter dados da nota.",
+    "msg_empty_content": "(sem conteúdo)",
+    "confirm": "Confirmar",
+    "info": "Informação",
+    "error": "Erro",
+    "close": "Fechar",
+    "settings_menu": "Menu",
+    "change_color": "Mudar Cor",
+    "show_all": "Mostrar tudo ({} caracteres)",
+    "arrange_all": "Organizar",
+    "status_arranged": "{} notas organizadas",
+    "status_loading": "Carregando notas...",
+    "status_created_many": "{} notas criadas",
+    "status_updated_many": "{} notas atualizadas",
+    "status_deleted_many": "{} notas excluídas",
+    "msg_confirm_delete_many": "Tem certeza de que deseja excluir as {} notas selecionadas?\nEsta ação não pode ser desfeita.",
+    "archive": "Arquivar",
+    "unarchive": "Desarquivar",
+    "show_archived": "Mostrar arquivadas",
+    "status_archived": "Arquivada",
+    "status_opened_many": "{} notas abertas",
+    "status_closed_many": "{} notas fechadas",
+    "status_color_changed_many": "Cor alterada em {} notas",
+    "status_archived_many": "{} notas arquivadas",
+    "status_unarchived_many": "{} notas desarquivadas",
+    "msg_select_note_to_close": "Selecione uma nota para fechar.",
+    "msg_select_note_to_archive": "Selecione uma nota para arquivar.",
+    "automation_api": "API de automação",
+    "enable_automation_api": "Ativar a API de automação local (127.0.0.1:{})",
+    "status_rpc_started": "API de automação iniciada (127.0.0.1:{})",
+    "status_rpc_stopped": "API de automação parada",
+    "status_rpc_failed": "Não foi possível iniciar a API de automação (porta {} em uso)",
+    "status_external_changes": "Carregadas alterações de outro programa em {} notas",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
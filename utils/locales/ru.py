@@ -0,0 +1,107 @@
+"""翻訳データ: Русский (ru)"""
+
+TRANSLATIONS = {
+    "language_name": "Русский",
+    "app_title": "Менеджер Заметок",
+    "all_notes": "Все Заметки",
+    "settings": "Настройки",
+    "language": "Язык",
+    "search": "Поиск:",
+    "new_note": "Новая Заметка",
+    "open": "Открыть",
+    "delete": "Удалить",
+    "color_change": "Изменить Цвет",
+    "refresh": "Обновить",
+    "preview": "Предпросмотр:",
+    "id": "ID",
+    "date": "Дата",
+    "content": "Содержание",
+    "status": "Статус",
+    "status_open": "Открыт",
+    "status_closed": "Закрыт",
+    "status_ready": "Готов",
+    "status_created": "Заметка создана (ID: {})",
+    "status_editing": "Редактирование заметки (ID: {})",
+    "status_deleted": "Заметка удалена (ID: {})",
+    "status_color_changed": "Цвет заметки изменен (ID: {})",
+    "status_loaded": "Загружено {} заметок",
+    "status_saved": "Сохранено {} заметок",
+    "status_load_failed": "Не удалось загрузить заметки",
+    "status_save_failed": "Не удалось сохранить заметки",
+    "status_new_file": "Создание нового файла данных",
+    "msg_select_note_to_open": "Выберите заметку для открытия.",
+    "msg_select_note_to_delete": "Выберите заметку для удаления.",
+    "msg_select_note_for_color": "Выберите заметку для изменения цвета.",
+    "msg_confirm_delete": "Вы уверены, что хотите удалить выбранную заметку?\nЭто действие нельзя отменить.",
+    "msg_error_note_data": "Ошибка получения данных заметки.",
+    "msg_empty_content": "(нет содержания)",
+    "confirm": "Подтвердить",
+    "info": "Информация",
+    "error": "Ошибка",
+    "close": "Закрыть",
+    "settings_menu": "Меню",
+    "change_color": "Изменить Цвет",
+    "show_all": "Показать всё ({} симв.)",
+    "arrange_all": "Упорядочить",
+    "status_arranged": "Упорядочено заметок: {}",
+    "status_loading": "Загрузка заметок...",
+    "status_created_many": "Создано заметок: {}",
+    "status_updated_many": "Обновлено заметок: {}",
+    "status_deleted_many": "Удалено заметок: {}",
+    "msg_confirm_delete_many": "Удалить выбранные заметки ({})?\nЭто действие нельзя отменить.",
+    "archive": "В архив",
+    "unarchive": "Вернуть из архива",
+    "show_archived": "Показать архив",
+    "status_archived": "В архиве",
+    "status_opened_many": "Открыто заметок: {}",
+    "status_closed_many": "Закрыто заметок: {}",
+    "status_color_changed_many": "Цвет изменён у заметок: {}",
+    "status_archived_many": "В архив перемещено заметок: {}",
+    "status_unarchived_many": "Возвращено из архива заметок: {}",
+    "msg_select_note_to_close": "Выберите заметку для закрытия.",
+    "msg_select_note_to_archive": "Выберите заметку для архивации.",
+    "automation_api": "API автоматизации",
+    "enable_automation_api": "Включить локальный API автоматизации (127.0.0.1:{})",
+    "status_rpc_started": "API автоматизации запущен (127.0.0.1:{})",
+    "status_rpc_stopped": "API автоматизации остановлен",
+    "status_rpc_failed": "Не удалось запустить API автоматизации (порт {} занят)",
+    "status_external_changes": "Загружены изменения других программ в заметках: {}",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
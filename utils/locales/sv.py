@@ -0,0 +1,107 @@
+"""翻訳データ: Svenska (sv)"""
+
+TRANSLATIONS = {
+    "language_name": "Svenska",
+    "app_title": "Klisterlapp Hanterare",
+    "all_notes": "Alla Anteckningar",
+    "settings": "Inställningar",
+    "language": "Språk",
+    "search": "Sök:",
+    "new_note": "Ny Anteckning",
+    "open": "Öppna",
+    "delete": "Ta bort",
+    "color_change": "Ändra Färg",
+    "refresh": "Uppdatera",
+    "preview": "Förhandsvisning:",
+    "id": "ID",
+    "date": "Datum",
+    "content": "Innehåll",
+    "status": "Status",
+    "status_open": "Öppen",
+    "status_closed": "Stängd",
+    "status_ready": "Redo",
+    "status_created": "Anteckning skapad (ID: {})",
+    "status_editing": "Redigerar anteckning (ID: {})",
+    "status_deleted": "Anteckning borttagen (ID: {})",
+    "status_color_changed": "Anteckningsfärg ändrad (ID: {})",
+    "status_loaded": "Laddade {} anteckningar",
+    "status_saved": "Sparade {} anteckningar",
+    "status_load_failed": "Misslyckades att ladda anteckningar",
+    "status_save_failed": "Misslyckades att spara anteckningar",
+    "status_new_file": "Skapar ny datafil",
+    "msg_select_note_to_open": "Välj en anteckning att öppna.",
+    "msg_select_note_to_delete": "Välj en anteckning att ta bort.",
+    "msg_select_note_for_color": "Välj en anteckning för att ändra färg.",
+    "msg_confirm_delete": "Är du säker på att du vill ta bort den valda anteckningen?\nDenna åtgärd kan inte ångras.",
+    "msg_error_note_data": "Misslyckades att hämta anteckningsdata.",
+    "msg_empty_content": "(inget innehåll)",
+    "confirm": "Bekräfta",
+    "info": "Information",
+    "error": "Fel",
+    "close": "Stäng",
+    "settings_menu": "Meny",
+    "change_color": "Ändra Färg",
+    "show_all": "Visa allt ({} tecken)",
+    "arrange_all": "Ordna",
+    "status_arranged": "{} anteckningar ordnade",
+    "status_loading": "Läser in anteckningar...",
+    "status_created_many": "{} anteckningar skapade",
+    "status_updated_many": "{} anteckningar uppdaterade",
+    "status_deleted_many": "{} anteckningar borttagna",
+    "msg_confirm_delete_many": "Vill du ta bort de {} markerade anteckningarna?\nDetta kan inte ångras.",
+    "archive": "Arkivera",
+    "unarchive": "Återställ från arkiv",
+    "show_archived": "Visa arkiverade",
+    "status_archived": "Arkiverad",
+    "status_opened_many": "{} anteckningar öppnade",
+    "status_closed_many": "{} anteckningar stängda",
+    "status_color_changed_many": "Färg ändrad för {} anteckningar",
+    "status_archived_many": "{} anteckningar arkiverade",
+    "status_unarchived_many": "{} anteckningar återställda från arkivet",
+    "msg_select_note_to_close": "Välj en anteckning att stänga.",
+    "msg_select_note_to_archive": "Välj en anteckning att arkivera.",
+    "automation_api": "Automatiserings-API",
+    "enable_automation_api": "Aktivera lokalt automatiserings-API (127.0.0.1:{})",
+    "status_rpc_started": "Automatiserings-API startat (127.0.0.1:{})",
+    "status_rpc_stopped": "Automatiserings-API stoppat",
+    "status_rpc_failed": "Kunde inte starta automatiserings-API (port {} används)",
+    "status_external_changes": "Läste in ändringar i {} anteckningar från ett annat program",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
@@ -0,0 +1,107 @@
+"""翻訳データ: ไทย (th)"""
+
+TRANSLATIONS = {
+    "language_name": "ไทย",
+    "app_title": "ตัวจัดการโน้ตติดบอร์ด",
+    "all_notes": "โน้ตทั้งหมด",
+    "settings": "การตั้งค่า",
+    "language": "ภาษา",
+    "search": "ค้นหา:",
+    "new_note": "โน้ตใหม่",
+    "open": "เปิด",
+    "delete": "ลบ",
+    "color_change": "เปลี่ยนสี",
+    "refresh": "รีเฟรช",
+    "preview": "แสดงตัวอย่าง:",
+    "id": "ID",
+    "date": "วันที่",
+    "content": "เนื้อหา",
+    "status": "สถานะ",
+    "status_open": "เปิดอยู่",
+    "status_closed": "ปิดแล้ว",
+    "status_ready": "พร้อม",
+    "status_created": "สร้างโน้ตแล้ว (ID: {})",
+    "status_editing": "กำลังแก้ไขโน้ต (ID: {})",
+    "status_deleted": "ลบโน้ตแล้ว (ID: {})",
+    "status_color_changed": "เปลี่ยนสีโน้ตแล้ว (ID: {})",
+    "status_loaded": "โหลดโน้ต {} รายการแล้ว",
+    "status_saved": "บันทึกโน้ต {} รายการแล้ว",
+    "status_load_failed": "โหลดโน้ตไม่สำเร็จ",
+    "status_save_failed": "บันทึกโน้ตไม่สำเร็จ",
+    "status_new_file": "กำลังสร้างไฟล์ข้อมูลใหม่",
+    "msg_select_note_to_open": "กรุณาเลือกโน้ตที่จะเปิด",
+    "msg_select_note_to_delete": "กรุณาเลือกโน้ตที่จะลบ",
+    "msg_select_note_for_color": "กรุณาเลือกโน้ตเพื่อเปลี่ยนสี",
+    "msg_confirm_delete": "คุณแน่ใจหรือไม่ว่าต้องการลบโน้ตที่เลือก?\nการกระทำนี้ไม่สามารถยกเลิกได้",
+    "msg_error_note_data": "ไม่สามารถดึงข้อมูลโน้ตได้",
+    "msg_empty_content": "(ไม่มีเนื้อหา)",
+    "confirm": "ยืนยัน",
+    "info": "ข้อมูล",
+    "error": "ข้อผิดพลาด",
+    "close": "ปิด",
+    "settings_menu": "เมนู",
+    "change_color": "เปลี่ยนสี",
+    "show_all": "แสดงทั้งหมด ({} ตัวอักษร)",
+    "arrange_all": "จัดเรียง",
+    "status_arranged": "จัดเรียงโน้ต {} รายการแล้ว",
+    "status_loading": "กำลังโหลดโน้ต...",
+    "status_created_many": "สร้างโน้ต {} รายการแล้ว",
+    "status_updated_many": "อัปเดตโน้ต {} รายการแล้ว",
+    "status_deleted_many": "ลบโน้ต {} รายการแล้ว",
+    "msg_confirm_delete_many": "ต้องการลบโน้ตที่เลือก {} รายการหรือไม่?\nการดำเนินการนี้ไม่สามารถย้อนกลับได้",
+    "archive": "เก็บถาวร",
+    "unarchive": "นำออกจากที่เก็บถาวร",
+    "show_archived": "แสดงที่เก็บถาวร",
+    "status_archived": "เก็บถาวรแล้ว",
+    "status_opened_many": "เปิดโน้ต {} รายการแล้ว",
+    "status_closed_many": "ปิดโน้ต {} รายการแล้ว",
+    "status_color_changed_many": "เปลี่ยนสีโน้ต {} รายการแล้ว",
+    "status_archived_many": "เก็บถาวรโน้ต {} รายการแล้ว",
+    "status_unarchived_many": "นำโน้ต {} รายการออกจากที่เก็บถาวรแล้ว",
+    "msg_select_note_to_close": "กรุณาเลือกโน้ตที่จะปิด",
+    "msg_select_note_to_archive": "กรุณาเลือกโน้ตที่จะเก็บถาวร",
+    "automation_api": "API อัตโนมัติ",
+    "enable_automation_api": "เปิดใช้ API อัตโนมัติภายในเครื่อง (127.0.0.1:{})",
+    "status_rpc_started": "เริ่ม API อัตโนมัติแล้ว (127.0.0.1:{})",
+    "status_rpc_stopped": "หยุด API อัตโนมัติแล้ว",
+    "status_rpc_failed": "ไม่สามารถเริ่ม API อัตโนมัติได้ (พอร์ต {} ถูกใช้งานอยู่)",
+    "status_external_changes": "โหลดการเปลี่ยนแปลงโน้ต {} รายการจากโปรแกรมอื่นแล้ว",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
@@ -0,0 +1,107 @@
+"""翻訳データ: Türkçe (tr)"""
+
+TRANSLATIONS = {
+    "language_name": "Türkçe",
+    "app_title": "Yapışkan Not Yöneticisi",
+    "all_notes": "Tüm Notlar",
+    "settings": "Ayarlar",
+    "language": "Dil",
+    "search": "Ara:",
+    "new_note": "Yeni Not",
+    "open": "Aç",
+    "delete": "Sil",
+    "color_change": "Renk Değiştir",
+    "refresh": "Yenile",
+    "preview": "Önizleme:",
+    "id": "ID",
+    "date": "Tarih",
+    "content": "İçerik",
+    "status": "Durum",
+    "status_open": "Açık",
+    "status_closed": "Kapalı",
+    "status_ready": "Hazır",
+    "status_created": "Not oluşturuldu (ID: {})",
+    "status_editing": "Not düzenleniyor (ID: {})",
+    "status_deleted": "Not silindi (ID: {})",
+    "status_color_changed": "Not rengi değiştirildi (ID: {})",
+    "status_loaded": "{} not yüklendi",
+    "status_saved": "{} not kaydedildi",
+    "status_load_failed": "Notları yükleme başarısız",
+    "status_save_failed": "Notları kaydetme başarısız",
+    "status_new_file": "Yeni veri dosyası oluşturuluyor",
+    "msg_select_note_to_open": "Açmak için bir not seçin.",
+    "msg_select_note_to_delete": "Silmek için bir not seçin.",
+    "msg_select_note_for_color": "Renk değiştirmek için bir not seçin.",
+    "msg_confirm_delete": "Seçili notu silmek istediğinizden emin misiniz?\nBu işlem geri alınamaz.",
+    "msg_error_note_data": "Not verilerini alma başarısız.",
+    "msg_empty_content": "(içerik yok)",
+    "confirm": "Onayla",
+    "info": "Bilgi",
+    "error": "Hata",
+    "close": "Kapat",
+    "settings_menu": "Menü",
+    "change_color": "Renk Değiştir",
+    "show_all": "Tümünü göster ({} karakter)",
+    "arrange_all": "Düzenle",
+    "status_arranged": "{} not düzenlendi",
+    "status_loading": "Notlar yükleniyor...",
+    "status_created_many": "{} not oluşturuldu",
+    "status_updated_many": "{} not güncellendi",
+    "status_deleted_many": "{} not silindi",
+    "msg_confirm_delete_many": "Seçili {} notu silmek istediğinizden emin misiniz?\nBu işlem geri alınamaz.",
+    "archive": "Arşivle",
+    "unarchive": "Arşivden çıkar",
+    "show_archived": "Arşivlenenleri göster",
+    "status_archived": "Arşivlendi",
+    "status_opened_many": "{} not açıldı",
+    "status_closed_many": "{} not kapatıldı",
+    "status_color_changed_many": "{} notun rengi değiştirildi",
+    "status_archived_many": "{} not arşivlendi",
+    "status_unarchived_many": "{} not arşivden çıkarıldı",
+    "msg_select_note_to_close": "Lütfen kapatılacak bir not seçin.",
+    "msg_select_note_to_archive": "Lütfen arşivlenecek bir not seçin.",
+    "automation_api": "Otomasyon API'si",
+    "enable_automation_api": "Yerel otomasyon API'sini etkinleştir (127.0.0.1:{})",
+    "status_rpc_started": "Otomasyon API'si başlatıldı (127.0.0.1:{})",
+    "status_rpc_stopped": "Otomasyon API'si durduruldu",
+    "status_rpc_failed": "Otomasyon API'si başlatılamadı ({} numaralı bağlantı noktası kullanımda)",
+    "status_external_changes": "Başka bir programın {} notta yaptığı değişiklikler yüklendi",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
@@ -0,0 +1,107 @@
+"""翻訳データ: Tiếng Việt (vi)"""
+
+TRANSLATIONS = {
+    "language_name": "Tiếng Việt",
+    "app_title": "Trình Quản Lý Ghi Chú Dán",
+    "all_notes": "Tất Cả Ghi Chú",
+    "settings": "Cài Đặt",
+    "language": "Ngôn Ngữ",
+    "search": "Tìm kiếm:",
+    "new_note": "Ghi Chú Mới",
+    "open": "Mở",
+    "delete": "Xóa",
+    "color_change": "Đổi Màu",
+    "refresh": "Làm Mới",
+    "preview": "Xem Trước:",
+    "id": "ID",
+    "date": "Ngày",
+    "content": "Nội Dung",
+    "status": "Trạng Thái",
+    "status_open": "Đang Mở",
+    "status_closed": "Đã Đóng",
+    "status_ready": "Sẵn Sàng",
+    "status_created": "Đã tạo ghi chú (ID: {})",
+    "status_editing": "Đang chỉnh sửa ghi chú (ID: {})",
+    "status_deleted": "Đã xóa ghi chú (ID: {})",
+    "status_color_changed": "Đã đổi màu ghi chú (ID: {})",
+    "status_loaded": "Đã tải {} ghi chú",
+    "status_saved": "Đã lưu {} ghi chú",
+    "status_load_failed": "Tải ghi chú thất bại",
+    "status_save_failed": "Lưu ghi chú thất bại",
+    "status_new_file": "Đang tạo tệp dữ liệu mới",
+    "msg_select_note_to_open": "Vui lòng chọn ghi chú để mở.",
+    "msg_select_note_to_delete": "Vui lòng chọn ghi chú để xóa.",
+    "msg_select_note_for_color": "Vui lòng chọn ghi chú để đổi màu.",
+    "msg_confirm_delete": "Bạn có chắc chắn muốn xóa ghi chú đã chọn không?\nHành động này không thể hoàn tác.",
+    "msg_error_note_data": "Không thể lấy dữ liệu ghi chú.",
+    "msg_empty_content": "(không có nội dung)",
+    "confirm": "Xác Nhận",
+    "info": "Thông Tin",
+    "error": "Lỗi",
+    "close": "Đóng",
+    "settings_menu": "Menu",
+    "change_color": "Đổi Màu",
+    "show_all": "Hiển thị tất cả ({} ký tự)",
+    "arrange_all": "Sắp xếp",
+    "status_arranged": "Đã sắp xếp {} ghi chú",
+    "status_loading": "Đang tải ghi chú...",
+    "status_created_many": "Đã tạo {} ghi chú",
+    "status_updated_many": "Đã cập nhật {} ghi chú",
+    "status_deleted_many": "Đã xóa {} ghi chú",
+    "msg_confirm_delete_many": "Bạn có chắc muốn xóa {} ghi chú đã chọn?\nKhông thể hoàn tác thao tác này.",
+    "archive": "Lưu trữ",
+    "unarchive": "Bỏ lưu trữ",
+    "show_archived": "Hiện ghi chú đã lưu trữ",
+    "status_archived": "Đã lưu trữ",
+    "status_opened_many": "Đã mở {} ghi chú",
+    "status_closed_many": "Đã đóng {} ghi chú",
+    "status_color_changed_many": "Đã đổi màu {} ghi chú",
+    "status_archived_many": "Đã lưu trữ {} ghi chú",
+    "status_unarchived_many": "Đã bỏ lưu trữ {} ghi chú",
+    "msg_select_note_to_close": "Vui lòng chọn ghi chú để đóng.",
+    "msg_select_note_to_archive": "Vui lòng chọn ghi chú để lưu trữ.",
+    "automation_api": "API tự động hóa",
+    "enable_automation_api": "Bật API tự động hóa cục bộ (127.0.0.1:{})",
+    "status_rpc_started": "Đã khởi động API tự động hóa (127.0.0.1:{})",
+    "status_rpc_stopped": "Đã dừng API tự động hóa",
+    "status_rpc_failed": "Không thể khởi động API tự động hóa (cổng {} đang được dùng)",
+    "status_external_changes": "Đã tải thay đổi của chương trình khác trên {} ghi chú",
+    "sync_conflict_prefix": "[Sync conflict] ",
+    "history": "History",
+    "characters": "Characters",
+    "restore": "Restore this version",
+    "msg_no_history": "There is no history for this note yet.",
+    "status_history_restored": "Restored a previous version of the note (ID: {})",
+    "edit": "Edit",
+    "status_undone": "Undid: {}",
+    "status_redone": "Redid: {}",
+    "status_nothing_to_undo": "Nothing to undo",
+    "status_nothing_to_redo": "Nothing to redo",
+    "trash": "Trash",
+    "deleted_at": "Deleted",
+    "restore_from_trash": "Restore",
+    "delete_permanently": "Delete permanently",
+    "empty_trash": "Empty trash",
+    "status_trashed": "Moved the note to the trash (ID: {})",
+    "status_trashed_many": "Moved {} notes to the trash",
+    "status_restored_many": "Restored {} notes from the trash",
+    "status_purged_many": "Permanently deleted {} notes",
+    "include_cold_archive": "Include cold storage",
+    "status_cold_archived": "Cold storage",
+    "status_cold_archived_many": "Moved {} old notes to cold storage",
+    "quick_open": "Quick open",
+    "quick_open_matches": "{} matching notes",
+    "diagnostics": "Diagnostics",
+    "diagnostics_enabled": "Record timings",
+    "diagnostics_export": "Export JSON",
+    "diagnostics_reset": "Reset",
+    "diagnostics_name": "Operation",
+    "diagnostics_count": "Count",
+    "diagnostics_mean": "Mean ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "Max ms",
+    "diagnostics_updated": "Updated at {}",
+    "msg_diagnostics_exported": "Exported diagnostics to {}",
+    "msg_diagnostics_export_failed": "Failed to export diagnostics: {}"
+}
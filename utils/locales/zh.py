@@ -0,0 +1,107 @@
+"""翻訳データ: 中文 (zh)"""
+
+TRANSLATIONS = {
+    "language_name": "中文",
+    "app_title": "便签管理器",
+    "all_notes": "所有便签",
+    "settings": "设置",
+    "language": "语言",
+    "search": "搜索:",
+    "new_note": "新建便签",
+    "open": "打开",
+    "delete": "删除",
+    "color_change": "更改颜色",
+    "refresh": "刷新",
+    "preview": "预览:",
+    "id": "ID",
+    "date": "日期",
+    "content": "内容",
+    "status": "状态",
+    "status_open": "打开",
+    "status_closed": "关闭",
+    "status_ready": "就绪",
+    "status_created": "便签已创建 (ID: {})",
+    "status_editing": "正在编辑便签 (ID: {})",
+    "status_deleted": "便签已删除 (ID: {})",
+    "status_color_changed": "便签颜色已更改 (ID: {})",
+    "status_loaded": "已加载 {} 个便签",
+    "status_saved": "已保存 {} 个便签",
+    "status_load_failed": "加载便签失败",
+    "status_save_failed": "保存便签失败",
+    "status_new_file": "正在创建新数据文件",
+    "msg_select_note_to_open": "请选择要打开的便签。",
+    "msg_select_note_to_delete": "请选择要删除的便签。",
+    "msg_select_note_for_color": "请选择要更改颜色的便签。",
+    "msg_confirm_delete": "确定要删除所选便签吗？\n此操作无法撤销。",
+    "msg_error_note_data": "获取便签数据失败。",
+    "msg_empty_content": "(无内容)",
+    "confirm": "确认",
+    "info": "信息",
+    "error": "错误",
+    "close": "关闭",
+    "settings_menu": "菜单",
+    "change_color": "更改颜色",
+    "show_all": "显示全部（{}个字符）",
+    "arrange_all": "排列",
+    "status_arranged": "已排列 {} 个便签",
+    "status_loading": "正在加载便签...",
+    "status_created_many": "已创建 {} 个便签",
+    "status_updated_many": "已更新 {} 个便签",
+    "status_deleted_many": "已删除 {} 个便签",
+    "msg_confirm_delete_many": "确定要删除所选的 {} 个便签吗？\n此操作无法撤消。",
+    "archive": "归档",
+    "unarchive": "取消归档",
+    "show_archived": "显示已归档",
+    "status_archived": "已归档",
+    "status_opened_many": "已打开 {} 个便签",
+    "status_closed_many": "已关闭 {} 个便签",
+    "status_color_changed_many": "已更改 {} 个便签的颜色",
+    "status_archived_many": "已归档 {} 个便签",
+    "status_unarchived_many": "已取消归档 {} 个便签",
+    "msg_select_note_to_close": "请选择要关闭的便签。",
+    "msg_select_note_to_archive": "请选择要归档的便签。",
+    "automation_api": "自动化 API",
+    "enable_automation_api": "启用本地自动化 API（127.0.0.1:{}）",
+    "status_rpc_started": "自动化 API 已启动（127.0.0.1:{}）",
+    "status_rpc_stopped": "自动化 API 已停止",
+    "status_rpc_failed": "无法启动自动化 API（端口 {} 已被占用）",
+    "status_external_changes": "已载入其他程序对 {} 个便签的更改",
+    "sync_conflict_prefix": "【同步冲突】",
+    "history": "历史记录",
+    "characters": "字数",
+    "restore": "恢复此版本",
+    "msg_no_history": "此便签还没有历史记录。",
+    "status_history_restored": "已将便签恢复到以前的版本（ID: {}）",
+    "edit": "编辑",
+    "status_undone": "已撤销：{}",
+    "status_redone": "已重做：{}",
+    "status_nothing_to_undo": "没有可撤销的操作",
+    "status_nothing_to_redo": "没有可重做的操作",
+    "trash": "回收站",
+    "deleted_at": "删除时间",
+    "restore_from_trash": "恢复",
+    "delete_permanently": "永久删除",
+    "empty_trash": "清空回收站",
+    "status_trashed": "已将便签移到回收站（ID: {}）",
+    "status_trashed_many": "已将 {} 个便签移到回收站",
+    "status_restored_many": "已从回收站恢复 {} 个便签",
+    "status_purged_many": "已永久删除 {} 个便签",
+    "include_cold_archive": "包括冷存储",
+    "status_cold_archived": "冷存储",
+    "status_cold_archived_many": "已将 {} 个旧便签移至冷存储",
+    "quick_open": "快速打开",
+    "quick_open_matches": "{} 条匹配",
+    "diagnostics": "诊断",
+    "diagnostics_enabled": "记录处理时间",
+    "diagnostics_export": "导出 JSON",
+    "diagnostics_reset": "重置",
+    "diagnostics_name": "操作",
+    "diagnostics_count": "次数",
+    "diagnostics_mean": "平均 ms",
+    "diagnostics_p50": "p50 ms",
+    "diagnostics_p95": "p95 ms",
+    "diagnostics_max": "最大 ms",
+    "diagnostics_updated": "更新于 {}",
+    "msg_diagnostics_exported": "已导出诊断信息: {}",
+    "msg_diagnostics_export_failed": "导出诊断信息失败: {}"
+}
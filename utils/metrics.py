@@ -0,0 +1,185 @@
+"""処理時間と回数の計測 - 保存・読み込み・一覧の更新などの所要時間をメモリに集計する
+
+計測したい関数は @timed("名前")、処理の一部は with measure("名前"): で囲み、
+回数だけを数える場合は increment("名前") を呼ぶ。
+所要時間はミリ秒のヒストグラム（対数の区切り）に、回数・合計・最小・最大とともに記録する。
+無効にしている間は、フラグを1回確認するだけで何も記録しない。
+"""
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+from utils.constants import METRICS_BUCKETS_MS, METRICS_ENABLED_DEFAULT
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Histogram:
+    """所要時間（ミリ秒）の分布"""
+    __slots__ = ("counts", "count", "total", "minimum", "maximum")
+    
+    def __init__(self):
+        self.counts = [0] * (len(METRICS_BUCKETS_MS) + 1)  # 最後は最大の区切りを超えた分
+        self.count = 0
+        self.total = 0.0
+        self.minimum = 0.0
+        self.maximum = 0.0
+    
+    def observe(self, value: float) -> None:
+        """値を1つ記録"""
+        self.counts[bisect_left(METRICS_BUCKETS_MS, value)] += 1
+        if self.count == 0 or value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        self.count += 1
+        self.total += value
+    
+    def percentile(self, ratio: float) -> float:
+        """分位点の推定値（その値が入る区切りの上限。最後の区切りを超えた分は最大値）"""
+        if self.count == 0:
+            return 0.0
+        target = ratio * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                if index == len(METRICS_BUCKETS_MS):
+                    return self.maximum
+                return min(METRICS_BUCKETS_MS[index], self.maximum)
+        return self.maximum
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """JSONに書き出せる辞書に変換"""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total, 3),
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "min_ms": round(self.minimum, 3),
+            "max_ms": round(self.maximum, 3),
+            "p50_ms": round(self.percentile(0.5), 3),
+            "p95_ms": round(self.percentile(0.95), 3),
+            "buckets": {("+inf" if index == len(METRICS_BUCKETS_MS) else f"le_{METRICS_BUCKETS_MS[index]:g}"): count
+                        for index, count in enumerate(self.counts) if count},
+        }
+
+
+class Metrics:
+    """回数とヒストグラムの集計（どのスレッドからも記録できる）"""
+    
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._started_at = time.time()
+    
+    def increment(self, name: str, value: int = 1) -> None:
+        """回数を加算"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+    
+    def observe(self, name: str, milliseconds: float) -> None:
+        """所要時間（ミリ秒）を記録"""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(milliseconds)
+    
+    def reset(self) -> None:
+        """記録を消去"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._started_at = time.time()
+    
+    def counters(self) -> List[Tuple[str, int]]:
+        """(名前, 回数) を名前順に取得"""
+        with self._lock:
+            return sorted(self._counters.items())
+    
+    def histograms(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """(名前, 集計結果の辞書) を名前順に取得"""
+        with self._lock:
+            return [(name, histogram.as_dict()) for name, histogram in sorted(self._histograms.items())]
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """すべての記録をJSONに書き出せる辞書で取得"""
+        return {
+            "enabled": self.enabled,
+            "started_at": self._started_at,
+            "captured_at": time.time(),
+            "counters": dict(self.counters()),
+            "histograms": dict(self.histograms()),
+        }
+    
+    def export_json(self, path: str) -> None:
+        """すべての記録をJSONファイルに書き出す"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+
+
+_metrics = Metrics(METRICS_ENABLED_DEFAULT)
+
+
+def get_metrics() -> Metrics:
+    """計測結果の集計を取得"""
+    return _metrics
+
+
+@contextmanager
+def _measure(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _metrics.observe(name, (time.perf_counter() - start) * 1000)
+
+
+class _NullContext:
+    """無効なときに measure が返す何もしない with 文の対象"""
+    
+    def __enter__(self) -> None:
+        return None
+    
+    def __exit__(self, *exc_info: Any) -> Optional[bool]:
+        return None
+
+
+_NULL_CONTEXT = _NullContext()
+
+
+def measure(name: str) -> Any:
+    """with文で囲んだ処理の所要時間を記録（無効なときは何もしない）"""
+    if not _metrics.enabled:
+        return _NULL_CONTEXT
+    return _measure(name)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """関数の所要時間を記録するデコレーター（例外で終わった呼び出しも記録する）"""
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _metrics.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _metrics.observe(name, (time.perf_counter() - start) * 1000)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def increment(name: str, value: int = 1) -> None:
+    """回数を加算（無効なときは何もしない）"""
+    _metrics.increment(name, value)
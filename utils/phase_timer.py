@@ -0,0 +1,54 @@
+"""処理フェーズの所要時間計測"""
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from utils.metrics import get_metrics
+
+
+class PhaseTimer:
+    """起動処理などのフェーズごとの所要時間を記録するタイマー"""
+    
+    def __init__(self, clock: Callable[[], float] = time.perf_counter, metrics_prefix: Optional[str] = None):
+        self._clock = clock
+        # 指定するとフェーズを計測結果の集計にも記録する（フェーズは所要時間、mark は開始からの経過時間）
+        self._metrics_prefix = metrics_prefix
+        self._origin = clock()
+        # (フェーズ名, 開始からの経過秒, 所要秒)
+        self._phases: List[Tuple[str, float, float]] = []
+    
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """with文で囲んだ処理をフェーズとして記録"""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.record(name, start, self._clock())
+    
+    def record(self, name: str, start: float, end: float) -> None:
+        """開始・終了時刻を指定してフェーズを記録（別スレッドからも呼び出し可能）"""
+        self._phases.append((name, start - self._origin, end - start))
+        if self._metrics_prefix is not None:
+            duration = end - start if end > start else end - self._origin
+            get_metrics().observe(f"{self._metrics_prefix}.{name}", duration * 1000)
+    
+    def mark(self, name: str) -> None:
+        """現在時刻を所要時間0のフェーズとして記録"""
+        now = self._clock()
+        self.record(name, now, now)
+    
+    def elapsed_ms(self) -> float:
+        """計測開始からの経過時間（ミリ秒）"""
+        return (self._clock() - self._origin) * 1000
+    
+    def get_timings(self) -> List[Tuple[str, float, float]]:
+        """記録したフェーズを (名前, 開始からの経過ミリ秒, 所要ミリ秒) のリストで取得"""
+        return [(name, offset * 1000, duration * 1000) for name, offset, duration in self._phases]
+    
+    def as_dict(self) -> Dict[str, float]:
+        """フェーズ名 -> 終了時点の経過ミリ秒 の辞書で取得"""
+        return {name: offset + duration for name, offset, duration in self.get_timings()}
+    
+    def summary(self) -> str:
+        """記録内容を1行の文字列で取得"""
+        return ", ".join(f"{name}={offset + duration:.1f}ms" for name, offset, duration in self.get_timings())
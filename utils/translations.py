@@ -1,996 +1,122 @@
-"""多言語対応の翻訳データ"""
+"""多言語対応の翻訳データ
 
-TRANSLATIONS = {
-    "ja": {
-        "language_name": "日本語",
-        "app_title": "付箋管理アプリ",
-        "all_notes": "すべての付箋",
-        "settings": "設定",
-        "language": "言語",
-        "search": "検索:",
-        "new_note": "新規作成",
-        "open": "開く",
-        "delete": "削除",
-        "color_change": "色変更",
-        "refresh": "更新",
-        "preview": "プレビュー:",
-        "id": "ID",
-        "date": "日時",
-        "content": "内容",
-        "status": "状態",
-        "status_open": "開いている",
-        "status_closed": "閉じている",
-        "status_ready": "準備完了",
-        "status_created": "付箋を作成しました（ID: {}）",
-        "status_editing": "付箋を編集中（ID: {}）",
-        "status_deleted": "付箋を削除しました（ID: {}）",
-        "status_color_changed": "付箋の色を変更しました（ID: {}）",
-        "status_loaded": "{}個の付箋データを読み込みました",
-        "status_saved": "{}個の付箋を保存しました",
-        "status_load_failed": "ノートの読み込みに失敗しました",
-        "status_save_failed": "ノートの保存に失敗しました",
-        "status_new_file": "新規データファイルを作成します",
-        "msg_select_note_to_open": "開く付箋を選択してください。",
-        "msg_select_note_to_delete": "削除する付箋を選択してください。",
-        "msg_select_note_for_color": "色を変更する付箋を選択してください。",
-        "msg_confirm_delete": "選択した付箋を完全に削除しますか？\nこの操作は元に戻せません。",
-        "msg_error_note_data": "付箋データの取得に失敗しました。",
-        "msg_empty_content": "(内容なし)",
-        "confirm": "確認",
-        "info": "情報",
-        "error": "エラー",
-        "close": "閉じる",
-        "settings_menu": "操作",
-        "change_color": "色の変更"
-    },
-    "en": {
-        "language_name": "English",
-        "app_title": "Sticky Notes Manager",
-        "all_notes": "All Notes",
-        "settings": "Settings",
-        "language": "Language",
-        "search": "Search:",
-        "new_note": "New Note",
-        "open": "Open",
-        "delete": "Delete",
-        "color_change": "Change Color",
-        "refresh": "Refresh",
-        "preview": "Preview:",
-        "id": "ID",
-        "date": "Date",
-        "content": "Content",
-        "status": "Status",
-        "status_open": "Open",
-        "status_closed": "Closed",
-        "status_ready": "Ready",
-        "status_created": "Note created (ID: {})",
-        "status_editing": "Editing note (ID: {})",
-        "status_deleted": "Note deleted (ID: {})",
-        "status_color_changed": "Note color changed (ID: {})",
-        "status_loaded": "Loaded {} notes",
-        "status_saved": "Saved {} notes",
-        "status_load_failed": "Failed to load notes",
-        "status_save_failed": "Failed to save notes",
-        "status_new_file": "Creating new data file",
-        "msg_select_note_to_open": "Please select a note to open.",
-        "msg_select_note_to_delete": "Please select a note to delete.",
-        "msg_select_note_for_color": "Please select a note to change color.",
-        "msg_confirm_delete": "Are you sure you want to delete the selected note?\nThis action cannot be undone.",
-        "msg_error_note_data": "Failed to retrieve note data.",
-        "msg_empty_content": "(no content)",
-        "confirm": "Confirm",
-        "info": "Information",
-        "error": "Error",
-        "close": "Close",
-        "settings_menu": "Menu",
-        "change_color": "Change Color"
-    },
-    "fr": {
-        "language_name": "Français",
-        "app_title": "Gestionnaire de Notes Adhésives",
-        "all_notes": "Toutes les Notes",
-        "settings": "Paramètres",
-        "language": "Langue",
-        "search": "Rechercher:",
-        "new_note": "Nouvelle Note",
-        "open": "Ouvrir",
-        "delete": "Supprimer",
-        "color_change": "Changer Couleur",
-        "refresh": "Actualiser",
-        "preview": "Aperçu:",
-        "id": "ID",
-        "date": "Date",
-        "content": "Contenu",
-        "status": "Statut",
-        "status_open": "Ouvert",
-        "status_closed": "Fermé",
-        "status_ready": "Prêt",
-        "status_created": "Note créée (ID: {})",
-        "status_editing": "Édition de la note (ID: {})",
-        "status_deleted": "Note supprimée (ID: {})",
-        "status_color_changed": "Couleur de la note changée (ID: {})",
-        "status_loaded": "{} notes chargées",
-        "status_saved": "{} notes sauvegardées",
-        "status_load_failed": "Échec du chargement des notes",
-        "status_save_failed": "Échec de la sauvegarde des notes",
-        "status_new_file": "Création d'un nouveau fichier de données",
-        "msg_select_note_to_open": "Veuillez sélectionner une note à ouvrir.",
-        "msg_select_note_to_delete": "Veuillez sélectionner une note à supprimer.",
-        "msg_select_note_for_color": "Veuillez sélectionner une note pour changer la couleur.",
-        "msg_confirm_delete": "Êtes-vous sûr de vouloir supprimer la note sélectionnée?\nCette action ne peut pas être annulée.",
-        "msg_error_note_data": "Échec de la récupération des données de la note.",
-        "msg_empty_content": "(aucun contenu)",
-        "confirm": "Confirmer",
-        "info": "Information",
-        "error": "Erreur",
-        "close": "Fermer",
-        "settings_menu": "Menu",
-        "change_color": "Changer la Couleur"
-    },
-    "de": {
-        "language_name": "Deutsch",
-        "app_title": "Haftnotizen-Manager",
-        "all_notes": "Alle Notizen",
-        "settings": "Einstellungen",
-        "language": "Sprache",
-        "search": "Suchen:",
-        "new_note": "Neue Notiz",
-        "open": "Öffnen",
-        "delete": "Löschen",
-        "color_change": "Farbe ändern",
-        "refresh": "Aktualisieren",
-        "preview": "Vorschau:",
-        "id": "ID",
-        "date": "Datum",
-        "content": "Inhalt",
-        "status": "Status",
-        "status_open": "Geöffnet",
-        "status_closed": "Geschlossen",
-        "status_ready": "Bereit",
-        "status_created": "Notiz erstellt (ID: {})",
-        "status_editing": "Notiz bearbeiten (ID: {})",
-        "status_deleted": "Notiz gelöscht (ID: {})",
-        "status_color_changed": "Notizfarbe geändert (ID: {})",
-        "status_loaded": "{} Notizen geladen",
-        "status_saved": "{} Notizen gespeichert",
-        "status_load_failed": "Laden der Notizen fehlgeschlagen",
-        "status_save_failed": "Speichern der Notizen fehlgeschlagen",
-        "status_new_file": "Neue Datendatei wird erstellt",
-        "msg_select_note_to_open": "Bitte wählen Sie eine Notiz zum Öffnen aus.",
-        "msg_select_note_to_delete": "Bitte wählen Sie eine Notiz zum Löschen aus.",
-        "msg_select_note_for_color": "Bitte wählen Sie eine Notiz zum Farbwechsel aus.",
-        "msg_confirm_delete": "Sind Sie sicher, dass Sie die ausgewählte Notiz löschen möchten?\nDiese Aktion kann nicht rückgängig gemacht werden.",
-        "msg_error_note_data": "Fehler beim Abrufen der Notizdaten.",
-        "msg_empty_content": "(kein Inhalt)",
-        "confirm": "Bestätigen",
-        "info": "Information",
-        "error": "Fehler",
-        "close": "Schließen",
-        "settings_menu": "Menü",
-        "change_color": "Farbe ändern"
-    },
-    "zh": {
-        "language_name": "中文",
-        "app_title": "便签管理器",
-        "all_notes": "所有便签",
-        "settings": "设置",
-        "language": "语言",
-        "search": "搜索:",
-        "new_note": "新建便签",
-        "open": "打开",
-        "delete": "删除",
-        "color_change": "更改颜色",
-        "refresh": "刷新",
-        "preview": "预览:",
-        "id": "ID",
-        "date": "日期",
-        "content": "内容",
-        "status": "状态",
-        "status_open": "打开",
-        "status_closed": "关闭",
-        "status_ready": "就绪",
-        "status_created": "便签已创建 (ID: {})",
-        "status_editing": "正在编辑便签 (ID: {})",
-        "status_deleted": "便签已删除 (ID: {})",
-        "status_color_changed": "便签颜色已更改 (ID: {})",
-        "status_loaded": "已加载 {} 个便签",
-        "status_saved": "已保存 {} 个便签",
-        "status_load_failed": "加载便签失败",
-        "status_save_failed": "保存便签失败",
-        "status_new_file": "正在创建新数据文件",
-        "msg_select_note_to_open": "请选择要打开的便签。",
-        "msg_select_note_to_delete": "请选择要删除的便签。",
-        "msg_select_note_for_color": "请选择要更改颜色的便签。",
-        "msg_confirm_delete": "确定要删除所选便签吗？\n此操作无法撤销。",
-        "msg_error_note_data": "获取便签数据失败。",
-        "msg_empty_content": "(无内容)",
-        "confirm": "确认",
-        "info": "信息",
-        "error": "错误",
-        "close": "关闭",
-        "settings_menu": "菜单",
-        "change_color": "更改颜色"
-    },
-    "es": {
-        "language_name": "Español",
-        "app_title": "Gestor de Notas Adhesivas",
-        "all_notes": "Todas las Notas",
-        "settings": "Configuración",
-        "language": "Idioma",
-        "search": "Buscar:",
-        "new_note": "Nueva Nota",
-        "open": "Abrir",
-        "delete": "Eliminar",
-        "color_change": "Cambiar Color",
-        "refresh": "Actualizar",
-        "preview": "Vista previa:",
-        "id": "ID",
-        "date": "Fecha",
-        "content": "Contenido",
-        "status": "Estado",
-        "status_open": "Abierto",
-        "status_closed": "Cerrado",
-        "status_ready": "Listo",
-        "status_created": "Nota creada (ID: {})",
-        "status_editing": "Editando nota (ID: {})",
-        "status_deleted": "Nota eliminada (ID: {})",
-        "status_color_changed": "Color de nota cambiado (ID: {})",
-        "status_loaded": "Cargadas {} notas",
-        "status_saved": "Guardadas {} notas",
-        "status_load_failed": "Error al cargar notas",
-        "status_save_failed": "Error al guardar notas",
-        "status_new_file": "Creando nuevo archivo de datos",
-        "msg_select_note_to_open": "Por favor seleccione una nota para abrir.",
-        "msg_select_note_to_delete": "Por favor seleccione una nota para eliminar.",
-        "msg_select_note_for_color": "Por favor seleccione una nota para cambiar color.",
-        "msg_confirm_delete": "¿Está seguro de que desea eliminar la nota seleccionada?\nEsta acción no se puede deshacer.",
-        "msg_error_note_data": "Error al obtener datos de la nota.",
-        "msg_empty_content": "(sin contenido)",
-        "confirm": "Confirmar",
-        "info": "Información",
-        "error": "Error",
-        "close": "Cerrar",
-        "settings_menu": "Menú",
-        "change_color": "Cambiar Color"
-    },
-    "it": {
-        "language_name": "Italiano",
-        "app_title": "Gestore Note Adesive",
-        "all_notes": "Tutte le Note",
-        "settings": "Impostazioni",
-        "language": "Lingua",
-        "search": "Cerca:",
-        "new_note": "Nuova Nota",
-        "open": "Apri",
-        "delete": "Elimina",
-        "color_change": "Cambia Colore",
-        "refresh": "Aggiorna",
-        "preview": "Anteprima:",
-        "id": "ID",
-        "date": "Data",
-        "content": "Contenuto",
-        "status": "Stato",
-        "status_open": "Aperto",
-        "status_closed": "Chiuso",
-        "status_ready": "Pronto",
-        "status_created": "Nota creata (ID: {})",
-        "status_editing": "Modifica nota (ID: {})",
-        "status_deleted": "Nota eliminata (ID: {})",
-        "status_color_changed": "Colore nota cambiato (ID: {})",
-        "status_loaded": "Caricate {} note",
-        "status_saved": "Salvate {} note",
-        "status_load_failed": "Caricamento note fallito",
-        "status_save_failed": "Salvataggio note fallito",
-        "status_new_file": "Creazione nuovo file dati",
-        "msg_select_note_to_open": "Seleziona una nota da aprire.",
-        "msg_select_note_to_delete": "Seleziona una nota da eliminare.",
-        "msg_select_note_for_color": "Seleziona una nota per cambiare colore.",
-        "msg_confirm_delete": "Sei sicuro di voler eliminare la nota selezionata?\nQuesta azione non può essere annullata.",
-        "msg_error_note_data": "Errore nel recupero dati nota.",
-        "msg_empty_content": "(nessun contenuto)",
-        "confirm": "Conferma",
-        "info": "Informazione",
-        "error": "Errore",
-        "close": "Chiudi",
-        "settings_menu": "Menu",
-        "change_color": "Cambia Colore"
-    },
-    "pt": {
-        "language_name": "Português",
-        "app_title": "Gerenciador de Notas Adesivas",
-        "all_notes": "Todas as Notas",
-        "settings": "Configurações",
-        "language": "Idioma",
-        "search": "Pesquisar:",
-        "new_note": "Nova Nota",
-        "open": "Abrir",
-        "delete": "Excluir",
-        "color_change": "Mudar Cor",
-        "refresh": "Atualizar",
-        "preview": "Visualização:",
-        "id": "ID",
-        "date": "Data",
-        "content": "Conteúdo",
-        "status": "Status",
-        "status_open": "Aberto",
-        "status_closed": "Fechado",
-        "status_ready": "Pronto",
-        "status_created": "Nota criada (ID: {})",
-        "status_editing": "Editando nota (ID: {})",
-        "status_deleted": "Nota excluída (ID: {})",
-        "status_color_changed": "Cor da nota alterada (ID: {})",
-        "status_loaded": "Carregadas {} notas",
-        "status_saved": "Salvas {} notas",
-        "status_load_failed": "Falha ao carregar notas",
-        "status_save_failed": "Falha ao salvar notas",
-        "status_new_file": "Criando novo arquivo de dados",
-        "msg_select_note_to_open": "Selecione uma nota para abrir.",
-        "msg_select_note_to_delete": "Selecione uma nota para excluir.",
-        "msg_select_note_for_color": "Selecione uma nota para mudar cor.",
-        "msg_confirm_delete": "Tem certeza de que deseja excluir a nota selecionada?\nEsta ação não pode ser desfeita.",
-        "msg_error_note_data": "Falha ao obter dados da nota.",
-        "msg_empty_content": "(sem conteúdo)",
-        "confirm": "Confirmar",
-        "info": "Informação",
-        "error": "Erro",
-        "close": "Fechar",
-        "settings_menu": "Menu",
-        "change_color": "Mudar Cor"
-    },
-    "ru": {
-        "language_name": "Русский",
-        "app_title": "Менеджер Заметок",
-        "all_notes": "Все Заметки",
-        "settings": "Настройки",
-        "language": "Язык",
-        "search": "Поиск:",
-        "new_note": "Новая Заметка",
-        "open": "Открыть",
-        "delete": "Удалить",
-        "color_change": "Изменить Цвет",
-        "refresh": "Обновить",
-        "preview": "Предпросмотр:",
-        "id": "ID",
-        "date": "Дата",
-        "content": "Содержание",
-        "status": "Статус",
-        "status_open": "Открыт",
-        "status_closed": "Закрыт",
-        "status_ready": "Готов",
-        "status_created": "Заметка создана (ID: {})",
-        "status_editing": "Редактирование заметки (ID: {})",
-        "status_deleted": "Заметка удалена (ID: {})",
-        "status_color_changed": "Цвет заметки изменен (ID: {})",
-        "status_loaded": "Загружено {} заметок",
-        "status_saved": "Сохранено {} заметок",
-        "status_load_failed": "Не удалось загрузить заметки",
-        "status_save_failed": "Не удалось сохранить заметки",
-        "status_new_file": "Создание нового файла данных",
-        "msg_select_note_to_open": "Выберите заметку для открытия.",
-        "msg_select_note_to_delete": "Выберите заметку для удаления.",
-        "msg_select_note_for_color": "Выберите заметку для изменения цвета.",
-        "msg_confirm_delete": "Вы уверены, что хотите удалить выбранную заметку?\nЭто действие нельзя отменить.",
-        "msg_error_note_data": "Ошибка получения данных заметки.",
-        "msg_empty_content": "(нет содержания)",
-        "confirm": "Подтвердить",
-        "info": "Информация",
-        "error": "Ошибка",
-        "close": "Закрыть",
-        "settings_menu": "Меню",
-        "change_color": "Изменить Цвет"
-    },
-    "ko": {
-        "language_name": "한국어",
-        "app_title": "스티커 노트 관리자",
-        "all_notes": "모든 노트",
-        "settings": "설정",
-        "language": "언어",
-        "search": "검색:",
-        "new_note": "새 노트",
-        "open": "열기",
-        "delete": "삭제",
-        "color_change": "색상 변경",
-        "refresh": "새로고침",
-        "preview": "미리보기:",
-        "id": "ID",
-        "date": "날짜",
-        "content": "내용",
-        "status": "상태",
-        "status_open": "열림",
-        "status_closed": "닫힘",
-        "status_ready": "준비됨",
-        "status_created": "노트가 생성되었습니다 (ID: {})",
-        "status_editing": "노트 편집 중 (ID: {})",
-        "status_deleted": "노트가 삭제되었습니다 (ID: {})",
-        "status_color_changed": "노트 색상이 변경되었습니다 (ID: {})",
-        "status_loaded": "{}개 노트를 불러왔습니다",
-        "status_saved": "{}개 노트를 저장했습니다",
-        "status_load_failed": "노트 불러오기 실패",
-        "status_save_failed": "노트 저장 실패",
-        "status_new_file": "새 데이터 파일을 생성합니다",
-        "msg_select_note_to_open": "열 노트를 선택하세요.",
-        "msg_select_note_to_delete": "삭제할 노트를 선택하세요.",
-        "msg_select_note_for_color": "색상을 변경할 노트를 선택하세요.",
-        "msg_confirm_delete": "선택한 노트를 삭제하시겠습니까?\n이 작업은 되돌릴 수 없습니다.",
-        "msg_error_note_data": "노트 데이터 가져오기 실패.",
-        "msg_empty_content": "(내용 없음)",
-        "confirm": "확인",
-        "info": "정보",
-        "error": "오류",
-        "close": "닫기",
-        "settings_menu": "메뉴",
-        "change_color": "색상 변경"
-    },
-    "ar": {
-        "language_name": "العربية",
-        "app_title": "مدير الملاحظات اللاصقة",
-        "all_notes": "جميع الملاحظات",
-        "settings": "الإعدادات",
-        "language": "اللغة",
-        "search": "البحث:",
-        "new_note": "ملاحظة جديدة",
-        "open": "فتح",
-        "delete": "حذف",
-        "color_change": "تغيير اللون",
-        "refresh": "تحديث",
-        "preview": "معاينة:",
-        "id": "المعرف",
-        "date": "التاريخ",
-        "content": "المحتوى",
-        "status": "الحالة",
-        "status_open": "مفتوح",
-        "status_closed": "مغلق",
-        "status_ready": "جاهز",
-        "status_created": "تم إنشاء الملاحظة (المعرف: {})",
-        "status_editing": "تحرير الملاحظة (المعرف: {})",
-        "status_deleted": "تم حذف الملاحظة (المعرف: {})",
-        "status_color_changed": "تم تغيير لون الملاحظة (المعرف: {})",
-        "status_loaded": "تم تحميل {} ملاحظة",
-        "status_saved": "تم حفظ {} ملاحظة",
-        "status_load_failed": "فشل في تحميل الملاحظات",
-        "status_save_failed": "فشل في حفظ الملاحظات",
-        "status_new_file": "إنشاء ملف بيانات جديد",
-        "msg_select_note_to_open": "يرجى اختيار ملاحظة لفتحها.",
-        "msg_select_note_to_delete": "يرجى اختيار ملاحظة لحذفها.",
-        "msg_select_note_for_color": "يرجى اختيار ملاحظة لتغيير لونها.",
-        "msg_confirm_delete": "هل أنت متأكد من أنك تريد حذف الملاحظة المحددة؟\nلا يمكن التراجع عن هذا الإجراء.",
-        "msg_error_note_data": "فشل في استرداد بيانات الملاحظة.",
-        "msg_empty_content": "(لا يوجد محتوى)",
-        "confirm": "تأكيد",
-        "info": "معلومات",
-        "error": "خطأ",
-        "close": "إغلاق",
-        "settings_menu": "القائمة",
-        "change_color": "تغيير اللون"
-    },
-    "hi": {
-        "language_name": "हिन्दी",
-        "app_title": "स्टिकी नोट्स प्रबंधक",
-        "all_notes": "सभी नोट्स",
-        "settings": "सेटिंग्स",
-        "language": "भाषा",
-        "search": "खोजें:",
-        "new_note": "नया नोट",
-        "open": "खोलें",
-        "delete": "हटाएं",
-        "color_change": "रंग बदलें",
-        "refresh": "रीफ्रेश",
-        "preview": "पूर्वावलोकन:",
-        "id": "आईडी",
-        "date": "दिनांक",
-        "content": "सामग्री",
-        "status": "स्थिति",
-        "status_open": "खुला",
-        "status_closed": "बंद",
-        "status_ready": "तैयार",
-        "status_created": "नोट बनाया गया (आईडी: {})",
-        "status_editing": "नोट संपादित कर रहे हैं (आईडी: {})",
-        "status_deleted": "नोट हटाया गया (आईडी: {})",
-        "status_color_changed": "नोट का रंग बदला गया (आईडी: {})",
-        "status_loaded": "{} नोट्स लोड किए गए",
-        "status_saved": "{} नोट्स सहेजे गए",
-        "status_load_failed": "नोट्स लोड करने में विफल",
-        "status_save_failed": "नोट्स सहेजने में विफल",
-        "status_new_file": "नई डेटा फ़ाइल बना रहे हैं",
-        "msg_select_note_to_open": "कृपया खोलने के लिए एक नोट चुनें।",
-        "msg_select_note_to_delete": "कृपया हटाने के लिए एक नोट चुनें।",
-        "msg_select_note_for_color": "कृपया रंग बदलने के लिए एक नोट चुनें।",
-        "msg_confirm_delete": "क्या आप वाकई चयनित नोट को हटाना चाहते हैं?\nयह क्रिया पूर्ववत नहीं की जा सकती।",
-        "msg_error_note_data": "नोट डेटा प्राप्त करने में विफल।",
-        "msg_empty_content": "(कोई सामग्री नहीं)",
-        "confirm": "पुष्टि करें",
-        "info": "जानकारी",
-        "error": "त्रुटि",
-        "close": "बंद करें",
-        "settings_menu": "मेनू",
-        "change_color": "रंग बदलें"
-    },
-    "nl": {
-        "language_name": "Nederlands",
-        "app_title": "Plaknotitie Beheerder",
-        "all_notes": "Alle Notities",
-        "settings": "Instellingen",
-        "language": "Taal",
-        "search": "Zoeken:",
-        "new_note": "Nieuwe Notitie",
-        "open": "Openen",
-        "delete": "Verwijderen",
-        "color_change": "Kleur Wijzigen",
-        "refresh": "Vernieuwen",
-        "preview": "Voorbeeld:",
-        "id": "ID",
-        "date": "Datum",
-        "content": "Inhoud",
-        "status": "Status",
-        "status_open": "Open",
-        "status_closed": "Gesloten",
-        "status_ready": "Klaar",
-        "status_created": "Notitie aangemaakt (ID: {})",
-        "status_editing": "Notitie bewerken (ID: {})",
-        "status_deleted": "Notitie verwijderd (ID: {})",
-        "status_color_changed": "Notitie kleur gewijzigd (ID: {})",
-        "status_loaded": "{} notities geladen",
-        "status_saved": "{} notities opgeslagen",
-        "status_load_failed": "Laden van notities mislukt",
-        "status_save_failed": "Opslaan van notities mislukt",
-        "status_new_file": "Nieuw gegevensbestand maken",
-        "msg_select_note_to_open": "Selecteer een notitie om te openen.",
-        "msg_select_note_to_delete": "Selecteer een notitie om te verwijderen.",
-        "msg_select_note_for_color": "Selecteer een notitie om de kleur te wijzigen.",
-        "msg_confirm_delete": "Weet je zeker dat je de geselecteerde notitie wilt verwijderen?\nDeze actie kan niet ongedaan worden gemaakt.",
-        "msg_error_note_data": "Fout bij ophalen notitie gegevens.",
-        "msg_empty_content": "(geen inhoud)",
-        "confirm": "Bevestigen",
-        "info": "Informatie",
-        "error": "Fout",
-        "close": "Sluiten",
-        "settings_menu": "Menu",
-        "change_color": "Kleur Wijzigen"
-    },
-    "sv": {
-        "language_name": "Svenska",
-        "app_title": "Klisterlapp Hanterare",
-        "all_notes": "Alla Anteckningar",
-        "settings": "Inställningar",
-        "language": "Språk",
-        "search": "Sök:",
-        "new_note": "Ny Anteckning",
-        "open": "Öppna",
-        "delete": "Ta bort",
-        "color_change": "Ändra Färg",
-        "refresh": "Uppdatera",
-        "preview": "Förhandsvisning:",
-        "id": "ID",
-        "date": "Datum",
-        "content": "Innehåll",
-        "status": "Status",
-        "status_open": "Öppen",
-        "status_closed": "Stängd",
-        "status_ready": "Redo",
-        "status_created": "Anteckning skapad (ID: {})",
-        "status_editing": "Redigerar anteckning (ID: {})",
-        "status_deleted": "Anteckning borttagen (ID: {})",
-        "status_color_changed": "Anteckningsfärg ändrad (ID: {})",
-        "status_loaded": "Laddade {} anteckningar",
-        "status_saved": "Sparade {} anteckningar",
-        "status_load_failed": "Misslyckades att ladda anteckningar",
-        "status_save_failed": "Misslyckades att spara anteckningar",
-        "status_new_file": "Skapar ny datafil",
-        "msg_select_note_to_open": "Välj en anteckning att öppna.",
-        "msg_select_note_to_delete": "Välj en anteckning att ta bort.",
-        "msg_select_note_for_color": "Välj en anteckning för att ändra färg.",
-        "msg_confirm_delete": "Är du säker på att du vill ta bort den valda anteckningen?\nDenna åtgärd kan inte ångras.",
-        "msg_error_note_data": "Misslyckades att hämta anteckningsdata.",
-        "msg_empty_content": "(inget innehåll)",
-        "confirm": "Bekräfta",
-        "info": "Information",
-        "error": "Fel",
-        "close": "Stäng",
-        "settings_menu": "Meny",
-        "change_color": "Ändra Färg"
-    },
-    "tr": {
-        "language_name": "Türkçe",
-        "app_title": "Yapışkan Not Yöneticisi",
-        "all_notes": "Tüm Notlar",
-        "settings": "Ayarlar",
-        "language": "Dil",
-        "search": "Ara:",
-        "new_note": "Yeni Not",
-        "open": "Aç",
-        "delete": "Sil",
-        "color_change": "Renk Değiştir",
-        "refresh": "Yenile",
-        "preview": "Önizleme:",
-        "id": "ID",
-        "date": "Tarih",
-        "content": "İçerik",
-        "status": "Durum",
-        "status_open": "Açık",
-        "status_closed": "Kapalı",
-        "status_ready": "Hazır",
-        "status_created": "Not oluşturuldu (ID: {})",
-        "status_editing": "Not düzenleniyor (ID: {})",
-        "status_deleted": "Not silindi (ID: {})",
-        "status_color_changed": "Not rengi değiştirildi (ID: {})",
-        "status_loaded": "{} not yüklendi",
-        "status_saved": "{} not kaydedildi",
-        "status_load_failed": "Notları yükleme başarısız",
-        "status_save_failed": "Notları kaydetme başarısız",
-        "status_new_file": "Yeni veri dosyası oluşturuluyor",
-        "msg_select_note_to_open": "Açmak için bir not seçin.",
-        "msg_select_note_to_delete": "Silmek için bir not seçin.",
-        "msg_select_note_for_color": "Renk değiştirmek için bir not seçin.",
-        "msg_confirm_delete": "Seçili notu silmek istediğinizden emin misiniz?\nBu işlem geri alınamaz.",
-        "msg_error_note_data": "Not verilerini alma başarısız.",
-        "msg_empty_content": "(içerik yok)",
-        "confirm": "Onayla",
-        "info": "Bilgi",
-        "error": "Hata",
-        "close": "Kapat",
-        "settings_menu": "Menü",
-        "change_color": "Renk Değiştir"
-    },
-    "pl": {
-        "language_name": "Polski",
-        "app_title": "Menedżer Karteczek",
-        "all_notes": "Wszystkie Notatki",
-        "settings": "Ustawienia",
-        "language": "Język",
-        "search": "Szukaj:",
-        "new_note": "Nowa Notatka",
-        "open": "Otwórz",
-        "delete": "Usuń",
-        "color_change": "Zmień Kolor",
-        "refresh": "Odśwież",
-        "preview": "Podgląd:",
-        "id": "ID",
-        "date": "Data",
-        "content": "Zawartość",
-        "status": "Status",
-        "status_open": "Otwarta",
-        "status_closed": "Zamknięta",
-        "status_ready": "Gotowy",
-        "status_created": "Notatka utworzona (ID: {})",
-        "status_editing": "Edytowanie notatki (ID: {})",
-        "status_deleted": "Notatka usunięta (ID: {})",
-        "status_color_changed": "Kolor notatki zmieniony (ID: {})",
-        "status_loaded": "Załadowano {} notatek",
-        "status_saved": "Zapisano {} notatek",
-        "status_load_failed": "Nie udało się załadować notatek",
-        "status_save_failed": "Nie udało się zapisać notatek",
-        "status_new_file": "Tworzenie nowego pliku danych",
-        "msg_select_note_to_open": "Wybierz notatkę do otwarcia.",
-        "msg_select_note_to_delete": "Wybierz notatkę do usunięcia.",
-        "msg_select_note_for_color": "Wybierz notatkę do zmiany koloru.",
-        "msg_confirm_delete": "Czy na pewno chcesz usunąć wybraną notatkę?\nTej czynności nie można cofnąć.",
-        "msg_error_note_data": "Nie udało się pobrać danych notatki.",
-        "msg_empty_content": "(brak zawartości)",
-        "confirm": "Potwierdź",
-        "info": "Informacja",
-        "error": "Błąd",
-        "close": "Zamknij",
-        "settings_menu": "Menu",
-        "change_color": "Zmień Kolor"
-    },
-    "th": {
-        "language_name": "ไทย",
-        "app_title": "ตัวจัดการโน้ตติดบอร์ด",
-        "all_notes": "โน้ตทั้งหมด",
-        "settings": "การตั้งค่า",
-        "language": "ภาษา",
-        "search": "ค้นหา:",
-        "new_note": "โน้ตใหม่",
-        "open": "เปิด",
-        "delete": "ลบ",
-        "color_change": "เปลี่ยนสี",
-        "refresh": "รีเฟรช",
-        "preview": "แสดงตัวอย่าง:",
-        "id": "ID",
-        "date": "วันที่",
-        "content": "เนื้อหา",
-        "status": "สถานะ",
-        "status_open": "เปิดอยู่",
-        "status_closed": "ปิดแล้ว",
-        "status_ready": "พร้อม",
-        "status_created": "สร้างโน้ตแล้ว (ID: {})",
-        "status_editing": "กำลังแก้ไขโน้ต (ID: {})",
-        "status_deleted": "ลบโน้ตแล้ว (ID: {})",
-        "status_color_changed": "เปลี่ยนสีโน้ตแล้ว (ID: {})",
-        "status_loaded": "โหลดโน้ต {} รายการแล้ว",
-        "status_saved": "บันทึกโน้ต {} รายการแล้ว",
-        "status_load_failed": "โหลดโน้ตไม่สำเร็จ",
-        "status_save_failed": "บันทึกโน้ตไม่สำเร็จ",
-        "status_new_file": "กำลังสร้างไฟล์ข้อมูลใหม่",
-        "msg_select_note_to_open": "กรุณาเลือกโน้ตที่จะเปิด",
-        "msg_select_note_to_delete": "กรุณาเลือกโน้ตที่จะลบ",
-        "msg_select_note_for_color": "กรุณาเลือกโน้ตเพื่อเปลี่ยนสี",
-        "msg_confirm_delete": "คุณแน่ใจหรือไม่ว่าต้องการลบโน้ตที่เลือก?\nการกระทำนี้ไม่สามารถยกเลิกได้",
-        "msg_error_note_data": "ไม่สามารถดึงข้อมูลโน้ตได้",
-        "msg_empty_content": "(ไม่มีเนื้อหา)",
-        "confirm": "ยืนยัน",
-        "info": "ข้อมูล",
-        "error": "ข้อผิดพลาด",
-        "close": "ปิด",
-        "settings_menu": "เมนู",
-        "change_color": "เปลี่ยนสี"
-    },
-    "vi": {
-        "language_name": "Tiếng Việt",
-        "app_title": "Trình Quản Lý Ghi Chú Dán",
-        "all_notes": "Tất Cả Ghi Chú",
-        "settings": "Cài Đặt",
-        "language": "Ngôn Ngữ",
-        "search": "Tìm kiếm:",
-        "new_note": "Ghi Chú Mới",
-        "open": "Mở",
-        "delete": "Xóa",
-        "color_change": "Đổi Màu",
-        "refresh": "Làm Mới",
-        "preview": "Xem Trước:",
-        "id": "ID",
-        "date": "Ngày",
-        "content": "Nội Dung",
-        "status": "Trạng Thái",
-        "status_open": "Đang Mở",
-        "status_closed": "Đã Đóng",
-        "status_ready": "Sẵn Sàng",
-        "status_created": "Đã tạo ghi chú (ID: {})",
-        "status_editing": "Đang chỉnh sửa ghi chú (ID: {})",
-        "status_deleted": "Đã xóa ghi chú (ID: {})",
-        "status_color_changed": "Đã đổi màu ghi chú (ID: {})",
-        "status_loaded": "Đã tải {} ghi chú",
-        "status_saved": "Đã lưu {} ghi chú",
-        "status_load_failed": "Tải ghi chú thất bại",
-        "status_save_failed": "Lưu ghi chú thất bại",
-        "status_new_file": "Đang tạo tệp dữ liệu mới",
-        "msg_select_note_to_open": "Vui lòng chọn ghi chú để mở.",
-        "msg_select_note_to_delete": "Vui lòng chọn ghi chú để xóa.",
-        "msg_select_note_for_color": "Vui lòng chọn ghi chú để đổi màu.",
-        "msg_confirm_delete": "Bạn có chắc chắn muốn xóa ghi chú đã chọn không?\nHành động này không thể hoàn tác.",
-        "msg_error_note_data": "Không thể lấy dữ liệu ghi chú.",
-        "msg_empty_content": "(không có nội dung)",
-        "confirm": "Xác Nhận",
-        "info": "Thông Tin",
-        "error": "Lỗi",
-        "close": "Đóng",
-        "settings_menu": "Menu",
-        "change_color": "Đổi Màu"
-    },
-    "da": {
-        "language_name": "Dansk",
-        "app_title": "Klæbende Noter Manager",
-        "all_notes": "Alle Noter",
-        "settings": "Indstillinger",
-        "language": "Sprog",
-        "search": "Søg:",
-        "new_note": "Ny Note",
-        "open": "Åbn",
-        "delete": "Slet",
-        "color_change": "Skift Farve",
-        "refresh": "Opdater",
-        "preview": "Forhåndsvisning:",
-        "id": "ID",
-        "date": "Dato",
-        "content": "Indhold",
-        "status": "Status",
-        "status_open": "Åben",
-        "status_closed": "Lukket",
-        "status_ready": "Klar",
-        "status_created": "Note oprettet (ID: {})",
-        "status_editing": "Redigerer note (ID: {})",
-        "status_deleted": "Note slettet (ID: {})",
-        "status_color_changed": "Note farve ændret (ID: {})",
-        "status_loaded": "Indlæste {} noter",
-        "status_saved": "Gemte {} noter",
-        "status_load_failed": "Kunne ikke indlæse noter",
-        "status_save_failed": "Kunne ikke gemme noter",
-        "status_new_file": "Opretter ny datafil",
-        "msg_select_note_to_open": "Vælg en note at åbne.",
-        "msg_select_note_to_delete": "Vælg en note at slette.",
-        "msg_select_note_for_color": "Vælg en note til at ændre farve.",
-        "msg_confirm_delete": "Er du sikker på, at du vil slette den valgte note?\nDenne handling kan ikke fortrydes.",
-        "msg_error_note_data": "Kunne ikke hente note data.",
-        "msg_empty_content": "(intet indhold)",
-        "confirm": "Bekræft",
-        "info": "Information",
-        "error": "Fejl",
-        "close": "Luk",
-        "settings_menu": "Menu",
-        "change_color": "Skift Farve"
-    },
-    "no": {
-        "language_name": "Norsk",
-        "app_title": "Klistrelapp Administrator",
-        "all_notes": "Alle Notater",
-        "settings": "Innstillinger",
-        "language": "Språk",
-        "search": "Søk:",
-        "new_note": "Nytt Notat",
-        "open": "Åpne",
-        "delete": "Slett",
-        "color_change": "Endre Farge",
-        "refresh": "Oppdater",
-        "preview": "Forhåndsvisning:",
-        "id": "ID",
-        "date": "Dato",
-        "content": "Innhold",
-        "status": "Status",
-        "status_open": "Åpen",
-        "status_closed": "Lukket",
-        "status_ready": "Klar",
-        "status_created": "Notat opprettet (ID: {})",
-        "status_editing": "Redigerer notat (ID: {})",
-        "status_deleted": "Notat slettet (ID: {})",
-        "status_color_changed": "Notat farge endret (ID: {})",
-        "status_loaded": "Lastet inn {} notater",
-        "status_saved": "Lagret {} notater",
-        "status_load_failed": "Kunne ikke laste inn notater",
-        "status_save_failed": "Kunne ikke lagre notater",
-        "status_new_file": "Oppretter ny datafil",
-        "msg_select_note_to_open": "Velg et notat å åpne.",
-        "msg_select_note_to_delete": "Velg et notat å slette.",
-        "msg_select_note_for_color": "Velg et notat for å endre farge.",
-        "msg_confirm_delete": "Er du sikker på at du vil slette det valgte notatet?\nDenne handlingen kan ikke angres.",
-        "msg_error_note_data": "Kunne ikke hente notat data.",
-        "msg_empty_content": "(intet innhold)",
-        "confirm": "Bekreft",
-        "info": "Informasjon",
-        "error": "Feil",
-        "close": "Lukk",
-        "settings_menu": "Meny",
-        "change_color": "Endre Farge"
-    },
-    "fi": {
-        "language_name": "Suomi",
-        "app_title": "Tarralappu Hallinta",
-        "all_notes": "Kaikki Muistiinpanot",
-        "settings": "Asetukset",
-        "language": "Kieli",
-        "search": "Etsi:",
-        "new_note": "Uusi Muistiinpano",
-        "open": "Avaa",
-        "delete": "Poista",
-        "color_change": "Vaihda Väri",
-        "refresh": "Päivitä",
-        "preview": "Esikatselu:",
-        "id": "ID",
-        "date": "Päivämäärä",
-        "content": "Sisältö",
-        "status": "Tila",
-        "status_open": "Avoinna",
-        "status_closed": "Suljettu",
-        "status_ready": "Valmis",
-        "status_created": "Muistiinpano luotu (ID: {})",
-        "status_editing": "Muokataan muistiinpanoa (ID: {})",
-        "status_deleted": "Muistiinpano poistettu (ID: {})",
-        "status_color_changed": "Muistiinpanon väri vaihdettu (ID: {})",
-        "status_loaded": "Ladattiin {} muistiinpanoa",
-        "status_saved": "Tallennettiin {} muistiinpanoa",
-        "status_load_failed": "Muistiinpanojen lataus epäonnistui",
-        "status_save_failed": "Muistiinpanojen tallennus epäonnistui",
-        "status_new_file": "Luodaan uusi datatiedosto",
-        "msg_select_note_to_open": "Valitse avattava muistiinpano.",
-        "msg_select_note_to_delete": "Valitse poistettava muistiinpano.",
-        "msg_select_note_for_color": "Valitse muistiinpano värin vaihtamiseksi.",
-        "msg_confirm_delete": "Oletko varma että haluat poistaa valitun muistiinpanon?\nTätä toimintoa ei voi perua.",
-        "msg_error_note_data": "Muistiinpanon tietojen hakeminen epäonnistui.",
-        "msg_empty_content": "(ei sisältöä)",
-        "confirm": "Vahvista",
-        "info": "Tiedot",
-        "error": "Virhe",
-        "close": "Sulje",
-        "settings_menu": "Valikko",
-        "change_color": "Vaihda Väri"
-    },
-    "cs": {
-        "language_name": "Čeština",
-        "app_title": "Správce Lepících Poznámek",
-        "all_notes": "Všechny Poznámky",
-        "settings": "Nastavení",
-        "language": "Jazyk",
-        "search": "Hledat:",
-        "new_note": "Nová Poznámka",
-        "open": "Otevřít",
-        "delete": "Smazat",
-        "color_change": "Změnit Barvu",
-        "refresh": "Obnovit",
-        "preview": "Náhled:",
-        "id": "ID",
-        "date": "Datum",
-        "content": "Obsah",
-        "status": "Stav",
-        "status_open": "Otevřená",
-        "status_closed": "Zavřená",
-        "status_ready": "Připraveno",
-        "status_created": "Poznámka vytvořena (ID: {})",
-        "status_editing": "Úprava poznámky (ID: {})",
-        "status_deleted": "Poznámka smazána (ID: {})",
-        "status_color_changed": "Barva poznámky změněna (ID: {})",
-        "status_loaded": "Načteno {} poznámek",
-        "status_saved": "Uloženo {} poznámek",
-        "status_load_failed": "Načítání poznámek selhalo",
-        "status_save_failed": "Ukládání poznámek selhalo",
-        "status_new_file": "Vytváření nového datového souboru",
-        "msg_select_note_to_open": "Vyberte poznámku k otevření.",
-        "msg_select_note_to_delete": "Vyberte poznámku ke smazání.",
-        "msg_select_note_for_color": "Vyberte poznámku pro změnu barvy.",
-        "msg_confirm_delete": "Opravdu chcete smazat vybranou poznámku?\nTuto akci nelze vrátit zpět.",
-        "msg_error_note_data": "Nepodařilo se získat data poznámky.",
-        "msg_empty_content": "(žádný obsah)",
-        "confirm": "Potvrdit",
-        "info": "Informace",
-        "error": "Chyba",
-        "close": "Zavřít",
-        "settings_menu": "Menu",
-        "change_color": "Změnit Barvu"
-    },
-    "hu": {
-        "language_name": "Magyar",
-        "app_title": "Öntapadó Jegyzet Kezelő",
-        "all_notes": "Összes Jegyzet",
-        "settings": "Beállítások",
-        "language": "Nyelv",
-        "search": "Keresés:",
-        "new_note": "Új Jegyzet",
-        "open": "Megnyitás",
-        "delete": "Törlés",
-        "color_change": "Szín Változtatás",
-        "refresh": "Frissítés",
-        "preview": "Előnézet:",
-        "id": "ID",
-        "date": "Dátum",
-        "content": "Tartalom",
-        "status": "Állapot",
-        "status_open": "Nyitva",
-        "status_closed": "Zárva",
-        "status_ready": "Kész",
-        "status_created": "Jegyzet létrehozva (ID: {})",
-        "status_editing": "Jegyzet szerkesztése (ID: {})",
-        "status_deleted": "Jegyzet törölve (ID: {})",
-        "status_color_changed": "Jegyzet színe megváltoztatva (ID: {})",
-        "status_loaded": "{} jegyzet betöltve",
-        "status_saved": "{} jegyzet mentve",
-        "status_load_failed": "Jegyzetek betöltése sikertelen",
-        "status_save_failed": "Jegyzetek mentése sikertelen",
-        "status_new_file": "Új adatfájl létrehozása",
-        "msg_select_note_to_open": "Válasszon egy jegyzetet a megnyitáshoz.",
-        "msg_select_note_to_delete": "Válasszon egy jegyzetet a törléshez.",
-        "msg_select_note_for_color": "Válasszon egy jegyzetet a szín változtatásához.",
-        "msg_confirm_delete": "Biztosan törölni szeretné a kiválasztott jegyzetet?\nEz a művelet nem vonható vissza.",
-        "msg_error_note_data": "Jegyzetek adatainak lekérése sikertelen.",
-        "msg_empty_content": "(nincs tartalom)",
-        "confirm": "Megerősítés",
-        "info": "Információ",
-        "error": "Hiba",
-        "close": "Bezárás",
-        "settings_menu": "Menü",
-        "change_color": "Szín Változtatás"
-    }
+翻訳テーブルは utils/locales/<言語コード>.py に言語ごとに分割されており、
+初めて使われたときに読み込まれる。読み込み時にデフォルト言語とマージした
+1つの辞書に展開するので、翻訳の取得は1回の辞書参照で済む。
+"""
+import importlib
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, Optional, Tuple
+
+# 利用可能な言語と言語名（一覧表示のために翻訳テーブルを読み込まなくて済むよう保持）
+LANGUAGE_NAMES = {
+    "ja": "日本語",
+    "en": "English",
+    "fr": "Français",
+    "de": "Deutsch",
+    "zh": "中文",
+    "es": "Español",
+    "it": "Italiano",
+    "pt": "Português",
+    "ru": "Русский",
+    "ko": "한국어",
+    "ar": "العربية",
+    "hi": "हिन्दी",
+    "nl": "Nederlands",
+    "sv": "Svenska",
+    "tr": "Türkçe",
+    "pl": "Polski",
+    "th": "ไทย",
+    "vi": "Tiếng Việt",
+    "da": "Dansk",
+    "no": "Norsk",
+    "fi": "Suomi",
+    "cs": "Čeština",
+    "hu": "Magyar"
 }
 
 # 利用可能な言語のリスト
-AVAILABLE_LANGUAGES = list(TRANSLATIONS.keys())
+AVAILABLE_LANGUAGES = list(LANGUAGE_NAMES.keys())
 
 # デフォルト言語
 DEFAULT_LANGUAGE = "ja"
 
-def get_translation(key: str, language: str = DEFAULT_LANGUAGE, *args) -> str:
-    """翻訳文字列を取得"""
-    if language not in TRANSLATIONS:
+# フォールバック込みで展開済みの翻訳テーブル（言語コード -> 辞書）
+_compiled_tables: Dict[str, Dict[str, str]] = {}
+
+
+def _load_locale(language: str) -> Dict[str, str]:
+    """言語モジュールから翻訳テーブルを読み込み"""
+    module = importlib.import_module(f"utils.locales.{language}")
+    return module.TRANSLATIONS
+
+
+def get_translation_table(language: str = DEFAULT_LANGUAGE) -> Dict[str, str]:
+    """デフォルト言語でフォールバック済みの翻訳テーブルを取得"""
+    if language not in LANGUAGE_NAMES:
         language = DEFAULT_LANGUAGE
     
-    translation = TRANSLATIONS[language].get(key, TRANSLATIONS[DEFAULT_LANGUAGE].get(key, key))
+    table = _compiled_tables.get(language)
+    if table is None:
+        table = dict(_load_locale(DEFAULT_LANGUAGE))
+        if language != DEFAULT_LANGUAGE:
+            table.update(_load_locale(language))
+        _compiled_tables[language] = table
+    return table
+
+
+@lru_cache(maxsize=None)
+def _compile_template(template: str) -> Optional[Tuple[str, ...]]:
+    """'{}'のみを含むテンプレートをリテラル部分に分解（それ以外はNone）"""
+    literals = []
+    current = ""
+    try:
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            current += literal
+            if field_name is None:
+                continue
+            if field_name or format_spec or conversion:
+                return None
+            literals.append(current)
+            current = ""
+    except ValueError:
+        return None
+    
+    literals.append(current)
+    return tuple(literals)
+
+
+def _format_template(template: str, args: tuple) -> str:
+    """キャッシュ済みのテンプレートで文字列を組み立て"""
+    literals = _compile_template(template)
+    if literals is None:
+        return template.format(*args)
+    if len(args) < len(literals) - 1:
+        raise IndexError("not enough format arguments")
+    
+    parts = [literals[0]]
+    for arg, literal in zip(args, literals[1:]):
+        parts.append(str(arg))
+        parts.append(literal)
+    return "".join(parts)
+
+
+def get_translation(key: str, language: str = DEFAULT_LANGUAGE, *args) -> str:
+    """翻訳文字列を取得"""
+    table = _compiled_tables.get(language) or get_translation_table(language)
+    translation = table.get(key, key)
     
     # フォーマット引数がある場合
     if args:
         try:
-            return translation.format(*args)
+            return _format_template(translation, args)
         except (IndexError, ValueError):
             return translation
     
     return translation
 
+
 def get_language_name(language_code: str) -> str:
     """言語コードから言語名を取得"""
-    return TRANSLATIONS.get(language_code, {}).get("language_name", language_code)
+    return LANGUAGE_NAMES.get(language_code, language_code)
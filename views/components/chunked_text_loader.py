@@ -0,0 +1,66 @@
+"""テキスト分割挿入コンポーネント"""
+import tkinter as tk
+from typing import Callable, Optional
+from utils.constants import TEXT_INSERT_CHUNK_SIZE, TEXT_INSERT_CHUNK_DELAY
+
+
+class ChunkedTextLoader:
+    """大きな文字列をafter()で少しずつTextウィジェットへ挿入するローダー"""
+    
+    def __init__(self, text_widget: tk.Text, chunk_size: int = TEXT_INSERT_CHUNK_SIZE,
+                 delay: int = TEXT_INSERT_CHUNK_DELAY):
+        self.text_widget = text_widget
+        self.chunk_size = chunk_size
+        self.delay = delay
+        self._job: Optional[str] = None
+        self._text = ""
+        self._offset = 0
+        self._on_complete: Optional[Callable[[], None]] = None
+    
+    @property
+    def is_loading(self) -> bool:
+        """挿入中かどうか"""
+        return self._job is not None
+    
+    def start(self, text: str, offset: int = 0, on_complete: Optional[Callable[[], None]] = None) -> None:
+        """text[offset:]の末尾への分割挿入を開始"""
+        self.cancel()
+        self._text = text
+        self._offset = offset
+        self._on_complete = on_complete
+        self._job = self.text_widget.after_idle(self._insert_next_chunk)
+    
+    def cancel(self) -> None:
+        """挿入を中断"""
+        if self._job is not None:
+            try:
+                self.text_widget.after_cancel(self._job)
+            except tk.TclError:
+                pass
+            self._job = None
+        self._text = ""
+        self._on_complete = None
+    
+    def _insert_next_chunk(self) -> None:
+        """次のチャンクを挿入"""
+        self._job = None
+        if not self.text_widget.winfo_exists():
+            return
+        
+        end = self._offset + self.chunk_size
+        
+        # disabled状態のウィジェットにも挿入できるよう一時的にnormalにする
+        previous_state = self.text_widget.cget("state")
+        self.text_widget.config(state="normal")
+        self.text_widget.insert(tk.END, self._text[self._offset:end])
+        self.text_widget.config(state=previous_state)
+        self._offset = end
+        
+        if self._offset < len(self._text):
+            self._job = self.text_widget.after(self.delay, self._insert_next_chunk)
+        else:
+            on_complete = self._on_complete
+            self._text = ""
+            self._on_complete = None
+            if on_complete:
+                on_complete()
@@ -0,0 +1,70 @@
+"""コンテキストメニューキャッシュ"""
+import tkinter as tk
+from typing import Callable, Dict, Tuple
+from services.language_service import get_language_service
+
+
+class ContextMenuCache:
+    """言語ごとにコンテキストメニューを保持し、ウィンドウ間で共有するキャッシュ"""
+    
+    def __init__(self):
+        self.language_service = get_language_service()
+        self._menus: Dict[Tuple[str, str], tk.Menu] = {}
+        self._targets: Dict[str, tk.Misc] = {}
+        
+        # 言語が変わったときだけメニューを作り直す
+        self.language_service.add_language_changed_listener(self._on_language_changed)
+    
+    def popup(self, name: str, target: tk.Misc, builder: Callable[[tk.Menu], None],
+              x: int, y: int) -> None:
+        """メニューを取得して指定位置に表示"""
+        menu = self.get_menu(name, target, builder)
+        self._targets[name] = target
+        try:
+            menu.tk_popup(x, y)
+        finally:
+            menu.grab_release()
+    
+    def get_menu(self, name: str, target: tk.Misc, builder: Callable[[tk.Menu], None]) -> tk.Menu:
+        """現在の言語のメニューを取得（なければ作成）"""
+        key = (name, self.language_service.get_current_language())
+        menu = self._menus.get(key)
+        if menu is None or not menu.winfo_exists():
+            # 個々のウィンドウより長く生きるようルートウィンドウを親にする
+            menu = tk.Menu(target.nametowidget("."), tearoff=0)
+            builder(menu)
+            self._menus[key] = menu
+        return menu
+    
+    def command(self, name: str, method_name: str) -> Callable[[], None]:
+        """メニューを最後に表示した対象のメソッドを呼び出すコマンドを作成"""
+        def invoke() -> None:
+            target = self._targets.get(name)
+            if target is not None and target.winfo_exists():
+                getattr(target, method_name)()
+        return invoke
+    
+    def clear(self) -> None:
+        """キャッシュ済みのメニューをすべて破棄"""
+        for menu in self._menus.values():
+            try:
+                if menu.winfo_exists():
+                    menu.destroy()
+            except tk.TclError:
+                pass
+        self._menus.clear()
+    
+    def _on_language_changed(self, language_code: str) -> None:
+        """言語が変更されたとき"""
+        self.clear()
+
+
+# グローバルインスタンス
+_context_menu_cache = None
+
+def get_context_menu_cache() -> ContextMenuCache:
+    """コンテキストメニューキャッシュのシングルトンインスタンスを取得"""
+    global _context_menu_cache
+    if _context_menu_cache is None:
+        _context_menu_cache = ContextMenuCache()
+    return _context_menu_cache
@@ -0,0 +1,138 @@
+"""診断パネルコンポーネント - 処理ごとの所要時間と回数を表示する"""
+import tkinter as tk
+from tkinter import ttk
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from services.language_service import get_language_service
+from services.settings_service import get_settings_service
+from services.ui_service import UIService
+from views.components.translation_registry import get_translation_registry
+from utils.metrics import get_metrics
+from utils.constants import (
+    TOOLBAR_PADDING, DIAGNOSTICS_REFRESH_INTERVAL, METRICS_ENABLED_DEFAULT, SETTING_DIAGNOSTICS_ENABLED
+)
+
+_COLUMNS = ("count", "mean", "p50", "p95", "max")
+# 列 -> 見出しの翻訳キー
+_HEADING_KEYS: Dict[str, str] = {"count": "diagnostics_count", "mean": "diagnostics_mean",
+                                 "p50": "diagnostics_p50", "p95": "diagnostics_p95", "max": "diagnostics_max"}
+
+
+class DiagnosticsPanelComponent:
+    """計測結果の一覧（表示している間は一定間隔で更新）"""
+    
+    def __init__(self, parent: tk.Widget):
+        self.parent = parent
+        self.language_service = get_language_service()
+        self.settings_service = get_settings_service()
+        self.enabled_var = tk.BooleanVar(
+            value=bool(self.settings_service.get(SETTING_DIAGNOSTICS_ENABLED, METRICS_ENABLED_DEFAULT)))
+        self._rows: Dict[str, Tuple[str, ...]] = {}  # 表示中の行（iidは計測名）-> 表示している値
+        self._refresh_job: Optional[str] = None
+        self._create_widgets()
+        self._register_translations()
+    
+    def _create_widgets(self) -> None:
+        """ウィジェットを作成"""
+        translate = self.language_service.translate
+        toolbar_frame = ttk.Frame(self.parent)
+        toolbar_frame.pack(fill=tk.X, padx=TOOLBAR_PADDING, pady=TOOLBAR_PADDING)
+        
+        self.enabled_check = ttk.Checkbutton(toolbar_frame, text=translate("diagnostics_enabled"),
+                                             variable=self.enabled_var, command=self._on_enabled_toggled)
+        self.enabled_check.pack(side=tk.LEFT, padx=2)
+        
+        self.export_button = ttk.Button(toolbar_frame, text=translate("diagnostics_export"),
+                                        command=self._on_export_clicked)
+        self.export_button.pack(side=tk.RIGHT, padx=2)
+        
+        self.reset_button = ttk.Button(toolbar_frame, text=translate("diagnostics_reset"),
+                                       command=self._on_reset_clicked)
+        self.reset_button.pack(side=tk.RIGHT, padx=2)
+        
+        # 一覧（所要時間はミリ秒。回数だけの項目は回数の列だけを表示）
+        list_view_frame = ttk.Frame(self.parent)
+        list_view_frame.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
+        
+        self.tree = ttk.Treeview(list_view_frame, columns=_COLUMNS, show="tree headings", selectmode="browse")
+        self.tree.column("#0", width=240, stretch=tk.YES)
+        for column in _COLUMNS:
+            self.tree.column(column, width=70, anchor="e", stretch=tk.NO)
+        self._update_headings()
+        
+        scrollbar = ttk.Scrollbar(list_view_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+        
+        self.status_label = ttk.Label(self.parent, anchor=tk.W)
+        self.status_label.pack(fill=tk.X, padx=5, pady=2)
+    
+    def _register_translations(self) -> None:
+        """言語変更時に更新するウィジェットを登録"""
+        registry = get_translation_registry()
+        registry.register(self.enabled_check, "diagnostics_enabled")
+        registry.register(self.export_button, "diagnostics_export")
+        registry.register(self.reset_button, "diagnostics_reset")
+        registry.register_updater(self.tree, self._update_headings)
+    
+    def _update_headings(self) -> None:
+        """見出しを現在の言語で表示"""
+        translate = self.language_service.translate
+        self.tree.heading("#0", text=translate("diagnostics_name"), anchor="w")
+        for column in _COLUMNS:
+            self.tree.heading(column, text=translate(_HEADING_KEYS[column]))
+    
+    def refresh(self) -> None:
+        """計測結果を表示し、表示している間は一定間隔で更新を続ける"""
+        if self._refresh_job is not None:
+            self.parent.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        if not self.parent.winfo_ismapped():
+            return
+        
+        metrics = get_metrics()
+        rows: Dict[str, Tuple[str, ...]] = {}
+        for name, summary in metrics.histograms():
+            rows[name] = (str(summary["count"]), f"{summary['mean_ms']:.2f}", f"{summary['p50_ms']:.2f}",
+                          f"{summary['p95_ms']:.2f}", f"{summary['max_ms']:.2f}")
+        for name, count in metrics.counters():
+            rows.setdefault(name, (str(count), "", "", "", ""))
+        
+        # 変わった行だけを書き換える
+        removed = [item for item in self._rows if item not in rows]
+        if removed:
+            self.tree.delete(*removed)
+        for index, name in enumerate(sorted(rows)):
+            values = rows[name]
+            current = self._rows.get(name)
+            if current is None:
+                self.tree.insert("", index, iid=name, text=name, values=values)
+            elif current != values:
+                self.tree.item(name, values=values)
+        self._rows = rows
+        
+        captured = datetime.now().strftime("%H:%M:%S")
+        self.status_label.configure(text=self.language_service.translate("diagnostics_updated", captured))
+        self._refresh_job = self.parent.after(DIAGNOSTICS_REFRESH_INTERVAL, self.refresh)
+    
+    def _on_enabled_toggled(self) -> None:
+        """計測の有効・無効が切り替えられたとき（設定の変更を受けてアプリケーションが切り替える）"""
+        self.settings_service.set(SETTING_DIAGNOSTICS_ENABLED, self.enabled_var.get())
+    
+    def _on_reset_clicked(self) -> None:
+        """リセットボタンがクリックされたとき"""
+        get_metrics().reset()
+        self.refresh()
+    
+    def _on_export_clicked(self) -> None:
+        """書き出しボタンがクリックされたとき（計測結果をJSONファイルに保存）"""
+        path = UIService.ask_save_json_path(f"free_sticky_diagnostics_{datetime.now():%Y%m%d_%H%M%S}.json")
+        if not path:
+            return
+        try:
+            get_metrics().export_json(path)
+        except OSError as e:
+            UIService.show_error(self.language_service.translate("msg_diagnostics_export_failed", e))
+            return
+        UIService.show_info(self.language_service.translate("msg_diagnostics_exported", path))
@@ -1,14 +1,21 @@
 """付箋リストコンポーネント"""
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 from models.note_model import NoteData
+from core.search import note_matches
+from core.note_sort import NoteRow, NoteRowCache, SortedOrder, SORT_COLUMNS
 from services.language_service import get_language_service
+from utils.metrics import timed
+from views.components.translation_registry import get_translation_registry
 from utils.constants import (
     COLUMN_ID_WIDTH, COLUMN_DATE_WIDTH, COLUMN_PREVIEW_WIDTH, COLUMN_STATUS_WIDTH,
-    TEXT_PREVIEW_MAX_LENGTH
+    TEXT_PREVIEW_MAX_LENGTH, SORT_ASCENDING_MARK, SORT_DESCENDING_MARK
 )
 
+# 列 -> 見出しの翻訳キー
+_HEADING_KEYS: Dict[str, str] = {"id": "id", "date": "date", "preview": "content", "status": "status"}
+
 
 class NoteListComponent:
     """付箋リストを表示するコンポーネント"""
@@ -17,14 +24,24 @@ class NoteListComponent:
         self.parent = parent
         self.language_service = get_language_service()
         self.search_var = tk.StringVar()
+        self.show_archived_var = tk.BooleanVar(value=False)
+        self.include_cold_var = tk.BooleanVar(value=False)
         self.all_notes: List[NoteData] = []
+        self.cold_notes: List[NoteData] = []  # 検索対象に含めるアーカイブファイルの付箋
+        # 表示中の行（iidは付箋ID）-> 表示している値（変更のあった行だけを書き換えるために保持）
+        self._rows: Dict[str, Tuple[str, str, str, str]] = {}
+        # 付箋ごとの表示値と並べ替えキー（付箋が変わるまで使い回す）と、見出しのクリックで選んだ並び順
+        self._row_cache = NoteRowCache(self._format_row)
+        self.sort_order = SortedOrder()
         self._create_widgets()
         self._setup_events()
+        self._register_translations()
         
         # コールバック
         self.on_double_click: Optional[Callable[[str], None]] = None
         self.on_selection_change: Optional[Callable[[Optional[str]], None]] = None
         self.on_right_click: Optional[Callable[[tk.Event], None]] = None
+        self.on_include_cold_changed: Optional[Callable[[bool], None]] = None
     
     def _create_widgets(self) -> None:
         """ウィジェットを作成"""
@@ -42,19 +59,29 @@ class NoteListComponent:
                                 command=lambda: self.search_var.set(""))
         clear_button.pack(side=tk.RIGHT, padx=2)
         
+        self.show_archived_check = ttk.Checkbutton(search_frame, text=self.language_service.translate("show_archived"),
+                                                   variable=self.show_archived_var,
+                                                   command=self._filter_notes)
+        self.show_archived_check.pack(side=tk.RIGHT, padx=2)
+        
+        self.include_cold_check = ttk.Checkbutton(search_frame,
+                                                  text=self.language_service.translate("include_cold_archive"),
+                                                  variable=self.include_cold_var,
+                                                  command=self._on_include_cold_toggled)
+        self.include_cold_check.pack(side=tk.RIGHT, padx=2)
+        
         # リストビューフレーム
         list_view_frame = ttk.Frame(self.parent)
         list_view_frame.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
         
         # ツリービュー
         self.tree = ttk.Treeview(list_view_frame, columns=("id", "date", "preview", "status"), 
-                              show="headings", selectmode="browse")
+                              show="headings", selectmode="extended")
         
-        # カラム設定
-        self.tree.heading("id", text=self.language_service.translate("id"))
-        self.tree.heading("date", text=self.language_service.translate("date"))
-        self.tree.heading("preview", text=self.language_service.translate("content"))
-        self.tree.heading("status", text=self.language_service.translate("status"))
+        # カラム設定（見出しのクリックで並べ替え）
+        for column in SORT_COLUMNS:
+            self.tree.heading(column, command=lambda column=column: self.sort_by(column))
+        self._update_headings()
         
         self.tree.column("id", width=COLUMN_ID_WIDTH, minwidth=0, stretch=tk.NO)
         self.tree.column("date", width=COLUMN_DATE_WIDTH, anchor="w")
@@ -79,54 +106,129 @@ class NoteListComponent:
         self.tree.bind("<<TreeviewSelect>>", self._on_selection_change)
         self.tree.bind("<Button-3>", self._on_right_click)
     
+    def _register_translations(self) -> None:
+        """言語変更時に更新するウィジェットを登録"""
+        registry = get_translation_registry()
+        registry.register(self.search_label, "search")
+        registry.register(self.show_archived_check, "show_archived")
+        registry.register(self.include_cold_check, "include_cold_archive")
+        registry.register_updater(self.tree, self.update_language)
+    
     def update_language(self) -> None:
-        """UI言語を更新"""
-        self.search_label.configure(text=self.language_service.translate("search"))
-        
-        # カラムヘッダーを更新
-        self.tree.heading("id", text=self.language_service.translate("id"))
-        self.tree.heading("date", text=self.language_service.translate("date"))
-        self.tree.heading("preview", text=self.language_service.translate("content"))
-        self.tree.heading("status", text=self.language_service.translate("status"))
+        """カラムヘッダーと状態列を現在の言語で更新（状態列で並べ替えている場合を除き、リストの再フィルタは行わない）"""
+        self._update_headings()
+        self._row_cache.clear()
+        if self.sort_order.column == "status":
+            self._filter_notes()
+            return
         
-        # リストを再表示して状態テキストを更新
-        self._filter_notes()
+        notes_by_id = {note.id: note for note in self.all_notes}
+        cold_ids = {note.id for note in self.cold_notes}
+        notes_by_id.update((note.id, note) for note in self.cold_notes)
+        for item, values in self._rows.items():
+            note = notes_by_id.get(item)
+            if note is None:
+                continue
+            status = self._status_text(note, item in cold_ids)
+            if status != values[3]:
+                self._rows[item] = values[:3] + (status,)
+                self.tree.set(item, "status", status)
     
     def set_notes(self, notes: List[NoteData]) -> None:
         """付箋リストを設定"""
         self.all_notes = notes
         self._filter_notes()
     
+    def set_cold_notes(self, notes: List[NoteData]) -> None:
+        """検索対象に含めるアーカイブファイルの付箋を設定"""
+        self.cold_notes = notes
+        self._filter_notes()
+    
     def refresh(self) -> None:
         """リストを更新"""
         self._filter_notes()
     
+    def sort_by(self, column: str) -> None:
+        """列で並べ替え（同じ列をもう一度選ぶと逆順）"""
+        self.sort_order.toggle(column)
+        self._update_headings()
+        self._filter_notes()
+    
     def get_selected_note_id(self) -> Optional[str]:
         """選択された付箋のIDを取得"""
         selected = self.tree.selection()
         if selected:
-            item_id = selected[0]
-            return self.tree.item(item_id, "values")[0]
+            return selected[0]
         return None
     
+    def get_selected_note_ids(self) -> List[str]:
+        """選択されたすべての付箋のIDを表示順に取得"""
+        return list(self.tree.selection())
+    
+    @timed("view.filter_notes")
     def _filter_notes(self) -> None:
-        """検索条件でフィルタリング"""
+        """検索条件でフィルタリング（前回の表示との差分だけをツリービューに反映）"""
         search_text = self.search_var.get().lower()
+        show_archived = self.show_archived_var.get()
+        
+        get_row = self._row_cache.get
+        visible: Dict[str, NoteRow] = {note.id: get_row(note) for note in self.all_notes
+                                       if (show_archived or not note.archived) and note_matches(note, search_text)}
+        if self.include_cold_var.get():
+            for note in self.cold_notes:
+                if note.id not in visible and (show_archived or not note.archived) and note_matches(note, search_text):
+                    visible[note.id] = get_row(note, True)
+        if len(self._row_cache) > 2 * (len(self.all_notes) + len(self.cold_notes)):
+            self._row_cache.retain({note.id for note in self.all_notes} | {note.id for note in self.cold_notes})
+        
+        order = self.sort_order.update(visible)
+        rows = {note_id: visible[note_id].values for note_id in order}
+        
+        # 表示されなくなった行を削除
+        removed = [item for item in self._rows if item not in rows]
+        if removed:
+            self.tree.delete(*removed)
+        
+        # 追加された行を挿入し、内容が変わった行だけを書き換える
+        for index, (note_id, values) in enumerate(rows.items()):
+            current = self._rows.get(note_id)
+            if current is None:
+                self.tree.insert("", index, iid=note_id, values=values)
+            elif current != values:
+                self.tree.item(note_id, values=values)
+        self._rows = rows
         
-        # ツリービューをクリア
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # フィルタリングして表示
-        for note in self.all_notes:
-            if (search_text in note.id.lower() or 
-                search_text in note.text.lower()):
-                
-                date_display = note.get_formatted_date()
-                preview = note.get_preview_text(TEXT_PREVIEW_MAX_LENGTH)
-                status = note.get_status_text(self.language_service)
-                
-                self.tree.insert("", "end", values=(note.id, date_display, preview, status))
+        # 並び順が変わった場合だけ並べ替える
+        order = tuple(rows)
+        if self.tree.get_children() != order:
+            for index, item in enumerate(order):
+                self.tree.move(item, "", index)
+    
+    def _format_row(self, note: NoteData, is_cold: bool) -> Tuple[str, str, str, str]:
+        """一覧の1行の表示値"""
+        return (note.id, note.get_formatted_date(), note.get_preview_text(TEXT_PREVIEW_MAX_LENGTH),
+                self._status_text(note, is_cold))
+    
+    def _update_headings(self) -> None:
+        """見出しを現在の言語で表示し、並べ替えている列に向きの印を付ける"""
+        for column in SORT_COLUMNS:
+            text = self.language_service.translate(_HEADING_KEYS[column])
+            if column == self.sort_order.column:
+                text += SORT_DESCENDING_MARK if self.sort_order.descending else SORT_ASCENDING_MARK
+            self.tree.heading(column, text=text)
+    
+    def _status_text(self, note: NoteData, is_cold: bool) -> str:
+        """状態列の表示（アーカイブファイルの付箋はその旨を表示）"""
+        if is_cold:
+            return self.language_service.translate("status_cold_archived")
+        return note.get_status_text(self.language_service)
+    
+    def _on_include_cold_toggled(self) -> None:
+        """アーカイブファイルも検索するかが切り替えられたとき"""
+        if self.on_include_cold_changed:
+            self.on_include_cold_changed(self.include_cold_var.get())
+        else:
+            self._filter_notes()
     
     def _on_double_click(self, event: tk.Event) -> None:
         """ダブルクリックイベント"""
@@ -142,9 +244,10 @@ class NoteListComponent:
     
     def _on_right_click(self, event: tk.Event) -> None:
         """右クリックイベント"""
-        # 右クリックした項目を選択
+        # 選択範囲の外を右クリックした場合だけ、その項目を選択し直す
         item = self.tree.identify_row(event.y)
         if item:
-            self.tree.selection_set(item)
+            if item not in self.tree.selection():
+                self.tree.selection_set(item)
             if self.on_right_click:
                 self.on_right_click(event)
@@ -4,7 +4,9 @@ from tkinter import ttk
 from typing import Optional
 from models.note_model import NoteData
 from services.language_service import get_language_service
-from utils.constants import DEFAULT_FONT, HEADER_FONT, PREVIEW_HEIGHT
+from views.components.chunked_text_loader import ChunkedTextLoader
+from views.components.translation_registry import get_translation_registry
+from utils.constants import DEFAULT_FONT, HEADER_FONT, PREVIEW_HEIGHT, PREVIEW_MAX_CHARS
 
 
 class PreviewPanelComponent:
@@ -13,31 +15,54 @@ class PreviewPanelComponent:
     def __init__(self, parent: tk.Widget):
         self.parent = parent
         self.language_service = get_language_service()
+        self._current_note: Optional[NoteData] = None
         self._create_widgets()
+        get_translation_registry().register_updater(self.preview_label, self.update_language)
     
     def _create_widgets(self) -> None:
         """ウィジェットを作成"""
+        # ヘッダーフレーム
+        header_frame = ttk.Frame(self.parent)
+        header_frame.pack(fill=tk.X)
+        
         # プレビューラベル
-        self.preview_label = ttk.Label(self.parent, text=self.language_service.translate("preview"), font=HEADER_FONT)
-        self.preview_label.pack(anchor="w", padx=5, pady=2)
+        self.preview_label = ttk.Label(header_frame, text=self.language_service.translate("preview"), font=HEADER_FONT)
+        self.preview_label.pack(side=tk.LEFT, anchor="w", padx=5, pady=2)
+        
+        # 全文表示ボタン（プレビューが切り詰められたときだけ表示）
+        self.show_all_button = ttk.Button(header_frame, command=self._on_show_all_clicked)
         
         # プレビューテキスト
         self.preview_text = tk.Text(self.parent, wrap=tk.WORD, height=PREVIEW_HEIGHT, 
                                   font=DEFAULT_FONT, state="disabled")
         self.preview_text.pack(expand=True, fill=tk.BOTH, padx=5, pady=2)
+        self.text_loader = ChunkedTextLoader(self.preview_text)
     
     def update_language(self) -> None:
         """UI言語を更新"""
         self.preview_label.configure(text=self.language_service.translate("preview"))
+        if self._current_note:
+            self.show_all_button.configure(
+                text=self.language_service.translate("show_all", len(self._current_note.text)))
     
     def update_preview(self, note: Optional[NoteData]) -> None:
         """プレビューを更新"""
+        self.text_loader.cancel()
+        self.show_all_button.pack_forget()
+        self._current_note = None
+        
         self.preview_text.config(state="normal")
         self.preview_text.delete("1.0", tk.END)
         
         if note:
-            self.preview_text.insert("1.0", note.text)
+            # 長い本文は先頭だけを表示し、残りは要求されたときに読み込む
+            self.preview_text.insert("1.0", note.text[:PREVIEW_MAX_CHARS])
             self.preview_text.config(bg=note.color)
+            if len(note.text) > PREVIEW_MAX_CHARS:
+                self._current_note = note
+                self.show_all_button.configure(
+                    text=self.language_service.translate("show_all", len(note.text)))
+                self.show_all_button.pack(side=tk.RIGHT, padx=5, pady=2)
         else:
             self.preview_text.config(bg="white")
         
@@ -46,3 +71,12 @@ class PreviewPanelComponent:
     def clear_preview(self) -> None:
         """プレビューをクリア"""
         self.update_preview(None)
+    
+    def _on_show_all_clicked(self) -> None:
+        """全文表示ボタンがクリックされたとき"""
+        note = self._current_note
+        if not note:
+            return
+        self._current_note = None
+        self.show_all_button.pack_forget()
+        self.text_loader.start(note.text, offset=PREVIEW_MAX_CHARS)
@@ -3,7 +3,9 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Optional, Callable
 from services.language_service import get_language_service
-from utils.constants import HEADER_FONT
+from services.settings_service import get_settings_service
+from views.components.translation_registry import get_translation_registry
+from utils.constants import HEADER_FONT, RPC_DEFAULT_PORT, SETTING_RPC_ENABLED, SETTING_RPC_PORT
 
 
 class SettingsPanelComponent:
@@ -12,10 +14,12 @@ class SettingsPanelComponent:
     def __init__(self, parent: tk.Widget):
         self.parent = parent
         self.language_service = get_language_service()
+        self.settings_service = get_settings_service()
         self.language_var = tk.StringVar()
+        self.rpc_enabled_var = tk.BooleanVar(value=bool(self.settings_service.get(SETTING_RPC_ENABLED, False)))
         self._create_widgets()
         self._setup_events()
-        self._update_interface()
+        self._register_translations()
         
         # 言語変更コールバック
         self.on_language_changed: Optional[Callable[[str], None]] = None
@@ -26,14 +30,14 @@ class SettingsPanelComponent:
     def _create_widgets(self) -> None:
         """ウィジェットを作成"""
         # 言語設定セクション
-        language_frame = ttk.LabelFrame(self.parent, text="Language / 言語")
-        language_frame.pack(fill=tk.X, padx=10, pady=10)
+        self.language_frame = ttk.LabelFrame(self.parent, text="Language / 言語")
+        self.language_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # 言語選択
-        language_label = ttk.Label(language_frame, text="Language:", font=HEADER_FONT)
-        language_label.pack(anchor="w", padx=10, pady=5)
+        self.language_label = ttk.Label(self.language_frame, text="Language:", font=HEADER_FONT)
+        self.language_label.pack(anchor="w", padx=10, pady=5)
         
-        self.language_combo = ttk.Combobox(language_frame, textvariable=self.language_var, 
+        self.language_combo = ttk.Combobox(self.language_frame, textvariable=self.language_var, 
                                          state="readonly", width=30)
         self.language_combo.pack(anchor="w", padx=10, pady=5)
         
@@ -47,6 +51,24 @@ class SettingsPanelComponent:
             if code == current_lang:
                 self.language_combo.current(i)
                 break
+        
+        # 自動化APIセクション
+        self.automation_frame = ttk.LabelFrame(self.parent, text=self.language_service.translate("automation_api"))
+        self.automation_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.rpc_check = ttk.Checkbutton(self.automation_frame, text=self._get_rpc_check_text(),
+                                         variable=self.rpc_enabled_var,
+                                         command=self._on_rpc_toggled)
+        self.rpc_check.pack(anchor="w", padx=10, pady=5)
+    
+    def _get_rpc_check_text(self) -> str:
+        """自動化APIのチェックボックスの表示文字列"""
+        port = self.settings_service.get(SETTING_RPC_PORT, RPC_DEFAULT_PORT)
+        return self.language_service.translate("enable_automation_api", port)
+    
+    def _on_rpc_toggled(self) -> None:
+        """自動化APIの有効・無効が切り替えられたとき"""
+        self.settings_service.set(SETTING_RPC_ENABLED, self.rpc_enabled_var.get())
     
     def _setup_events(self) -> None:
         """イベントを設定"""
@@ -63,28 +85,17 @@ class SettingsPanelComponent:
     
     def _on_language_changed(self, language_code: str) -> None:
         """言語が変更されたときのコールバック"""
-        self._update_interface()
         if self.on_language_changed:
             self.on_language_changed(language_code)
     
-    def _update_interface(self) -> None:
-        """インターフェース言語を更新"""
-        # ラベルテキストを更新
-        try:
-            # LabelFrameのテキストを更新 
-            for widget in self.parent.winfo_children():
-                if isinstance(widget, ttk.LabelFrame):
-                    widget.configure(text=f"{self.language_service.translate('language')} / Language")
-                    break
-            
-            # 言語ラベルを更新
-            for widget in self.parent.winfo_children():
-                if isinstance(widget, ttk.LabelFrame):
-                    for child in widget.winfo_children():
-                        if isinstance(child, ttk.Label):
-                            child.configure(text=f"{self.language_service.translate('language')}:")
-                            break
-                    break
-        except:
-            # エラーが発生した場合は無視
-            pass
+    def _register_translations(self) -> None:
+        """言語変更時に更新するウィジェットを登録し、現在の言語で表示"""
+        registry = get_translation_registry()
+        registry.register(self.language_frame, "language", template="{} / Language")
+        registry.register(self.language_label, "language", template="{}:")
+        registry.register(self.automation_frame, "automation_api")
+        registry.register_updater(self.rpc_check, lambda: self.rpc_check.configure(text=self._get_rpc_check_text()))
+        
+        translate = self.language_service.translate
+        self.language_frame.configure(text=f"{translate('language')} / Language")
+        self.language_label.configure(text=f"{translate('language')}:")
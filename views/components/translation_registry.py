@@ -0,0 +1,56 @@
+"""翻訳対象ウィジェットの登録簿"""
+import tkinter as tk
+from typing import Callable, Dict, List
+from services.language_service import get_language_service
+
+
+class TranslationRegistry:
+    """言語変更時に翻訳し直すウィジェットを保持し、一括で更新する登録簿"""
+    
+    def __init__(self):
+        self.language_service = get_language_service()
+        # トップレベルウィンドウのパス -> そのウィンドウに属する更新処理
+        self._updaters: Dict[str, List[Callable[[], None]]] = {}
+        self.language_service.add_language_changed_listener(self._on_language_changed)
+    
+    def register(self, widget: tk.Misc, key: str, option: str = "text", template: str = "{}") -> None:
+        """ウィジェットのオプションを翻訳キーに関連付けて登録"""
+        def update() -> None:
+            text = template.format(self.language_service.translate(key))
+            widget.configure(**{option: text})
+        
+        self.register_updater(widget, update)
+    
+    def register_updater(self, widget: tk.Misc, updater: Callable[[], None]) -> None:
+        """任意の更新処理を登録（ウィジェットの属するウィンドウ単位で管理）"""
+        owner = str(widget.winfo_toplevel())
+        self._updaters.setdefault(owner, []).append(updater)
+    
+    def unregister(self, window: tk.Misc) -> None:
+        """ウィンドウに属する登録をすべて削除"""
+        self._updaters.pop(str(window), None)
+    
+    def apply_all(self) -> None:
+        """登録されたすべてのウィンドウを現在の言語で一括更新"""
+        for owner, updaters in list(self._updaters.items()):
+            try:
+                for updater in updaters:
+                    updater()
+            except tk.TclError:
+                # 破棄済みのウィンドウは登録から外す
+                del self._updaters[owner]
+    
+    def _on_language_changed(self, language_code: str) -> None:
+        """言語が変更されたとき"""
+        self.apply_all()
+
+
+# グローバルインスタンス
+_translation_registry = None
+
+def get_translation_registry() -> TranslationRegistry:
+    """翻訳登録簿のシングルトンインスタンスを取得"""
+    global _translation_registry
+    if _translation_registry is None:
+        _translation_registry = TranslationRegistry()
+    return _translation_registry
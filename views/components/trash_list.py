@@ -0,0 +1,123 @@
+"""ごみ箱コンポーネント"""
+import tkinter as tk
+from tkinter import ttk
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from core.trash import TrashItem
+from services.language_service import get_language_service
+from views.components.translation_registry import get_translation_registry
+from utils.constants import (
+    DATE_FORMAT, TOOLBAR_PADDING, COLUMN_ID_WIDTH, COLUMN_DATE_WIDTH, COLUMN_PREVIEW_WIDTH,
+    TEXT_PREVIEW_MAX_LENGTH
+)
+
+
+class TrashListComponent:
+    """ごみ箱の付箋を表示し、元に戻す・完全に削除するコンポーネント"""
+    
+    def __init__(self, parent: tk.Widget):
+        self.parent = parent
+        self.language_service = get_language_service()
+        # 表示中の行（iidは付箋ID）-> 表示している値
+        self._rows: Dict[str, Tuple[str, str, str]] = {}
+        self._create_widgets()
+        self._register_translations()
+        
+        # コールバック
+        self.on_restore: Optional[Callable[[List[str]], None]] = None
+        self.on_purge: Optional[Callable[[List[str]], None]] = None
+        self.on_empty: Optional[Callable[[], None]] = None
+    
+    def _create_widgets(self) -> None:
+        """ウィジェットを作成"""
+        translate = self.language_service.translate
+        toolbar_frame = ttk.Frame(self.parent)
+        toolbar_frame.pack(fill=tk.X, padx=TOOLBAR_PADDING, pady=TOOLBAR_PADDING)
+        
+        self.restore_button = ttk.Button(toolbar_frame, text=translate("restore_from_trash"),
+                                         command=self._on_restore_clicked)
+        self.restore_button.pack(side=tk.LEFT, padx=2)
+        
+        self.purge_button = ttk.Button(toolbar_frame, text=translate("delete_permanently"),
+                                       command=self._on_purge_clicked)
+        self.purge_button.pack(side=tk.LEFT, padx=2)
+        
+        self.empty_button = ttk.Button(toolbar_frame, text=translate("empty_trash"), command=self._on_empty_clicked)
+        self.empty_button.pack(side=tk.RIGHT, padx=2)
+        
+        # リストビュー
+        list_view_frame = ttk.Frame(self.parent)
+        list_view_frame.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
+        
+        self.tree = ttk.Treeview(list_view_frame, columns=("id", "deleted_at", "preview"),
+                                 show="headings", selectmode="extended")
+        self.tree.heading("id", text=translate("id"))
+        self.tree.heading("deleted_at", text=translate("deleted_at"))
+        self.tree.heading("preview", text=translate("content"))
+        self.tree.column("id", width=COLUMN_ID_WIDTH, minwidth=0, stretch=tk.NO)
+        self.tree.column("deleted_at", width=COLUMN_DATE_WIDTH, anchor="w")
+        self.tree.column("preview", width=COLUMN_PREVIEW_WIDTH, anchor="w", stretch=tk.YES)
+        
+        scrollbar = ttk.Scrollbar(list_view_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+    
+    def _register_translations(self) -> None:
+        """言語変更時に更新するウィジェットを登録"""
+        registry = get_translation_registry()
+        registry.register(self.restore_button, "restore_from_trash")
+        registry.register(self.purge_button, "delete_permanently")
+        registry.register(self.empty_button, "empty_trash")
+        registry.register_updater(self.tree, self.update_language)
+    
+    def update_language(self) -> None:
+        """カラムヘッダーを現在の言語で更新"""
+        translate = self.language_service.translate
+        self.tree.heading("id", text=translate("id"))
+        self.tree.heading("deleted_at", text=translate("deleted_at"))
+        self.tree.heading("preview", text=translate("content"))
+    
+    def set_items(self, items: List[TrashItem]) -> None:
+        """ごみ箱の付箋を表示（前回の表示との差分だけをツリービューに反映）"""
+        rows = {item.note.id: (item.note.id,
+                               datetime.fromtimestamp(item.deleted_at).strftime(DATE_FORMAT),
+                               item.note.get_preview_text(TEXT_PREVIEW_MAX_LENGTH, self.language_service))
+                for item in items}
+        
+        removed = [item for item in self._rows if item not in rows]
+        if removed:
+            self.tree.delete(*removed)
+        for index, (note_id, values) in enumerate(rows.items()):
+            current = self._rows.get(note_id)
+            if current is None:
+                self.tree.insert("", index, iid=note_id, values=values)
+            elif current != values:
+                self.tree.item(note_id, values=values)
+        self._rows = rows
+        
+        order = tuple(rows)
+        if self.tree.get_children() != order:
+            for index, item in enumerate(order):
+                self.tree.move(item, "", index)
+    
+    def get_selected_note_ids(self) -> List[str]:
+        """選択された付箋のIDを取得"""
+        return list(self.tree.selection())
+    
+    def _on_restore_clicked(self) -> None:
+        """元に戻すボタンがクリックされたとき"""
+        note_ids = self.get_selected_note_ids()
+        if note_ids and self.on_restore:
+            self.on_restore(note_ids)
+    
+    def _on_purge_clicked(self) -> None:
+        """完全に削除ボタンがクリックされたとき"""
+        note_ids = self.get_selected_note_ids()
+        if note_ids and self.on_purge:
+            self.on_purge(note_ids)
+    
+    def _on_empty_clicked(self) -> None:
+        """ごみ箱を空にするボタンがクリックされたとき"""
+        if self._rows and self.on_empty:
+            self.on_empty()
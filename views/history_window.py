@@ -0,0 +1,111 @@
+"""履歴ビューア - 付箋の過去の版を一覧表示し、選択した版に戻す"""
+import tkinter as tk
+from tkinter import ttk
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from core.history import Revision
+from services.language_service import get_language_service
+from utils.constants import DATE_FORMAT, DEFAULT_FONT, HISTORY_WINDOW_SIZE
+
+
+class HistoryWindow(tk.Toplevel):
+    """付箋の履歴を表示するウィンドウ"""
+    
+    def __init__(self, master, note_id: str, revisions: List[Revision],
+                 load_text: Callable[[int], Optional[str]]):
+        super().__init__(master)
+        self.note_id = note_id
+        self.revisions = revisions
+        self.load_text = load_text
+        self.language_service = get_language_service()
+        self._texts: Dict[int, str] = {}  # 版番号 -> 復元した本文
+        
+        # コールバック
+        self.on_restore: Optional[Callable[[str, str], None]] = None
+        
+        self._setup_window()
+        self._create_widgets()
+        self._fill_revisions()
+    
+    def _setup_window(self) -> None:
+        """ウィンドウの基本設定"""
+        self.title(f"{self.language_service.translate('history')} - {self.note_id}")
+        self.geometry(HISTORY_WINDOW_SIZE)
+        self.transient(self.master)
+    
+    def _create_widgets(self) -> None:
+        """ウィジェットを作成"""
+        translate = self.language_service.translate
+        paned_window = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
+        paned_window.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
+        
+        # 版の一覧
+        list_frame = ttk.Frame(paned_window)
+        paned_window.add(list_frame, weight=1)
+        self.tree = ttk.Treeview(list_frame, columns=("date", "length"), show="headings", selectmode="browse")
+        self.tree.heading("date", text=translate("date"))
+        self.tree.heading("length", text=translate("characters"))
+        self.tree.column("date", width=130, anchor="w")
+        self.tree.column("length", width=60, anchor="e")
+        self.tree.pack(expand=True, fill=tk.BOTH)
+        self.tree.bind("<<TreeviewSelect>>", self._on_selection_change)
+        
+        # 選択した版の本文
+        text_frame = ttk.Frame(paned_window)
+        paned_window.add(text_frame, weight=2)
+        self.text_area = tk.Text(text_frame, wrap=tk.WORD, font=DEFAULT_FONT, state="disabled")
+        scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=self.text_area.yview)
+        self.text_area.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text_area.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+        
+        # ボタン
+        button_frame = ttk.Frame(self)
+        button_frame.pack(fill=tk.X, padx=5, pady=5)
+        ttk.Button(button_frame, text=translate("close"), command=self.destroy).pack(side=tk.RIGHT, padx=2)
+        self.restore_button = ttk.Button(button_frame, text=translate("restore"),
+                                         command=self._on_restore_clicked, state="disabled")
+        self.restore_button.pack(side=tk.RIGHT, padx=2)
+    
+    def _fill_revisions(self) -> None:
+        """版の一覧を新しい順に表示し、最新の版を選択"""
+        for revision in self.revisions:
+            date = datetime.fromtimestamp(revision.timestamp).strftime(DATE_FORMAT + ":%S")
+            self.tree.insert("", tk.END, iid=str(revision.number), values=(date, revision.length))
+        if self.revisions:
+            self.tree.selection_set(str(self.revisions[0].number))
+    
+    def _get_selected_number(self) -> Optional[int]:
+        """選択中の版番号"""
+        selected = self.tree.selection()
+        return int(selected[0]) if selected else None
+    
+    def _get_text(self, number: int) -> Optional[str]:
+        """版の本文（一度復元した本文は再利用する）"""
+        if number not in self._texts:
+            text = self.load_text(number)
+            if text is None:
+                return None
+            self._texts[number] = text
+        return self._texts[number]
+    
+    def _on_selection_change(self, event: Optional[tk.Event] = None) -> None:
+        """選択した版の本文を表示"""
+        number = self._get_selected_number()
+        text = self._get_text(number) if number is not None else None
+        self.text_area.config(state="normal")
+        self.text_area.delete("1.0", tk.END)
+        if text is not None:
+            self.text_area.insert(tk.END, text)
+        self.text_area.config(state="disabled")
+        # 最新の版は現在の本文と同じなので戻す必要がない
+        is_latest = bool(self.revisions) and number == self.revisions[0].number
+        self.restore_button.config(state="disabled" if text is None or is_latest else "normal")
+    
+    def _on_restore_clicked(self) -> None:
+        """選択した版に戻す"""
+        number = self._get_selected_number()
+        text = self._get_text(number) if number is not None else None
+        if text is not None and self.on_restore:
+            self.on_restore(self.note_id, text)
+        self.destroy()
@@ -3,15 +3,20 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Optional, Callable, List
 from models.note_model import NoteData
+from core.trash import TrashItem
 from views.components.note_list import NoteListComponent
 from views.components.preview_panel import PreviewPanelComponent
 from views.components.settings_panel import SettingsPanelComponent
+from views.components.trash_list import TrashListComponent
+from views.components.diagnostics_panel import DiagnosticsPanelComponent
+from views.components.context_menu_cache import get_context_menu_cache
+from views.components.translation_registry import get_translation_registry
 from services.ui_service import UIService
 from services.language_service import get_language_service
 from utils.constants import (
     DEFAULT_MAIN_WIDTH, DEFAULT_MAIN_HEIGHT, MAIN_BG_COLOR, STATUS_FONT,
     STATUS_READY, TOOLBAR_PADDING, MSG_SELECT_NOTE_TO_OPEN, MSG_SELECT_NOTE_TO_DELETE,
-    MSG_SELECT_NOTE_FOR_COLOR, STATUS_BAR_HEIGHT
+    MSG_SELECT_NOTE_FOR_COLOR, STATUS_BAR_HEIGHT, NOTE_LIST_CONTEXT_MENU, QUICK_OPEN_SHORTCUT
 )
 
 
@@ -27,14 +32,26 @@ class MainWindow(tk.Tk):
         # コールバック
         self.on_create_note: Optional[Callable[[], None]] = None
         self.on_open_note: Optional[Callable[[str], None]] = None
-        self.on_delete_note: Optional[Callable[[str], None]] = None
-        self.on_change_color: Optional[Callable[[str], None]] = None
+        self.on_open_notes: Optional[Callable[[List[str]], None]] = None
+        self.on_close_notes: Optional[Callable[[List[str]], None]] = None
+        self.on_delete_notes: Optional[Callable[[List[str]], None]] = None
+        self.on_change_color: Optional[Callable[[List[str]], None]] = None
+        self.on_archive_notes: Optional[Callable[[List[str], bool], None]] = None
         self.on_refresh: Optional[Callable[[], None]] = None
+        self.on_arrange_notes: Optional[Callable[[], None]] = None
+        self.on_undo: Optional[Callable[[], None]] = None
+        self.on_redo: Optional[Callable[[], None]] = None
+        self.on_trash_shown: Optional[Callable[[], None]] = None
+        self.on_restore_trash: Optional[Callable[[List[str]], None]] = None
+        self.on_purge_trash: Optional[Callable[[List[str]], None]] = None
+        self.on_empty_trash: Optional[Callable[[], None]] = None
+        self.on_include_cold_changed: Optional[Callable[[bool], None]] = None
+        self.on_quick_open: Optional[Callable[[], None]] = None
         
         self._setup_window()
         self._create_widgets()
         self._setup_events()
-        self._update_ui_language()
+        self._register_translations()
     
     def _setup_window(self) -> None:
         """ウィンドウの基本設定"""
@@ -70,10 +87,18 @@ class MainWindow(tk.Tk):
         self.notes_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.notes_tab, text=self.language_service.translate("all_notes"))
         
+        # ごみ箱タブ
+        self.trash_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.trash_tab, text=self.language_service.translate("trash"))
+        
         # 設定タブ
         self.settings_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.settings_tab, text=self.language_service.translate("settings"))
         
+        # 診断タブ
+        self.diagnostics_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.diagnostics_tab, text=self.language_service.translate("diagnostics"))
+        
         # ツールバー
         self._create_toolbar()
         
@@ -82,10 +107,19 @@ class MainWindow(tk.Tk):
         self.note_list.on_double_click = self._on_note_double_clicked
         self.note_list.on_selection_change = self._on_note_selection_changed
         self.note_list.on_right_click = self._on_note_right_clicked
+        self.note_list.on_include_cold_changed = self._on_include_cold_changed
+        
+        # ごみ箱コンポーネント
+        self.trash_list = TrashListComponent(self.trash_tab)
+        self.trash_list.on_restore = self._on_trash_restore_clicked
+        self.trash_list.on_purge = self._on_trash_purge_clicked
+        self.trash_list.on_empty = self._on_empty_trash_clicked
         
         # 設定パネルコンポーネント
         self.settings_panel = SettingsPanelComponent(self.settings_tab)
-        self.settings_panel.on_language_changed = self._on_language_changed
+        
+        # 診断パネルコンポーネント
+        self.diagnostics_panel = DiagnosticsPanelComponent(self.diagnostics_tab)
         
         # プレビューフレーム（下部）
         self.preview_frame = ttk.Frame(self.paned_window)
@@ -94,9 +128,6 @@ class MainWindow(tk.Tk):
         # プレビューコンポーネント
         self.preview_panel = PreviewPanelComponent(self.preview_frame)
         
-        # コンテキストメニュー
-        self._create_context_menu()
-        
         # ステータスバー
         self._create_status_bar()
     
@@ -112,27 +143,52 @@ class MainWindow(tk.Tk):
         self.open_button = ttk.Button(toolbar_frame, text=self.language_service.translate("open"), command=self._on_open_clicked)
         self.open_button.pack(side=tk.LEFT, padx=2)
         
+        self.close_button = ttk.Button(toolbar_frame, text=self.language_service.translate("close"), command=self._on_close_clicked)
+        self.close_button.pack(side=tk.LEFT, padx=2)
+        
         self.delete_button = ttk.Button(toolbar_frame, text=self.language_service.translate("delete"), command=self._on_delete_clicked)
         self.delete_button.pack(side=tk.LEFT, padx=2)
         
         self.color_button = ttk.Button(toolbar_frame, text=self.language_service.translate("color_change"), command=self._on_color_clicked)
         self.color_button.pack(side=tk.LEFT, padx=2)
         
+        self.archive_button = ttk.Button(toolbar_frame, text=self.language_service.translate("archive"), command=self._on_archive_clicked)
+        self.archive_button.pack(side=tk.LEFT, padx=2)
+        
         self.refresh_button = ttk.Button(toolbar_frame, text=self.language_service.translate("refresh"), command=self._on_refresh_clicked)
         self.refresh_button.pack(side=tk.RIGHT, padx=2)
+        
+        self.arrange_button = ttk.Button(toolbar_frame, text=self.language_service.translate("arrange_all"), command=self._on_arrange_clicked)
+        self.arrange_button.pack(side=tk.RIGHT, padx=2)
+        
+        self.toolbar_buttons = [self.new_button, self.open_button, self.close_button, self.delete_button,
+                                self.color_button, self.archive_button, self.refresh_button, self.arrange_button]
     
-    def _create_context_menu(self) -> None:
-        """コンテキストメニューを作成"""
-        self.context_menu = tk.Menu(self.note_list.tree, tearoff=0)
-        self.context_menu.add_command(label=self.language_service.translate("open"), command=self._on_open_clicked)
-        self.context_menu.add_command(label=self.language_service.translate("color_change"), command=self._on_color_clicked)
-        self.context_menu.add_separator()
-        self.context_menu.add_command(label=self.language_service.translate("delete"), command=self._on_delete_clicked)
+    @staticmethod
+    def _build_context_menu(menu: tk.Menu) -> None:
+        """付箋リストのコンテキストメニューの項目を作成"""
+        language_service = get_language_service()
+        menu_cache = get_context_menu_cache()
+        menu.add_command(label=language_service.translate("open"),
+                         command=menu_cache.command(NOTE_LIST_CONTEXT_MENU, "_on_open_clicked"))
+        menu.add_command(label=language_service.translate("close"),
+                         command=menu_cache.command(NOTE_LIST_CONTEXT_MENU, "_on_close_clicked"))
+        menu.add_command(label=language_service.translate("color_change"),
+                         command=menu_cache.command(NOTE_LIST_CONTEXT_MENU, "_on_color_clicked"))
+        menu.add_separator()
+        menu.add_command(label=language_service.translate("archive"),
+                         command=menu_cache.command(NOTE_LIST_CONTEXT_MENU, "_on_archive_clicked"))
+        menu.add_command(label=language_service.translate("unarchive"),
+                         command=menu_cache.command(NOTE_LIST_CONTEXT_MENU, "_on_unarchive_clicked"))
+        menu.add_separator()
+        menu.add_command(label=language_service.translate("delete"),
+                         command=menu_cache.command(NOTE_LIST_CONTEXT_MENU, "_on_delete_clicked"))
     
     def _create_status_bar(self) -> None:
         """ステータスバーを作成"""
         self.status_var = tk.StringVar()
         self.status_var.set(self.language_service.translate("status_ready"))
+        self._status_is_ready = True
         status_bar = tk.Label(self, textvariable=self.status_var, 
                             font=STATUS_FONT, bd=1, relief=tk.SUNKEN, anchor=tk.W,
                             height=STATUS_BAR_HEIGHT)  # 固定高さを設定
@@ -140,57 +196,117 @@ class MainWindow(tk.Tk):
     
     def _setup_events(self) -> None:
         """イベントを設定"""
-        pass  # コールバックベースなので特に設定はなし
+        # 元に戻す・やり直し（付箋ウィンドウのテキスト編集とは別に、メインウィンドウでの操作が対象）
+        self.bind("<Control-z>", self._on_undo_pressed)
+        self.bind("<Control-y>", self._on_redo_pressed)
+        self.bind("<Control-Z>", self._on_redo_pressed)
+        
+        # クイックオープン（付箋ウィンドウからも呼び出せるよう、すべてのウィジェットに設定）
+        self.bind_all(QUICK_OPEN_SHORTCUT, lambda e: self._on_quick_open_pressed())
+        
+        # ごみ箱は最初に表示したときに読み込む
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
     
     def set_notes(self, notes: List[NoteData]) -> None:
         """付箋リストを設定"""
         self.note_list.set_notes(notes)
     
+    def set_cold_notes(self, notes: List[NoteData]) -> None:
+        """検索対象に含めるアーカイブファイルの付箋を設定"""
+        self.note_list.set_cold_notes(notes)
+    
     def refresh_notes(self) -> None:
         """付箋リストを更新"""
         self.note_list.refresh()
     
+    def show_window(self) -> None:
+        """最小化や他のウィンドウの背後から前面に表示"""
+        self.deiconify()
+        self.lift()
+        self.focus_force()
+    
     def update_status(self, message: str) -> None:
         """ステータスメッセージを更新"""
+        self._status_is_ready = False
         self.status_var.set(message)
     
+    def set_loading(self, is_loading: bool) -> None:
+        """読み込み中の表示に切り替え（読み込み中は付箋を操作できない）"""
+        state = "disabled" if is_loading else "normal"
+        for button in self.toolbar_buttons:
+            button.configure(state=state)
+        if is_loading:
+            self.update_status(self.language_service.translate("status_loading"))
+    
+    def set_trash_items(self, items: List[TrashItem]) -> None:
+        """ごみ箱の付箋を設定"""
+        self.trash_list.set_items(items)
+    
+    def _on_include_cold_changed(self, include: bool) -> None:
+        """アーカイブファイルも検索するかが切り替えられたとき"""
+        if self.on_include_cold_changed:
+            self.on_include_cold_changed(include)
+    
+    def is_trash_visible(self) -> bool:
+        """ごみ箱タブを表示中か"""
+        return self.notebook.select() == str(self.trash_tab)
+    
+    def _on_tab_changed(self, event: tk.Event) -> None:
+        """タブが切り替えられたとき"""
+        if self.is_trash_visible() and self.on_trash_shown:
+            self.on_trash_shown()
+        if self.notebook.select() == str(self.diagnostics_tab):
+            # タブの中身が表示されてから更新を始める（表示されなくなると更新を止める）
+            self.after_idle(self.diagnostics_panel.refresh)
+    
+    def _on_trash_restore_clicked(self, note_ids: List[str]) -> None:
+        """ごみ箱の付箋を元に戻すボタンがクリックされたとき"""
+        if self.on_restore_trash:
+            self.on_restore_trash(note_ids)
+    
+    def _on_trash_purge_clicked(self, note_ids: List[str]) -> None:
+        """ごみ箱の付箋を完全に削除するボタンがクリックされたとき"""
+        if self.on_purge_trash:
+            self.on_purge_trash(note_ids)
+    
+    def _on_empty_trash_clicked(self) -> None:
+        """ごみ箱を空にするボタンがクリックされたとき"""
+        if self.on_empty_trash:
+            self.on_empty_trash()
+    
     def update_preview(self, note: Optional[NoteData]) -> None:
         """プレビューを更新"""
         self.preview_panel.update_preview(note)
     
-    def _on_language_changed(self, language_code: str) -> None:
-        """言語が変更されたときの処理"""
-        self._update_ui_language()
-    
-    def _update_ui_language(self) -> None:
-        """UI言語を更新"""
-        # ウィンドウタイトルを更新
-        self.title(self.language_service.translate("app_title"))
-        
-        # タブのテキストを更新
-        self.notebook.tab(self.notes_tab, text=self.language_service.translate("all_notes"))
-        self.notebook.tab(self.settings_tab, text=self.language_service.translate("settings"))
+    def _register_translations(self) -> None:
+        """言語変更時に更新するウィジェットを登録"""
+        registry = get_translation_registry()
+        translate = self.language_service.translate
         
-        # ツールバーボタンを更新
-        self.new_button.configure(text=self.language_service.translate("new_note"))
-        self.open_button.configure(text=self.language_service.translate("open"))
-        self.delete_button.configure(text=self.language_service.translate("delete"))
-        self.color_button.configure(text=self.language_service.translate("color_change"))
-        self.refresh_button.configure(text=self.language_service.translate("refresh"))
+        # ウィンドウタイトルとタブ
+        registry.register_updater(self, lambda: self.title(translate("app_title")))
+        registry.register_updater(self, lambda: self.notebook.tab(self.notes_tab, text=translate("all_notes")))
+        registry.register_updater(self, lambda: self.notebook.tab(self.trash_tab, text=translate("trash")))
+        registry.register_updater(self, lambda: self.notebook.tab(self.settings_tab, text=translate("settings")))
+        registry.register_updater(self, lambda: self.notebook.tab(self.diagnostics_tab, text=translate("diagnostics")))
         
-        # コンテキストメニューを再作成
-        self._create_context_menu()
+        # ツールバーボタン
+        registry.register(self.new_button, "new_note")
+        registry.register(self.open_button, "open")
+        registry.register(self.close_button, "close")
+        registry.register(self.delete_button, "delete")
+        registry.register(self.color_button, "color_change")
+        registry.register(self.archive_button, "archive")
+        registry.register(self.refresh_button, "refresh")
+        registry.register(self.arrange_button, "arrange_all")
         
-        # ステータスを更新
-        current_status = self.status_var.get()
-        if current_status == "準備完了" or current_status == "Ready":
+        # 準備完了のままのステータス
+        registry.register_updater(self, self._update_ready_status)
+    
+    def _update_ready_status(self) -> None:
+        """ステータスが準備完了のままなら現在の言語で表示し直す"""
+        if self._status_is_ready:
             self.status_var.set(self.language_service.translate("status_ready"))
-        
-        # 子コンポーネントの言語更新
-        if hasattr(self, 'note_list'):
-            self.note_list.update_language()
-        if hasattr(self, 'preview_panel'):
-            self.preview_panel.update_language()
     
     def _on_new_clicked(self) -> None:
         """新規作成ボタンがクリックされたとき"""
@@ -199,36 +315,86 @@ class MainWindow(tk.Tk):
     
     def _on_open_clicked(self) -> None:
         """開くボタンがクリックされたとき"""
-        note_id = self.note_list.get_selected_note_id()
-        if note_id:
-            if self.on_open_note:
-                self.on_open_note(note_id)
+        note_ids = self.note_list.get_selected_note_ids()
+        if note_ids:
+            if self.on_open_notes:
+                self.on_open_notes(note_ids)
         else:
             UIService.show_select_note_message("open")
     
+    def _on_close_clicked(self) -> None:
+        """閉じるボタンがクリックされたとき"""
+        note_ids = self.note_list.get_selected_note_ids()
+        if note_ids:
+            if self.on_close_notes:
+                self.on_close_notes(note_ids)
+        else:
+            UIService.show_select_note_message("close")
+    
     def _on_delete_clicked(self) -> None:
         """削除ボタンがクリックされたとき"""
-        note_id = self.note_list.get_selected_note_id()
-        if note_id:
-            if self.on_delete_note:
-                self.on_delete_note(note_id)
+        note_ids = self.note_list.get_selected_note_ids()
+        if note_ids:
+            if self.on_delete_notes:
+                self.on_delete_notes(note_ids)
         else:
             UIService.show_select_note_message("delete")
     
     def _on_color_clicked(self) -> None:
         """色変更ボタンがクリックされたとき"""
-        note_id = self.note_list.get_selected_note_id()
-        if note_id:
+        note_ids = self.note_list.get_selected_note_ids()
+        if note_ids:
             if self.on_change_color:
-                self.on_change_color(note_id)
+                self.on_change_color(note_ids)
         else:
             UIService.show_select_note_message("color")
     
+    def _on_archive_clicked(self) -> None:
+        """アーカイブボタンがクリックされたとき"""
+        note_ids = self.note_list.get_selected_note_ids()
+        if note_ids:
+            if self.on_archive_notes:
+                self.on_archive_notes(note_ids, True)
+        else:
+            UIService.show_select_note_message("archive")
+    
+    def _on_unarchive_clicked(self) -> None:
+        """アーカイブから戻すメニューが選択されたとき"""
+        note_ids = self.note_list.get_selected_note_ids()
+        if note_ids and self.on_archive_notes:
+            self.on_archive_notes(note_ids, False)
+    
+    @staticmethod
+    def _is_text_input(widget) -> bool:
+        """ウィジェットが文字入力欄か（入力欄では自身の元に戻す・やり直しを優先する）"""
+        return isinstance(widget, (tk.Entry, tk.Text))
+    
+    def _on_undo_pressed(self, event: tk.Event) -> None:
+        """元に戻すキーが押されたとき"""
+        if self.on_undo and not self._is_text_input(event.widget):
+            self.on_undo()
+    
+    def _on_redo_pressed(self, event: tk.Event) -> None:
+        """やり直しキーが押されたとき"""
+        if self.on_redo and not self._is_text_input(event.widget):
+            self.on_redo()
+    
+    def _on_quick_open_pressed(self) -> str:
+        """クイックオープンのキーが押されたとき"""
+        if self.on_quick_open:
+            self.on_quick_open()
+        return "break"
+    
     def _on_refresh_clicked(self) -> None:
         """更新ボタンがクリックされたとき"""
         if self.on_refresh:
             self.on_refresh()
     
+    def _on_arrange_clicked(self) -> None:
+        """整列ボタンがクリックされたとき"""
+        if self.on_arrange_notes:
+            self.on_arrange_notes()
+    
     def _on_note_double_clicked(self, note_id: str) -> None:
         """付箋がダブルクリックされたとき"""
         if self.on_open_note:
@@ -242,11 +408,13 @@ class MainWindow(tk.Tk):
     
     def _on_note_right_clicked(self, event: tk.Event) -> None:
         """付箋が右クリックされたとき"""
-        try:
-            self.context_menu.tk_popup(event.x_root, event.y_root)
-        finally:
-            self.context_menu.grab_release()
+        get_context_menu_cache().popup(NOTE_LIST_CONTEXT_MENU, self, self._build_context_menu,
+                                       event.x_root, event.y_root)
     
     def get_selected_note_id(self) -> Optional[str]:
         """選択された付箋IDを取得"""
         return self.note_list.get_selected_note_id()
+    
+    def get_selected_note_ids(self) -> List[str]:
+        """選択されたすべての付箋IDを取得"""
+        return self.note_list.get_selected_note_ids()
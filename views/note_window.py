@@ -5,10 +5,13 @@ from typing import Callable, Optional
 from models.note_model import NoteData
 from services.ui_service import UIService
 from services.language_service import get_language_service
+from views.components.chunked_text_loader import ChunkedTextLoader
+from views.components.context_menu_cache import get_context_menu_cache
+from views.components.translation_registry import get_translation_registry
 from utils.constants import (
-    DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT, MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT,
+    NOTE_CONTEXT_MENU, DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT, MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT,
     ALWAYS_ON_TOP, CONTROL_HEIGHT, RESIZE_HANDLE_SIZE, CONTROL_TEXT_COLOR,
-    DEFAULT_FONT, CONTROL_FONT
+    DEFAULT_FONT, CONTROL_FONT, LARGE_NOTE_THRESHOLD
 )
 
 
@@ -25,6 +28,7 @@ class StickyNoteWindow(tk.Toplevel):
         self.on_save: Optional[Callable[[NoteData], None]] = None
         self.on_close: Optional[Callable[[str], None]] = None
         self.on_color_change: Optional[Callable[[str, str], None]] = None
+        self.on_show_history: Optional[Callable[[str], None]] = None
         
         # ドラッグ用変数
         self.drag_start_x = 0
@@ -40,9 +44,11 @@ class StickyNoteWindow(tk.Toplevel):
         self._create_widgets()
         self._setup_events()
         self._apply_note_data()
+        self._register_translations()
     
     def _setup_window(self) -> None:
         """ウィンドウの基本設定"""
+        self.title(self._get_window_title())
         self.overrideredirect(True)
         self.geometry(f"{DEFAULT_WINDOW_WIDTH}x{DEFAULT_WINDOW_HEIGHT}")
         self.config(bg=self.note_data.color)
@@ -79,15 +85,27 @@ class StickyNoteWindow(tk.Toplevel):
         self.text_area = tk.Text(self, wrap=tk.WORD, bg=self.note_data.color, 
                                relief=tk.FLAT, font=DEFAULT_FONT, bd=2)
         self.text_area.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
-        
-        # コンテキストメニュー
-        self._create_context_menu()
+        self.text_loader = ChunkedTextLoader(self.text_area)
+    
+    @staticmethod
+    def _build_context_menu(menu: tk.Menu) -> None:
+        """コンテキストメニューの項目を作成（全付箋ウィンドウで共有）"""
+        language_service = get_language_service()
+        menu_cache = get_context_menu_cache()
+        menu.add_command(label=language_service.translate("change_color"),
+                         command=menu_cache.command(NOTE_CONTEXT_MENU, "_change_color"))
+        menu.add_command(label=language_service.translate("history"),
+                         command=menu_cache.command(NOTE_CONTEXT_MENU, "_show_history"))
+        menu.add_command(label=language_service.translate("close"),
+                         command=menu_cache.command(NOTE_CONTEXT_MENU, "_on_close_clicked"))
     
-    def _create_context_menu(self) -> None:
-        """コンテキストメニューを作成"""
-        self.context_menu = tk.Menu(self, tearoff=0)
-        self.context_menu.add_command(label=self.language_service.translate("change_color"), command=self._change_color)
-        self.context_menu.add_command(label=self.language_service.translate("close"), command=self._on_close_clicked)
+    def _get_window_title(self) -> str:
+        """ウィンドウタイトル（タスク切り替えやアクセシビリティツールで表示される）"""
+        return f"{self.language_service.translate('app_title')} - {self.note_data.id}"
+    
+    def _register_translations(self) -> None:
+        """言語変更時に更新する項目を登録"""
+        get_translation_registry().register_updater(self, lambda: self.title(self._get_window_title()))
     
     def _setup_events(self) -> None:
         """イベントを設定"""
@@ -113,8 +131,14 @@ class StickyNoteWindow(tk.Toplevel):
     
     def _apply_note_data(self) -> None:
         """付箋データをウィンドウに適用"""
-        # テキストを設定
-        self.text_area.insert(tk.END, self.note_data.text)
+        # テキストを設定（大きな本文は分割して挿入し、完了まで編集不可にする）
+        text = self.note_data.text
+        if len(text) > LARGE_NOTE_THRESHOLD:
+            self.text_area.config(state="disabled")
+            self.text_loader.start(text, on_complete=self._on_text_loaded)
+        else:
+            self.text_area.insert(tk.END, text)
+            self.text_area.edit_modified(False)
         
         # 位置とサイズを設定
         if self.note_data.x is not None and self.note_data.y is not None:
@@ -124,6 +148,11 @@ class StickyNoteWindow(tk.Toplevel):
             x, y = UIService.get_random_position(self.winfo_screenwidth(), self.winfo_screenheight())
             self.geometry(f"{self.note_data.width}x{self.note_data.height}+{x}+{y}")
     
+    def _on_text_loaded(self) -> None:
+        """本文の分割挿入が完了したとき"""
+        self.text_area.config(state="normal")
+        self.text_area.edit_modified(False)
+    
     def _start_drag(self, event: tk.Event) -> None:
         """ドラッグ開始"""
         self.drag_start_x = event.x
@@ -152,28 +181,32 @@ class StickyNoteWindow(tk.Toplevel):
     
     def _show_context_menu(self, event: Optional[tk.Event] = None) -> None:
         """コンテキストメニュー表示"""
-        try:
-            # メニューを再作成して最新の翻訳を反映
-            self._create_context_menu()
-            
-            if event:
-                self.context_menu.tk_popup(event.x_root, event.y_root)
-            else:
-                x = self.settings_button.winfo_rootx()
-                y = self.settings_button.winfo_rooty() + self.settings_button.winfo_height()
-                self.context_menu.tk_popup(x, y)
-        finally:
-            self.context_menu.grab_release()
+        if event:
+            x, y = event.x_root, event.y_root
+        else:
+            x = self.settings_button.winfo_rootx()
+            y = self.settings_button.winfo_rooty() + self.settings_button.winfo_height()
+        
+        # 言語ごとにキャッシュされた共有メニューを表示
+        get_context_menu_cache().popup(NOTE_CONTEXT_MENU, self, self._build_context_menu, x, y)
     
     def _change_color(self) -> None:
-        """色を変更"""
+        """色を変更（コールバックがあれば、元に戻せるよう変更そのものをコントローラーに任せる）"""
         color = UIService.choose_color(self.note_data.color)
-        if color:
-            self._apply_color(color)
-            self.note_data.color = color
+        if not color:
+            return
+        self._save_note()
+        if self.on_color_change:
+            self.on_color_change(self.note_data.id, color)
+        else:
+            self.apply_color_change(color)
             self._save_note()
-            if self.on_color_change:
-                self.on_color_change(self.note_data.id, color)
+    
+    def _show_history(self) -> None:
+        """履歴ビューアを表示（現在の本文を保存して最新の版として記録してから）"""
+        self._save_note()
+        if self.on_show_history:
+            self.on_show_history(self.note_data.id)
     
     def _apply_color(self, color: str) -> None:
         """色をウィンドウに適用"""
@@ -198,7 +231,10 @@ class StickyNoteWindow(tk.Toplevel):
     
     def _update_note_data(self) -> None:
         """ウィンドウの状態をデータに反映"""
-        self.note_data.text = self.text_area.get("1.0", tk.END).strip()
+        # 編集されたときだけ本文をTkから取り出す（読み込み中は未完成なので取り出さない）
+        if not self.text_loader.is_loading and self.text_area.edit_modified():
+            self.note_data.text = self.text_area.get("1.0", tk.END).strip()
+            self.text_area.edit_modified(False)
         self.note_data.x = self.winfo_x()
         self.note_data.y = self.winfo_y()
         self.note_data.width = self.winfo_width()
@@ -214,6 +250,29 @@ class StickyNoteWindow(tk.Toplevel):
             self.on_close(self.note_data.id)
         self.destroy()
     
+    def destroy(self) -> None:
+        """ウィンドウを破棄"""
+        self.text_loader.cancel()
+        get_translation_registry().unregister(self)
+        super().destroy()
+    
+    def move_to(self, x: int, y: int) -> None:
+        """ウィンドウを指定位置に移動"""
+        self.geometry(f"+{x}+{y}")
+        self.note_data.x = x
+        self.note_data.y = y
+    
+    def reload_note_data(self, reload_text: bool = True) -> None:
+        """外部で変更された付箋データ（色・位置・サイズ・本文）をウィンドウに反映"""
+        self._apply_color(self.note_data.color)
+        if reload_text:
+            self.text_loader.cancel()
+            self.text_area.config(state="normal")
+            self.text_area.delete("1.0", tk.END)
+            self._apply_note_data()
+        elif self.note_data.x is not None and self.note_data.y is not None:
+            self.geometry(f"{self.note_data.width}x{self.note_data.height}+{self.note_data.x}+{self.note_data.y}")
+    
     def apply_color_change(self, color: str) -> None:
         """外部からの色変更を適用"""
         self.note_data.color = color
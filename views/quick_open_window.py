@@ -0,0 +1,111 @@
+"""クイックオープン - キーボードだけで付箋を探して開く小さなウィンドウ"""
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, List, Optional
+from core.quick_open import QuickOpenItem, QuickOpenMatcher
+from services.language_service import get_language_service
+from utils.constants import DEFAULT_FONT, QUICK_OPEN_WINDOW_SIZE
+
+
+class QuickOpenWindow(tk.Toplevel):
+    """入力に一致する付箋を一覧表示し、Enterで開くウィンドウ（Escで閉じる）"""
+    
+    def __init__(self, master, matcher: QuickOpenMatcher):
+        super().__init__(master)
+        self.matcher = matcher
+        self.language_service = get_language_service()
+        self.query_var = tk.StringVar()
+        self._items: List[QuickOpenItem] = []  # 表示中の候補
+        self._update_pending = False  # 続けて入力された文字はまとめて1回で絞り込む
+        
+        # コールバック
+        self.on_open: Optional[Callable[[str], None]] = None
+        
+        self._setup_window()
+        self._create_widgets()
+        self._setup_events()
+        self._update_results()
+        self.entry.focus_force()
+    
+    def _setup_window(self) -> None:
+        """ウィンドウの基本設定（画面の上寄り中央に表示）"""
+        self.title(self.language_service.translate("quick_open"))
+        width = int(QUICK_OPEN_WINDOW_SIZE.split("x")[0])
+        x = (self.winfo_screenwidth() - width) // 2
+        y = self.winfo_screenheight() // 4
+        self.geometry(f"{QUICK_OPEN_WINDOW_SIZE}+{x}+{y}")
+        self.attributes("-topmost", True)
+    
+    def _create_widgets(self) -> None:
+        """ウィジェットを作成"""
+        self.entry = ttk.Entry(self, textvariable=self.query_var, font=DEFAULT_FONT)
+        self.entry.pack(fill=tk.X, padx=5, pady=5)
+        
+        list_frame = ttk.Frame(self)
+        list_frame.pack(expand=True, fill=tk.BOTH, padx=5)
+        self.listbox = tk.Listbox(list_frame, font=DEFAULT_FONT, activestyle="none", exportselection=False)
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.listbox.yview)
+        self.listbox.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.listbox.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+        
+        self.status_label = ttk.Label(self, anchor=tk.W)
+        self.status_label.pack(fill=tk.X, padx=5, pady=2)
+    
+    def _setup_events(self) -> None:
+        """イベントを設定"""
+        self.query_var.trace("w", lambda *args: self._schedule_update())
+        self.entry.bind("<Down>", lambda e: self._move_selection(1))
+        self.entry.bind("<Up>", lambda e: self._move_selection(-1))
+        self.entry.bind("<Next>", lambda e: self._move_selection(self._page_size()))
+        self.entry.bind("<Prior>", lambda e: self._move_selection(-self._page_size()))
+        self.bind("<Return>", lambda e: self._open_selected())
+        self.bind("<Escape>", lambda e: self.destroy())
+        self.listbox.bind("<Double-1>", lambda e: self._open_selected())
+    
+    def _schedule_update(self) -> None:
+        """溜まっているキー入力を処理し終えてから候補を更新"""
+        if not self._update_pending:
+            self._update_pending = True
+            self.after_idle(self._update_results)
+    
+    def _update_results(self) -> None:
+        """入力に一致する候補を表示し、先頭を選択"""
+        self._update_pending = False
+        if not self.winfo_exists():
+            return
+        query = self.query_var.get()
+        self._items = self.matcher.match(query)
+        self.listbox.delete(0, tk.END)
+        if self._items:
+            self.listbox.insert(tk.END, *(item.label for item in self._items))
+            self.listbox.selection_set(0)
+            self.listbox.see(0)
+        count = self.matcher.candidate_count(query)
+        self.status_label.configure(text=self.language_service.translate("quick_open_matches", count))
+    
+    def _move_selection(self, offset: int) -> str:
+        """選択している候補を上下に移動（入力欄のカーソルは動かさない）"""
+        if self._items:
+            selected = self.listbox.curselection()
+            index = max(0, min(len(self._items) - 1, (selected[0] if selected else 0) + offset))
+            self.listbox.selection_clear(0, tk.END)
+            self.listbox.selection_set(index)
+            self.listbox.see(index)
+        return "break"
+    
+    def _page_size(self) -> int:
+        """1ページに表示している候補の数"""
+        return max(1, self.listbox.nearest(self.listbox.winfo_height()) - self.listbox.nearest(0))
+    
+    def _open_selected(self) -> None:
+        """選択している候補の付箋を開いてウィンドウを閉じる"""
+        if self._update_pending:
+            self._update_results()
+        selected = self.listbox.curselection()
+        if not selected or not self._items:
+            return
+        note_id = self._items[selected[0]].note_id
+        self.destroy()
+        if self.on_open:
+            self.on_open(note_id)